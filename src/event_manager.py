@@ -6,7 +6,6 @@ A modular Python TUI for managing community events
 
 import argparse
 import fnmatch
-import json
 import os
 import sys
 from datetime import datetime
@@ -15,17 +14,20 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+from modules import fast_json
 from modules.scraper import EventScraper
 from modules.editor import EventEditor
 from modules.site_generator import SiteGenerator
 from modules.archive_events import EventArchiver, print_config_info
-from modules.batch_operations import expand_wildcards, process_in_batches, find_events_by_ids, determine_batch_size
+from modules.batch_operations import expand_wildcards, process_in_batches, determine_batch_size
 from modules.event_translator import EventTranslator
 from modules.utils import (
     load_config, load_events, save_events, 
     load_pending_events, save_pending_events, 
     backup_published_event, update_events_in_html,
-    add_rejected_event
+    add_rejected_event, get_document_cache_stats,
+    get_pending_event, remove_pending_events, add_published_events,
+    export_event_snapshots
 )
 
 # Import new optimization modules
@@ -274,6 +276,9 @@ class EventManagerTUI:
             else:
                 print("\nInvalid choice. Please try again.")
                 input("Press Enter to continue...")
+            
+            # Write event store changes to the JSON snapshots after each action
+            export_event_snapshots(self.base_path)
         
 def print_help():
     """Print CLI help information"""
@@ -291,6 +296,11 @@ COMMANDS:
     (no command)              Launch interactive TUI (default)
     setup                     Show detailed setup instructions for your own site
     scrape                    Scrape events from configured sources
+    scrape --workers N        Scrape N sources in parallel (default: scraping.concurrency)
+    scrape --no-cache         Re-download every page (ignore the HTTP ETag/Last-Modified cache)
+    scrape --record DIR       Scrape and save every HTTP exchange to DIR (offline corpus)
+    scrape --replay DIR       Scrape offline from a recorded corpus (dry run, nothing saved)
+    scrape --source NAME      Scrape only the enabled source NAME (imports just its module)
     diagnose-scraping         Debug scraping issues - check network, DNS, and sources
     scrape-weather            Calculate weather dresscode for map center location (config: weather.enabled)
     scrape-weather --force    Force refresh weather data (bypass cache)
@@ -309,6 +319,10 @@ COMMANDS:
                               - Builds HTML from templates with inlined assets
                               - Lints and validates content
                               - Outputs: public/index.html (self-contained)
+                              - Incremental: rebuilds only outputs whose inputs
+                                changed (.cache/build_manifest.json)
+    generate --force          Rebuild every output, even if up to date
+    generate --explain        Print why each output was rebuilt
     generate-feeds            Generate RSS feeds for all regions
                               - Creates per-region RSS 2.0 feeds
                               - Shows events until next sunrise for each region
@@ -365,6 +379,30 @@ COMMANDS:
     cache clear               Clear asset cache
     cache inspect KEY         Inspect specific cache entry
     
+    bench scrapers DIR        Time parse + normalize per source on a recorded corpus
+                              - Reports events/second and peak memory
+                              - Options: --rounds N (default: 3), --source NAME
+    
+    categorizer train         Train the offline category model on categorized events
+                              - Reads events.json, pending_events.json and archives
+                              - Saves data/models/category_model.json
+    categorizer stats         Show the trained category model
+    
+    ai-providers stats        Show AI provider latency (p50/p95), errors and circuit state
+                              - Recorded by scrape runs and the Telegram bot
+    
+    backups stats             Show published-event backup archive statistics
+    backups pack              Pack per-event backups in assets/json/old/ into segments
+                              - Removes the packed per-event files
+    backups reindex           Rebuild the backup index from the segment files
+    
+    store init                Enable SQLite event store (.cache/events.sqlite3)
+                              - Imports events.json and pending_events.json
+                              - JSON files stay as exported snapshots
+    store stats               Show event store statistics
+    store export              Re-export JSON snapshots from the store
+    store disable             Remove the store database (JSON files only)
+    
     icons                     Show current icon mode
     icons mode [MODE]         Set or show icon mode (svg-paths | base64)
     icons switch              Interactive icon mode switcher
@@ -869,18 +907,85 @@ Need help? Run: python3 src/event_manager.py --help
     print(setup_guide)
 
 
-def cli_scrape(base_path, config):
-    """CLI: Scrape events"""
-    print("Scraping events from configured sources...")
+def cli_scrape(base_path, config, max_workers=None, use_http_cache=True, record_dir=None, replay_dir=None,
+               source_name=None):
+    """CLI: Scrape events
+    
+    Args:
+        max_workers: Parallel source workers (None = scraping.concurrency.max_workers)
+        source_name: Only scrape the enabled source of this name (case-insensitive)
+        use_http_cache: Revalidate pages with ETag/Last-Modified (False = re-download all)
+        record_dir: Save every HTTP exchange of the run to this corpus directory
+        replay_dir: Serve HTTP from a recorded corpus instead of the network
+            (a dry run: the replayed events are not saved)
+    """
+    from contextlib import nullcontext
+    from modules.http_replay import HTTPCorpus
+    
+    if source_name and not any(s.get('enabled') and s.get('name', '').lower() == source_name.lower()
+                               for s in config.get('scraping', {}).get('sources', [])):
+        print(f"Error: No enabled source named '{source_name}' in config.json")
+        return 1
+    
     scraper = EventScraper(config, base_path)
-    new_events = scraper.scrape_all_sources()
+    scraper.max_workers = max_workers
+    scraper.source_name = source_name
+    http_mode = nullcontext()
+    if record_dir:
+        print(f"⏺️  Recording HTTP exchanges to {record_dir}")
+        http_mode = HTTPCorpus(record_dir).record()
+    elif replay_dir:
+        if not HTTPCorpus(replay_dir).exists():
+            print(f"Error: No recorded corpus in {replay_dir} (record one with: scrape --record {replay_dir})")
+            return 1
+        print(f"▶️  Replaying HTTP exchanges from {replay_dir} (offline)")
+        http_mode = HTTPCorpus(replay_dir).replay()
+    # Recorded corpora must hold full responses, not 304s for cached pages
+    if not use_http_cache or record_dir or replay_dir:
+        scraper.http_cache.enabled = False
+    # Replays must request every recorded URL, whatever the live hosts did,
+    # and must not store their (possibly stale) events or mark items as seen
+    # for the next real scrape
+    if replay_dir:
+        scraper.circuit_breaker.enabled = False
+        scraper.use_item_cache = False
+        scraper.dry_run = True
+    
+    print("Scraping events from configured sources...")
+    with http_mode as corpus:
+        new_events = scraper.scrape_all_sources()
+    if replay_dir:
+        print(f"✓ Scraped {len(new_events)} events from the replay (dry run, nothing saved)")
+        return 0
     print(f"✓ Scraped {len(new_events)} new events")
+    if record_dir:
+        stats = corpus.get_stats()
+        print(f"⏺️  Recorded {stats['exchanges']} exchanges ({stats['urls']} URLs) to {record_dir}")
+    
+    unchanged = 0
+    if scraper.http_cache.enabled:
+        stats = scraper.http_cache.get_stats()
+        unchanged = stats['not_modified']
+        print(f"🗄️  HTTP cache: {unchanged}/{stats['requests']} pages unchanged (304), "
+              f"{stats['bytes_saved'] / 1024:.0f} KB not re-downloaded")
+    
+    if scraper.circuit_breaker.enabled:
+        stats = scraper.circuit_breaker.get_stats()
+        if stats['tripped'] or stats['skipped']:
+            print(f"⚡ Circuit breaker tripped for: {', '.join(stats['tripped']) or '-'}; "
+                  f"{stats['skipped']} requests skipped (open: {', '.join(stats['open']) or '-'})")
+        if stats['retries_denied']:
+            print(f"⚡ Retry budget of {stats['retry_budget']} spent, {stats['retries_denied']} retries skipped")
     
     # Count enabled sources
     enabled_sources = sum(1 for s in config.get('scraping', {}).get('sources', []) if s.get('enabled'))
     
     # Provide helpful hint if zero events scraped from enabled sources
-    if len(new_events) == 0 and enabled_sources > 0:
+    if len(new_events) == 0 and enabled_sources > 0 and unchanged:
+        print()
+        print("💡 TIP: Unchanged pages (HTTP 304) are not parsed again.")
+        print("   Re-download everything with: python3 src/event_manager.py scrape --no-cache")
+    elif len(new_events) == 0 and enabled_sources > 0:
         print()
         print("💡 TIP: 0 events scraped from configured sources.")
         print("   Run diagnostics to identify the issue:")
@@ -1331,17 +1436,8 @@ def cli_list_pending(base_path):
 
 def cli_publish_event(base_path, event_id):
     """CLI: Publish a pending event"""
-    pending_data = load_pending_events(base_path)
-    events = pending_data.get('pending_events', [])
-    
-    # Find event
-    event = None
-    event_index = None
-    for i, e in enumerate(events):
-        if e.get('id') == event_id:
-            event = e
-            event_index = i
-            break
+    # Indexed lookup and single-row writes with the event store
+    event = get_pending_event(base_path, event_id)
     
     if not event:
         print(f"Error: Event with ID '{event_id}' not found in pending queue.")
@@ -1363,13 +1459,10 @@ def cli_publish_event(base_path, event_id):
     backup_path = backup_published_event(base_path, event)
     print(f"✓ Event backed up to: {backup_path.relative_to(base_path)}")
     
-    events_data = load_events(base_path)
-    events_data['events'].append(event)
-    save_events(base_path, events_data)
+    add_published_events(base_path, [event])
     
     # Remove from pending
-    events.pop(event_index)
-    save_pending_events(base_path, pending_data)
+    remove_pending_events(base_path, [event_id])
     
     # Update pending count in events.json
     from modules.utils import update_pending_count_in_events
@@ -1386,30 +1479,19 @@ def cli_publish_event(base_path, event_id):
 
 def cli_reject_event(base_path, event_id):
     """CLI: Reject a pending event"""
-    pending_data = load_pending_events(base_path)
-    events = pending_data.get('pending_events', [])
+    event = get_pending_event(base_path, event_id)
     
-    # Find event
-    event_index = None
-    event_title = None
-    event_source = None
-    for i, e in enumerate(events):
-        if e.get('id') == event_id:
-            event_index = i
-            event_title = e.get('title')
-            event_source = e.get('source', 'unknown')
-            break
-    
-    if event_index is None:
+    if event is None:
         print(f"Error: Event with ID '{event_id}' not found in pending queue.")
         return 1
+    event_title = event.get('title')
+    event_source = event.get('source', 'unknown')
     
     # Add to rejected events list
     add_rejected_event(base_path, event_title, event_source)
     
     # Remove from pending
-    events.pop(event_index)
-    save_pending_events(base_path, pending_data)
+    remove_pending_events(base_path, [event_id])
     
     # Update pending count in events.json
     from modules.utils import update_pending_count_in_events
@@ -1455,14 +1537,12 @@ def _find_events_to_process(event_ids, events):
     return events_to_process, failed_ids
 
 
-def _publish_events_batch(base_path, events_to_publish, events, events_data):
-    """Publish a batch of events.
+def _publish_events_batch(review, events_to_publish):
+    """Stage a batch of events for publishing.
     
     Args:
-        base_path: Repository root path
-        events_to_publish: List of (index, id, event) tuples
-        events: Pending events list (modified in place)
-        events_data: Published events data (modified in place)
+        review: ReviewBatch the decisions are staged in
+        events_to_publish: List of (id, event) tuples
         
     Returns:
         Tuple of (published_count, failed_count, failed_ids)
@@ -1471,7 +1551,7 @@ def _publish_events_batch(base_path, events_to_publish, events, events_data):
     failed_count = 0
     failed_ids = []
     
-    for event_index, event_id, event in events_to_publish:
+    for event_id, event in events_to_publish:
         try:
             # Validate event before publishing
             is_valid, error_msg = minimal_eventdata_requirements_check(event)
@@ -1481,19 +1561,7 @@ def _publish_events_batch(base_path, events_to_publish, events, events_data):
                 failed_ids.append(event_id)
                 continue
             
-            # Publish event
-            event['status'] = 'published'
-            event['published_at'] = datetime.now().isoformat()
-            
-            # Backup the published event
-            backup_published_event(base_path, event)
-            
-            # Add to published events
-            events_data['events'].append(event)
-            
-            # Remove from pending (safe because we're removing in reverse order)
-            events.pop(event_index)
-            
+            review.publish(event_id)
             print(f"✓ Published: {event.get('title')} (ID: {event_id})")
             published_count += 1
         except Exception as e:
@@ -1506,6 +1574,8 @@ def _publish_events_batch(base_path, events_to_publish, events, events_data):
 
 def cli_bulk_publish_events(base_path, event_ids_str):
     """CLI: Bulk publish pending events (supports wildcards and batching)"""
+    from modules.review_batch import ReviewBatch
+    
     # Parse comma-separated event IDs/patterns
     patterns = [p.strip() for p in event_ids_str.split(',')]
     
@@ -1513,18 +1583,16 @@ def cli_bulk_publish_events(base_path, event_ids_str):
         print("Error: No event IDs or patterns provided")
         return 1
     
-    pending_data = load_pending_events(base_path)
-    events = pending_data.get('pending_events', [])
+    # All decisions are staged in memory and written once at the end
+    review = ReviewBatch(base_path)
     
     # Expand wildcards using modular function
-    event_ids = expand_wildcards(patterns, events)
+    event_ids = expand_wildcards(patterns, review.events)
     
     if not event_ids:
         print("Error: No events matched the provided patterns")
         return 1
     
-    events_data = load_events(base_path)
-    
     print(f"📝 Bulk publishing {len(event_ids)} event(s)...")
     print("=" * 80)
     
@@ -1536,13 +1604,15 @@ def cli_bulk_publish_events(base_path, event_ids_str):
         """Process a batch of events for publishing"""
         batch_result = {'success': [], 'failed': []}
         
-        # Find events in this batch
-        events_to_publish, failed_ids = find_events_by_ids(batch_ids, events)
+        # Find events in this batch (id-indexed lookups)
+        events_to_publish, failed_ids = review.find(batch_ids)
+        for event_id in failed_ids:
+            print(f"✗ Event '{event_id}' not found in pending queue")
         batch_result['failed'].extend(failed_ids)
         
         # Publish the batch
         published_count, pub_failed_count, pub_failed_ids = _publish_events_batch(
-            base_path, events_to_publish, events, events_data
+            review, events_to_publish
         )
         
         # Track successes
@@ -1562,12 +1632,7 @@ def cli_bulk_publish_events(base_path, event_ids_str):
     # Save changes if any events were published
     if results['processed'] > 0:
         print("\n💾 Saving changes...")
-        save_events(base_path, events_data)
-        save_pending_events(base_path, pending_data)
-        
-        # Update pending count in events.json
-        from modules.utils import update_pending_count_in_events
-        update_pending_count_in_events(base_path)
+        review.commit()
         
         print("🔄 Updating events in HTML...")
         update_events_in_html(base_path)
@@ -1582,13 +1647,12 @@ def cli_bulk_publish_events(base_path, event_ids_str):
     return 0
 
 
-def _reject_events_batch(base_path, events_to_reject, events):
-    """Reject a batch of events.
+def _reject_events_batch(review, events_to_reject):
+    """Stage a batch of events for rejection.
     
     Args:
-        base_path: Repository root path
-        events_to_reject: List of (index, id, title, source) tuples
-        events: Pending events list (modified in place)
+        review: ReviewBatch the decisions are staged in
+        events_to_reject: List of (id, event) tuples
         
     Returns:
         Tuple of (rejected_count, failed_count, failed_ids)
@@ -1597,14 +1661,10 @@ def _reject_events_batch(base_path, events_to_reject, events):
     failed_count = 0
     failed_ids = []
     
-    for event_index, event_id, event_title, event_source in events_to_reject:
+    for event_id, event in events_to_reject:
         try:
-            # Add to rejected events list
-            add_rejected_event(base_path, event_title, event_source)
-            
-            # Remove from pending (safe because we're removing in reverse order)
-            events.pop(event_index)
-            print(f"✓ Rejected: {event_title} (ID: {event_id})")
+            review.reject(event_id)
+            print(f"✓ Rejected: {event.get('title')} (ID: {event_id})")
             rejected_count += 1
         except Exception as e:
             print(f"✗ Failed to reject '{event_id}': {e}")
@@ -1616,6 +1676,8 @@ def _reject_events_batch(base_path, events_to_reject, events):
 
 def cli_bulk_reject_events(base_path, event_ids_str):
     """CLI: Bulk reject pending events (supports wildcards)"""
+    from modules.review_batch import ReviewBatch
+    
     # Parse comma-separated event IDs/patterns
     patterns = [p.strip() for p in event_ids_str.split(',')]
     
@@ -1623,11 +1685,11 @@ def cli_bulk_reject_events(base_path, event_ids_str):
         print("Error: No event IDs or patterns provided")
         return 1
     
-    pending_data = load_pending_events(base_path)
-    events = pending_data.get('pending_events', [])
+    # All decisions are staged in memory and written once at the end
+    review = ReviewBatch(base_path)
     
     # Expand wildcards
-    event_ids = expand_wildcard_patterns(patterns, events)
+    event_ids = expand_wildcards(patterns, review.events)
     
     if not event_ids:
         print("Error: No events matched the provided patterns")
@@ -1636,46 +1698,21 @@ def cli_bulk_reject_events(base_path, event_ids_str):
     print(f"Bulk rejecting {len(event_ids)} event(s)...")
     print("-" * 80)
     
-    # Find events to reject
-    events_to_reject = []
-    failed_ids = []
-    
-    for event_id in event_ids:
-        # Find event
-        event_index = None
-        event_title = None
-        event_source = None
-        for i, e in enumerate(events):
-            if e.get('id') == event_id:
-                event_index = i
-                event_title = e.get('title')
-                event_source = e.get('source', 'unknown')
-                break
-        
-        if event_index is None:
-            print(f"✗ Event '{event_id}' not found in pending queue")
-            failed_ids.append(event_id)
-        else:
-            events_to_reject.append((event_index, event_id, event_title, event_source))
-    
-    # Sort by index in reverse order
-    events_to_reject.sort(key=lambda x: x[0], reverse=True)
+    # Find events to reject (id-indexed lookups)
+    events_to_reject, failed_ids = review.find(event_ids)
+    for event_id in failed_ids:
+        print(f"✗ Event '{event_id}' not found in pending queue")
     
     # Reject events
     rejected_count, rej_failed_count, rej_failed_ids = _reject_events_batch(
-        base_path, events_to_reject, events
+        review, events_to_reject
     )
     failed_count = len(failed_ids) + rej_failed_count
     failed_ids.extend(rej_failed_ids)
     
-    # Save changes
+    # Save changes (one write per file)
     if rejected_count > 0:
-        save_pending_events(base_path, pending_data)
-        
-        # Update pending count in events.json
-        from modules.utils import update_pending_count_in_events
-        update_pending_count_in_events(base_path)
-        
+        review.commit()
         print(f"\n✓ Added {rejected_count} event(s) to rejected_events.json")
     
     # Summary
@@ -1754,7 +1791,7 @@ def cli_translate_events(base_path, config, args):
     # Load events
     try:
         with open(input_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+            data = fast_json.load(f)
         events = data.get('events', [])
         print(f"Loaded {len(events)} events from {input_file.name}")
     except Exception as e:
@@ -1791,7 +1828,7 @@ def cli_translate_events(base_path, config, args):
     try:
         data['events'] = translated_events
         with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+            fast_json.dump(data, f, ensure_ascii=False, indent=2)
         print(f"\n✓ Saved translated events to {output_file.name}")
     except Exception as e:
         print(f"\n✗ Failed to save events: {e}")
@@ -1824,18 +1861,25 @@ def cli_translate_events(base_path, config, args):
     return 0
 
 
-def cli_generate(base_path, config):
+def cli_generate(base_path, config, force=False, explain=False):
     """
     CLI: Generate static site with inlined HTML.
     
     Creates a self-contained HTML file with all CSS, JS, events, and translations
     embedded. Uses KISS templating (Python .format()) from assets/html/.
+    Outputs whose inputs are unchanged since the last build are skipped.
     
     Output: public/index.html (~313KB single-file HTML)
+    
+    Args:
+        base_path: Repository root path
+        config: Configuration dictionary
+        force: Rebuild every output (--force)
+        explain: Print why each output was rebuilt (--explain)
     """
     print("Generating static site...")
     generator = SiteGenerator(base_path)
-    success = generator.generate_site()
+    success = generator.generate_site(force=force, explain=explain)
     if success:
         print(f"✓ Static site generated successfully!")
         return 0
@@ -2236,6 +2280,16 @@ def cli_cache_stats(base_path):
     
     cache = CacheManager(base_path)
     cache.print_stats()
+    
+    # Parsed-JSON document cache (per process - only covers this command)
+    doc_stats = get_document_cache_stats()
+    print("📄 Document Cache (this process)")
+    print(f"Cache hits:       {doc_stats['hits']}")
+    print(f"Cache misses:     {doc_stats['misses']}")
+    print(f"Invalidations:    {doc_stats['invalidations']}")
+    print(f"Hit rate:         {doc_stats['hit_rate']:.1f}%")
+    print(f"Cached documents: {doc_stats['entries']}")
+    print("=" * 60)
     return 0
 
 
@@ -2273,6 +2327,243 @@ def cli_cache_inspect(base_path, key):
         return 1
 
 
+def cli_store_init(base_path):
+    """Create the SQLite event store and import the JSON snapshots"""
+    from modules.event_store import get_event_store, COLLECTIONS
+    
+    store = get_event_store(base_path, create=True)
+    for collection in COLLECTIONS:
+        store.sync_from_snapshot(collection, force=True)
+    
+    print(f"✅ Event store initialised: {store.db_path.relative_to(base_path)}")
+    return cli_store_stats(base_path)
+
+
+def cli_store_stats(base_path):
+    """Show event store statistics"""
+    from modules.event_store import get_event_store
+    from modules.cache_manager import format_size
+    
+    store = get_event_store(base_path)
+    if store is None:
+        print("ℹ️  Event store not enabled (JSON files only)")
+        print("   Enable with: python3 src/event_manager.py store init")
+        return 0
+    
+    stats = store.get_stats()
+    print("\n" + "=" * 60)
+    print("🗄️  Event Store Statistics")
+    print("=" * 60)
+    print(f"Database:         {stats['db_path']}")
+    print(f"Database size:    {format_size(stats['db_size'])}")
+    for collection, count in stats['collections'].items():
+        print(f"{collection + ':':18s}{count} events")
+    if stats['dirty']:
+        print(f"Not yet exported: {', '.join(stats['dirty'])}")
+    print("=" * 60)
+    return 0
+
+
+def cli_store_export(base_path):
+    """Export JSON snapshots from the event store"""
+    from modules.event_store import get_event_store, COLLECTIONS
+    
+    store = get_event_store(base_path)
+    if store is None:
+        print("❌ Event store not enabled")
+        return 1
+    
+    for collection in COLLECTIONS:
+        path = store.export_snapshot(collection)
+        print(f"✓ Exported {collection} → {path.relative_to(base_path)}")
+    return 0
+
+
+def cli_store_disable(base_path):
+    """Remove the event store database (JSON files stay untouched)"""
+    from modules.event_store import get_event_store, close_event_stores
+    
+    store = get_event_store(base_path)
+    if store is None:
+        print("ℹ️  Event store not enabled")
+        return 0
+    
+    # Make sure the snapshots contain every change before dropping the database
+    store.export_dirty()
+    db_path = store.db_path
+    close_event_stores()
+    for suffix in ('', '-wal', '-shm'):
+        Path(str(db_path) + suffix).unlink(missing_ok=True)
+    
+    print("✅ Event store disabled - using JSON files only")
+    return 0
+
+
+def cli_bench_scrapers(base_path, config, corpus_dir, rounds=3, source_name=None):
+    """Benchmark source parsing and normalization on a recorded HTTP corpus"""
+    from modules.scraper_benchmark import benchmark_sources
+    
+    try:
+        results = benchmark_sources(config, base_path, corpus_dir, rounds=rounds, source_name=source_name)
+    except FileNotFoundError:
+        print(f"Error: No recorded corpus in {corpus_dir}")
+        print(f"Record one with: python3 src/event_manager.py scrape --record {corpus_dir}")
+        return 1
+    
+    print("\n" + "=" * 78)
+    print(f"⏱️  Scraper Benchmark ({corpus_dir}, best of {rounds})")
+    print("=" * 78)
+    print(f"{'Source':26s} {'Events':>7s} {'Parse':>10s} {'Normalize':>10s} {'Events/s':>10s} {'Peak':>10s}")
+    print("-" * 78)
+    for result in results:
+        if result.error:
+            print(f"{result.name[:26]:26s} ⚠ {result.error}")
+            continue
+        print(f"{result.name[:26]:26s} {result.events:7d} {result.parse_ms:8.1f}ms {result.normalize_ms:8.1f}ms "
+              f"{result.events_per_second:10.0f} {result.peak_kb / 1024:8.1f}MB")
+    measured = [r for r in results if not r.error]
+    if measured:
+        total_events = sum(r.events for r in measured)
+        total_ms = sum(r.total_ms for r in measured)
+        print("-" * 78)
+        print(f"{'Total':26s} {total_events:7d} {total_ms:8.1f}ms total "
+              f"({total_events / (total_ms / 1000) if total_ms else 0:.0f} events/s)")
+    print("=" * 78)
+    return 0
+
+
+def cli_backups_stats(base_path):
+    """Show published-event backup archive statistics"""
+    from modules.backup_archive import get_backup_archive
+    from modules.cache_manager import format_size
+    
+    stats = get_backup_archive(base_path).get_stats()
+    print("\n" + "=" * 60)
+    print("📚 Backup Archive Statistics")
+    print("=" * 60)
+    print(f"Directory:        {stats['archive_dir']}")
+    print(f"Segments:         {stats['segments']} ({format_size(stats['segment_bytes'])})")
+    print(f"Indexed backups:  {stats['indexed']} ({stats['unsorted']} not yet compacted)")
+    print(f"Legacy files:     {stats['legacy_files']}")
+    if stats['legacy_files']:
+        print("\n💡 Pack legacy files with: python3 src/event_manager.py backups pack")
+    print("=" * 60)
+    return 0
+
+
+def cli_backups_pack(base_path):
+    """Pack legacy per-event backup files into the segment archive"""
+    from modules.backup_archive import get_backup_archive
+    
+    archive = get_backup_archive(base_path)
+    legacy_count = len(archive.legacy_files())
+    if legacy_count == 0:
+        print("✓ No legacy backup files to pack")
+        return 0
+    
+    print(f"📦 Packing {legacy_count} backup file(s)...")
+    packed = archive.pack_legacy()
+    print(f"✅ Packed {packed} backup(s) into {archive.archive_dir.relative_to(base_path)}")
+    return 0
+
+
+def cli_backups_reindex(base_path):
+    """Rebuild the backup archive index from its segments"""
+    from modules.backup_archive import get_backup_archive
+    
+    count = get_backup_archive(base_path).rebuild_index()
+    print(f"✅ Rebuilt backup index: {count} record(s)")
+    return 0
+
+
+def cli_categorizer_train(base_path, config):
+    """Train the offline category model on the project's categorized events"""
+    import time
+    from modules.category_model import CategoryModel, collect_training_events, DEFAULT_MODEL_PATH
+    
+    model_config = config.get('ai', {}).get('categorization', {}).get('model', {})
+    model_path = base_path / model_config.get('path', DEFAULT_MODEL_PATH)
+    
+    examples = collect_training_events(base_path)
+    print(f"📚 Training on {len(examples)} categorized event(s)...")
+    start = time.perf_counter()
+    try:
+        model = CategoryModel.train(examples, min_examples=int(model_config.get('min_examples', 3)))
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+    model.save(model_path)
+    
+    print(f"✅ Trained in {time.perf_counter() - start:.2f}s → {model_path.relative_to(base_path)}")
+    return cli_categorizer_stats(base_path, config)
+
+
+def cli_categorizer_stats(base_path, config):
+    """Show the trained category model"""
+    from modules.category_model import CategoryModel, DEFAULT_MODEL_PATH
+    
+    model_config = config.get('ai', {}).get('categorization', {}).get('model', {})
+    model = CategoryModel.load(base_path / model_config.get('path', DEFAULT_MODEL_PATH))
+    if model is None:
+        print("ℹ️  No category model trained")
+        print("   Train one with: python3 src/event_manager.py categorizer train")
+        return 0
+    
+    info = model.metadata
+    print("\n" + "=" * 60)
+    print("🧠 Category Model")
+    print("=" * 60)
+    print(f"Trained:          {info.get('trained_at', 'unknown')}")
+    print(f"Examples:         {info.get('examples', 0)}")
+    print(f"Vocabulary:       {info.get('vocabulary', 0)} words")
+    if 'heldout_accuracy' in info:
+        print(f"Held-out acc.:    {info['heldout_accuracy']:.1%}")
+    print(f"Temperature:      {model.temperature:.2f}")
+    print(f"Threshold:        {float(model_config.get('confidence_threshold', 0.75)):.2f}")
+    print("-" * 60)
+    for category, count in sorted(info.get('per_category', {}).items(), key=lambda item: -item[1]):
+        print(f"  {category:20s} {count:6d}")
+    if info.get('skipped_categories'):
+        print(f"Skipped (too few examples): {', '.join(info['skipped_categories'])}")
+    print("=" * 60)
+    return 0
+
+
+def cli_ai_providers_stats(base_path, config):
+    """Show the AI router's per-provider latency, error and circuit statistics"""
+    from datetime import datetime as dt
+    from modules.smart_scraper.ai_providers.router import get_router_stats_path, load_router_stats
+    
+    stats = load_router_stats(base_path)
+    if not stats:
+        print("ℹ️  No AI provider statistics recorded yet")
+        print(f"   They are written to {get_router_stats_path(base_path).relative_to(base_path)} "
+              "by scrape runs and the Telegram bot")
+        return 0
+    
+    hedge = config.get('ai', {}).get('router', {}).get('hedge', {})
+    print("\n" + "=" * 72)
+    print("🤖 AI Providers")
+    print("=" * 72)
+    print(f"{'Provider':14s}{'calls':>7s}{'errors':>8s}{'empty':>7s}{'err %':>7s}"
+          f"{'p50 ms':>8s}{'p95 ms':>8s}{'hedges':>9s}  circuit")
+    print("-" * 72)
+    for name, info in stats.items():
+        p50 = info['p50_ms'] if info['p50_ms'] is not None else '-'
+        p95 = info['p95_ms'] if info['p95_ms'] is not None else '-'
+        circuit = info['circuit']
+        if info['open_until']:
+            circuit += f" until {dt.fromtimestamp(info['open_until']).strftime('%H:%M')}"
+        print(f"{name:14s}{info['calls']:>7d}{info['errors']:>8d}{info['empty']:>7d}{info['error_rate']:>7.1f}"
+              f"{p50:>8}{p95:>8}{info['hedge_wins']:>4d}/{info['hedges']:<4d}  {circuit}")
+    print("-" * 72)
+    print(f"Latencies and error rate over the last {max(info['window'] for info in stats.values())} calls; "
+          f"hedges = won/sent")
+    print(f"Hedging (Telegram bot): {'on' if hedge.get('enabled') else 'off'} (ai.router.hedge.enabled)")
+    print("=" * 72)
+    return 0
+
+
 def cli_icons_mode(base_path, mode=None):
     """Set or show icon mode"""
     if not IconModeTUI:
@@ -2289,7 +2580,7 @@ def cli_icons_mode(base_path, mode=None):
         # Show current mode
         try:
             with open(config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+                config = fast_json.load(f)
             
             current_mode = config.get('icons', {}).get('mode', 'svg-paths')
             
@@ -2344,7 +2635,7 @@ def cli_config_validate(base_path):
     
     try:
         with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+            config = fast_json.load(f)
     except Exception as e:
         print(f"❌ Failed to load config: {e}")
         return 1
@@ -2622,7 +2913,37 @@ def _execute_command(args, base_path, config):
         return 0
     
     if command == 'scrape':
-        return cli_scrape(base_path, config)
+        # Parse --workers flag (parallel source scraping)
+        max_workers = None
+        if args.args and '--workers' in args.args:
+            try:
+                workers_idx = args.args.index('--workers')
+                max_workers = int(args.args[workers_idx + 1])
+            except (ValueError, IndexError):
+                print("Warning: Invalid --workers value, using scraping.concurrency from config.json")
+        use_http_cache = '--no-cache' not in (args.args or [])
+        # Parse --record DIR / --replay DIR (offline HTTP corpus)
+        http_dirs = {}
+        for flag in ('--record', '--replay'):
+            if args.args and flag in args.args:
+                flag_idx = args.args.index(flag)
+                if flag_idx + 1 >= len(args.args):
+                    print(f"Error: {flag} requires a directory")
+                    return 1
+                http_dirs[flag] = args.args[flag_idx + 1]
+        if len(http_dirs) > 1:
+            print("Error: --record and --replay cannot be combined")
+            return 1
+        source_name = None
+        if args.args and '--source' in args.args:
+            source_idx = args.args.index('--source')
+            if source_idx + 1 >= len(args.args):
+                print("Error: --source requires a source name")
+                return 1
+            source_name = args.args[source_idx + 1]
+        return cli_scrape(base_path, config, max_workers=max_workers, use_http_cache=use_http_cache,
+                          record_dir=http_dirs.get('--record'), replay_dir=http_dirs.get('--replay'),
+                          source_name=source_name)
     
     if command == 'diagnose-scraping':
         return cli_diagnose_scraping(base_path, config)
@@ -2666,7 +2987,9 @@ def _execute_command(args, base_path, config):
         return cli_bulk_reject_events(base_path, args.args[0])
     
     if command == 'generate':
-        return cli_generate(base_path, config)
+        return cli_generate(base_path, config,
+                            force='--force' in (args.args or []),
+                            explain='--explain' in (args.args or []))
     
     if command == 'generate-feeds':
         return cli_generate_feeds(base_path)
@@ -2800,7 +3123,7 @@ def _execute_command(args, base_path, config):
         scraper = EventScraper(config, base_path)
         capabilities = scraper.get_scraper_capabilities()
         # Output pure JSON to stdout only
-        print(json.dumps(capabilities, indent=2))
+        print(fast_json.dumps(capabilities, indent=2))
         return 0
     
     # Production Optimization Commands
@@ -2843,6 +3166,79 @@ def _execute_command(args, base_path, config):
             print("Usage: python3 event_manager.py cache [stats|clear|inspect KEY]")
             return 1
     
+    if command == 'bench':
+        # Offline benchmarks
+        if len(args.args or []) < 2 or args.args[0] != 'scrapers':
+            print("Usage: python3 event_manager.py bench scrapers DIR [--rounds N] [--source NAME]")
+            return 1
+        rounds = 3
+        if '--rounds' in args.args:
+            try:
+                rounds = int(args.args[args.args.index('--rounds') + 1])
+            except (ValueError, IndexError):
+                print("Warning: Invalid --rounds value, using 3")
+        source_name = None
+        if '--source' in args.args:
+            source_idx = args.args.index('--source')
+            source_name = args.args[source_idx + 1] if source_idx + 1 < len(args.args) else None
+        return cli_bench_scrapers(base_path, config, args.args[1], rounds=rounds, source_name=source_name)
+    
+    if command == 'categorizer':
+        # Offline category model subcommands
+        subcommand = args.args[0] if args.args else 'stats'
+        
+        if subcommand == 'train':
+            return cli_categorizer_train(base_path, config)
+        elif subcommand == 'stats':
+            return cli_categorizer_stats(base_path, config)
+        else:
+            print(f"Error: Unknown categorizer subcommand '{subcommand}'")
+            print("Usage: python3 event_manager.py categorizer [train|stats]")
+            return 1
+    
+    if command == 'ai-providers':
+        # AI provider router subcommands
+        subcommand = args.args[0] if args.args else 'stats'
+        
+        if subcommand == 'stats':
+            return cli_ai_providers_stats(base_path, config)
+        else:
+            print(f"Error: Unknown ai-providers subcommand '{subcommand}'")
+            print("Usage: python3 event_manager.py ai-providers [stats]")
+            return 1
+    
+    if command == 'backups':
+        # Backup archive subcommands
+        subcommand = args.args[0] if args.args else 'stats'
+        
+        if subcommand == 'stats':
+            return cli_backups_stats(base_path)
+        elif subcommand == 'pack':
+            return cli_backups_pack(base_path)
+        elif subcommand == 'reindex':
+            return cli_backups_reindex(base_path)
+        else:
+            print(f"Error: Unknown backups subcommand '{subcommand}'")
+            print("Usage: python3 event_manager.py backups [stats|pack|reindex]")
+            return 1
+    
+    if command == 'store':
+        # Event store subcommands
+        subcommand = args.args[0] if args.args else 'stats'
+        
+        if subcommand == 'init':
+            return cli_store_init(base_path)
+        elif subcommand == 'stats':
+            return cli_store_stats(base_path)
+        elif subcommand == 'export':
+            return cli_store_export(base_path)
+        elif subcommand == 'disable':
+            return cli_store_disable(base_path)
+        else:
+            print(f"Error: Unknown store subcommand '{subcommand}'")
+            print("Usage: python3 event_manager.py store [init|stats|export|disable]")
+            return 1
+    
     if command == 'icons':
         # Icons subcommands
         if not args.args:
@@ -3277,6 +3673,9 @@ def main():
         import traceback
         traceback.print_exc()
         return 1
+    finally:
+        # Event store changes are written to the JSON snapshots once per command
+        export_event_snapshots(base_path)
 
 
 if __name__ == "__main__":
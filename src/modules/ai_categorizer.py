@@ -5,6 +5,9 @@ Uses local LLM (Ollama) to intelligently categorize scraped events into
 schema-defined categories. Falls back to keyword-based categorization
 if AI is unavailable.
 
+A locally trained model (category_model.py, `categorizer train`) answers
+first when present: only events it is unsure about go to the LLM.
+
 This module provides a KISS approach to AI-powered event categorization:
 - Single responsibility: categorize events
 - Graceful fallback to keyword matching
@@ -16,12 +19,18 @@ Usage:
     
     categorizer = AICategorizer(config, base_path)
     category = categorizer.categorize_event(title, description)
+    
+    # Several events: packed into as few LLM requests as the context allows
+    results = categorizer.categorize_events([(title, description), ...])
 """
 
 import logging
-from typing import Dict, Any, Optional, Tuple, List
+from typing import Dict, Any, Iterator, Optional, Tuple, List
 from pathlib import Path
 
+from .keyword_matcher import KeywordMatcher
+from .category_model import CategoryModel, DEFAULT_MODEL_PATH
+
 logger = logging.getLogger(__name__)
 
 # Keyword to category mapping for fallback categorization
@@ -49,6 +58,34 @@ KEYWORD_CATEGORY_MAP = {
     'community': ['community', 'meetup', 'gathering', 'social event'],  # Generic terms last
 }
 
+# Compiled once: all keywords are found in a single pass over the event text
+KEYWORD_MATCHER = KeywordMatcher(KEYWORD_CATEGORY_MAP)
+KEYWORD_CATEGORY_ORDER = {category: index for index, category in enumerate(KEYWORD_CATEGORY_MAP)}
+
+# Batch categorization: events packed into one prompt per request
+DEFAULT_BATCH_SIZE = 20
+# Trained model answers below this confidence go to the LLM
+DEFAULT_MODEL_THRESHOLD = 0.75
+# Descriptions are cut to this many characters in batch prompts
+BATCH_DESCRIPTION_CHARS = 300
+# Rough token estimate (chars per token) and per-event response allowance
+CHARS_PER_TOKEN = 4
+RESPONSE_TOKENS_PER_EVENT = 30
+
+BATCH_PROMPT = """You are an event categorization assistant. Categorize each of the numbered events below.
+
+{category_guide}
+
+Events:
+{events}
+
+Respond with ONLY a JSON object in this exact format, one entry per event:
+{{"results": [{{"index": 0, "category": "selected_category", "confidence": 0.95}}]}}
+
+Choose the most appropriate category for every event. Use "default" if uncertain."""
+
+CategoryResult = Tuple[str, float, str]
+
 
 class AICategorizer:
     """
@@ -67,9 +104,25 @@ class AICategorizer:
         """
         self.config = config
         self.base_path = base_path
-        self.enabled = config.get('ai', {}).get('categorization', {}).get('enabled', False)
+        categorization_config = config.get('ai', {}).get('categorization', {})
+        self.enabled = categorization_config.get('enabled', False)
         self.ai_provider = None
+        self.model: Optional[CategoryModel] = None
+        model_config = categorization_config.get('model', {})
+        self.model_threshold = float(model_config.get('confidence_threshold', DEFAULT_MODEL_THRESHOLD))
         self.keyword_fallback_enabled = True
+        self.batch_size = max(1, int(config.get('ai', {}).get('categorization', {}).get(
+            'batch_size', DEFAULT_BATCH_SIZE)))
+        # Current batch limit: halved after malformed batch responses,
+        # grows back towards batch_size after good ones
+        self._batch_limit = self.batch_size
+        self.stats = {'requests': 0, 'events': 0, 'splits': 0, 'model': 0}
+        
+        # Trained model is used whenever one exists (AI enabled or not)
+        if model_config.get('enabled', True):
+            self.model = CategoryModel.load(base_path / model_config.get('path', DEFAULT_MODEL_PATH))
+            if self.model:
+                logger.info(f"✓ Category model loaded ({len(self.model.categories)} categories)")
         
         # Initialize AI provider if enabled
         if self.enabled:
@@ -95,8 +148,11 @@ class AICategorizer:
                     }
                 }
             
-            # Initialize provider
+            # Initialize provider (answers are cached across runs)
+            from .smart_scraper.ai_providers.result_cache import get_ai_result_cache
             provider = OllamaProvider(ollama_config)
+            provider.result_cache = get_ai_result_cache(
+                self.base_path, self.config.get('ai', {}).get('result_cache', {}))
             
             if provider.is_available():
                 self.ai_provider = provider
@@ -114,7 +170,7 @@ class AICategorizer:
     
     def categorize_event(self, title: str, description: str = "") -> Tuple[str, float, str]:
         """
-        Categorize an event using AI or keyword fallback.
+        Categorize an event using the trained model, AI or keyword fallback.
         
         Args:
             title: Event title
@@ -124,21 +180,46 @@ class AICategorizer:
             Tuple of (category, confidence, method)
             - category: Selected category string
             - confidence: Confidence score (0.0 to 1.0)
-            - method: Categorization method used ('ai', 'keyword', or 'default')
+            - method: Categorization method used ('model', 'ai', 'keyword', or 'default')
         """
+        # Confident model answers need no LLM request
+        guess = self._categorize_with_model(title, description)
+        if guess and guess[1] >= self.model_threshold:
+            self.stats['model'] += 1
+            return guess
+        
         # Try AI categorization first if available
         if self.enabled and self.ai_provider:
             result = self._categorize_with_ai(title, description)
             if result:
                 return result
         
-        # Fall back to keyword categorization
+        return self._categorize_fallback(title, description, guess)
+    
+    def _categorize_fallback(self, title: str, description: str,
+                             guess: Optional[CategoryResult]) -> CategoryResult:
+        """Keyword match, else the model's low-confidence guess, else default."""
+        # A uniform guess (no known word in the text) says nothing
+        if guess and guess[1] <= 1.0 / len(self.model.categories):
+            guess = None
         if self.keyword_fallback_enabled:
-            return self._categorize_with_keywords(title, description)
+            result = self._categorize_with_keywords(title, description)
+            if result[0] != 'default' or not guess:
+                return result
+        if guess:
+            return guess
         
         # Ultimate fallback
         return 'default', 0.5, 'default'
     
+    def _categorize_with_model(self, title: str, description: str) -> Optional[CategoryResult]:
+        """Categorize with the trained model; None if no model is loaded."""
+        if not self.model:
+            return None
+        category, confidence = self.model.predict(title, description)
+        logger.debug(f"Model categorized as '{category}' (confidence: {confidence:.2f})")
+        return category, confidence, 'model'
+    
     def _categorize_with_ai(self, title: str, description: str) -> Optional[Tuple[str, float, str]]:
         """Categorize using AI (Ollama).
         
@@ -175,6 +256,160 @@ class AICategorizer:
             logger.warning(f"AI categorization failed: {e}")
             return None
     
+    def categorize_events(self, items: List[Tuple[str, str]]) -> List[CategoryResult]:
+        """
+        Categorize several events with as few AI requests as possible.
+        
+        Events are packed into batches that fit the model's context window
+        (at most batch_size events each); the model answers with a JSON array
+        for the whole batch. Batches with a malformed or incomplete answer are
+        split in half and retried; single events that still fail fall back to
+        the per-event path (AI, then keywords). Events the trained model is
+        confident about are not sent at all.
+        
+        Args:
+            items: List of (title, description) tuples
+            
+        Returns:
+            List of (category, confidence, method) tuples, in input order
+        """
+        if not (self.enabled and self.ai_provider) or len(items) < 2 \
+                or not hasattr(self.ai_provider, 'generate_json'):
+            return [self.categorize_event(title, description) for title, description in items]
+        
+        results: List[Optional[CategoryResult]] = [None] * len(items)
+        unsure = []
+        for index, (title, description) in enumerate(items):
+            guess = self._categorize_with_model(title, description)
+            if guess and guess[1] >= self.model_threshold:
+                results[index] = guess
+                self.stats['model'] += 1
+            else:
+                unsure.append(index)
+        
+        if len(unsure) < 2:
+            for index in unsure:
+                results[index] = self.categorize_event(*items[index])
+            return results
+        
+        # Batches are packed over the unsure events only
+        pending = [items[index] for index in unsure]
+        pending_results: List[Optional[CategoryResult]] = [None] * len(pending)
+        for batch in self._pack_batches(pending):
+            self._categorize_batch(pending, batch, pending_results)
+        for index, result in zip(unsure, pending_results):
+            results[index] = result
+        return results
+    
+    def _event_line(self, index: int, title: str, description: str) -> str:
+        description = ' '.join((description or '').split())[:BATCH_DESCRIPTION_CHARS]
+        return f"[{index}] Title: {title}\n    Description: {description}"
+    
+    def _pack_batches(self, items: List[Tuple[str, str]]) -> Iterator[List[int]]:
+        """
+        Greedily group item indices into batches that fit the context window.
+        
+        Batches are produced lazily, so each one is sized with the batch
+        limit as adapted by the previous batches.
+        """
+        context_window = getattr(self.ai_provider, 'context_window', 4096)
+        overhead = len(self._build_batch_prompt('')) // CHARS_PER_TOKEN
+        budget = max(context_window - overhead, 0)
+        
+        batch, used = [], 0
+        for index, (title, description) in enumerate(items):
+            cost = (len(self._event_line(index, title, description)) // CHARS_PER_TOKEN
+                    + RESPONSE_TOKENS_PER_EVENT)
+            if batch and (used + cost > budget or len(batch) >= self._batch_limit):
+                yield batch
+                batch, used = [], 0
+            batch.append(index)
+            used += cost
+        if batch:
+            yield batch
+    
+    def _build_batch_prompt(self, events: str) -> str:
+        from .smart_scraper.ai_providers.ollama import CATEGORY_GUIDE
+        return BATCH_PROMPT.format(category_guide=CATEGORY_GUIDE, events=events)
+    
+    def _categorize_batch(self, items: List[Tuple[str, str]], batch: List[int],
+                          results: List[Optional[CategoryResult]]) -> None:
+        """Categorize one batch into results, splitting it on bad answers."""
+        if len(batch) == 1:
+            title, description = items[batch[0]]
+            results[batch[0]] = self.categorize_event(title, description)
+            return
+        
+        # Prompt positions are 0..n-1 within the batch
+        lines = [self._event_line(position, *items[index]) for position, index in enumerate(batch)]
+        prompt = self._build_batch_prompt('\n'.join(lines))
+        timeout = getattr(self.ai_provider, 'timeout', 30) * (1 + len(batch) / 10)
+        self.stats['requests'] += 1
+        try:
+            response = self.ai_provider.generate_json(prompt, timeout=timeout)
+        except Exception as e:
+            logger.warning(f"AI batch categorization failed: {e}")
+            response = None
+        
+        answers = self._parse_batch_response(response, len(batch))
+        missing = []
+        for position, index in enumerate(batch):
+            if position in answers:
+                results[index] = answers[position]
+                self.stats['events'] += 1
+            else:
+                missing.append(index)
+        
+        if not missing:
+            self._batch_limit = min(self.batch_size, self._batch_limit + 2)
+            return
+        
+        if len(missing) == len(batch):
+            # Nothing usable: most likely the batch was too much for the model
+            self._batch_limit = max(1, len(batch) // 2)
+            self.stats['splits'] += 1
+            logger.debug(f"Malformed AI batch response, splitting {len(batch)} events")
+            middle = len(batch) // 2
+            self._categorize_batch(items, batch[:middle], results)
+            self._categorize_batch(items, batch[middle:], results)
+        else:
+            self._categorize_batch(items, missing, results)
+    
+    def _parse_batch_response(self, response: Any, count: int) -> Dict[int, CategoryResult]:
+        """
+        Map batch positions to results from a model answer.
+        
+        Accepts {"results": [...]} or a bare list; entries with a missing or
+        out-of-range index are ignored.
+        """
+        from .event_schema import EVENT_CATEGORIES
+        
+        if isinstance(response, dict):
+            response = response.get('results')
+        if not isinstance(response, list):
+            return {}
+        
+        answers = {}
+        for entry in response:
+            if not isinstance(entry, dict):
+                continue
+            try:
+                position = int(entry.get('index'))
+                confidence = float(entry.get('confidence', 0.8))
+            except (TypeError, ValueError):
+                continue
+            if not 0 <= position < count or position in answers:
+                continue
+            category = entry.get('category')
+            if not isinstance(category, str):
+                continue
+            if category not in EVENT_CATEGORIES:
+                logger.warning(f"AI returned invalid category '{category}', using default")
+                answers[position] = ('default', 0.5, 'ai')
+            else:
+                answers[position] = (category, confidence, 'ai')
+        return answers
+    
     def _categorize_with_keywords(self, title: str, description: str) -> Tuple[str, float, str]:
         """Categorize using keyword matching (fallback method).
         
@@ -209,13 +444,14 @@ class AICategorizer:
         Returns:
             List of (category, score) tuples sorted by score descending
         """
-        scores = []
-        for category, keywords in KEYWORD_CATEGORY_MAP.items():
-            match_count = sum(1 for keyword in keywords if keyword in text)
-            if match_count > 0:
-                score = match_count / len(keywords)
-                scores.append((category, score))
+        # One pass over the text for all keywords (see keyword_matcher.py)
+        scores = [
+            (category, match_count / len(KEYWORD_CATEGORY_MAP[category]))
+            for category, match_count in KEYWORD_MATCHER.count(text).items()
+        ]
         
+        # Ties keep map order (priority), as sorted() is stable
+        scores.sort(key=lambda x: KEYWORD_CATEGORY_ORDER[x[0]])
         return sorted(scores, key=lambda x: x[1], reverse=True)
     
     def is_available(self) -> bool:
@@ -237,6 +473,10 @@ class AICategorizer:
             'ai_available': self.ai_provider is not None if self.enabled else False,
             'provider': 'ollama' if self.ai_provider else None,
             'fallback_enabled': self.keyword_fallback_enabled,
+            'batch_size': self.batch_size,
+            'batch_stats': dict(self.stats),
+            'model': dict(self.model.metadata) if self.model else None,
+            'model_threshold': self.model_threshold,
         }
 
 
@@ -23,6 +23,11 @@ import logging
 from datetime import datetime, timedelta
 from pathlib import Path
 
+try:
+    from . import fast_json
+except ImportError:
+    import fast_json  # Running as a script from src/modules/
+
 logger = logging.getLogger(__name__)
 
 
@@ -72,7 +77,7 @@ class EventArchiver:
         if filepath.exists():
             try:
                 with open(filepath, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                    return fast_json.load(f)
             except json.JSONDecodeError:
                 logger.error(f"Corrupt archive: {filename}")
         
@@ -83,7 +88,7 @@ class EventArchiver:
         filepath = self.archive_path / filename
         data['last_updated'] = datetime.now().isoformat()
         with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+            fast_json.dump(data, f, indent=2, ensure_ascii=False)
         logger.info(f"Saved {filename}: {len(data.get('archived_events', []))} events")
     
     def archive_events(self, dry_run=False):
@@ -103,7 +108,7 @@ class EventArchiver:
         events_path = self.base_path / 'assets' / 'json' / 'events.json'
         try:
             with open(events_path, 'r', encoding='utf-8') as f:
-                events_data = json.load(f)
+                events_data = fast_json.load(f)
         except (FileNotFoundError, json.JSONDecodeError) as e:
             logger.error(f"Cannot load events: {e}")
             return {'error': str(e), 'archived_count': 0}
@@ -132,7 +137,7 @@ class EventArchiver:
             events_data['events'] = active_events
             events_data['last_updated'] = datetime.now().isoformat()
             with open(events_path, 'w', encoding='utf-8') as f:
-                json.dump(events_data, f, indent=2, ensure_ascii=False)
+                fast_json.dump(events_data, f, indent=2, ensure_ascii=False)
             
             logger.info(f"Archived {len(to_archive)}, {len(active_events)} remain active")
         
@@ -184,7 +189,7 @@ class EventArchiver:
         for archive_file in sorted(self.archive_path.glob('*.json')):
             try:
                 with open(archive_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                    data = fast_json.load(f)
                 archives.append({
                     'filename': archive_file.name,
                     'period': archive_file.stem,
@@ -0,0 +1,498 @@
+"""
+Backup Archive Module
+
+Packed, append-only storage for published-event backups in assets/json/old/.
+
+Every published event used to be written to its own JSON file, and every
+scrape globbed and parsed all of them for deduplication. The archive stores
+backups as JSON-lines segment files plus a compact binary index of
+(title, start_time) and id hashes with segment offsets, so a dedup check is a
+binary search over a memory-mapped index - no event bodies are parsed.
+
+Layout (assets/json/old/):
+- backups-000001.jsonl ...  Append-only segments, one backup record per line
+- backups.idx               Sorted index: header + fixed 32-byte records
+- backups.log               Unsorted index records appended since last compaction
+- *.json                    Legacy per-event backups (packed with `backups pack`)
+
+Usage:
+    from modules.backup_archive import get_backup_archive
+
+    archive = get_backup_archive(base_path)
+    archive.append(event)
+    if archive.contains_key(event['title'], event['start_time']):
+        ...
+"""
+
+import hashlib
+import json
+import logging
+import mmap
+import struct
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from . import fast_json
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_PREFIX = 'backups-'
+SEGMENT_SUFFIX = '.jsonl'
+INDEX_FILE = 'backups.idx'
+LOG_FILE = 'backups.log'
+
+# Index header: magic, record count, segment bytes covered by idx + log
+HEADER = struct.Struct('<8sQQ')
+MAGIC = b'KRWLBAK1'
+# Index record: key hash, id hash, segment number, record length, byte offset
+RECORD = struct.Struct('<QQIIQ')
+
+DEFAULT_SEGMENT_MAX_BYTES = 4 * 1024 * 1024
+DEFAULT_LOG_MAX_RECORDS = 1024
+
+
+def _hash(text: str) -> int:
+    """Stable 64-bit hash (Python's hash() is salted per process)."""
+    return int.from_bytes(hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def key_hash(title: Optional[str], start_time: Optional[str]) -> int:
+    """Hash of the (title, start_time) deduplication key."""
+    return _hash(f"{title or ''}\x1f{start_time or ''}")
+
+
+def id_hash(event_id: Optional[str]) -> int:
+    """Hash of an event id."""
+    return _hash(str(event_id or ''))
+
+
+class BackupArchive:
+    """Append-only segment archive with a memory-mapped key index."""
+
+    def __init__(self, base_path: Path, archive_dir: Optional[Path] = None,
+                 segment_max_bytes: int = DEFAULT_SEGMENT_MAX_BYTES,
+                 log_max_records: int = DEFAULT_LOG_MAX_RECORDS):
+        """
+        Initialize backup archive.
+
+        Args:
+            base_path: Root path of the repository
+            archive_dir: Archive directory (default: assets/json/old)
+            segment_max_bytes: Start a new segment once the current one is this big
+            log_max_records: Merge the unsorted log into the index after this many appends
+        """
+        self.base_path = Path(base_path)
+        self.archive_dir = Path(archive_dir) if archive_dir else self.base_path / 'assets' / 'json' / 'old'
+        self.segment_max_bytes = segment_max_bytes
+        self.log_max_records = log_max_records
+
+        self._lock = threading.RLock()
+        self._index_file = None
+        self._index_map = None
+        self._index_count = 0
+        self._index_covered = 0
+        self._log_records: List[Tuple[int, int, int, int, int]] = []
+        self._legacy_keys = None
+        self._loaded = False
+
+    # ------------------------------------------------------------------
+    # Paths
+    # ------------------------------------------------------------------
+
+    @property
+    def index_path(self) -> Path:
+        return self.archive_dir / INDEX_FILE
+
+    @property
+    def log_path(self) -> Path:
+        return self.archive_dir / LOG_FILE
+
+    def segment_path(self, number: int) -> Path:
+        return self.archive_dir / f"{SEGMENT_PREFIX}{number:06d}{SEGMENT_SUFFIX}"
+
+    def _segment_numbers(self) -> List[int]:
+        if not self.archive_dir.exists():
+            return []
+        numbers = []
+        for path in self.archive_dir.glob(f"{SEGMENT_PREFIX}*{SEGMENT_SUFFIX}"):
+            try:
+                numbers.append(int(path.stem[len(SEGMENT_PREFIX):]))
+            except ValueError:
+                continue
+        return sorted(numbers)
+
+    def _segment_bytes(self) -> int:
+        return sum(self.segment_path(n).stat().st_size for n in self._segment_numbers())
+
+    def legacy_files(self) -> List[Path]:
+        """Per-event backup files written before the archive existed."""
+        if not self.archive_dir.exists():
+            return []
+        return sorted(self.archive_dir.glob('*.json'))
+
+    # ------------------------------------------------------------------
+    # Index handling
+    # ------------------------------------------------------------------
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._open_index()
+        covered = self._index_covered + sum(r[3] for r in self._log_records)
+        if covered != self._segment_bytes():
+            logger.info("Backup archive index out of date - rebuilding")
+            self.rebuild_index()
+        self._loaded = True
+
+    def _close_index(self) -> None:
+        if self._index_map is not None:
+            self._index_map.close()
+            self._index_map = None
+        if self._index_file is not None:
+            self._index_file.close()
+            self._index_file = None
+        self._index_count = 0
+        self._index_covered = 0
+
+    def _open_index(self) -> None:
+        self._close_index()
+        self._log_records = []
+
+        if self.index_path.exists() and self.index_path.stat().st_size >= HEADER.size:
+            self._index_file = open(self.index_path, 'rb')
+            self._index_map = mmap.mmap(self._index_file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, count, covered = HEADER.unpack_from(self._index_map, 0)
+            if magic != MAGIC or HEADER.size + count * RECORD.size > len(self._index_map):
+                logger.warning(f"Ignoring invalid backup index: {self.index_path}")
+                self._close_index()
+            else:
+                self._index_count = count
+                self._index_covered = covered
+
+        if self.log_path.exists():
+            data = self.log_path.read_bytes()
+            usable = len(data) - len(data) % RECORD.size
+            self._log_records = [rec for rec in RECORD.iter_unpack(data[:usable])]
+
+    def _write_index(self, records: List[Tuple[int, int, int, int, int]], covered: int) -> None:
+        """Atomically write a sorted index and truncate the log."""
+        records = sorted(records)
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_suffix('.idx.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, len(records), covered))
+            for record in records:
+                f.write(RECORD.pack(*record))
+        self._close_index()
+        tmp_path.replace(self.index_path)
+        self.log_path.unlink(missing_ok=True)
+        self._open_index()
+
+    def _index_records(self) -> List[Tuple[int, int, int, int, int]]:
+        if self._index_map is None:
+            return []
+        return list(RECORD.iter_unpack(
+            self._index_map[HEADER.size:HEADER.size + self._index_count * RECORD.size]
+        ))
+
+    def rebuild_index(self) -> int:
+        """
+        Rebuild the index by scanning all segments.
+
+        Returns:
+            Number of indexed backup records
+        """
+        with self._lock:
+            records = []
+            covered = 0
+            for number in self._segment_numbers():
+                offset = 0
+                with open(self.segment_path(number), 'rb') as f:
+                    for line in f:
+                        length = len(line)
+                        try:
+                            event = fast_json.loads(line).get('event') or {}
+                            records.append((
+                                key_hash(event.get('title'), event.get('start_time')),
+                                id_hash(event.get('id')), number, length, offset
+                            ))
+                        except (json.JSONDecodeError, AttributeError):
+                            logger.warning(f"Skipping corrupt backup record in segment {number} at {offset}")
+                        offset += length
+                covered += offset
+            self._write_index(records, covered)
+            return len(records)
+
+    def compact(self) -> None:
+        """Merge the unsorted log into the sorted index."""
+        with self._lock:
+            self._ensure_loaded()
+            if not self._log_records:
+                return
+            covered = self._index_covered + sum(r[3] for r in self._log_records)
+            self._write_index(self._index_records() + self._log_records, covered)
+
+    def _find(self, column: int, value: int) -> List[Tuple[int, int, int, int, int]]:
+        """Find index records whose column (0=key hash, 1=id hash) equals value."""
+        matches = []
+        if column == 0 and self._index_map is not None:
+            # Binary search over the memory-mapped, key-sorted records
+            lo, hi = 0, self._index_count
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if struct.unpack_from('<Q', self._index_map, HEADER.size + mid * RECORD.size)[0] < value:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            while lo < self._index_count:
+                record = RECORD.unpack_from(self._index_map, HEADER.size + lo * RECORD.size)
+                if record[0] != value:
+                    break
+                matches.append(record)
+                lo += 1
+        elif self._index_map is not None:
+            matches.extend(r for r in self._index_records() if r[column] == value)
+        matches.extend(r for r in self._log_records if r[column] == value)
+        return matches
+
+    def _read_record(self, record: Tuple[int, int, int, int, int]) -> Dict[str, Any]:
+        _, _, number, length, offset = record
+        with open(self.segment_path(number), 'rb') as f:
+            f.seek(offset)
+            return fast_json.loads(f.read(length))
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def append(self, event: Dict[str, Any], backed_up_at: Optional[str] = None) -> Path:
+        """
+        Append a backup record for a published event.
+
+        Args:
+            event: Event dictionary to back up
+            backed_up_at: Optional backup timestamp (default: now)
+
+        Returns:
+            Path to the segment file the record was written to
+        """
+        return self.append_many([event], backed_up_at=backed_up_at)
+
+    def append_many(self, events: List[Dict[str, Any]], backed_up_at: Optional[str] = None) -> Path:
+        """
+        Append backup records for several published events.
+
+        All records go to the current segment in one write, and their index
+        records to the log in one write (a batch may push a segment past
+        segment_max_bytes; the next append starts a new one).
+
+        Args:
+            events: Event dictionaries to back up
+            backed_up_at: Optional backup timestamp (default: now)
+
+        Returns:
+            Path to the segment file the records were written to
+        """
+        with self._lock:
+            self._ensure_loaded()
+            self.archive_dir.mkdir(parents=True, exist_ok=True)
+
+            numbers = self._segment_numbers()
+            number = numbers[-1] if numbers else 1
+            segment = self.segment_path(number)
+            if segment.exists() and segment.stat().st_size >= self.segment_max_bytes:
+                number += 1
+                segment = self.segment_path(number)
+
+            backed_up_at = backed_up_at or datetime.now().isoformat()
+            lines = [
+                (fast_json.dumps({'backed_up_at': backed_up_at, 'event': event},
+                                 ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
+                for event in events
+            ]
+
+            with open(segment, 'ab') as f:
+                offset = f.tell()
+                f.write(b''.join(lines))
+
+            index_records = []
+            for event, line in zip(events, lines):
+                index_records.append((
+                    key_hash(event.get('title'), event.get('start_time')),
+                    id_hash(event.get('id')), number, len(line), offset
+                ))
+                offset += len(line)
+            with open(self.log_path, 'ab') as f:
+                f.write(b''.join(RECORD.pack(*record) for record in index_records))
+            self._log_records.extend(index_records)
+
+            if len(self._log_records) >= self.log_max_records:
+                self.compact()
+            return segment
+
+    def contains_key(self, title: Optional[str], start_time: Optional[str]) -> bool:
+        """Check whether an event with this (title, start_time) was ever published."""
+        with self._lock:
+            self._ensure_loaded()
+            if self._find(0, key_hash(title, start_time)):
+                return True
+            return (title, start_time) in self._get_legacy_keys()
+
+    def get_by_key(self, title: Optional[str], start_time: Optional[str]) -> List[Dict[str, Any]]:
+        """Get all backed-up events with this (title, start_time) key."""
+        with self._lock:
+            self._ensure_loaded()
+            events = []
+            for record in self._find(0, key_hash(title, start_time)):
+                event = self._read_record(record).get('event') or {}
+                # Guard against (very unlikely) 64-bit hash collisions
+                if event.get('title') == title and event.get('start_time') == start_time:
+                    events.append(event)
+            return events
+
+    def get_by_id(self, event_id: str) -> List[Dict[str, Any]]:
+        """Get all backup records (with backed_up_at) for an event id."""
+        with self._lock:
+            self._ensure_loaded()
+            records = [self._read_record(r) for r in self._find(1, id_hash(event_id))]
+            return [r for r in records if (r.get('event') or {}).get('id') == event_id]
+
+    def iter_events(self) -> Iterator[Dict[str, Any]]:
+        """Iterate all backed-up events (segments first, then legacy files)."""
+        for number in self._segment_numbers():
+            with open(self.segment_path(number), 'rb') as f:
+                for line in f:
+                    try:
+                        event = fast_json.loads(line).get('event')
+                    except json.JSONDecodeError:
+                        continue
+                    if event:
+                        yield event
+        for backup_file in self.legacy_files():
+            event = self._load_legacy_file(backup_file).get('event')
+            if event:
+                yield event
+
+    def iter_segment_events(self, offsets: Dict[int, int]) -> Iterator[Tuple[int, int, Dict[str, Any]]]:
+        """
+        Iterate segment events appended after known per-segment byte offsets.
+
+        Segments are append-only, so consumers that mirror the archive (e.g.
+        the near-duplicate index) only need to read what was added since their
+        last sync. Legacy per-event files are not included.
+
+        Args:
+            offsets: Segment number -> bytes already consumed (missing = 0)
+
+        Yields:
+            (segment number, byte offset after the record, event)
+        """
+        for number in self._segment_numbers():
+            path = self.segment_path(number)
+            start = offsets.get(number, 0)
+            if start >= path.stat().st_size:
+                continue
+            with open(path, 'rb') as f:
+                f.seek(start)
+                offset = start
+                for line in f:
+                    offset += len(line)
+                    if not line.endswith(b'\n'):
+                        # Record still being written - pick it up next sync
+                        break
+                    try:
+                        event = fast_json.loads(line).get('event')
+                    except json.JSONDecodeError:
+                        continue
+                    if event:
+                        yield number, offset, event
+
+    def _load_legacy_file(self, backup_file: Path) -> Dict[str, Any]:
+        try:
+            with open(backup_file, 'r') as f:
+                return fast_json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"Could not load backup file {backup_file}: {e}")
+            return {}
+
+    def _get_legacy_keys(self) -> set:
+        """Dedup keys of unpacked legacy files (empty once packed)."""
+        if self._legacy_keys is None:
+            self._legacy_keys = set()
+            for backup_file in self.legacy_files():
+                event = self._load_legacy_file(backup_file).get('event') or {}
+                self._legacy_keys.add((event.get('title'), event.get('start_time')))
+        return self._legacy_keys
+
+    def pack_legacy(self, delete: bool = True) -> int:
+        """
+        Migrate per-event backup files into the archive.
+
+        Files are appended in backup order (backed_up_at, then filename) and
+        removed afterwards unless delete is False.
+
+        Returns:
+            Number of packed backups
+        """
+        with self._lock:
+            backups = []
+            for backup_file in self.legacy_files():
+                data = self._load_legacy_file(backup_file)
+                if data.get('event'):
+                    backups.append((data.get('backed_up_at') or '', backup_file.name, backup_file, data))
+
+            backups.sort(key=lambda item: (item[0], item[1]))
+            for backed_up_at, _, _, data in backups:
+                self.append(data['event'], backed_up_at=backed_up_at or None)
+            self.compact()
+
+            if delete:
+                for _, _, backup_file, _ in backups:
+                    backup_file.unlink()
+            self._legacy_keys = None
+            return len(backups)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get archive statistics."""
+        with self._lock:
+            self._ensure_loaded()
+            numbers = self._segment_numbers()
+            return {
+                'archive_dir': str(self.archive_dir),
+                'segments': len(numbers),
+                'segment_bytes': self._segment_bytes(),
+                'indexed': self._index_count + len(self._log_records),
+                'unsorted': len(self._log_records),
+                'legacy_files': len(self.legacy_files()),
+            }
+
+    def close(self) -> None:
+        """Release the memory-mapped index."""
+        with self._lock:
+            self._close_index()
+            self._log_records = []
+            self._loaded = False
+
+
+# One archive per repository root and process
+_archives: Dict[str, BackupArchive] = {}
+_archives_lock = threading.Lock()
+
+
+def get_backup_archive(base_path: Path) -> BackupArchive:
+    """Get the shared BackupArchive for a repository root."""
+    key = str(Path(base_path).resolve())
+    with _archives_lock:
+        if key not in _archives:
+            _archives[key] = BackupArchive(base_path)
+        return _archives[key]
+
+
+def close_backup_archives() -> None:
+    """Close all shared archives (mainly for tests)."""
+    with _archives_lock:
+        for archive in _archives.values():
+            archive.close()
+        _archives.clear()
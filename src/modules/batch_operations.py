@@ -7,6 +7,7 @@ Each function does one thing well.
 
 import fnmatch
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +16,9 @@ def expand_wildcards(patterns, events):
     """
     Expand wildcard patterns to match event IDs
     
+    All wildcard patterns are compiled into one matcher, so the events are
+    scanned once no matter how many patterns are given.
+    
     Args:
         patterns: List of patterns (can include wildcards)
         events: List of events with 'id' field
@@ -22,48 +26,65 @@ def expand_wildcards(patterns, events):
     Returns:
         List of expanded event IDs (no duplicates)
     """
+    patterns = [pattern.strip() for pattern in patterns if pattern.strip()]
+    wildcards = [(i, pattern) for i, pattern in enumerate(patterns) if _is_wildcard(pattern)]
+    matches = {i: [] for i, _ in wildcards}
+    
+    if wildcards:
+        matcher = compile_wildcards(wildcards)
+        for event in events:
+            event_id = event.get('id') or ''
+            match = matcher.match(event_id)
+            if match:
+                # The first pattern (in argument order) that matches wins
+                matches[int(match.lastgroup[1:])].append(event_id)
+    
     expanded_ids = []
     seen_ids = set()
-    
-    for pattern in patterns:
-        pattern = pattern.strip()
-        if not pattern:
+    for i, pattern in enumerate(patterns):
+        if i not in matches:
+            _add_ids([pattern], expanded_ids, seen_ids)
             continue
-        
-        if _is_wildcard(pattern):
-            _add_wildcard_matches(pattern, events, expanded_ids, seen_ids)
-        else:
-            _add_exact_id(pattern, expanded_ids, seen_ids)
+        if not matches[i] and not _matches_any(pattern, events):
+            logger.warning(f"Pattern '{pattern}' matched no events")
+            print(f"⚠ Warning: Pattern '{pattern}' matched no events")
+        _add_ids(matches[i], expanded_ids, seen_ids)
     
     return expanded_ids
 
 
+def compile_wildcards(indexed_patterns):
+    """
+    Compile wildcard patterns into one regular expression
+    
+    Args:
+        indexed_patterns: List of (index, pattern) tuples
+        
+    Returns:
+        Compiled regex; the group name of a match is 'p<index>' of the
+        first pattern that matches
+    """
+    return re.compile('|'.join(
+        f'(?P<p{i}>{fnmatch.translate(pattern)})' for i, pattern in indexed_patterns
+    ))
+
+
 def _is_wildcard(pattern):
     """Check if pattern contains wildcards"""
     return '*' in pattern or '?' in pattern or '[' in pattern
 
 
-def _add_wildcard_matches(pattern, events, expanded_ids, seen_ids):
-    """Add events matching wildcard pattern"""
-    matches_found = False
-    for event in events:
-        event_id = event.get('id', '')
-        if fnmatch.fnmatch(event_id, pattern):
-            matches_found = True
-            if event_id not in seen_ids:
-                expanded_ids.append(event_id)
-                seen_ids.add(event_id)
-    
-    if not matches_found:
-        logger.warning(f"Pattern '{pattern}' matched no events")
-        print(f"⚠ Warning: Pattern '{pattern}' matched no events")
+def _matches_any(pattern, events):
+    """Check if a pattern matches any event (even one claimed by an earlier pattern)"""
+    return any(fnmatch.fnmatchcase(event.get('id') or '', pattern) for event in events)
 
 
-def _add_exact_id(pattern, expanded_ids, seen_ids):
-    """Add exact event ID"""
-    if pattern not in seen_ids:
-        expanded_ids.append(pattern)
-        seen_ids.add(pattern)
+def _add_ids(event_ids, expanded_ids, seen_ids):
+    """Add event IDs that were not added yet"""
+    for event_id in event_ids:
+        if event_id not in seen_ids:
+            expanded_ids.append(event_id)
+            seen_ids.add(event_id)
 
 
 def process_in_batches(items, batch_size=10, callback=None):
@@ -164,14 +185,20 @@ def find_events_by_ids(event_ids, events):
     Returns:
         Tuple of (found_events, failed_ids)
     """
+    # One pass to index positions instead of a linear search per ID
+    positions = {}
+    for i, event in enumerate(events):
+        positions.setdefault(event.get('id'), i)
+    
     found_events = []
     failed_ids = []
     
     for event_id in event_ids:
-        event_data = _find_event(event_id, events)
-        if event_data:
-            found_events.append(event_data)
+        index = positions.get(event_id)
+        if index is not None:
+            found_events.append((index, event_id, events[index]))
         else:
+            logger.warning(f"Event '{event_id}' not found")
             failed_ids.append(event_id)
     
     # Sort by index in reverse for safe removal
@@ -180,16 +207,6 @@ def find_events_by_ids(event_ids, events):
     return found_events, failed_ids
 
 
-def _find_event(event_id, events):
-    """Find single event by ID"""
-    for i, event in enumerate(events):
-        if event.get('id') == event_id:
-            return (i, event_id, event)
-    
-    logger.warning(f"Event '{event_id}' not found")
-    return None
-
-
 def determine_batch_size(total_count):
     """
     Determine optimal batch size
@@ -0,0 +1,307 @@
+"""
+Incremental Build Graph
+
+Lets SiteGenerator rebuild only the outputs whose inputs changed. Every
+node (index.html with its lint report, 404.html, RSS feeds, ...) records the
+content hashes of its inputs and outputs in a build manifest; the next build
+compares them and runs only the stale nodes.
+
+Features:
+- File inputs: files, directories (recursive) or glob patterns relative to
+  the repository root, hashed by content (BLAKE2b)
+- Value inputs: computed inputs such as the loaded configuration or the
+  events visible right now, hashed as JSON - covers what is not a file
+  (environment overrides, the current time, the git commit)
+- Outputs are hashed as well: a deleted or hand-edited output is rebuilt
+- File hashes are reused while a file's size and mtime are unchanged, so a
+  no-op build only stats the inputs
+- Reasons per node ("input changed: assets/css/map.css", "output missing:
+  public/404.html", ...) for `generate --explain`
+- Manifest in .cache/build_manifest.json
+
+Nodes run in the order they were added; a node that reads the outputs of
+another one (e.g. copying the generated feeds) is added after it.
+
+Usage:
+    from modules.build_graph import BuildGraph, BuildNode
+
+    graph = BuildGraph(base_path)
+    graph.add(BuildNode('404.html', build=write_404, outputs=['public/404.html'],
+                        files=['src/modules/site_generator.py']))
+    report = graph.run()
+    for name, reasons in report.reasons.items():
+        print(name, reasons)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    from . import fast_json
+except ImportError:
+    import fast_json  # Running as a script from src/modules/
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+
+# Reasons listed per input before "... and N more"
+MAX_REASONS = 5
+
+
+def hash_bytes(data: bytes) -> str:
+    """Content hash used in the manifest"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def hash_value(value: Any) -> str:
+    """Hash of a JSON-serializable value (keys sorted, other types via str())"""
+    return hash_bytes(json.dumps(value, sort_keys=True, default=str, ensure_ascii=False).encode('utf-8'))
+
+
+@dataclass
+class BuildNode:
+    """One build step and the inputs it depends on."""
+
+    name: str
+    build: Callable[[], Any]  # Returns False on failure (nothing is recorded)
+    outputs: List[str]  # Files or glob patterns relative to the repository root
+    files: List[str] = field(default_factory=list)  # Input files, directories or glob patterns
+    values: Dict[str, Callable[[], Any]] = field(default_factory=dict)  # Computed inputs
+
+
+@dataclass
+class BuildReport:
+    """Outcome of BuildGraph.run()."""
+
+    built: List[str] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)  # Up to date
+    failed: List[str] = field(default_factory=list)
+    reasons: Dict[str, List[str]] = field(default_factory=dict)  # Why each node was (re)built
+    duration: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
+
+
+class BuildGraph:
+    """Build nodes with content-hash staleness checks and a persistent manifest"""
+
+    def __init__(self, base_path: Path, manifest_file: str = '.cache/build_manifest.json'):
+        """
+        Initialize build graph.
+
+        Args:
+            base_path: Repository root (inputs and outputs are relative to it)
+            manifest_file: Manifest path relative to base_path
+        """
+        self.base_path = Path(base_path)
+        self.manifest_file = self.base_path / manifest_file
+        self.nodes: List[BuildNode] = []
+        self._manifest = self._load_manifest()
+        # rel path -> [mtime_ns, size, hash] from the last build
+        self._file_hashes: Dict[str, list] = self._manifest.get('files', {})
+        self._dirty = False
+
+    def add(self, node: BuildNode) -> BuildNode:
+        """Add a node (runs after the nodes added before it)"""
+        self.nodes.append(node)
+        return node
+
+    # ------------------------------------------------------------------
+    # Manifest
+    # ------------------------------------------------------------------
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        try:
+            manifest = fast_json.read_json(self.manifest_file)
+        except FileNotFoundError:
+            return {'version': MANIFEST_VERSION, 'nodes': {}, 'files': {}}
+        except (fast_json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Build manifest unreadable, rebuilding everything: {e}")
+            return {'version': MANIFEST_VERSION, 'nodes': {}, 'files': {}}
+        if not isinstance(manifest, dict) or manifest.get('version') != MANIFEST_VERSION:
+            return {'version': MANIFEST_VERSION, 'nodes': {}, 'files': {}}
+        return manifest
+
+    def flush(self):
+        """Write the manifest if a node was recorded"""
+        if not self._dirty:
+            return
+        self.manifest_file.parent.mkdir(parents=True, exist_ok=True)
+        # Keep stat entries of files that are still inputs or outputs of a node
+        used = set()
+        for entry in self._manifest['nodes'].values():
+            used.update(path for path in entry.get('inputs', {}) if not path.startswith('value:'))
+            used.update(entry.get('outputs', {}))
+        self._manifest['files'] = {path: stat for path, stat in self._file_hashes.items() if path in used}
+        tmp_file = self.manifest_file.with_suffix('.tmp')
+        fast_json.write_json(tmp_file, self._manifest, indent=2)
+        os.replace(tmp_file, self.manifest_file)
+        self._dirty = False
+
+    def clear(self):
+        """Forget all recorded builds (the next run rebuilds everything)"""
+        self._manifest = {'version': MANIFEST_VERSION, 'nodes': {}, 'files': {}}
+        self._file_hashes = {}
+        self._dirty = True
+        self.flush()
+
+    # ------------------------------------------------------------------
+    # Hashing
+    # ------------------------------------------------------------------
+
+    def file_hash(self, rel_path: str) -> Optional[str]:
+        """Content hash of a file (None if missing); reused while size and mtime match"""
+        path = self.base_path / rel_path
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        cached = self._file_hashes.get(rel_path)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+        try:
+            digest = hash_bytes(path.read_bytes())
+        except OSError:
+            return None
+        self._file_hashes[rel_path] = [stat.st_mtime_ns, stat.st_size, digest]
+        return digest
+
+    def expand(self, patterns: List[str]) -> List[str]:
+        """Files matched by paths, directories (recursive) and glob patterns"""
+        files = set()
+        for pattern in patterns:
+            if any(char in pattern for char in '*?['):
+                matches = self.base_path.glob(pattern)
+            else:
+                path = self.base_path / pattern
+                matches = path.rglob('*') if path.is_dir() else [path]
+            for match in matches:
+                if match.is_file() and '__pycache__' not in match.parts:
+                    files.add(match.relative_to(self.base_path).as_posix())
+        return sorted(files)
+
+    def input_hashes(self, node: BuildNode) -> Dict[str, str]:
+        """Hashes of a node's file and value inputs ('value:<name>' keys)"""
+        hashes = {}
+        for rel_path in self.expand(node.files):
+            digest = self.file_hash(rel_path)
+            if digest is not None:
+                hashes[rel_path] = digest
+        for name, compute in node.values.items():
+            hashes[f'value:{name}'] = hash_value(compute())
+        return hashes
+
+    def output_hashes(self, node: BuildNode) -> Dict[str, str]:
+        """Hashes of a node's existing outputs"""
+        hashes = {}
+        for rel_path in self.expand(node.outputs):
+            digest = self.file_hash(rel_path)
+            if digest is not None:
+                hashes[rel_path] = digest
+        return hashes
+
+    # ------------------------------------------------------------------
+    # Staleness
+    # ------------------------------------------------------------------
+
+    def stale_reasons(self, node: BuildNode, inputs: Dict[str, str]) -> List[str]:
+        """
+        Why a node must be rebuilt.
+
+        Args:
+            node: Build node
+            inputs: Its current input hashes (input_hashes())
+
+        Returns:
+            Reasons (empty if the node is up to date)
+        """
+        entry = self._manifest['nodes'].get(node.name)
+        if entry is None:
+            return ['never built']
+
+        reasons = []
+        recorded_inputs = entry.get('inputs', {})
+        changes = []
+        for key in sorted(set(inputs) | set(recorded_inputs)):
+            label = key.replace('value:', '', 1) if key.startswith('value:') else key
+            if key not in recorded_inputs:
+                changes.append(f"input added: {label}")
+            elif key not in inputs:
+                changes.append(f"input removed: {label}")
+            elif inputs[key] != recorded_inputs[key]:
+                changes.append(f"{'value' if key.startswith('value:') else 'input'} changed: {label}")
+        reasons.extend(changes[:MAX_REASONS])
+        if len(changes) > MAX_REASONS:
+            reasons.append(f"... and {len(changes) - MAX_REASONS} more changed inputs")
+
+        recorded_outputs = entry.get('outputs', {})
+        if not recorded_outputs:
+            reasons.append('no outputs recorded')
+        for rel_path, digest in recorded_outputs.items():
+            current = self.file_hash(rel_path)
+            if current is None:
+                reasons.append(f"output missing: {rel_path}")
+            elif current != digest:
+                reasons.append(f"output modified since last build: {rel_path}")
+        return reasons
+
+    def record(self, node: BuildNode, inputs: Dict[str, str]):
+        """Record a successful build of node"""
+        self._manifest['nodes'][node.name] = {
+            'inputs': inputs,
+            'outputs': self.output_hashes(node),
+            'built_at': time.time(),
+        }
+        self._dirty = True
+
+    # ------------------------------------------------------------------
+    # Running
+    # ------------------------------------------------------------------
+
+    def run(self, force: bool = False) -> BuildReport:
+        """
+        Build the stale nodes.
+
+        Args:
+            force: Rebuild every node
+
+        Returns:
+            BuildReport with the built, skipped and failed nodes and reasons
+        """
+        start = time.perf_counter()
+        report = BuildReport()
+        try:
+            for node in self.nodes:
+                inputs = self.input_hashes(node)
+                reasons = ['forced (--force)'] if force else self.stale_reasons(node, inputs)
+                if not reasons:
+                    report.skipped.append(node.name)
+                    continue
+                report.reasons[node.name] = reasons
+                try:
+                    result = node.build()
+                except Exception as e:
+                    logger.error(f"Build step {node.name} failed: {e}")
+                    result = False
+                if result is False:
+                    report.failed.append(node.name)
+                    continue
+                self.record(node, inputs)
+                report.built.append(node.name)
+        finally:
+            self.flush()
+        report.duration = time.perf_counter() - start
+        return report
+
+    def explain(self) -> Dict[str, List[str]]:
+        """Reasons per node without building anything (empty list = up to date)"""
+        return {node.name: self.stale_reasons(node, self.input_hashes(node)) for node in self.nodes}
@@ -23,13 +23,17 @@ Usage:
         cache.set('css:app', content, source_hash)
 """
 
-import json
 import hashlib
 import logging
 from pathlib import Path
 from typing import Dict, Optional, Any, Tuple
 from datetime import datetime
 
+try:
+    from . import fast_json
+except ImportError:
+    import fast_json  # Running as a script from src/modules/
+
 logger = logging.getLogger(__name__)
 
 
@@ -72,7 +76,7 @@ class CacheManager:
         if self.cache_file.exists():
             try:
                 with open(self.cache_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                    data = fast_json.load(f)
                     logger.debug(f"Loaded cache with {len(data.get('entries', {}))} entries")
                     return data
             except Exception as e:
@@ -89,7 +93,7 @@ class CacheManager:
             self.cache['metadata']['total_entries'] = len(self.cache['entries'])
             
             with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(self.cache, f, indent=2)
+                fast_json.dump(self.cache, f, indent=2)
             logger.debug(f"Saved cache with {len(self.cache['entries'])} entries")
         except Exception as e:
             logger.error(f"Failed to save cache: {e}")
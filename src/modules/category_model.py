@@ -0,0 +1,303 @@
+"""
+Category Model Module
+
+Offline event category classifier trained on the project's own
+human-reviewed events (published, pending and archived). It sits between
+the keyword fallback and the LLM in AICategorizer: events the model is
+confident about never reach Ollama.
+
+The model is a multinomial naive Bayes over TF-IDF weighted words of title
+and description, in pure Python (no NumPy needed):
+- Title words count twice, descriptions are cut to DESCRIPTION_CHARS
+- Word weights are stored sparsely: one "unseen" log-probability per
+  category plus per-word deltas for the categories the word occurred in,
+  so prediction touches only the words of the event
+- Naive Bayes posteriors are far too sharp, so confidences are calibrated
+  with a softmax temperature fitted on held-out folds (minimum log loss)
+
+Usage:
+    from modules.category_model import CategoryModel, collect_training_events
+
+    model = CategoryModel.train(collect_training_events(base_path))
+    model.save(base_path / 'data' / 'models' / 'category_model.json')
+
+    model = CategoryModel.load(path)
+    category, confidence = model.predict(title, description)
+"""
+
+import logging
+import math
+import re
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    from . import fast_json
+except ImportError:
+    import fast_json  # Running as a script from src/modules/
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL_PATH = 'data/models/category_model.json'
+MODEL_VERSION = 1
+
+# Descriptions are cut to this many characters (scraped pages can be long)
+DESCRIPTION_CHARS = 1000
+# Laplace smoothing of word counts
+ALPHA = 0.1
+# Categories need at least this many examples to be learned
+DEFAULT_MIN_EXAMPLES = 3
+# Held-out folds used to fit the confidence temperature
+CALIBRATION_FOLDS = 4
+# Candidate temperatures (log-spaced, 0.5 .. ~50)
+TEMPERATURES = [0.5 * 1.25 ** step for step in range(21)]
+
+TOKEN_PATTERN = re.compile(r'[^\W\d_]{2,}')
+
+Example = Tuple[str, str, str]  # (title, description, category)
+
+
+def tokenize(title: str, description: str = "") -> Counter:
+    """Word counts of an event text (title words count twice)"""
+    counts = Counter(TOKEN_PATTERN.findall((title or '').lower()) * 2)
+    counts.update(TOKEN_PATTERN.findall((description or '')[:DESCRIPTION_CHARS].lower()))
+    return counts
+
+
+def collect_training_events(base_path: Path, categories: Optional[Iterable[str]] = None) -> List[Example]:
+    """
+    Categorized events from events.json, pending_events.json and the archives.
+
+    Events without a category, with 'default' or with a category not in
+    categories (EVENT_CATEGORIES by default) are skipped; events appearing in
+    several files are used once (by id, else title + start time).
+
+    Args:
+        base_path: Repository root
+        categories: Valid categories (default: EVENT_CATEGORIES)
+
+    Returns:
+        List of (title, description, category) tuples
+    """
+    from .utils import load_events, load_pending_events, load_json_document
+    from .event_schema import EVENT_CATEGORIES
+
+    valid = set(categories if categories is not None else EVENT_CATEGORIES)
+    valid.discard('default')
+
+    sources = [
+        load_events(base_path).get('events', []),
+        load_pending_events(base_path).get('pending_events', []),
+    ]
+    archive_files = [base_path / 'assets' / 'json' / 'archived_events.json']
+    archive_files += sorted((base_path / 'assets' / 'json' / 'events' / 'archived').glob('*.json'))
+    for path in archive_files:
+        if path.exists():
+            try:
+                sources.append(load_json_document(path).get('archived_events', []))
+            except (OSError, ValueError) as e:
+                logger.warning(f"Skipping unreadable archive {path.name}: {e}")
+
+    examples, seen = [], set()
+    for events in sources:
+        for event in events:
+            if not isinstance(event, dict) or event.get('category') not in valid:
+                continue
+            key = event.get('id') or (event.get('title'), event.get('start_time'))
+            if key in seen:
+                continue
+            seen.add(key)
+            examples.append((event.get('title') or '', event.get('description') or '', event['category']))
+    return examples
+
+
+class CategoryModel:
+    """TF-IDF weighted multinomial naive Bayes with calibrated confidence."""
+
+    def __init__(self, categories: List[str], priors: List[float], unseen: List[float],
+                 weights: Dict[str, List[List[float]]], idf: Dict[str, float],
+                 temperature: float = 1.0, metadata: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            categories: Category names (class order)
+            priors: Log prior per category
+            unseen: Log P(word | category) of words never seen in the category
+            weights: word -> [[category index, log P(word | category) - unseen], ...]
+            idf: word -> inverse document frequency
+            temperature: Softmax temperature for confidences
+            metadata: Training summary (examples, accuracy, trained_at, ...)
+        """
+        self.categories = categories
+        self.priors = priors
+        self.unseen = unseen
+        self.weights = weights
+        self.idf = idf
+        self.temperature = temperature
+        self.metadata = metadata or {}
+
+    @classmethod
+    def train(cls, examples: List[Example], min_examples: int = DEFAULT_MIN_EXAMPLES,
+              calibrate: bool = True) -> 'CategoryModel':
+        """
+        Fit the model on (title, description, category) examples.
+
+        Raises:
+            ValueError: If fewer than two categories have min_examples examples
+        """
+        per_category = Counter(category for _, _, category in examples)
+        kept = [example for example in examples if per_category[example[2]] >= min_examples]
+        categories = sorted({category for _, _, category in kept})
+        if len(categories) < 2:
+            raise ValueError(f"Need at least two categories with {min_examples}+ examples, "
+                             f"found {len(categories)} in {len(examples)} events")
+
+        model = cls._fit(kept, categories)
+        model.metadata = {
+            'version': MODEL_VERSION,
+            'trained_at': datetime.now().isoformat(),
+            'examples': len(kept),
+            'per_category': {category: per_category[category] for category in categories},
+            'skipped_categories': sorted(set(per_category) - set(categories)),
+            'vocabulary': len(model.weights),
+        }
+        if calibrate and len(kept) >= CALIBRATION_FOLDS * 2:
+            model.temperature, accuracy = cls._calibrate(kept, categories)
+            model.metadata['heldout_accuracy'] = round(accuracy, 4)
+        model.metadata['temperature'] = round(model.temperature, 4)
+        return model
+
+    @classmethod
+    def _fit(cls, examples: List[Example], categories: List[str]) -> 'CategoryModel':
+        index = {category: i for i, category in enumerate(categories)}
+        documents = [(tokenize(title, description), index[category]) for title, description, category in examples]
+
+        document_frequency: Counter = Counter()
+        for counts, _ in documents:
+            document_frequency.update(counts.keys())
+        total_documents = len(documents)
+        idf = {word: math.log((1 + total_documents) / (1 + df)) + 1.0
+               for word, df in document_frequency.items()}
+
+        # Weighted word mass per category: log-scaled TF times IDF
+        mass: List[Dict[str, float]] = [{} for _ in categories]
+        totals = [0.0] * len(categories)
+        class_counts = [0] * len(categories)
+        for counts, label in documents:
+            class_counts[label] += 1
+            for word, count in counts.items():
+                value = (1.0 + math.log(count)) * idf[word]
+                mass[label][word] = mass[label].get(word, 0.0) + value
+                totals[label] += value
+
+        vocabulary = len(idf)
+        unseen = [math.log(ALPHA / (totals[i] + ALPHA * vocabulary)) for i in range(len(categories))]
+        weights: Dict[str, List[List[float]]] = {}
+        for i, words in enumerate(mass):
+            denominator = totals[i] + ALPHA * vocabulary
+            for word, value in words.items():
+                delta = math.log((value + ALPHA) / denominator) - unseen[i]
+                weights.setdefault(word, []).append([i, delta])
+        priors = [math.log(count / total_documents) for count in class_counts]
+        return cls(categories, priors, unseen, weights, idf)
+
+    @classmethod
+    def _calibrate(cls, examples: List[Example], categories: List[str]) -> Tuple[float, float]:
+        """Fit the softmax temperature on held-out folds; returns (temperature, accuracy)"""
+        heldout = []  # (scores, true label index)
+        for fold in range(CALIBRATION_FOLDS):
+            train = [e for i, e in enumerate(examples) if i % CALIBRATION_FOLDS != fold]
+            test = [e for i, e in enumerate(examples) if i % CALIBRATION_FOLDS == fold]
+            fold_categories = sorted({category for _, _, category in train})
+            if len(fold_categories) < 2:
+                continue
+            fold_model = cls._fit(train, fold_categories)
+            for title, description, category in test:
+                if category in fold_categories:
+                    heldout.append((fold_model.scores(title, description), fold_categories.index(category)))
+        if not heldout:
+            return 1.0, 0.0
+
+        accuracy = sum(1 for scores, label in heldout if scores.index(max(scores)) == label) / len(heldout)
+
+        def log_loss(temperature: float) -> float:
+            loss = 0.0
+            for scores, label in heldout:
+                top = max(scores)
+                norm = sum(math.exp((score - top) / temperature) for score in scores)
+                loss -= (scores[label] - top) / temperature - math.log(norm)
+            return loss
+
+        return min(TEMPERATURES, key=log_loss), accuracy
+
+    def scores(self, title: str, description: str = "") -> List[float]:
+        """Unnormalised log-posterior per category"""
+        scores = list(self.priors)
+        total = 0.0
+        for word, count in tokenize(title, description).items():
+            idf = self.idf.get(word)
+            if idf is None:
+                continue  # Unknown words carry no evidence
+            value = (1.0 + math.log(count)) * idf
+            total += value
+            for i, delta in self.weights[word]:
+                scores[i] += value * delta
+        for i, unseen in enumerate(self.unseen):
+            scores[i] += total * unseen
+        return scores
+
+    def predict(self, title: str, description: str = "") -> Tuple[str, float]:
+        """
+        Most likely category and its calibrated probability.
+
+        Returns:
+            (category, confidence); confidence is 1 / len(categories) when the
+            text contains no known word
+        """
+        scores = self.scores(title, description)
+        top = max(scores)
+        exps = [math.exp((score - top) / self.temperature) for score in scores]
+        best = scores.index(top)
+        return self.categories[best], exps[best] / sum(exps)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'metadata': self.metadata,
+            'categories': self.categories,
+            'priors': self.priors,
+            'unseen': self.unseen,
+            'temperature': self.temperature,
+            'idf': self.idf,
+            'weights': self.weights,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CategoryModel':
+        return cls(data['categories'], data['priors'], data['unseen'], data['weights'],
+                   data['idf'], data.get('temperature', 1.0), data.get('metadata', {}))
+
+    def save(self, path: Path) -> None:
+        """Write the model as JSON (parent directories are created)"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            fast_json.dump(self.to_dict(), f, ensure_ascii=False)
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> Optional['CategoryModel']:
+        """Load a saved model; None if the file is missing or unreadable"""
+        if not path.exists():
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = fast_json.load(f)
+            if data.get('metadata', {}).get('version') != MODEL_VERSION:
+                logger.warning(f"Category model {path} has an old format - retrain with: "
+                               f"python3 src/event_manager.py categorizer train")
+                return None
+            return cls.from_dict(data)
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Could not load category model {path}: {e}")
+            return None
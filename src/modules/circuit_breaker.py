@@ -0,0 +1,325 @@
+"""
+Per-Host Circuit Breaker
+
+Shared by EventScraper and all smart scraper sources so that a site that is
+down costs a few failed requests instead of the full retry backoff on every
+listing, detail page and post, run after run.
+
+Features:
+- Breaker per host: opens after failure_threshold consecutive failures
+  (timeouts, connection errors, HTTP 5xx/429); requests to an open host
+  are skipped until cooldown_minutes have passed
+- After the cool-down one probe request is let through; success closes the
+  breaker, failure opens it for another cool-down
+- State in .cache/circuit_breaker.json, so a host that tripped in one
+  scheduled run is skipped by the next one as well (the scraping
+  workflows restore the file with actions/cache)
+- Run-wide retry budget (retry_budget): once spent, failed requests are no
+  longer retried anywhere
+- Tripped hosts and skipped requests for the scrape status file
+
+HTTP 4xx answers (other than 429) count as success - the host is up.
+
+Usage:
+    from modules.circuit_breaker import get_circuit_breaker
+
+    breaker = get_circuit_breaker(base_path)
+    if breaker.allow(url):
+        try:
+            response = session.get(url, timeout=10)
+            breaker.record(url, status_code=response.status_code)
+        except requests.exceptions.RequestException as e:
+            breaker.record(url, error=e)
+    if breaker.allow_retry(url):
+        ...  # Retry the request
+    breaker.flush()
+"""
+
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+try:
+    import requests
+    REQUESTS_AVAILABLE = True
+    _ConnectionError = requests.exceptions.ConnectionError
+    _NETWORK_ERRORS = (requests.exceptions.Timeout, requests.exceptions.ConnectionError,
+                       TimeoutError, ConnectionError)
+except ImportError:
+    REQUESTS_AVAILABLE = False
+    _ConnectionError = ConnectionError
+    _NETWORK_ERRORS = (TimeoutError, ConnectionError)
+
+try:
+    from . import fast_json
+except ImportError:
+    import fast_json  # Running as a script from src/modules/
+
+logger = logging.getLogger(__name__)
+
+# Used when config.json has no scraping.circuit_breaker section
+DEFAULT_FAILURE_THRESHOLD = 3
+# Longer than the 12 hours between scheduled scrapes: the next run skips a
+# tripped host, the one after sends a probe
+DEFAULT_COOLDOWN_MINUTES = 780
+DEFAULT_RETRY_BUDGET = 30
+
+
+class CircuitOpenError(_ConnectionError):
+    """Raised instead of sending a request to a host whose breaker is open.
+
+    A requests ConnectionError, so sources handle it like an unreachable
+    host - without waiting for a timeout.
+    """
+
+    def __init__(self, host: str):
+        self.host = host
+        super().__init__(f"Circuit breaker open for {host} - request skipped")
+
+
+def host_of(url: str) -> str:
+    """Breaker key of a URL (lower-case host name)"""
+    return (urlparse(url).hostname or url).lower()
+
+
+def is_host_failure(error: Optional[BaseException] = None, status_code: Optional[int] = None) -> bool:
+    """Whether a request outcome says the host is down or overloaded"""
+    if error is not None:
+        if isinstance(error, CircuitOpenError):
+            return False
+        response = getattr(error, 'response', None)
+        if status_code is None and response is not None:
+            status_code = response.status_code
+        if status_code is None:
+            return isinstance(error, _NETWORK_ERRORS)
+    return status_code is not None and (status_code >= 500 or status_code == 429)
+
+
+class CircuitBreaker:
+    """Consecutive-failure breakers by host plus a run-wide retry budget"""
+
+    def __init__(self, base_path: Path, state_file: str = '.cache/circuit_breaker.json',
+                 failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+                 cooldown_minutes: float = DEFAULT_COOLDOWN_MINUTES,
+                 retry_budget: Optional[int] = DEFAULT_RETRY_BUDGET, enabled: bool = True):
+        """
+        Initialize circuit breaker.
+
+        Args:
+            base_path: Repository root
+            state_file: State file relative to base_path
+            failure_threshold: Consecutive failures that open a host's breaker
+            cooldown_minutes: How long an open breaker skips the host
+            retry_budget: Retries allowed per run across all hosts (None = unlimited)
+            enabled: False lets every request and retry through
+        """
+        self.base_path = Path(base_path)
+        self.state_file = self.base_path / state_file
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_minutes * 60
+        self.retry_budget = retry_budget
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._hosts: Optional[Dict[str, Dict[str, Any]]] = None
+        self._probing = set()
+        self.stats = self._empty_stats()
+
+    @staticmethod
+    def _empty_stats() -> Dict[str, Any]:
+        return {
+            'tripped': [],         # Hosts whose breaker opened in this run
+            'skipped': 0,          # Requests not sent because a breaker was open
+            'retries': 0,
+            'retries_denied': 0,   # Retries refused because the budget was spent
+        }
+
+    def configure(self, settings: Dict[str, Any]):
+        """Apply a scraping.circuit_breaker config section"""
+        self.enabled = settings.get('enabled', True)
+        self.failure_threshold = max(1, settings.get('failure_threshold', DEFAULT_FAILURE_THRESHOLD))
+        self.cooldown_seconds = settings.get('cooldown_minutes', DEFAULT_COOLDOWN_MINUTES) * 60
+        self.retry_budget = settings.get('retry_budget', DEFAULT_RETRY_BUDGET)
+
+    # ------------------------------------------------------------------
+    # State
+    # ------------------------------------------------------------------
+
+    def _load_state(self) -> Dict[str, Dict[str, Any]]:
+        """Breaker state by host (loaded lazily, called with the lock held)"""
+        if self._hosts is None:
+            try:
+                self._hosts = fast_json.read_json(self.state_file).get('hosts', {})
+            except FileNotFoundError:
+                self._hosts = {}
+            except (fast_json.JSONDecodeError, OSError, AttributeError) as e:
+                logger.warning(f"Circuit breaker state unreadable, starting closed: {e}")
+                self._hosts = {}
+        return self._hosts
+
+    def flush(self):
+        """Write the breaker state to disk if it changed"""
+        with self._lock:
+            if not self._dirty or self._hosts is None:
+                return
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.state_file.with_suffix('.tmp')
+            fast_json.write_json(tmp_file, {'version': 1, 'hosts': self._hosts}, indent=2)
+            os.replace(tmp_file, self.state_file)
+            self._dirty = False
+
+    def clear(self):
+        """Close all breakers"""
+        with self._lock:
+            self._hosts = {}
+            self._probing.clear()
+            self._dirty = True
+        self.flush()
+
+    # ------------------------------------------------------------------
+    # Requests
+    # ------------------------------------------------------------------
+
+    def allow(self, url: str) -> bool:
+        """
+        Check whether a request to url may be sent.
+
+        False while the host's breaker is open (the request counts as
+        skipped). After the cool-down the first caller gets True as the
+        probe; others are skipped until the probe is recorded.
+        """
+        if not self.enabled:
+            return True
+        host = host_of(url)
+        with self._lock:
+            entry = self._load_state().get(host)
+            if entry is None or entry.get('open_until') is None:
+                return True
+            if time.time() >= entry['open_until'] and host not in self._probing:
+                self._probing.add(host)
+                return True
+            self.stats['skipped'] += 1
+            return False
+
+    def check(self, url: str):
+        """Raise CircuitOpenError if a request to url may not be sent"""
+        if not self.allow(url):
+            raise CircuitOpenError(host_of(url))
+
+    def record(self, url: str, error: Optional[BaseException] = None, status_code: Optional[int] = None):
+        """
+        Record the outcome of a request to url.
+
+        Args:
+            url: Requested URL
+            error: Exception raised by the request, if any
+            status_code: HTTP status of the response, if any
+        """
+        if not self.enabled or isinstance(error, CircuitOpenError):
+            return
+        failed = is_host_failure(error, status_code)
+        if error is not None and status_code is None and getattr(error, 'response', None) is None and not failed:
+            # Not a network error (e.g. a parsing bug or TooManyRedirects) -
+            # says nothing about the host; a probe's turn goes to the next request
+            with self._lock:
+                self._probing.discard(host_of(url))
+            return
+        if failed:
+            self._record_failure(host_of(url))
+        else:
+            self._record_success(host_of(url))
+
+    def _record_success(self, host: str):
+        with self._lock:
+            self._probing.discard(host)
+            if self._load_state().pop(host, None) is not None:
+                self._dirty = True
+
+    def _record_failure(self, host: str):
+        with self._lock:
+            probe = host in self._probing
+            self._probing.discard(host)
+            entry = self._load_state().setdefault(host, {'failures': 0, 'open_until': None})
+            entry['failures'] += 1
+            self._dirty = True
+            if entry['failures'] < self.failure_threshold and not probe:
+                return
+            entry['open_until'] = time.time() + self.cooldown_seconds
+            if host not in self.stats['tripped']:
+                self.stats['tripped'].append(host)
+        logger.warning(f"Circuit breaker open for {host} after {entry['failures']} consecutive failures; "
+                       f"skipping it for {self.cooldown_seconds / 60:g} minutes")
+
+    def allow_retry(self, url: str) -> bool:
+        """
+        Take one retry from the run's budget.
+
+        False if the host's breaker is open or the budget is spent; the
+        caller then gives up on the request.
+        """
+        if not self.enabled:
+            return True
+        with self._lock:
+            entry = self._load_state().get(host_of(url))
+            if entry is not None and entry.get('open_until') is not None and time.time() < entry['open_until']:
+                return False
+            if self.retry_budget is not None and self.stats['retries'] >= self.retry_budget:
+                self.stats['retries_denied'] += 1
+                return False
+            self.stats['retries'] += 1
+            return True
+
+    def is_open(self, url: str) -> bool:
+        """Whether the host's breaker is currently open"""
+        with self._lock:
+            entry = self._load_state().get(host_of(url))
+        return bool(entry and entry.get('open_until') and time.time() < entry['open_until'])
+
+    # ------------------------------------------------------------------
+    # Statistics
+    # ------------------------------------------------------------------
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Statistics of this run plus the hosts that are open now"""
+        now = time.time()
+        with self._lock:
+            stats = dict(self.stats, tripped=list(self.stats['tripped']))
+            stats['open'] = sorted(host for host, entry in self._load_state().items()
+                                   if entry.get('open_until') and now < entry['open_until'])
+        stats['retry_budget'] = self.retry_budget
+        return stats
+
+    def reset_stats(self):
+        """Start a new run (refills the retry budget)"""
+        with self._lock:
+            self.stats = self._empty_stats()
+
+
+# Process-wide breakers by base path
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(base_path, settings: Optional[Dict[str, Any]] = None) -> CircuitBreaker:
+    """
+    Shared CircuitBreaker for a repository root.
+
+    Args:
+        base_path: Repository root
+        settings: Optional scraping.circuit_breaker config section to apply
+
+    Returns:
+        The process-wide CircuitBreaker for base_path
+    """
+    key = os.path.abspath(base_path)
+    with _breakers_lock:
+        breaker = _breakers.get(key)
+        if breaker is None:
+            breaker = _breakers[key] = CircuitBreaker(Path(base_path))
+    if settings is not None:
+        breaker.configure(settings)
+    return breaker
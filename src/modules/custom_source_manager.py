@@ -20,6 +20,7 @@ Usage:
     python3 src/modules/custom_source_manager.py document MySource
 """
 
+import re
 import sys
 import argparse
 from pathlib import Path
@@ -153,6 +154,8 @@ class {class_name}(BaseSource):
         "enabled": true,
         "options": {{
             "category": "community",
+            "max_detail_pages": 20,
+            "detail_concurrency": 4,
             "default_location": {{
                 "name": "Default City",
                 "lat": 50.0,
@@ -187,23 +190,30 @@ class {class_name}(BaseSource):
         events = []
         try:
             # Step 1: Get list of events from main page
-            response = self.session.get(self.url, timeout=10)
+            response = self.http_get(self.url, timeout=10)
             response.raise_for_status()
+            if self.is_unchanged(response):
+                return []
             soup = BeautifulSoup(response.content, 'lxml')
             
             # Extract basic event info from listing
             event_links = self._extract_event_links(soup)
             print(f"    Found {{len(event_links)}} event links")
             
-            # Step 2: Fetch each detail page to get location
-            for i, (title, detail_url, date_text) in enumerate(event_links[:20], 1):
+            # Step 2: Fetch detail pages concurrently (options.max_detail_pages,
+            # detail_concurrency), then parse them in listing order
+            event_links = self.limit_detail_links(event_links)
+            pages = self.fetch_detail_pages([url for _, url, _ in event_links], session=self.session)
+            for i, ((title, detail_url, date_text), page) in enumerate(zip(event_links, pages), 1):
                 try:
-                    event = self._scrape_detail_page(title, detail_url, date_text)
+                    if not page.ok:
+                        raise page.error
+                    event = self._parse_detail_page(title, detail_url, date_text, page.content)
                     if event and not self.filter_event(event):
                         events.append(event)
-                        print(f"    [{{i}}/{{min(len(event_links), 20)}}] ✓ {{title[:50]}}")
+                        print(f"    [{{i}}/{{len(event_links)}}] ✓ {{title[:50]}}")
                 except Exception as e:
-                    print(f"    [{{i}}/{{min(len(event_links), 20)}}] ✗ Error: {{str(e)[:50]}}")
+                    print(f"    [{{i}}/{{len(event_links)}}] ✗ Error: {{str(e)[:50]}}")
                     
         except Exception as e:
             print(f"    {name} scraping error: {{str(e)}}")
@@ -266,21 +276,23 @@ class {class_name}(BaseSource):
         
         return event_links
     
-    def _scrape_detail_page(self, title: str, url: str, date_text: str) -> Dict[str, Any]:
+    def _parse_detail_page(self, title: str, url: str, date_text: str, content: bytes) -> Dict[str, Any]:
         """
-        Scrape event detail page to extract location and other info.
+        Build the event from a fetched detail page.
+        
+        Detail pages are fetched concurrently by BaseSource.fetch_detail_pages();
+        this method only parses, so it runs in listing order.
         
         Args:
             title: Event title from listing
             url: Detail page URL
             date_text: Date text from listing
+            content: Detail page HTML
             
         Returns:
             Complete event dictionary with location
         """
-        response = self.session.get(url, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'lxml')
+        soup = BeautifulSoup(content, 'lxml')
         
         # Extract location from detail page
         location = self._extract_location_from_detail(soup)
@@ -547,8 +559,10 @@ class {class_name}(BaseSource):
         
         events = []
         try:
-            response = self.session.get(self.url, timeout=10)
+            response = self.http_get(self.url, timeout=10)
             response.raise_for_status()
+            if self.is_unchanged(response):
+                return []
             soup = BeautifulSoup(response.content, 'lxml')
             
             events = self._extract_events(soup)
@@ -744,8 +758,10 @@ class {class_name}(BaseSource):
         
         events = []
         try:
-            response = self.session.get(self.url, timeout=10)
+            response = self.http_get(self.url, timeout=10)
             response.raise_for_status()
+            if self.is_unchanged(response):
+                return []
             data = response.json()
             
             # TODO: Customize based on API response structure
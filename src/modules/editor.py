@@ -2,8 +2,8 @@
 
 import logging
 from datetime import datetime
-from .utils import (load_pending_events, save_pending_events, load_events, 
-                   save_events, add_rejected_event)
+from .utils import (load_pending_events, upsert_pending_event, remove_pending_events,
+                   add_published_events, add_rejected_event)
 from .batch_selector import BatchSelector
 
 # Configure module logger
@@ -101,52 +101,37 @@ class EventEditor:
                 break
             else:
                 print("\nInvalid choice. Try again.")
-                
-        # Save updated pending events
-        save_pending_events(self.base_path, pending_data)
         
-        # Update pending count in events.json
+        # Every decision and edit was saved as it was made (single-event
+        # writes); only the pending count is left to update in events.json
         from .utils import update_pending_count_in_events
         update_pending_count_in_events(self.base_path)
     
     def _batch_approve(self, pending_events, selected_indices):
-        """Batch approve selected events"""
-        events_data = load_events(self.base_path)
+        """Batch approve selected events (staged, then one write per file)"""
+        from .review_batch import ReviewBatch
         
-        # Sort in reverse order to safely remove from list
-        for idx in sorted(selected_indices, reverse=True):
+        review = ReviewBatch(self.base_path, {'pending_events': pending_events})
+        for idx in sorted(selected_indices):
             event = pending_events[idx]
-            self._approve_event(event)
-            pending_events.pop(idx)
-        
-        # Save changes
-        save_events(self.base_path, events_data)
-        pending_data = {'pending_events': pending_events}
-        save_pending_events(self.base_path, pending_data)
-        
-        # Update pending count in events.json
-        from .utils import update_pending_count_in_events
-        update_pending_count_in_events(self.base_path)
+            try:
+                review.publish(event.get('id'), self._validate_for_publishing(event))
+            except (ValueError, KeyError) as e:
+                print(f"  ⚠ Skipped {event.get('title', 'N/A')}: {e}")
+        review.commit()
         
         # Update HTML
         from .utils import update_events_in_html
         update_events_in_html(self.base_path)
     
     def _batch_reject(self, pending_events, selected_indices):
-        """Batch reject selected events"""
-        # Sort in reverse order to safely remove from list
-        for idx in sorted(selected_indices, reverse=True):
-            event = pending_events[idx]
-            self._reject_event(event)
-            pending_events.pop(idx)
+        """Batch reject selected events (staged, then one write per file)"""
+        from .review_batch import ReviewBatch
         
-        # Save changes
-        pending_data = {'pending_events': pending_events}
-        save_pending_events(self.base_path, pending_data)
-        
-        # Update pending count in events.json
-        from .utils import update_pending_count_in_events
-        update_pending_count_in_events(self.base_path)
+        review = ReviewBatch(self.base_path, {'pending_events': pending_events})
+        for idx in sorted(selected_indices):
+            review.reject(pending_events[idx].get('id'))
+        review.commit()
     
     def _print_review_footer(self):
         """Print footer with editorial tooltips"""
@@ -167,24 +152,33 @@ class EventEditor:
         print(f"End Time: {event.get('end_time', 'N/A')}")
         print(f"URL: {event.get('url', 'N/A')}")
         print(f"Source: {event.get('source', 'N/A')}")
+        for source in event.get('additional_sources', []):
+            print(f"  Also listed at: {source}")
+        duplicate = event.get('possible_duplicate')
+        if duplicate:
+            print(f"⚠ Possible duplicate of {duplicate.get('in')} event "
+                  f"'{duplicate.get('title')}' ({duplicate.get('similarity', 0):.0%} similar)")
+        
+    def _validate_for_publishing(self, event):
+        """Check minimal requirements and the event model; returns the validated event dict"""
+        # Check minimal requirements first (clearer error messages)
+        # Import the validation function from event_manager using package-relative import
+        from ..event_manager import minimal_eventdata_requirements_check
         
+        is_valid, error_msg = minimal_eventdata_requirements_check(event)
+        if not is_valid:
+            print(f"\n⚠ WARNING: Cannot publish event - {error_msg}")
+            print("Please edit the event to add the missing information.")
+            raise ValueError(error_msg)
+        
+        # Validate event before publishing
+        from .models import validate_event_data
+        return validate_event_data(event).model_dump()
+    
     def _approve_event(self, event):
         """Approve and publish an event with validation"""
         try:
-            # Check minimal requirements first (clearer error messages)
-            # Import the validation function from event_manager using package-relative import
-            from ..event_manager import minimal_eventdata_requirements_check
-            
-            is_valid, error_msg = minimal_eventdata_requirements_check(event)
-            if not is_valid:
-                print(f"\n⚠ WARNING: Cannot publish event - {error_msg}")
-                print("Please edit the event to add the missing information.")
-                raise ValueError(error_msg)
-            
-            # Validate event before publishing
-            from .models import validate_event_data
-            validated_event = validate_event_data(event)
-            event_dict = validated_event.model_dump()
+            event_dict = self._validate_for_publishing(event)
             
             event_dict['status'] = 'published'
             event_dict['published_at'] = datetime.now().isoformat()
@@ -194,10 +188,9 @@ class EventEditor:
             backup_path = backup_published_event(self.base_path, event_dict)
             print(f"  ✓ Event backed up to: {backup_path.relative_to(self.base_path)}")
             
-            # Add to published events
-            events_data = load_events(self.base_path)
-            events_data['events'].append(event_dict)
-            save_events(self.base_path, events_data)
+            # Add to published events and remove from pending
+            add_published_events(self.base_path, [event_dict])
+            remove_pending_events(self.base_path, [event.get('id')])
             
             logger.info(f"Event approved and published: {event_dict['title']}", extra={
                 'event_id': event_dict['id'],
@@ -231,6 +224,7 @@ class EventEditor:
             logger.warning("Rejected event missing title or source", extra={
                 'event': event
             })
+        remove_pending_events(self.base_path, [event.get('id')])
         
     def _edit_event(self, event):
         """Edit event details"""
@@ -289,7 +283,8 @@ class EventEditor:
         new_url = input(f"URL [{event.get('url', '')}]: ").strip()
         if new_url:
             event['url'] = new_url
-            
+        
+        upsert_pending_event(self.base_path, event)
         print("\nEvent updated!")
     
     def _find_similar_events(self, event, historical_events):
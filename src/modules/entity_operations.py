@@ -13,7 +13,6 @@ Can be used via:
 3. TUI: Interactive menus
 """
 
-import json
 import logging
 import shutil
 from pathlib import Path
@@ -21,6 +20,7 @@ from typing import Dict, List, Any
 from datetime import datetime, timezone
 from collections import defaultdict
 
+from . import fast_json
 from .entity_models import generate_location_id, generate_organizer_id, Location, Organizer
 
 logger = logging.getLogger(__name__)
@@ -77,7 +77,7 @@ class EntityOperations:
             
             # Load events
             with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+                data = fast_json.load(f)
             
             # Get events list (handle different formats)
             if file_path == self.events_file:
@@ -130,7 +130,7 @@ class EntityOperations:
                 
                 # Save updated data
                 with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
+                    fast_json.dump(data, f, indent=2, ensure_ascii=False)
                 logger.info(f"Updated: {file_path}")
         
         return stats
@@ -176,7 +176,7 @@ class EntityOperations:
                 continue
             
             with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+                data = fast_json.load(f)
             
             if file_path == self.events_file:
                 events = data.get('events', [])
@@ -229,7 +229,7 @@ class EntityOperations:
         
         # Save report to JSON
         with open(self.report_file, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+            fast_json.dump(results, f, indent=2, ensure_ascii=False)
         
         return results
     
@@ -295,7 +295,7 @@ class EntityOperations:
                 continue
             
             with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+                data = fast_json.load(f)
             
             if file_path == self.events_file:
                 events = data.get('events', [])
@@ -364,7 +364,7 @@ class EntityOperations:
         
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+                data = fast_json.load(f)
                 # Handle both 'locations'/'organizers' keys
                 for key in ['locations', 'organizers']:
                     if key in data:
@@ -411,7 +411,7 @@ class EntityOperations:
                 continue
             
             with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+                data = fast_json.load(f)
             
             if file_path == self.events_file:
                 events = data.get('events', [])
@@ -477,7 +477,7 @@ class EntityOperations:
         }
         
         with open(self.locations_file, 'w', encoding='utf-8') as f:
-            json.dump(locations_data, f, indent=2, ensure_ascii=False)
+            fast_json.dump(locations_data, f, indent=2, ensure_ascii=False)
         logger.info(f"Created locations library: {self.locations_file}")
         
         # Save organizers library
@@ -489,7 +489,7 @@ class EntityOperations:
         }
         
         with open(self.organizers_file, 'w', encoding='utf-8') as f:
-            json.dump(organizers_data, f, indent=2, ensure_ascii=False)
+            fast_json.dump(organizers_data, f, indent=2, ensure_ascii=False)
         logger.info(f"Created organizers library: {self.organizers_file}")
         
         return stats
@@ -559,7 +559,7 @@ class EntityOperationsCLI:
         results = self.operations.track_overrides(output_format=output_format)
         
         if output_format == 'json':
-            print(json.dumps(results, indent=2))
+            print(fast_json.dumps(results, indent=2))
         else:
             self._print_override_report(results)
         
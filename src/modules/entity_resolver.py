@@ -10,12 +10,13 @@ This allows events to share common locations while supporting event-specific
 customizations when needed (e.g., VIP entrance, temporary stage).
 """
 
-import json
 import logging
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from copy import deepcopy
 
+from . import fast_json
+
 logger = logging.getLogger(__name__)
 
 
@@ -62,7 +63,7 @@ class EntityResolver:
         
         try:
             with open(self.locations_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+                data = fast_json.load(f)
                 locations = data.get('locations', [])
                 # Convert list to dict keyed by ID for fast lookup
                 return {loc['id']: loc for loc in locations}
@@ -78,7 +79,7 @@ class EntityResolver:
         
         try:
             with open(self.organizers_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+                data = fast_json.load(f)
                 organizers = data.get('organizers', [])
                 # Convert list to dict keyed by ID for fast lookup
                 return {org['id']: org for org in organizers}
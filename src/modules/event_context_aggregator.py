@@ -17,9 +17,10 @@ This provides editors with complete context to make informed decisions.
 from typing import Dict, Any, List, Optional, Set
 from datetime import datetime
 from pathlib import Path
-import json
 import re
 
+from .utils import load_json_document
+
 
 class EventContext:
     """
@@ -151,13 +152,12 @@ class EventContextAggregator:
         self.reviewer_notes = self._load_json('reviewer_notes.json')
     
     def _load_json(self, filename: str, key: Optional[str] = None) -> Any:
-        """Load JSON file."""
+        """Load JSON file (read-only, shared via the utils document cache)."""
         filepath = self.assets_json / filename
         try:
             if filepath.exists():
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    return data.get(key, data) if key else data
+                data = load_json_document(filepath, copy=False)
+                return data.get(key, data) if key else data
             return [] if key else {}
         except Exception as e:
             print(f"  ⚠ Warning: Could not load {filename}: {e}")
@@ -171,10 +171,8 @@ class EventContextAggregator:
         if archive_dir.exists():
             for archive_file in archive_dir.glob('*.json'):
                 try:
-                    with open(archive_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        events = data.get('events', [])
-                        archived.extend(events)
+                    data = load_json_document(archive_file, copy=False)
+                    archived.extend(data.get('events', []))
                 except Exception as e:
                     print(f"  ⚠ Warning: Could not load {archive_file.name}: {e}")
         
@@ -19,12 +19,18 @@ Usage:
     migrated = schema.migrate_event(old_event)
 """
 
-import json
 import logging
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Any
 
+try:
+    from . import fast_json
+    from .keyword_matcher import KeywordMatcher
+except ImportError:
+    import fast_json  # Running as a script from src/modules/
+    from keyword_matcher import KeywordMatcher
+
 logger = logging.getLogger(__name__)
 
 # Canonical list of valid event categories (60+ categories)
@@ -214,6 +220,21 @@ CATEGORY_ICON_MAP = {
     "geolocation": "locate"
 }
 
+# Keyword fallback for _infer_category (first matching category wins)
+FALLBACK_KEYWORD_MAP = {
+    'music': ['music', 'concert', 'band', 'orchestra'],
+    'sports': ['sport', 'game', 'match', 'tournament'],
+    'food': ['food', 'restaurant', 'dining', 'culinary'],
+    'arts': ['art', 'exhibition', 'gallery', 'paint'],
+    'workshops': ['workshop', 'class', 'training', 'learn'],
+    'festivals': ['festival', 'celebration', 'carnival'],
+    'theatre': ['theatre', 'theater', 'play', 'drama'],
+    'museum': ['museum', 'history', 'heritage'],
+    'community': ['community', 'meetup', 'gathering'],
+    'shopping': ['market', 'shopping', 'bazaar', 'sale'],
+}
+FALLBACK_KEYWORD_MATCHER = KeywordMatcher(FALLBACK_KEYWORD_MAP)
+
 
 class EventSchema:
     """
@@ -348,7 +369,7 @@ class EventSchema:
         
         return len(errors) == 0, errors
     
-    def migrate_event(self, event: Dict[str, Any]) -> Dict[str, Any]:
+    def migrate_event(self, event: Dict[str, Any], infer_category: bool = True) -> Dict[str, Any]:
         """
         Migrate event from old format to new schema.
         
@@ -363,6 +384,8 @@ class EventSchema:
         
         Args:
             event: Event in old format
+            infer_category: Infer a missing category (False leaves it missing,
+                            used by migrate_events() to categorize in batches)
             
         Returns:
             Event in new schema format
@@ -447,7 +470,7 @@ class EventSchema:
                     migrated['source'] = f"https://example.com/event/{migrated.get('id', 'unknown')}"
         
         # Add category if missing (default)
-        if 'category' not in migrated:
+        if 'category' not in migrated and infer_category:
             # Try to infer from title/description
             migrated['category'] = self._infer_category(
                 migrated.get('title', ''),
@@ -468,6 +491,48 @@ class EventSchema:
         
         return migrated
     
+    def migrate_events(self, events: List[Dict[str, Any]],
+                       failures: Optional[List[Tuple[Dict[str, Any], str]]] = None) -> List[Dict[str, Any]]:
+        """
+        Migrate several events to the new schema.
+        
+        Same as migrate_event() for each event, but missing categories are
+        inferred together: with AI categorization available, all events
+        without a category are sent to the model in batches instead of one
+        request per event.
+        
+        Args:
+            events: Events in old format
+            failures: If given, events whose migration raises are appended as
+                      (event, error message) and skipped instead of raising
+            
+        Returns:
+            Migrated events (in input order)
+        """
+        migrated = []
+        for event in events:
+            try:
+                migrated.append(self.migrate_event(event, infer_category=False))
+            except Exception as e:
+                if failures is None:
+                    raise
+                failures.append((event, f"Migration failed: {e}"))
+        
+        uncategorized = [event for event in migrated if 'category' not in event]
+        if len(uncategorized) > 1 and self.ai_categorizer and self.ai_categorizer.is_available():
+            items = [(event.get('title', ''), event.get('description', '')) for event in uncategorized]
+            try:
+                results = self.ai_categorizer.categorize_events(items)
+                for event, (category, confidence, method) in zip(uncategorized, results):
+                    event['category'] = category
+            except Exception as e:
+                logger.warning(f"Batch categorization failed, categorizing per event: {e}")
+        
+        for event in migrated:
+            if 'category' not in event:
+                event['category'] = self._infer_category(event.get('title', ''), event.get('description', ''))
+        return migrated
+    
     def _infer_category(self, title: str, description: str) -> str:
         """
         Infer event category from title and description.
@@ -490,26 +555,10 @@ class EventSchema:
             except Exception as e:
                 logger.warning(f"AI categorization failed, using keyword fallback: {e}")
         
-        # Keyword-based fallback (original implementation)
-        text = f"{title} {description}".lower()
-        
-        # Keyword to category mapping
-        keyword_map = {
-            'music': ['music', 'concert', 'band', 'orchestra'],
-            'sports': ['sport', 'game', 'match', 'tournament'],
-            'food': ['food', 'restaurant', 'dining', 'culinary'],
-            'arts': ['art', 'exhibition', 'gallery', 'paint'],
-            'workshops': ['workshop', 'class', 'training', 'learn'],
-            'festivals': ['festival', 'celebration', 'carnival'],
-            'theatre': ['theatre', 'theater', 'play', 'drama'],
-            'museum': ['museum', 'history', 'heritage'],
-            'community': ['community', 'meetup', 'gathering'],
-            'shopping': ['market', 'shopping', 'bazaar', 'sale'],
-        }
-        
-        for category, keywords in keyword_map.items():
-            if any(keyword in text for keyword in keywords):
-                return category
+        # Keyword-based fallback (first category in FALLBACK_KEYWORD_MAP order)
+        category = FALLBACK_KEYWORD_MATCHER.first_match(f"{title} {description}".lower())
+        if category:
+            return category
         
         return 'default'
     
@@ -587,7 +636,7 @@ class EventSchema:
         doc.append("## Event Structure")
         doc.append("")
         doc.append("```json")
-        doc.append(json.dumps({
+        doc.append(fast_json.dumps({
             "id": "unique_event_id",
             "title": "Event Title",
             "teaser": "Short description of the event (10-300 chars)",
@@ -669,7 +718,7 @@ def validate_events_file(file_path: Path) -> Tuple[bool, List[str], List[Dict]]:
     
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+            data = fast_json.load(f)
         
         events = data.get('events', [])
         all_errors = []
@@ -705,29 +754,24 @@ def migrate_events_file(file_path: Path, backup: bool = True, config: Optional[D
     
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+            data = fast_json.load(f)
         
         # Backup if requested
         if backup:
             backup_path = file_path.with_suffix('.json.backup')
             with open(backup_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+                fast_json.dump(data, f, indent=2)
             logger.info(f"Backup created: {backup_path}")
         
-        # Migrate events
-        events = data.get('events', [])
-        migrated_events = []
-        
-        for event in events:
-            migrated = schema.migrate_event(event)
-            migrated_events.append(migrated)
+        # Migrate events (missing categories are inferred in batches)
+        migrated_events = schema.migrate_events(data.get('events', []))
         
         # Update data
         data['events'] = migrated_events
         
         # Write back
         with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+            fast_json.dump(data, f, indent=2)
         
         logger.info(f"Migrated {len(migrated_events)} events in {file_path}")
         return len(migrated_events)
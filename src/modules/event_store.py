@@ -0,0 +1,675 @@
+"""
+Event Store Module
+
+Optional SQLite-backed storage engine for published and pending events.
+
+The JSON files in assets/json/ stay the source of truth for the static site
+and the git workflow. The store keeps an indexed copy of them so that single
+event inserts, updates and deletes become row operations instead of
+re-parsing and rewriting a whole JSON document.
+
+Features:
+- One table for all collections, indexed on id, status, start_time, source
+  and (title, start_time)
+- Diff-based document saves: only changed rows are written
+- Single-event inserts, updates and deletes as indexed row operations
+  (upsert_event(s), delete_event(s)) - used by utils for publish, reject
+  and insert
+- JSON snapshots are re-imported automatically when they change on disk
+  (e.g. after a git pull). Saves and row operations only mark a collection
+  dirty (persisted, so a crash does not lose the export); export_dirty()
+  writes the snapshots once - event_manager.py calls it when a command
+  finishes, and stores opened through get_event_store() export at
+  interpreter exit as well
+- Opt-in: the store is only used once .cache/events.sqlite3 exists
+  (python3 src/event_manager.py store init)
+
+Usage:
+    from modules.event_store import EventStore
+
+    store = EventStore(base_path)
+    pending = store.load_document('pending')
+    store.upsert_event('pending', event)
+    store.delete_event('pending', 'html_frankenpost_123')
+    store.export_dirty()
+"""
+
+import atexit
+import logging
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from . import fast_json
+
+logger = logging.getLogger(__name__)
+
+# Default database location (relative to repository root)
+DEFAULT_DB_PATH = Path('.cache') / 'events.sqlite3'
+
+# Collection name -> (snapshot file in assets/json/, key of the event list)
+COLLECTIONS = {
+    'events': ('events.json', 'events'),
+    'pending': ('pending_events.json', 'pending_events'),
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    collection TEXT NOT NULL,
+    event_id   TEXT,
+    position   INTEGER NOT NULL,
+    status     TEXT,
+    start_time TEXT,
+    source     TEXT,
+    title      TEXT,
+    body       TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_events_id ON events (collection, event_id);
+CREATE INDEX IF NOT EXISTS idx_events_status ON events (collection, status);
+CREATE INDEX IF NOT EXISTS idx_events_start_time ON events (collection, start_time);
+CREATE INDEX IF NOT EXISTS idx_events_source ON events (collection, source);
+CREATE INDEX IF NOT EXISTS idx_events_title_start ON events (collection, title, start_time);
+CREATE INDEX IF NOT EXISTS idx_events_position ON events (collection, position);
+
+CREATE TABLE IF NOT EXISTS documents (
+    collection     TEXT PRIMARY KEY,
+    envelope       TEXT NOT NULL,
+    snapshot_mtime INTEGER,
+    snapshot_size  INTEGER
+);
+
+-- Collections changed since their last snapshot export
+CREATE TABLE IF NOT EXISTS dirty (
+    collection TEXT PRIMARY KEY
+);
+"""
+
+
+def get_db_path(base_path: Path) -> Path:
+    """Return the default database path for a repository root."""
+    return Path(base_path) / DEFAULT_DB_PATH
+
+
+def is_enabled(base_path: Path) -> bool:
+    """Check whether the SQLite event store has been initialised."""
+    return get_db_path(base_path).exists()
+
+
+def _encode(event: Dict[str, Any]) -> str:
+    """Serialize an event body for storage (compact, order-preserving)."""
+    return fast_json.dumps(event, ensure_ascii=False, separators=(',', ':'))
+
+
+def _text(value: Any) -> Optional[str]:
+    """Coerce an indexed column value to text (or None)."""
+    if value is None:
+        return None
+    return value if isinstance(value, str) else str(value)
+
+
+class EventStore:
+    """
+    SQLite-backed event store.
+
+    Each collection ('events', 'pending') maps to one JSON snapshot file.
+    The non-list keys of the snapshot (last_updated, pending_count, ...)
+    are kept as an "envelope" so documents round-trip unchanged.
+    """
+
+    def __init__(self, base_path: Path, db_path: Optional[Path] = None):
+        """
+        Initialize event store.
+
+        Args:
+            base_path: Root path of the repository
+            db_path: Optional database path (default: .cache/events.sqlite3)
+        """
+        self.base_path = Path(base_path)
+        self.db_path = Path(db_path) if db_path else get_db_path(self.base_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._depth = 0  # transaction() nesting
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+        # Collections modified since their last snapshot export (also left
+        # over from a process that ended before exporting)
+        self._dirty = {row['collection'] for row in self._conn.execute('SELECT collection FROM dirty')}
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run a block of row operations in a single transaction (nested blocks join it)."""
+        with self._lock:
+            if self._depth:
+                self._depth += 1
+                try:
+                    yield self._conn
+                finally:
+                    self._depth -= 1
+                return
+            self._depth = 1
+            try:
+                yield self._conn
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+            finally:
+                self._depth = 0
+
+    # ------------------------------------------------------------------
+    # Snapshot handling
+    # ------------------------------------------------------------------
+
+    def snapshot_path(self, collection: str) -> Path:
+        """Return the JSON snapshot path for a collection."""
+        filename, _ = self._collection(collection)
+        return self.base_path / 'assets' / 'json' / filename
+
+    def _collection(self, collection: str):
+        if collection not in COLLECTIONS:
+            raise ValueError(f"Unknown event collection: {collection}")
+        return COLLECTIONS[collection]
+
+    def _snapshot_signature(self, collection: str):
+        try:
+            stat = self.snapshot_path(collection).stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _stored_signature(self, collection: str):
+        row = self._conn.execute(
+            'SELECT snapshot_mtime, snapshot_size FROM documents WHERE collection = ?',
+            (collection,)
+        ).fetchone()
+        if row is None or row['snapshot_mtime'] is None:
+            return None
+        return row['snapshot_mtime'], row['snapshot_size']
+
+    def _mark_dirty(self, collection: str) -> None:
+        """Remember that a collection needs exporting (inside a transaction)."""
+        if collection not in self._dirty:
+            self._conn.execute('INSERT OR IGNORE INTO dirty (collection) VALUES (?)', (collection,))
+            self._dirty.add(collection)
+
+    def _clear_dirty(self, collection: str) -> None:
+        self._conn.execute('DELETE FROM dirty WHERE collection = ?', (collection,))
+        self._dirty.discard(collection)
+
+    def _record_signature(self, collection: str) -> None:
+        signature = self._snapshot_signature(collection)
+        mtime, size = signature if signature else (None, None)
+        self._conn.execute(
+            'UPDATE documents SET snapshot_mtime = ?, snapshot_size = ? WHERE collection = ?',
+            (mtime, size, collection)
+        )
+
+    def sync_from_snapshot(self, collection: str, force: bool = False) -> bool:
+        """
+        Import the JSON snapshot if it changed since the last import/export.
+
+        Args:
+            collection: Collection name ('events' or 'pending')
+            force: Re-import even if the snapshot looks unchanged
+
+        Returns:
+            True if the snapshot was (re-)imported, False otherwise
+        """
+        with self._lock:
+            signature = self._snapshot_signature(collection)
+            if signature is None:
+                return False
+            if not force and signature == self._stored_signature(collection):
+                return False
+
+            if collection in self._dirty:
+                logger.warning(f"{collection} snapshot changed on disk; discarding unexported store changes")
+            with open(self.snapshot_path(collection), 'r', encoding='utf-8') as f:
+                document = fast_json.load(f)
+
+            with self.transaction():
+                self._write_document(collection, document)
+                self._record_signature(collection)
+                self._clear_dirty(collection)
+            logger.debug(f"Imported {collection} snapshot into event store")
+            return True
+
+    def export_snapshot(self, collection: str) -> Path:
+        """
+        Write the collection to its JSON snapshot file.
+
+        Output matches the format used by utils.save_* (indent=2).
+
+        Returns:
+            Path to the written snapshot
+        """
+        with self._lock:
+            document = self._read_document(collection)
+            path = self.snapshot_path(collection)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, 'w') as f:
+                fast_json.dump(document, f, indent=2)
+            with self.transaction():
+                self._record_signature(collection)
+                self._clear_dirty(collection)
+            return path
+
+    def export_dirty(self) -> List[Path]:
+        """Export every collection modified since its last export."""
+        with self._lock:
+            return [self.export_snapshot(collection) for collection in sorted(self._dirty)]
+
+    # ------------------------------------------------------------------
+    # Document level (used by utils.load_*/save_* adapters)
+    # ------------------------------------------------------------------
+
+    def load_document(self, collection: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a full document (envelope + event list).
+
+        Re-imports the JSON snapshot first if it was changed outside the store.
+
+        Returns:
+            Document dictionary, or None if neither store nor snapshot has it
+        """
+        with self._lock:
+            self.sync_from_snapshot(collection)
+            return self._read_document(collection)
+
+    def save_document(self, collection: str, document: Dict[str, Any], export: bool = False) -> Dict[str, int]:
+        """
+        Save a full document, touching only rows that changed.
+
+        Args:
+            collection: Collection name
+            document: Document dictionary (envelope + event list)
+            export: Write the JSON snapshot right away (default: leave it
+                    to export_dirty())
+
+        Returns:
+            Row operation counts {'inserted', 'updated', 'deleted'}
+        """
+        with self._lock:
+            with self.transaction():
+                counts = self._write_document(collection, document)
+                self._mark_dirty(collection)
+            if export:
+                self.export_snapshot(collection)
+            return counts
+
+    def _read_document(self, collection: str) -> Optional[Dict[str, Any]]:
+        _, list_key = self._collection(collection)
+        row = self._conn.execute(
+            'SELECT envelope FROM documents WHERE collection = ?', (collection,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        envelope = fast_json.loads(row['envelope'])
+        events = [
+            fast_json.loads(r['body'])
+            for r in self._conn.execute(
+                'SELECT body FROM events WHERE collection = ? ORDER BY position',
+                (collection,)
+            )
+        ]
+        # Envelope keeps the original key order with the list key as placeholder
+        document = {}
+        for key, value in envelope.items():
+            document[key] = events if key == list_key else value
+        if list_key not in document:
+            document[list_key] = events
+        return document
+
+    def _write_document(self, collection: str, document: Dict[str, Any]) -> Dict[str, int]:
+        """Diff a document against stored rows and apply the changes (no commit)."""
+        _, list_key = self._collection(collection)
+        events = document.get(list_key, []) or []
+        envelope = {key: (None if key == list_key else value) for key, value in document.items()}
+
+        self._conn.execute(
+            'INSERT INTO documents (collection, envelope) VALUES (?, ?) '
+            'ON CONFLICT(collection) DO UPDATE SET envelope = excluded.envelope',
+            (collection, _encode(envelope))
+        )
+
+        existing = {}
+        duplicate_ids = False
+        for row in self._conn.execute(
+            'SELECT rowid, event_id, position, body FROM events WHERE collection = ?',
+            (collection,)
+        ):
+            if row['event_id'] is None or row['event_id'] in existing:
+                duplicate_ids = True
+            existing[row['event_id']] = row
+
+        new_ids = [_text(event.get('id')) for event in events]
+        if duplicate_ids or None in new_ids or len(set(new_ids)) != len(new_ids):
+            # Ids are not usable as keys - fall back to a full replace
+            self._conn.execute('DELETE FROM events WHERE collection = ?', (collection,))
+            self._conn.executemany(
+                'INSERT INTO events VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                [self._row(collection, event, index) for index, event in enumerate(events)]
+            )
+            return {'inserted': len(events), 'updated': 0, 'deleted': len(existing)}
+
+        # Keep stored positions if surviving rows are still in order and
+        # new rows are only appended; otherwise renumber everything.
+        keep_positions = True
+        last_position = -1
+        seen_new = False
+        for event_id in new_ids:
+            row = existing.get(event_id)
+            if row is None:
+                seen_new = True
+            elif seen_new or row['position'] <= last_position:
+                keep_positions = False
+                break
+            else:
+                last_position = row['position']
+
+        counts = {'inserted': 0, 'updated': 0, 'deleted': 0}
+        next_position = max((row['position'] for row in existing.values()), default=-1) + 1
+
+        for index, (event_id, event) in enumerate(zip(new_ids, events)):
+            row = existing.pop(event_id, None)
+            if row is None:
+                position = next_position if keep_positions else index
+                next_position += 1
+                self._conn.execute(
+                    'INSERT INTO events VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                    self._row(collection, event, position)
+                )
+                counts['inserted'] += 1
+                continue
+
+            position = row['position'] if keep_positions else index
+            body = _encode(event)
+            if body != row['body'] or position != row['position']:
+                values = self._row(collection, event, position)
+                self._conn.execute(
+                    'UPDATE events SET position = ?, status = ?, start_time = ?, '
+                    'source = ?, title = ?, body = ? WHERE rowid = ?',
+                    values[2:] + (row['rowid'],)
+                )
+                counts['updated'] += 1
+
+        if existing:
+            self._conn.executemany(
+                'DELETE FROM events WHERE rowid = ?',
+                [(row['rowid'],) for row in existing.values()]
+            )
+            counts['deleted'] = len(existing)
+
+        return counts
+
+    def _row(self, collection: str, event: Dict[str, Any], position: int) -> tuple:
+        return (
+            collection,
+            _text(event.get('id')),
+            position,
+            _text(event.get('status')),
+            _text(event.get('start_time')),
+            _text(event.get('source')),
+            _text(event.get('title')),
+            _encode(event),
+        )
+
+    # ------------------------------------------------------------------
+    # Row level operations
+    # ------------------------------------------------------------------
+
+    def _ensure_document(self, collection: str) -> None:
+        _, list_key = self._collection(collection)
+        self._conn.execute(
+            'INSERT OR IGNORE INTO documents (collection, envelope) VALUES (?, ?)',
+            (collection, _encode({list_key: None}))
+        )
+
+    def get_event(self, collection: str, event_id: str) -> Optional[Dict[str, Any]]:
+        """Get a single event by id (indexed lookup)."""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT body FROM events WHERE collection = ? AND event_id = ?',
+                (collection, event_id)
+            ).fetchone()
+            return fast_json.loads(row['body']) if row else None
+
+    def upsert_event(self, collection: str, event: Dict[str, Any]) -> bool:
+        """
+        Insert a new event or update the existing event with the same id.
+
+        New events are appended to the end of the collection.
+
+        Returns:
+            True if the event was inserted, False if an existing row was updated
+        """
+        return self.upsert_events(collection, [event]) == 1
+
+    def upsert_events(self, collection: str, events: List[Dict[str, Any]]) -> int:
+        """
+        Insert or update several events in one transaction (see upsert_event).
+
+        Returns:
+            Number of inserted (new) events
+        """
+        if any(_text(event.get('id')) is None for event in events):
+            raise ValueError("Event must have an 'id' to be stored")
+
+        inserted = 0
+        with self.transaction():
+            self._ensure_document(collection)
+            for event in events:
+                inserted += self._upsert_row(collection, event)
+            if events:
+                self._mark_dirty(collection)
+        return inserted
+
+    def _upsert_row(self, collection: str, event: Dict[str, Any]) -> bool:
+        """Insert or update one row by id (inside a transaction)."""
+        row = self._conn.execute(
+            'SELECT rowid, position FROM events WHERE collection = ? AND event_id = ?',
+            (collection, _text(event.get('id')))
+        ).fetchone()
+        if row is not None:
+            values = self._row(collection, event, row['position'])
+            self._conn.execute(
+                'UPDATE events SET status = ?, start_time = ?, source = ?, '
+                'title = ?, body = ? WHERE rowid = ?',
+                values[3:] + (row['rowid'],)
+            )
+            return False
+        position = self._conn.execute(
+            'SELECT COALESCE(MAX(position), -1) + 1 FROM events WHERE collection = ?',
+            (collection,)
+        ).fetchone()[0]
+        self._conn.execute(
+            'INSERT INTO events VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            self._row(collection, event, position)
+        )
+        return True
+
+    def delete_event(self, collection: str, event_id: str) -> bool:
+        """
+        Delete an event by id.
+
+        Returns:
+            True if a row was deleted, False if the id was not found
+        """
+        return self.delete_events(collection, [event_id]) > 0
+
+    def delete_events(self, collection: str, event_ids: List[str]) -> int:
+        """
+        Delete several events by id in one transaction.
+
+        Returns:
+            Number of deleted rows
+        """
+        deleted = 0
+        with self.transaction():
+            for event_id in event_ids:
+                deleted += self._conn.execute(
+                    'DELETE FROM events WHERE collection = ? AND event_id = ?',
+                    (collection, event_id)
+                ).rowcount
+            if deleted:
+                self._mark_dirty(collection)
+        return deleted
+
+    def set_meta(self, collection: str, key: str, value: Any) -> None:
+        """Set a top-level (non-list) key of a collection document."""
+        _, list_key = self._collection(collection)
+        if key == list_key:
+            raise ValueError(f"Use row operations to modify '{list_key}'")
+
+        with self.transaction():
+            self._ensure_document(collection)
+            row = self._conn.execute(
+                'SELECT envelope FROM documents WHERE collection = ?', (collection,)
+            ).fetchone()
+            envelope = fast_json.loads(row['envelope'])
+            envelope[key] = value
+            self._conn.execute(
+                'UPDATE documents SET envelope = ? WHERE collection = ?',
+                (_encode(envelope), collection)
+            )
+            self._mark_dirty(collection)
+
+    def touch(self, collection: str, key: str = 'last_updated') -> None:
+        """Set a timestamp key (e.g. last_updated) to now."""
+        self.set_meta(collection, key, datetime.now().isoformat())
+
+    # ------------------------------------------------------------------
+    # Indexed queries
+    # ------------------------------------------------------------------
+
+    def _query(self, sql: str, params: tuple) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [fast_json.loads(row['body']) for row in self._conn.execute(sql, params)]
+
+    def count(self, collection: str) -> int:
+        """Count events in a collection."""
+        with self._lock:
+            return self._conn.execute(
+                'SELECT COUNT(*) FROM events WHERE collection = ?', (collection,)
+            ).fetchone()[0]
+
+    def find_by_status(self, collection: str, status: str) -> List[Dict[str, Any]]:
+        """Find events with a given status."""
+        return self._query(
+            'SELECT body FROM events WHERE collection = ? AND status = ? ORDER BY position',
+            (collection, status)
+        )
+
+    def find_by_source(self, collection: str, source: str) -> List[Dict[str, Any]]:
+        """Find events scraped from a given source."""
+        return self._query(
+            'SELECT body FROM events WHERE collection = ? AND source = ? ORDER BY position',
+            (collection, source)
+        )
+
+    def find_between(self, collection: str, start: str, end: str) -> List[Dict[str, Any]]:
+        """Find events whose start_time (ISO string) is in [start, end)."""
+        return self._query(
+            'SELECT body FROM events WHERE collection = ? AND start_time >= ? '
+            'AND start_time < ? ORDER BY start_time',
+            (collection, start, end)
+        )
+
+    def find_duplicates(self, title: str, start_time: str) -> List[Dict[str, Any]]:
+        """Find events in any collection with the same (title, start_time) key."""
+        return self._query(
+            'SELECT body FROM events WHERE title = ? AND start_time = ? ORDER BY collection, position',
+            (title, start_time)
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get store statistics.
+
+        Returns:
+            Dictionary with per-collection counts and database size
+        """
+        with self._lock:
+            counts = {
+                row['collection']: row['n']
+                for row in self._conn.execute(
+                    'SELECT collection, COUNT(*) AS n FROM events GROUP BY collection'
+                )
+            }
+        return {
+            'db_path': str(self.db_path),
+            'db_size': self.db_path.stat().st_size if self.db_path.exists() else 0,
+            'collections': {name: counts.get(name, 0) for name in COLLECTIONS},
+            'dirty': sorted(self._dirty),
+        }
+
+
+# One store per repository root and process
+_stores: Dict[str, EventStore] = {}
+_stores_lock = threading.Lock()
+
+
+def export_all_dirty() -> None:
+    """Export the dirty snapshots of every shared store (registered with atexit)."""
+    with _stores_lock:
+        stores = list(_stores.values())
+    for store in stores:
+        try:
+            store.export_dirty()
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Could not export event snapshots from {store.db_path}: {e}")
+
+
+def get_event_store(base_path: Path, create: bool = False) -> Optional[EventStore]:
+    """
+    Get the shared EventStore for a repository root.
+
+    Args:
+        base_path: Root path of the repository
+        create: Create the database if it does not exist yet
+
+    Returns:
+        EventStore instance, or None if the store is not enabled
+    """
+    key = str(Path(base_path).resolve())
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is not None and store.db_path.exists():
+            return store
+        if not create and not is_enabled(base_path):
+            _stores.pop(key, None)
+            return None
+        if not _stores:
+            atexit.register(export_all_dirty)
+        store = EventStore(base_path)
+        _stores[key] = store
+        return store
+
+
+def close_event_stores() -> None:
+    """Close all shared store connections (mainly for tests)."""
+    with _stores_lock:
+        for store in _stores.values():
+            store.close()
+        _stores.clear()
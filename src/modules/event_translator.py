@@ -14,13 +14,17 @@ This module implements the AI translation system with full transparency as
 specified in docs/AI_TRANSLATION_TRANSPARENCY.md.
 """
 
-import json
 import logging
 import time
 from datetime import datetime
 from typing import Dict, List, Optional
 from pathlib import Path
 
+try:
+    from . import fast_json
+except ImportError:
+    import fast_json  # Running as a script from src/modules/
+
 logger = logging.getLogger(__name__)
 
 
@@ -219,7 +223,7 @@ def translate_events_file(input_path: str, output_path: str, config: Dict, force
     try:
         # Load events
         with open(input_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+            data = fast_json.load(f)
         
         events = data.get('events', [])
         logger.info(f"Loaded {len(events)} events from {input_path}")
@@ -233,7 +237,7 @@ def translate_events_file(input_path: str, output_path: str, config: Dict, force
         # Save results
         data['events'] = translated_events
         with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+            fast_json.dump(data, f, ensure_ascii=False, indent=2)
         
         logger.info(f"Saved {len(translated_events)} translated events to {output_path}")
         
@@ -271,7 +275,7 @@ if __name__ == '__main__':
     # Load config
     try:
         with open('config.json', 'r', encoding='utf-8') as f:
-            config = json.load(f)
+            config = fast_json.load(f)
     except Exception as e:
         print(f"Error loading config.json: {e}")
         sys.exit(1)
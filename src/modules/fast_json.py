@@ -0,0 +1,219 @@
+"""
+Fast JSON Backend
+
+One serialization module for all event I/O and HTML embedding. Uses orjson
+when installed, ujson (parsing only) as a second choice, and the stdlib json
+module otherwise.
+
+Features:
+- Drop-in load/loads/dump/dumps with the stdlib arguments used in this repo
+- Byte-identical output to the stdlib in compact mode (separators=COMPACT)
+  and with indent=2, including the \\uXXXX escapes of ensure_ascii=True
+- Anything the fast backend cannot encode identically (other indents, the
+  default ', ' separators, non-str keys, >64-bit ints, datetimes) falls back
+  to the stdlib transparently
+- Parse errors are always json.JSONDecodeError
+
+Usage:
+    from modules import fast_json
+
+    data = fast_json.read_json(path)
+    fast_json.write_json(path, data, indent=2)
+    snippet = fast_json.dumps(events, separators=fast_json.COMPACT, ensure_ascii=False)
+
+Set KRWL_JSON_BACKEND=json to force the stdlib (e.g. when debugging).
+
+Known difference: orjson writes floats in exponent notation without '+' and
+zero padding (1e16 vs 1e+16, 1e-7 vs 1e-07) and NaN as null. Event data
+(coordinates, temperatures, prices) never uses either.
+"""
+
+import json
+import os
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ujson
+    UJSON_AVAILABLE = True
+except ImportError:
+    UJSON_AVAILABLE = False
+
+
+# Separators for compact output (no whitespace) - the byte-identical mode
+COMPACT = (',', ':')
+
+JSONDecodeError = json.JSONDecodeError
+
+# Bytes ensure_ascii leaves alone: ASCII except DEL (0x7f), which it escapes
+_KEPT_BYTES = bytes(range(0x7f))
+
+if ORJSON_AVAILABLE:
+    # Types orjson serializes natively but differently from the stdlib are
+    # passed to `default` (or rejected, which triggers the stdlib fallback)
+    _ORJSON_BASE_OPTION = (
+        orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_SUBCLASS
+    )
+
+
+def _default_backend():
+    """Pick the fastest installed backend (KRWL_JSON_BACKEND overrides)"""
+    requested = os.environ.get('KRWL_JSON_BACKEND', '').lower()
+    if requested == 'json':
+        return 'json'
+    if ORJSON_AVAILABLE and requested in ('', 'orjson'):
+        return 'orjson'
+    if UJSON_AVAILABLE and requested in ('', 'ujson'):
+        return 'ujson'
+    return 'json'
+
+
+_backend = _default_backend()
+
+
+def get_backend() -> str:
+    """Name of the active backend: 'orjson', 'ujson' or 'json'"""
+    return _backend
+
+
+def set_backend(name: str) -> str:
+    """
+    Switch the active backend (used by benchmarks and tests).
+
+    Returns:
+        The previously active backend name
+
+    Raises:
+        ValueError: If the backend is unknown or not installed
+    """
+    global _backend
+    available = {'json': True, 'orjson': ORJSON_AVAILABLE, 'ujson': UJSON_AVAILABLE}
+    if not available.get(name):
+        raise ValueError(f"JSON backend not available: {name}")
+    previous, _backend = _backend, name
+    return previous
+
+
+def _escape_char(char):
+    """Escape one character exactly like json.dumps(ensure_ascii=True)"""
+    code = ord(char)
+    if code < 0x10000:
+        return '\\u{0:04x}'.format(code)
+    code -= 0x10000
+    return '\\u{0:04x}\\u{1:04x}'.format(0xd800 | (code >> 10), 0xdc00 | (code & 0x3ff))
+
+
+def _escape_non_ascii(data: bytes) -> str:
+    """
+    Apply ensure_ascii escaping to UTF-8 encoded JSON.
+
+    Non-ASCII characters (and DEL) can only occur inside JSON strings, so each distinct
+    character is replaced in one pass over the text. Event text uses only a
+    handful of distinct characters (umlauts, dashes, emoji), which keeps this
+    far cheaper than a per-character callback.
+    """
+    text = data.decode('utf-8')
+    for char in set(data.translate(None, _KEPT_BYTES).decode('utf-8')):
+        text = text.replace(char, _escape_char(char))
+    return text
+
+
+def _orjson_option(indent, separators, sort_keys):
+    """orjson option matching the stdlib layout, or None if there is none"""
+    if indent is None and separators == COMPACT:
+        option = _ORJSON_BASE_OPTION
+    elif indent == 2 and separators in (None, (',', ': ')):
+        option = _ORJSON_BASE_OPTION | orjson.OPT_INDENT_2
+    else:
+        return None
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    return option
+
+
+def dumps(obj, indent=None, separators=None, ensure_ascii=True, sort_keys=False, default=None) -> str:
+    """
+    Serialize obj to a JSON string (same arguments and output as json.dumps).
+
+    Args:
+        obj: Object to serialize
+        indent: None or number of spaces (only 2 uses the fast path)
+        separators: (item, key) separators; COMPACT uses the fast path
+        ensure_ascii: Escape non-ASCII characters (stdlib default)
+        sort_keys: Sort dictionary keys
+        default: Fallback serializer for unsupported types
+
+    Returns:
+        JSON string
+    """
+    if _backend == 'orjson':
+        option = _orjson_option(indent, separators, sort_keys)
+        if option is not None:
+            try:
+                data = orjson.dumps(obj, default=default, option=option)
+            except orjson.JSONEncodeError:
+                pass  # Non-str keys, huge ints, ... - the stdlib handles (or reports) them
+            else:
+                if ensure_ascii and (not data.isascii() or b'\x7f' in data):
+                    return _escape_non_ascii(data)
+                return data.decode('utf-8')
+
+    return json.dumps(obj, indent=indent, separators=separators, ensure_ascii=ensure_ascii,
+                      sort_keys=sort_keys, default=default)
+
+
+def loads(s):
+    """
+    Parse a JSON document from str or bytes (same result as json.loads).
+
+    Raises:
+        json.JSONDecodeError: If the document is invalid
+    """
+    if _backend == 'orjson':
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            pass  # NaN/Infinity or invalid - the stdlib accepts or gives the canonical error
+    elif _backend == 'ujson':
+        try:
+            return ujson.loads(s)
+        except ValueError:
+            pass
+    return json.loads(s)
+
+
+def load(fp):
+    """Parse a JSON document from an open file (text or binary mode)"""
+    return loads(fp.read())
+
+
+def dump(obj, fp, **kwargs):
+    """Serialize obj to an open text file (same keyword arguments as dumps)"""
+    fp.write(dumps(obj, **kwargs))
+
+
+def read_json(path):
+    """
+    Read and parse a JSON file.
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    if _backend == 'json':
+        return json.loads(data.decode('utf-8'))
+    return loads(data)
+
+
+def write_json(path, obj, **kwargs):
+    """Serialize obj to a UTF-8 JSON file (same keyword arguments as dumps)"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(dumps(obj, **kwargs))
@@ -0,0 +1,305 @@
+"""
+Fingerprint Index Module
+
+Persistent index of the deduplication keys of every event the project has
+seen, so a scrape can check new events without parsing the event documents.
+
+Before every scrape the scraper used to parse pending_events.json,
+events.json and rejected_events.json and rebuild a Python set of keys from
+each. This index keeps one sorted array of 64-bit key hashes per document in
+.cache/fingerprints.idx (a few bytes per event, loaded in milliseconds) and
+answers lookups with a binary search:
+- pending / published: hash of (title, start_time), as in backup_archive.py
+- rejected: hash of the normalized (title, source) rejection key
+- historical keys stay in the backup archive's own memory-mapped index
+
+Sections are refreshed by the save_* helpers in utils.py from the documents
+they have in memory anyway. Each section records the size and content hash
+of its JSON file; if a file was changed by anything else (manual edit, git
+pull), only that section is rebuilt on next use.
+
+Usage:
+    from modules.fingerprint_index import get_fingerprint_index
+
+    index = get_fingerprint_index(base_path)
+    if index.contains_event(event['title'], event['start_time']):
+        ...
+    if index.is_rejected(event['title'], event['source']):
+        ...
+"""
+
+import hashlib
+import logging
+import os
+import struct
+import threading
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .backup_archive import get_backup_archive, key_hash
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = '.cache/fingerprints.idx'
+
+# File header: magic, number of sections
+HEADER = struct.Struct('<8sI')
+MAGIC = b'KRWLFPX1'
+# Section header: name, JSON file size, JSON content hash, key count
+SECTION = struct.Struct('<16sQ16sQ')
+
+# Section name -> document file in assets/json/
+SECTION_FILES = {
+    'pending': 'pending_events.json',
+    'published': 'events.json',
+    'rejected': 'rejected_events.json',
+}
+
+Stamp = Tuple[int, bytes]
+
+
+def rejected_key_hash(title: Optional[str], source: Optional[str]) -> int:
+    """Hash of the normalized (title, source) rejection key."""
+    return key_hash((title or '').lower().strip(), (source or '').lower().strip())
+
+
+def section_keys(section: str, records: Iterable[Dict[str, Any]]) -> array:
+    """Sorted, unique key hashes of a document's records."""
+    if section == 'rejected':
+        hashes = {rejected_key_hash(r.get('title'), r.get('source')) for r in records}
+    else:
+        hashes = {key_hash(r.get('title'), r.get('start_time')) for r in records}
+    return array('Q', sorted(hashes))
+
+
+def _stat_signature(path: Path) -> Tuple[int, int]:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return 0, 0
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _file_stamp(path: Path) -> Stamp:
+    """(size, content hash) of a file - (0, b'') if it does not exist."""
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return 0, b''
+    return len(data), hashlib.blake2b(data, digest_size=16).digest()
+
+
+class FingerprintIndex:
+    """Sorted key-hash arrays of pending, published and rejected events."""
+
+    def __init__(self, base_path: Path, index_path: Optional[Path] = None):
+        """
+        Args:
+            base_path: Repository root
+            index_path: Index file (default: .cache/fingerprints.idx)
+        """
+        self.base_path = Path(base_path)
+        self.index_path = Path(index_path) if index_path else self.base_path / INDEX_FILE
+        # section -> (stamp of its JSON file, sorted key hashes)
+        self._sections: Dict[str, Tuple[Stamp, array]] = {}
+        # section -> os.stat() signature of its JSON file when last verified
+        self._verified: Dict[str, Tuple[int, int]] = {}
+        self._loaded = False
+        self._lock = threading.RLock()
+        self.stats = {'lookups': 0, 'rebuilds': 0}
+
+    def document_path(self, section: str) -> Path:
+        return self.base_path / 'assets' / 'json' / SECTION_FILES[section]
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            data = self.index_path.read_bytes()
+        except FileNotFoundError:
+            return
+        try:
+            magic, count = HEADER.unpack_from(data, 0)
+            if magic != MAGIC:
+                raise ValueError('bad magic')
+            offset = HEADER.size
+            sections = {}
+            for _ in range(count):
+                name, size, digest, keys = SECTION.unpack_from(data, offset)
+                offset += SECTION.size
+                hashes = array('Q')
+                hashes.frombytes(data[offset:offset + keys * 8])
+                if len(hashes) != keys:
+                    raise ValueError('truncated section')
+                offset += keys * 8
+                sections[name.rstrip(b'\0').decode('ascii')] = ((size, digest), hashes)
+        except (struct.error, ValueError, UnicodeDecodeError) as e:
+            logger.warning(f"Ignoring invalid fingerprint index {self.index_path}: {e}")
+            return
+        self._sections = sections
+
+    def _save(self) -> None:
+        """Atomically write all sections."""
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        parts = [HEADER.pack(MAGIC, len(self._sections))]
+        for name, ((size, digest), hashes) in sorted(self._sections.items()):
+            parts.append(SECTION.pack(name.encode('ascii'), size, digest, len(hashes)))
+            parts.append(hashes.tobytes())
+        tmp_path = self.index_path.with_suffix('.idx.tmp')
+        tmp_path.write_bytes(b''.join(parts))
+        os.replace(tmp_path, self.index_path)
+
+    # ------------------------------------------------------------------
+    # Sections
+    # ------------------------------------------------------------------
+
+    def _load_records(self, section: str) -> List[Dict[str, Any]]:
+        from .utils import load_events, load_pending_events, load_rejected_events
+
+        if section == 'pending':
+            return load_pending_events(self.base_path).get('pending_events', [])
+        if section == 'published':
+            try:
+                return load_events(self.base_path).get('events', [])
+            except FileNotFoundError:
+                return []
+        return load_rejected_events(self.base_path).get('rejected_events', [])
+
+    def _section(self, section: str) -> array:
+        """Key hashes of a section, rebuilt if its JSON file changed."""
+        self._load()
+        path = self.document_path(section)
+        # The content hash is only recomputed when the file's mtime/size moved
+        if self._verified.get(section) != _stat_signature(path):
+            entry = self._sections.get(section)
+            if entry is None or entry[0] != _file_stamp(path):
+                logger.info(f"Fingerprint index: rebuilding {section} keys")
+                self.stats['rebuilds'] += 1
+                self.refresh(section, self._load_records(section))
+            self._verified[section] = _stat_signature(path)
+        return self._sections[section][1]
+
+    def refresh(self, section: str, records: Iterable[Dict[str, Any]]) -> None:
+        """
+        Replace a section's keys after its document was saved.
+
+        Args:
+            section: 'pending', 'published' or 'rejected'
+            records: The saved events / rejection records
+        """
+        with self._lock:
+            self._load()
+            hashes = section_keys(section, records)
+            path = self.document_path(section)
+            self._sections[section] = (_file_stamp(path), hashes)
+            self._verified[section] = _stat_signature(path)
+            self._save()
+
+    def invalidate(self, section: str) -> None:
+        """Drop a section whose document was changed row by row (rebuilt on next lookup)."""
+        with self._lock:
+            self._load()
+            self._verified.pop(section, None)
+            if self._sections.pop(section, None) is not None:
+                self._save()
+
+    def restamp(self, sections: Iterable[str]) -> None:
+        """
+        Re-stamp sections after their documents were exported from the event store.
+
+        A section always reflects its document's latest save (refresh) or was
+        dropped (invalidate), so only the file stamp needs updating.
+        """
+        with self._lock:
+            self._load()
+            changed = False
+            for section in sections:
+                if section not in self._sections:
+                    continue
+                stamp, hashes = self._sections[section]
+                path = self.document_path(section)
+                current = _file_stamp(path)
+                if current != stamp:
+                    self._sections[section] = (current, hashes)
+                    changed = True
+                self._verified[section] = _stat_signature(path)
+            if changed:
+                self._save()
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def contains(self, section: str, value: int) -> bool:
+        """Check whether a key hash is in a section."""
+        with self._lock:
+            hashes = self._section(section)
+            self.stats['lookups'] += 1
+            i = bisect_left(hashes, value)
+            return i < len(hashes) and hashes[i] == value
+
+    def contains_event(self, title: Optional[str], start_time: Optional[str]) -> bool:
+        """Check whether an event with this (title, start_time) is pending, published or archived."""
+        value = key_hash(title, start_time)
+        return (self.contains('pending', value) or self.contains('published', value)
+                or get_backup_archive(self.base_path).contains_key(title, start_time))
+
+    def is_rejected(self, title: Optional[str], source: Optional[str]) -> bool:
+        """Check whether (title, source) matches a rejected event."""
+        return self.contains('rejected', rejected_key_hash(title, source))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get key counts per section and lookup counters."""
+        with self._lock:
+            self._load()
+            stats = dict(self.stats)
+            for section in SECTION_FILES:
+                entry = self._sections.get(section)
+                stats[section] = len(entry[1]) if entry else 0
+            return stats
+
+
+# One index per repository root and process
+_indexes: Dict[str, FingerprintIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_fingerprint_index(base_path: Path) -> FingerprintIndex:
+    """Get the shared FingerprintIndex for a repository root."""
+    key = str(Path(base_path).resolve())
+    with _indexes_lock:
+        if key not in _indexes:
+            _indexes[key] = FingerprintIndex(base_path)
+        return _indexes[key]
+
+
+def refresh_fingerprints(base_path: Path, section: str, records: Iterable[Dict[str, Any]]) -> None:
+    """Update a section after its document was saved (called by utils.save_*)."""
+    try:
+        get_fingerprint_index(base_path).refresh(section, records)
+    except OSError as e:
+        # The index is derived data - it is rebuilt on next use
+        logger.warning(f"Could not update fingerprint index: {e}")
+
+
+def invalidate_fingerprints(base_path: Path, section: str) -> None:
+    """Drop a section after row operations on its document (called by utils)."""
+    try:
+        get_fingerprint_index(base_path).invalidate(section)
+    except OSError as e:
+        logger.warning(f"Could not update fingerprint index: {e}")
+
+
+def restamp_fingerprints(base_path: Path, sections: Iterable[str]) -> None:
+    """Re-stamp sections after event store snapshots were exported (called by utils)."""
+    try:
+        get_fingerprint_index(base_path).restamp(sections)
+    except OSError as e:
+        logger.warning(f"Could not update fingerprint index: {e}")
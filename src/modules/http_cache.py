@@ -0,0 +1,312 @@
+"""
+HTTP Conditional-Request Cache
+
+Persistent cache of scraped HTTP responses, shared by EventScraper and all
+smart scraper sources. Responses that carry an ETag or Last-Modified header
+are stored on disk; the next request for the same URL sends If-None-Match /
+If-Modified-Since, and a 304 answer is served from the stored body.
+
+Features:
+- Bodies in .cache/http/<sha1 of url>.body, validators in .cache/http/index.json
+- Size cap with LRU eviction (scraping.http_cache.max_size_mb)
+- 304 responses are flagged (response.not_modified) so sources can skip
+  parsing a page that has not changed since the last run
+- Hit/304 statistics for the scrape status file
+- Thread-safe (sources are scraped in parallel)
+- Kept across scheduled runs: the scraping workflows restore .cache/http/
+  with actions/cache
+
+Usage:
+    from modules.http_cache import get_http_cache
+
+    cache = get_http_cache(base_path)
+    response = cache.get(session, url, timeout=10)
+    if response.not_modified:
+        ...  # Same body as last run
+    cache.flush()
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+try:
+    import requests
+    from requests.structures import CaseInsensitiveDict
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
+try:
+    from . import fast_json
+except ImportError:
+    import fast_json  # Running as a script from src/modules/
+
+logger = logging.getLogger(__name__)
+
+# Used when config.json has no scraping.http_cache section
+DEFAULT_MAX_SIZE_MB = 50
+
+# Response headers kept with a cached body (enough to rebuild the response)
+_STORED_HEADERS = ('Content-Type', 'ETag', 'Last-Modified')
+
+
+class HTTPCache:
+    """Disk cache of response bodies keyed by URL, revalidated with ETag/Last-Modified"""
+
+    def __init__(self, base_path: Path, cache_dir: str = '.cache/http',
+                 max_size_mb: float = DEFAULT_MAX_SIZE_MB, enabled: bool = True):
+        """
+        Initialize HTTP cache.
+
+        Args:
+            base_path: Repository root
+            cache_dir: Cache directory relative to base_path
+            max_size_mb: Total size cap of stored bodies
+            enabled: False passes every request straight through
+        """
+        self.base_path = Path(base_path)
+        self.cache_dir = self.base_path / cache_dir
+        self.index_file = self.cache_dir / 'index.json'
+        self.max_bytes = int(max_size_mb * 1024 * 1024)
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self.stats = self._empty_stats()
+
+    @staticmethod
+    def _empty_stats() -> Dict[str, int]:
+        return {
+            'requests': 0,
+            'revalidated': 0,      # Sent with If-None-Match / If-Modified-Since
+            'not_modified': 0,     # Answered 304 - served from cache
+            'stored': 0,
+            'evicted': 0,
+            'bytes_downloaded': 0,
+            'bytes_saved': 0,
+        }
+
+    def configure(self, settings: Dict[str, Any]):
+        """Apply a scraping.http_cache config section"""
+        self.enabled = settings.get('enabled', True)
+        self.max_bytes = int(settings.get('max_size_mb', DEFAULT_MAX_SIZE_MB) * 1024 * 1024)
+
+    # ------------------------------------------------------------------
+    # Index
+    # ------------------------------------------------------------------
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        """Entries by URL (loaded lazily, called with the lock held)"""
+        if self._entries is None:
+            try:
+                self._entries = fast_json.read_json(self.index_file).get('entries', {})
+            except FileNotFoundError:
+                self._entries = {}
+            except (fast_json.JSONDecodeError, OSError, AttributeError) as e:
+                logger.warning(f"HTTP cache index unreadable, starting empty: {e}")
+                self._entries = {}
+        return self._entries
+
+    def _body_path(self, url: str) -> Path:
+        return self.cache_dir / (hashlib.sha1(url.encode('utf-8')).hexdigest() + '.body')
+
+    def flush(self):
+        """Write the index to disk if it changed"""
+        with self._lock:
+            if not self._dirty or self._entries is None:
+                return
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.index_file.with_suffix('.tmp')
+            fast_json.write_json(tmp_file, {'version': 1, 'entries': self._entries},
+                                 separators=fast_json.COMPACT)
+            os.replace(tmp_file, self.index_file)
+            self._dirty = False
+
+    def clear(self):
+        """Remove all cached responses"""
+        with self._lock:
+            for entry in self._load_index().values():
+                (self.cache_dir / entry['file']).unlink(missing_ok=True)
+            self._entries = {}
+            self._dirty = True
+        self.flush()
+
+    # ------------------------------------------------------------------
+    # Requests
+    # ------------------------------------------------------------------
+
+    def get(self, session, url: str, **kwargs) -> 'requests.Response':
+        """
+        GET a URL, revalidating a cached copy if there is one.
+
+        Args:
+            session: requests.Session (or module) used for the request
+            url: URL to fetch
+            **kwargs: Passed to session.get (timeout, params, ...)
+
+        Returns:
+            requests.Response with two extra attributes: from_cache (body
+            came from disk) and not_modified (server answered 304). A 304
+            is returned as a 200 response with the cached body.
+        """
+        if not self.enabled or kwargs.get('params'):
+            response = session.get(url, **kwargs)
+            response.from_cache = response.not_modified = False
+            return response
+
+        with self._lock:
+            entry = self._load_index().get(url)
+            self.stats['requests'] += 1
+            if entry:
+                self.stats['revalidated'] += 1
+
+        base_headers = kwargs.pop('headers', None) or {}
+        headers = dict(base_headers)
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        response = session.get(url, headers=headers, **kwargs)
+
+        if response.status_code == 304 and entry:
+            cached = self._cached_response(url, entry, response)
+            if cached is not None:
+                return cached
+            # Body lost from disk - fetch it again unconditionally
+            response = session.get(url, headers=base_headers, **kwargs)
+
+        response.from_cache = response.not_modified = False
+        with self._lock:
+            self.stats['bytes_downloaded'] += len(response.content)
+        if response.status_code == 200:
+            self._store(url, response)
+        return response
+
+    def _cached_response(self, url, entry, not_modified_response):
+        """Rebuild a 200 response from the stored body (None if it is gone)"""
+        try:
+            body = (self.cache_dir / entry['file']).read_bytes()
+        except OSError:
+            with self._lock:
+                self._load_index().pop(url, None)
+                self._dirty = True
+            return None
+
+        response = requests.Response()
+        response.status_code = 200
+        response._content = body
+        response.url = url
+        response.headers = CaseInsensitiveDict(entry.get('headers', {}))
+        response.encoding = entry.get('encoding')
+        response.request = not_modified_response.request
+        response.elapsed = not_modified_response.elapsed
+        response.from_cache = response.not_modified = True
+
+        with self._lock:
+            entry['last_used'] = time.time()
+            self._dirty = True
+            self.stats['not_modified'] += 1
+            self.stats['bytes_saved'] += len(body)
+        return response
+
+    def _store(self, url, response):
+        """Keep a 200 response that can be revalidated next time"""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+        if 'no-store' in response.headers.get('Cache-Control', '').lower():
+            return
+        body = response.content
+        if len(body) > self.max_bytes:
+            return
+
+        body_path = self._body_path(url)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = body_path.with_name(f"{body_path.name}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(body)
+        os.replace(tmp_path, body_path)
+
+        with self._lock:
+            entries = self._load_index()
+            entries[url] = {
+                'file': body_path.name,
+                'etag': etag,
+                'last_modified': last_modified,
+                'encoding': response.encoding,
+                'headers': {name: response.headers[name] for name in _STORED_HEADERS
+                            if name in response.headers},
+                'size': len(body),
+                'stored_at': time.time(),
+                'last_used': time.time(),
+            }
+            self.stats['stored'] += 1
+            self._dirty = True
+            self._evict()
+
+    def _evict(self):
+        """Drop least recently used entries until under max_bytes (lock held)"""
+        entries = self._entries
+        total = sum(entry['size'] for entry in entries.values())
+        if total <= self.max_bytes:
+            return
+        for url in sorted(entries, key=lambda u: entries[u]['last_used']):
+            entry = entries.pop(url)
+            (self.cache_dir / entry['file']).unlink(missing_ok=True)
+            self.stats['evicted'] += 1
+            total -= entry['size']
+            if total <= self.max_bytes:
+                break
+
+    # ------------------------------------------------------------------
+    # Statistics
+    # ------------------------------------------------------------------
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Request statistics of this process plus the current cache size"""
+        with self._lock:
+            entries = self._load_index()
+            stats = dict(self.stats)
+            stats['entries'] = len(entries)
+            stats['size_bytes'] = sum(entry['size'] for entry in entries.values())
+        requests_made = stats['requests']
+        stats['hit_rate'] = round(stats['not_modified'] / requests_made * 100, 1) if requests_made else 0.0
+        return stats
+
+    def reset_stats(self):
+        """Start counting a new run"""
+        with self._lock:
+            self.stats = self._empty_stats()
+
+
+# Process-wide caches by base path
+_caches: Dict[str, HTTPCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_http_cache(base_path, settings: Optional[Dict[str, Any]] = None) -> HTTPCache:
+    """
+    Shared HTTPCache for a repository root.
+
+    Args:
+        base_path: Repository root
+        settings: Optional scraping.http_cache config section to apply
+
+    Returns:
+        The process-wide HTTPCache for base_path
+    """
+    key = os.path.abspath(base_path)
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = _caches[key] = HTTPCache(Path(base_path))
+    if settings is not None:
+        cache.configure(settings)
+    return cache
@@ -0,0 +1,212 @@
+"""
+HTTP Record/Replay
+
+Captures every HTTP exchange of a scrape run into a corpus directory and
+serves it back offline, so scraper behaviour and throughput can be tested
+and measured without the live sites.
+
+All scrapers (EventScraper, the SmartScraper web/custom/social sources and
+Frankenpost detail pages) use requests sessions, so recording and replay hook
+requests.Session.send for the duration of a `with` block.
+
+Corpus layout:
+    DIR/index.json          Exchanges: method, url, status, headers, body hash
+    DIR/bodies/<sha1>       Response bodies (content-addressed, deduplicated)
+
+Usage:
+    from modules.http_replay import HTTPCorpus
+
+    with HTTPCorpus(corpus_dir).record():
+        scraper.scrape_all_sources()       # live network, exchanges saved
+
+    with HTTPCorpus(corpus_dir).replay():
+        scraper.scrape_all_sources()       # no network, recorded responses
+
+Requests that are not in the corpus fail with requests.ConnectionError during
+replay, exactly like an unreachable host.
+"""
+
+import hashlib
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+try:
+    import requests
+    from requests.structures import CaseInsensitiveDict
+    from requests.utils import get_encoding_from_headers
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
+try:
+    from . import fast_json
+except ImportError:
+    import fast_json  # Running as a script from src/modules/
+
+# Headers describing the wire format; bodies are stored decoded
+_DROPPED_HEADERS = {'content-encoding', 'transfer-encoding', 'content-length', 'set-cookie'}
+
+# Only one record/replay block can patch requests at a time
+_patch_lock = threading.Lock()
+
+
+class HTTPCorpus:
+    """A directory of recorded HTTP exchanges"""
+
+    def __init__(self, directory):
+        """
+        Args:
+            directory: Corpus directory (created when recording)
+        """
+        self.directory = Path(directory)
+        self.index_file = self.directory / 'index.json'
+        self.bodies_dir = self.directory / 'bodies'
+        self.exchanges: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def exists(self) -> bool:
+        return self.index_file.exists()
+
+    def load(self) -> 'HTTPCorpus':
+        """Read the corpus index (FileNotFoundError if nothing was recorded)"""
+        self.exchanges = fast_json.read_json(self.index_file).get('exchanges', [])
+        return self
+
+    def save(self):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fast_json.write_json(self.index_file, {
+            'version': 1,
+            'recorded_at': datetime.now().isoformat(),
+            'exchanges': self.exchanges,
+        }, indent=2)
+
+    def urls(self) -> List[str]:
+        """Recorded request URLs in recording order (without repeats)"""
+        return list(dict.fromkeys(exchange['url'] for exchange in self.exchanges))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Number of exchanges and URLs plus total body size"""
+        bodies = {exchange['body'] for exchange in self.exchanges}
+        return {
+            'exchanges': len(self.exchanges),
+            'urls': len(self.urls()),
+            'bodies': len(bodies),
+            'size_bytes': sum((self.bodies_dir / body).stat().st_size for body in bodies
+                              if (self.bodies_dir / body).exists()),
+        }
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def record(self):
+        """Record all requests made inside the block (appends to the corpus)"""
+        if self.exists():
+            self.load()
+        original_send = requests.Session.send
+        corpus = self
+
+        def send(session, request, **kwargs):
+            response = original_send(session, request, **kwargs)
+            corpus._add(request, response)
+            return response
+
+        with _patched_send(send):
+            try:
+                yield self
+            finally:
+                self.save()
+
+    def _add(self, request, response):
+        body = response.content or b''
+        digest = hashlib.sha1(body).hexdigest()
+        body_path = self.bodies_dir / digest
+        with self._lock:
+            if not body_path.exists():
+                self.bodies_dir.mkdir(parents=True, exist_ok=True)
+                body_path.write_bytes(body)
+            self.exchanges.append({
+                'method': request.method,
+                'url': request.url,
+                'status': response.status_code,
+                'reason': response.reason,
+                'final_url': response.url,
+                'headers': {name: value for name, value in response.headers.items()
+                            if name.lower() not in _DROPPED_HEADERS},
+                'body': digest,
+                'elapsed_ms': round(response.elapsed.total_seconds() * 1000, 1),
+            })
+
+    # ------------------------------------------------------------------
+    # Replay
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def replay(self):
+        """Serve requests made inside the block from the corpus"""
+        self.load()
+        by_request: Dict[tuple, List[Dict[str, Any]]] = {}
+        for exchange in self.exchanges:
+            by_request.setdefault((exchange['method'], exchange['url']), []).append(exchange)
+        # Repeated requests get the recorded answers in order, then the last one again
+        served: Dict[tuple, int] = {}
+        corpus = self
+
+        def send(session, request, **kwargs):
+            key = (request.method, request.url)
+            answers = by_request.get(key)
+            if not answers:
+                raise requests.exceptions.ConnectionError(
+                    f"Not in recorded corpus {corpus.directory}: {request.method} {request.url}",
+                    request=request)
+            with corpus._lock:
+                position = served.get(key, 0)
+                served[key] = position + 1
+            return corpus._build_response(request, answers[min(position, len(answers) - 1)])
+
+        with _patched_send(send):
+            yield self
+
+    def _build_response(self, request, exchange) -> 'requests.Response':
+        response = requests.Response()
+        response.status_code = exchange['status']
+        response.reason = exchange.get('reason')
+        response.url = exchange.get('final_url') or exchange['url']
+        response.headers = CaseInsensitiveDict(exchange.get('headers', {}))
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = (self.bodies_dir / exchange['body']).read_bytes()
+        response.request = request
+        response.elapsed = timedelta(milliseconds=exchange.get('elapsed_ms', 0))
+        return response
+
+
+@contextmanager
+def _patched_send(send):
+    """Replace requests.Session.send for the duration of the block"""
+    if not REQUESTS_AVAILABLE:
+        raise RuntimeError("requests is not installed")
+    if not _patch_lock.acquire(blocking=False):
+        raise RuntimeError("HTTP recording or replay is already active")
+    original_send = requests.Session.send
+    requests.Session.send = send
+    try:
+        yield
+    finally:
+        requests.Session.send = original_send
+        _patch_lock.release()
+
+
+def find_source_exchange(corpus: HTTPCorpus, url: str) -> Optional[Dict[str, Any]]:
+    """First recorded GET of a source URL (None if the source was not recorded)"""
+    try:
+        prepared_url = requests.Request('GET', url).prepare().url
+    except requests.exceptions.RequestException:
+        return None
+    for exchange in corpus.exchanges:
+        if exchange['method'] == 'GET' and exchange['url'] == prepared_url:
+            return exchange
+    return None
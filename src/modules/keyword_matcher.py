@@ -0,0 +1,151 @@
+"""
+Keyword Matcher Module
+
+Compiled keyword -> category matching for the keyword categorizers
+(AICategorizer's fallback and EventSchema._infer_category).
+
+Both used to test every keyword of every category with `keyword in text`,
+i.e. one scan of the event text per keyword. A KeywordMatcher compiles a
+{category: [keywords]} map once into prefix-trie shaped regexes (one branch
+per character instead of one test per keyword) and finds all keywords in
+two passes over the text, both anchored at word boundaries:
+- Keywords match at the start of a word ("concert" matches "Concerts",
+  "art" no longer matches "start" or "party", "band" no longer "Verband")
+- Keywords of MIN_AFFIX_LENGTH or more characters also match at the end of
+  a word, which German compounds need ("Krafttraining",
+  "Gesundheitssport"); this pass runs over the reversed text
+- At each position the longest keyword wins; keywords it starts (or ends)
+  with are counted as well ("festival" also counts "fest"), so counts are
+  the same as testing every keyword separately
+- Counts are distinct keywords per category, as the scoring expects
+
+Usage:
+    from modules.keyword_matcher import KeywordMatcher
+
+    matcher = KeywordMatcher({'music': ['concert', 'band'], ...})
+    counts = matcher.count("Rock concert with local bands")  # {'music': 2}
+"""
+
+import re
+import threading
+from typing import Dict, Iterable, List, Optional, Pattern, Set, Tuple
+
+# Keywords at least this long also match at the end of a word (compounds)
+MIN_AFFIX_LENGTH = 5
+
+
+def trie_pattern(words: Iterable[str]) -> str:
+    """
+    Regex alternation of words, factored by common prefixes.
+
+    ['art', 'artifact', 'band'] becomes '(?:a(?:rt(?:ifact)?)|band)'
+    (roughly): at each position the regex engine follows one branch per
+    character instead of trying every word, and the longest word wins.
+    """
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        # Greedy optional tail: longer words are preferred over their prefixes
+        return f'(?:{body})?' if '' in node else body
+
+    return build(trie)
+
+
+class KeywordMatcher:
+    """Word-boundary keyword matcher for a category -> keywords map."""
+
+    def __init__(self, keyword_map: Dict[str, List[str]]):
+        """
+        Args:
+            keyword_map: Category -> keywords (lowercase); the patterns are
+                         compiled on first use
+        """
+        self.keyword_map = keyword_map
+        self.categories = list(keyword_map)
+        self._patterns: Optional[Tuple[Pattern, Optional[Pattern]]] = None
+        # keyword -> categories it counts for
+        self._categories_of: Dict[str, List[str]] = {}
+        # keyword -> keywords it starts with (itself included)
+        self._prefixes: Dict[str, Set[str]] = {}
+        # reversed long keyword -> long keywords the keyword ends with
+        self._suffixes: Dict[str, Set[str]] = {}
+        # keyword -> position of its first category in the map
+        self._first_category: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _compile(self) -> Tuple[Pattern, Optional[Pattern]]:
+        with self._lock:
+            if self._patterns is not None:
+                return self._patterns
+            for category, keywords in self.keyword_map.items():
+                for keyword in keywords:
+                    self._categories_of.setdefault(keyword.lower(), []).append(category)
+            keywords = list(self._categories_of)
+            long_keywords = [keyword for keyword in keywords if len(keyword) >= MIN_AFFIX_LENGTH]
+            for keyword in keywords:
+                self._first_category[keyword] = self.categories.index(self._categories_of[keyword][0])
+                self._prefixes[keyword] = {other for other in keywords if keyword.startswith(other)}
+            for keyword in long_keywords:
+                self._suffixes[keyword[::-1]] = {other for other in long_keywords if keyword.endswith(other)}
+
+            # Zero-width lookahead: every word start is tried, so keywords
+            # starting inside a longer match are still found
+            starts = re.compile(rf'\b(?=({trie_pattern(keywords)}))')
+            ends = None
+            if long_keywords:
+                ends = re.compile(rf'\b(?=({trie_pattern(k[::-1] for k in long_keywords)}))')
+            self._patterns = (starts, ends)
+            return self._patterns
+
+    def find(self, text: str) -> Set[str]:
+        """
+        Distinct keywords found in text.
+
+        Args:
+            text: Lowercased text
+        """
+        starts, ends = self._patterns or self._compile()
+        found: Set[str] = set()
+        for keyword in set(starts.findall(text)):
+            found |= self._prefixes[keyword]
+        if ends is not None:
+            for reversed_keyword in set(ends.findall(text[::-1])):
+                found |= self._suffixes[reversed_keyword]
+        return found
+
+    def count(self, text: str) -> Dict[str, int]:
+        """
+        Number of distinct keywords per category found in text.
+
+        Args:
+            text: Lowercased text
+
+        Returns:
+            Category -> match count (categories without matches omitted)
+        """
+        counts: Dict[str, int] = {}
+        for keyword in self.find(text):
+            for category in self._categories_of[keyword]:
+                counts[category] = counts.get(category, 0) + 1
+        return counts
+
+    def first_match(self, text: str) -> Optional[str]:
+        """
+        First category (in map order) with any keyword in text.
+
+        Args:
+            text: Lowercased text
+        """
+        found = self.find(text)
+        if not found:
+            return None
+        return self.categories[min(self._first_category[keyword] for keyword in found)]
@@ -5,12 +5,13 @@ Resolves generic location names (e.g., "Hof", "Frankenpost") to specific venue n
 by scraping event detail pages for actual location information.
 """
 
-import json
 import logging
 import re
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
+from . import fast_json
+
 # Configure module logger
 logger = logging.getLogger(__name__)
 
@@ -80,7 +81,7 @@ class LocationResolver:
             return {'total_checked': 0, 'resolved_count': 0, 'failed_count': 0}
         
         with open(pending_file, 'r', encoding='utf-8') as f:
-            pending_data = json.load(f)
+            pending_data = fast_json.load(f)
         
         events = pending_data.get('pending_events', [])
         
@@ -152,7 +153,7 @@ class LocationResolver:
         # Save updated pending events (if not dry run and changes were made)
         if not dry_run and resolved_count > 0:
             with open(pending_file, 'w', encoding='utf-8') as f:
-                json.dump(pending_data, f, indent=2, ensure_ascii=False)
+                fast_json.dump(pending_data, f, indent=2, ensure_ascii=False)
             logger.info(f"✓ Updated {resolved_count} events in pending_events.json")
         
         # Print summary
@@ -313,7 +314,7 @@ class LocationResolver:
             return {'error': 'No pending events file found'}
         
         with open(pending_file, 'r', encoding='utf-8') as f:
-            pending_data = json.load(f)
+            pending_data = fast_json.load(f)
         
         events = pending_data.get('pending_events', [])
         event = next((e for e in events if e.get('id') == event_id), None)
@@ -349,7 +350,7 @@ class LocationResolver:
                         event['location']['address'] = new_location['address']
                     
                     with open(pending_file, 'w', encoding='utf-8') as f:
-                        json.dump(pending_data, f, indent=2, ensure_ascii=False)
+                        fast_json.dump(pending_data, f, indent=2, ensure_ascii=False)
                 
                 return result
             else:
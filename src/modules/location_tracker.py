@@ -5,11 +5,12 @@ Collects and manages unverified locations from scrapers for editor review.
 This keeps scraper code simple (KISS) while providing location management features.
 """
 
-import json
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+from . import fast_json
+
 
 class LocationTracker:
     """
@@ -39,7 +40,7 @@ class LocationTracker:
         if self.unverified_file.exists():
             try:
                 with open(self.unverified_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                    data = fast_json.load(f)
                     self.unverified_locations = data.get('locations', {})
             except Exception as e:
                 print(f"  ⚠ Warning: Could not load unverified locations: {e}")
@@ -48,7 +49,7 @@ class LocationTracker:
         if self.verified_file.exists():
             try:
                 with open(self.verified_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                    data = fast_json.load(f)
                     self.verified_locations = data.get('locations', {})
             except Exception as e:
                 print(f"  ⚠ Warning: Could not load verified locations: {e}")
@@ -165,7 +166,7 @@ class LocationTracker:
             }
             
             with open(self.unverified_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+                fast_json.dump(data, f, indent=2, ensure_ascii=False)
             
         except Exception as e:
             print(f"  ⚠ Warning: Could not save unverified locations: {e}")
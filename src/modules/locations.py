@@ -22,13 +22,13 @@ Usage:
     python3 src/event_manager.py locations add --name "Theater Hof" --lat 50.32 --lon 11.92
 """
 
-import json
 import logging
 import os
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timezone
 
+from . import fast_json
 from .entity_models import Location, generate_location_id
 
 logger = logging.getLogger(__name__)
@@ -59,17 +59,17 @@ class LocationManager:
                 'locations': []
             }
             with open(self.locations_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+                fast_json.dump(data, f, indent=2, ensure_ascii=False)
     
     def _load_data(self) -> dict:
         """Load locations.json"""
         with open(self.locations_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+            return fast_json.load(f)
     
     def _save_data(self, data: dict):
         """Save locations.json"""
         with open(self.locations_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+            fast_json.dump(data, f, indent=2, ensure_ascii=False)
     
     def add_location(self, location: Location) -> str:
         """
@@ -627,7 +627,7 @@ class LocationCLI:
         
         if output_format == 'json':
             data = [loc.to_dict() for loc in locations]
-            print(json.dumps(data, indent=2, ensure_ascii=False))
+            print(fast_json.dumps(data, indent=2, ensure_ascii=False))
         else:
             print(f"Total locations: {len(locations)}")
             print()
@@ -7,8 +7,8 @@ It ensures data integrity throughout the scraping, editing, and publishing pipel
 
 import logging
 from datetime import datetime
-from typing import Optional, List, Dict
-from pydantic import BaseModel, Field, field_validator, model_validator
+from typing import Optional, List, Dict, Tuple
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError, field_validator, model_validator
 
 logger = logging.getLogger(__name__)
 
@@ -182,6 +182,10 @@ class MapConfig(BaseModel):
         return v
 
 
+# List-level validator, built once per process (bulk validation of a scrape)
+_EVENT_LIST_ADAPTER = TypeAdapter(List[Event])
+
+
 def validate_event_data(event_data: dict) -> Event:
     """
     Validate event data and return a Pydantic Event model
@@ -202,6 +206,40 @@ def validate_event_data(event_data: dict) -> Event:
         raise ValueError(f"Invalid event data: {e}") from e
 
 
+def validate_events_bulk(events_data: List[dict]) -> Tuple[List[Optional[Event]], Dict[int, str]]:
+    """
+    Validate a batch of events with one list-level validator call
+    
+    The common case (every event valid) costs a single TypeAdapter call. If
+    some events are invalid, the rest is validated again in one more call.
+    
+    Args:
+        events_data: List of event dictionaries
+        
+    Returns:
+        Tuple of (models, errors): models[i] is the Event for events_data[i]
+        or None if it is invalid, errors maps those indexes to a message
+    """
+    try:
+        return _EVENT_LIST_ADAPTER.validate_python(events_data), {}
+    except ValidationError as e:
+        messages: Dict[int, List[str]] = {}
+        for error in e.errors():
+            loc = error.get('loc') or ()
+            if not loc or not isinstance(loc[0], int):
+                raise  # Not a per-event error (e.g. input is not a list)
+            field = '.'.join(str(part) for part in loc[1:])
+            messages.setdefault(loc[0], []).append(f"{field}: {error['msg']}" if field else error['msg'])
+    
+    errors = {index: '; '.join(msgs) for index, msgs in messages.items()}
+    valid_indexes = [index for index in range(len(events_data)) if index not in errors]
+    models: List[Optional[Event]] = [None] * len(events_data)
+    for index, model in zip(valid_indexes,
+                            _EVENT_LIST_ADAPTER.validate_python([events_data[i] for i in valid_indexes])):
+        models[index] = model
+    return models, errors
+
+
 def validate_events_list(events_data: List[dict]) -> List[Event]:
     """
     Validate a list of events and return validated models
@@ -212,18 +250,13 @@ def validate_events_list(events_data: List[dict]) -> List[Event]:
     Returns:
         List of validated Event models (invalid events are skipped with warning)
     """
-    validated_events = []
-    for idx, event_data in enumerate(events_data):
-        try:
-            validated_event = validate_event_data(event_data)
-            validated_events.append(validated_event)
-        except ValueError as e:
-            logger.warning(
-                f"Skipping invalid event at index {idx}: {e}",
-                extra={'event_index': idx, 'event_title': event_data.get('title', 'Unknown')}
-            )
-    
-    return validated_events
+    models, errors = validate_events_bulk(events_data)
+    for idx, message in sorted(errors.items()):
+        logger.warning(
+            f"Skipping invalid event at index {idx}: Invalid event data: {message}",
+            extra={'event_index': idx, 'event_title': events_data[idx].get('title', 'Unknown')}
+        )
+    return [model for model in models if model is not None]
 
 
 def validate_location_data(location_data: dict) -> Location:
@@ -0,0 +1,405 @@
+"""
+Near-Duplicate Detection Module
+
+Fuzzy deduplication of scraped events with MinHash and locality-sensitive
+hashing (LSH).
+
+The exact (title, start_time) check in EventScraper misses the same concert
+scraped from several sources with slightly different titles ("Jazz-Konzert:
+Trio X" vs. "Trio X - Jazzkonzert") or start times. Each event is reduced to a
+set of shingles (character 3-grams of the title, venue words and the leading
+description words) and a MinHash signature whose agreement estimates the
+Jaccard similarity of two shingle sets.
+
+Comparing every scraped event with every known event would be linear in the
+history size. Instead signatures are split into bands and hashed into buckets
+keyed by the event day, so a lookup only compares events that share the same
+day and at least one band:
+- Pending and published events: in-memory index, built only for the days
+  present in the current scrape
+- Historical events (backup archive): persistent SQLite index in
+  data/scraper_cache/near_duplicates.sqlite3, synced incrementally from the
+  append-only archive segments
+
+Usage:
+    from modules.near_duplicates import NearDuplicateDetector
+
+    detector = NearDuplicateDetector(base_path, settings)
+    detector.prepare(scraped_events, pending_events, published_events)
+    match = detector.find(event)
+    if match and match.similarity >= detector.merge_threshold:
+        ...
+"""
+
+import hashlib
+import logging
+import random
+import re
+import sqlite3
+import unicodedata
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+NUM_PERM = 64
+BANDS = 32
+ROWS = NUM_PERM // BANDS
+SEED = 20240601
+
+DEFAULT_THRESHOLD = 0.5
+DEFAULT_MERGE_THRESHOLD = 0.9
+
+# Leading description words that take part in the shingle set; descriptions
+# differ most between sources, so they only tip the balance
+DESCRIPTION_WORDS = 8
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 64) - 1
+_NON_WORD = re.compile(r'[^a-z0-9]+')
+# Sources spell German umlauts either way ("Küche" / "Kueche")
+_UMLAUTS = (('ä', 'ae'), ('ö', 'oe'), ('ü', 'ue'), ('ß', 'ss'))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS signatures (
+    ref       INTEGER PRIMARY KEY,
+    segment   INTEGER NOT NULL,
+    day       TEXT NOT NULL,
+    event_id  TEXT,
+    title     TEXT,
+    source    TEXT,
+    signature BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS bands (
+    day  TEXT NOT NULL,
+    band INTEGER NOT NULL,
+    hash INTEGER NOT NULL,
+    ref  INTEGER NOT NULL,
+    PRIMARY KEY (day, band, hash, ref)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS segments (
+    number INTEGER PRIMARY KEY,
+    offset INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def get_near_duplicate_index_path(base_path: Path) -> Path:
+    """Return the historical near-duplicate index path for a repository root."""
+    return Path(base_path) / "data" / "scraper_cache" / "near_duplicates.sqlite3"
+
+
+def normalize_text(text: Any) -> str:
+    """Lowercase, spell out umlauts, strip accents and collapse everything but letters and digits."""
+    text = str(text or '').lower()
+    for umlaut, spelled in _UMLAUTS:
+        text = text.replace(umlaut, spelled)
+    text = unicodedata.normalize('NFKD', text)
+    text = ''.join(c for c in text if not unicodedata.combining(c))
+    return _NON_WORD.sub(' ', text).strip()
+
+
+def shingles(event: Dict[str, Any]) -> Set[str]:
+    """
+    Shingle set of an event: title character 3-grams, venue words and the
+    first DESCRIPTION_WORDS significant description words.
+    """
+    result = set()
+    title = normalize_text(event.get('title'))
+    if title:
+        padded = f" {title} "
+        result.update('t:' + padded[i:i + 3] for i in range(len(padded) - 2))
+
+    location = event.get('location')
+    venue = location.get('name') if isinstance(location, dict) else location
+    result.update('v:' + word for word in normalize_text(venue).split() if len(word) > 2)
+
+    words = [word for word in normalize_text(event.get('description')).split() if len(word) > 3]
+    result.update('d:' + word for word in words[:DESCRIPTION_WORDS])
+    return result
+
+
+def date_bucket(event: Dict[str, Any]) -> Optional[str]:
+    """Blocking key: the event day (YYYY-MM-DD) or None without a start time."""
+    start_time = event.get('start_time')
+    if not isinstance(start_time, str) or len(start_time) < 10:
+        return None
+    return start_time[:10]
+
+
+class MinHasher:
+    """MinHash signatures from NUM_PERM universal hash permutations."""
+
+    def __init__(self, num_perm: int = NUM_PERM, seed: int = SEED):
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self.permutations = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+
+    def signature(self, shingle_set: Iterable[str]) -> Tuple[int, ...]:
+        """MinHash signature of a shingle set (all-max for an empty set)."""
+        hashes = [
+            int.from_bytes(hashlib.blake2b(s.encode('utf-8'), digest_size=8).digest(), 'little')
+            for s in shingle_set
+        ]
+        if not hashes:
+            return (_MAX_HASH,) * self.num_perm
+        return tuple(
+            min((a * h + b) % _MERSENNE_PRIME for h in hashes)
+            for a, b in self.permutations
+        )
+
+
+def similarity(sig_a: Tuple[int, ...], sig_b: Tuple[int, ...]) -> float:
+    """Estimated Jaccard similarity: share of agreeing signature positions."""
+    return sum(1 for a, b in zip(sig_a, sig_b) if a == b) / len(sig_a)
+
+
+def band_hashes(signature: Tuple[int, ...]) -> List[int]:
+    """LSH bucket hash per band (63-bit, so SQLite can store it as INTEGER)."""
+    result = []
+    for band in range(BANDS):
+        rows = array('Q', signature[band * ROWS:(band + 1) * ROWS]).tobytes()
+        result.append(int.from_bytes(hashlib.blake2b(rows, digest_size=8).digest(), 'little') >> 1)
+    return result
+
+
+@dataclass
+class NearDuplicateMatch:
+    """Most similar known event for a scraped event"""
+    similarity: float
+    origin: str  # 'batch', 'pending', 'published' or 'historical'
+    event_id: Optional[str] = None
+    title: Optional[str] = None
+    source: Optional[str] = None
+    event: Optional[Dict[str, Any]] = None  # Only for in-memory origins
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary stored on a marked event (possible_duplicate)."""
+        return {
+            'id': self.event_id,
+            'title': self.title,
+            'source': self.source,
+            'in': self.origin,
+            'similarity': round(self.similarity, 2),
+        }
+
+
+class LSHIndex:
+    """In-memory LSH index of signatures, blocked by day."""
+
+    def __init__(self):
+        self.buckets: Dict[Tuple[str, int, int], List[int]] = {}
+        self.entries: List[Tuple[Tuple[int, ...], str, Dict[str, Any]]] = []
+
+    def add(self, day: str, signature: Tuple[int, ...], hashes: List[int],
+            origin: str, event: Dict[str, Any]) -> None:
+        ref = len(self.entries)
+        self.entries.append((signature, origin, event))
+        for band, value in enumerate(hashes):
+            self.buckets.setdefault((day, band, value), []).append(ref)
+
+    def query(self, day: str, signature: Tuple[int, ...],
+              hashes: List[int]) -> Optional[NearDuplicateMatch]:
+        """Best candidate sharing a bucket with the signature."""
+        candidates = set()
+        for band, value in enumerate(hashes):
+            candidates.update(self.buckets.get((day, band, value), ()))
+
+        best = None
+        for ref in candidates:
+            other, origin, event = self.entries[ref]
+            score = similarity(signature, other)
+            if best is None or score > best.similarity:
+                best = NearDuplicateMatch(score, origin, event.get('id'),
+                                          event.get('title'), event.get('source'), event)
+        return best
+
+
+class HistoricalLSHIndex:
+    """Persistent LSH index of backup archive events (SQLite)."""
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+
+    def _connect(self) -> sqlite3.Connection:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(SCHEMA)
+        return conn
+
+    def sync(self, archive, hasher: MinHasher) -> int:
+        """
+        Index backups appended since the last sync.
+
+        Returns:
+            Number of newly indexed events
+        """
+        conn = self._connect()
+        try:
+            params = f"{hasher.num_perm}/{BANDS}/{SEED}/{DESCRIPTION_WORDS}"
+            row = conn.execute("SELECT value FROM meta WHERE key = 'params'").fetchone()
+            if row is None or row[0] != params:
+                # Signatures of another configuration are not comparable
+                with conn:
+                    conn.execute("DELETE FROM signatures")
+                    conn.execute("DELETE FROM bands")
+                    conn.execute("DELETE FROM segments")
+                    conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('params', ?)", (params,))
+
+            offsets = dict(conn.execute("SELECT number, offset FROM segments").fetchall())
+            for number, offset in list(offsets.items()):
+                path = archive.segment_path(number)
+                if not path.exists() or path.stat().st_size < offset:
+                    # Segment was replaced - re-index it from the start
+                    with conn:
+                        conn.execute("DELETE FROM bands WHERE ref IN "
+                                     "(SELECT ref FROM signatures WHERE segment = ?)", (number,))
+                        conn.execute("DELETE FROM signatures WHERE segment = ?", (number,))
+                        conn.execute("DELETE FROM segments WHERE number = ?", (number,))
+                    del offsets[number]
+
+            added = 0
+            with conn:
+                for number, offset, event in archive.iter_segment_events(offsets):
+                    offsets[number] = offset
+                    day = date_bucket(event)
+                    if day is None:
+                        continue
+                    signature = hasher.signature(shingles(event))
+                    cursor = conn.execute(
+                        "INSERT INTO signatures (segment, day, event_id, title, source, signature) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (number, day, event.get('id'), event.get('title'), event.get('source'),
+                         array('Q', signature).tobytes())
+                    )
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO bands (day, band, hash, ref) VALUES (?, ?, ?, ?)",
+                        [(day, band, value, cursor.lastrowid)
+                         for band, value in enumerate(band_hashes(signature))]
+                    )
+                    added += 1
+                conn.executemany(
+                    "INSERT OR REPLACE INTO segments (number, offset) VALUES (?, ?)",
+                    offsets.items()
+                )
+            return added
+        finally:
+            conn.close()
+
+    def query_many(self, lookups: List[Tuple[str, Tuple[int, ...], List[int]]]) -> List[Optional[NearDuplicateMatch]]:
+        """Best historical candidate for each (day, signature, band hashes)."""
+        if not lookups or not self.db_path.exists():
+            return [None] * len(lookups)
+        conn = self._connect()
+        try:
+            results = []
+            band_filter = ' OR '.join(['(band = ? AND hash = ?)'] * BANDS)
+            for day, signature, hashes in lookups:
+                params = [day]
+                for band, value in enumerate(hashes):
+                    params.extend((band, value))
+                rows = conn.execute(
+                    "SELECT event_id, title, source, signature FROM signatures WHERE ref IN "
+                    f"(SELECT ref FROM bands WHERE day = ? AND ({band_filter}))",
+                    params
+                ).fetchall()
+                best = None
+                for event_id, title, source, blob in rows:
+                    score = similarity(signature, tuple(array('Q', blob)))
+                    if best is None or score > best.similarity:
+                        best = NearDuplicateMatch(score, 'historical', event_id, title, source)
+                results.append(best)
+            return results
+        finally:
+            conn.close()
+
+
+class NearDuplicateDetector:
+    """Finds probable duplicates of scraped events among known events."""
+
+    def __init__(self, base_path: Path, settings: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            base_path: Repository root
+            settings: scraping.near_duplicates from config.json
+                      (enabled, threshold, merge_threshold)
+        """
+        settings = settings or {}
+        self.base_path = Path(base_path)
+        self.enabled = settings.get('enabled', True)
+        self.threshold = float(settings.get('threshold', DEFAULT_THRESHOLD))
+        merge_threshold = settings.get('merge_threshold', DEFAULT_MERGE_THRESHOLD)
+        # None disables merging - probable duplicates are only marked
+        self.merge_threshold = float(merge_threshold) if merge_threshold is not None else None
+        self.hasher = MinHasher()
+        self.index = LSHIndex()
+        self.historical = HistoricalLSHIndex(get_near_duplicate_index_path(self.base_path))
+        self._historical_matches: Dict[int, Optional[NearDuplicateMatch]] = {}
+        self._signatures: Dict[int, Tuple[str, Tuple[int, ...], List[int]]] = {}
+
+    def _sign(self, event: Dict[str, Any]) -> Optional[Tuple[str, Tuple[int, ...], List[int]]]:
+        key = id(event)
+        if key not in self._signatures:
+            day = date_bucket(event)
+            if day is None:
+                self._signatures[key] = None
+            else:
+                signature = self.hasher.signature(shingles(event))
+                self._signatures[key] = (day, signature, band_hashes(signature))
+        return self._signatures[key]
+
+    def prepare(self, scraped_events: List[Dict[str, Any]],
+                pending_events: List[Dict[str, Any]],
+                published_events: List[Dict[str, Any]]) -> None:
+        """
+        Index known events for the days of the scraped events and look up the
+        historical index once for the whole batch.
+        """
+        days = {date_bucket(event) for event in scraped_events} - {None}
+        for origin, events in (('pending', pending_events), ('published', published_events)):
+            for event in events:
+                if date_bucket(event) in days:
+                    self.index.add(*self._sign(event), origin, event)
+
+        from .backup_archive import get_backup_archive
+        try:
+            added = self.historical.sync(get_backup_archive(self.base_path), self.hasher)
+            if added:
+                logger.info(f"Near-duplicate index: {added} archived events indexed")
+            lookups = [(event, self._sign(event)) for event in scraped_events]
+            lookups = [(event, signed) for event, signed in lookups if signed is not None]
+            matches = self.historical.query_many([signed for _, signed in lookups])
+            self._historical_matches = {id(event): match for (event, _), match in zip(lookups, matches)}
+        except sqlite3.Error as e:
+            logger.warning(f"Near-duplicate index unavailable, checking pending/published only: {e}")
+            self._historical_matches = {}
+
+    def find(self, event: Dict[str, Any]) -> Optional[NearDuplicateMatch]:
+        """Most similar known or already accepted event above threshold."""
+        signed = self._sign(event)
+        if signed is None:
+            return None
+        day, signature, hashes = signed
+        best = self.index.query(day, signature, hashes)
+        historical = self._historical_matches.get(id(event))
+        if historical is not None and (best is None or historical.similarity > best.similarity):
+            best = historical
+        if best is None or best.similarity < self.threshold:
+            return None
+        return best
+
+    def add(self, event: Dict[str, Any]) -> None:
+        """Make an accepted scraped event visible to the rest of the batch."""
+        signed = self._sign(event)
+        if signed is not None:
+            self.index.add(*signed, 'batch', event)
@@ -22,13 +22,13 @@ Usage:
     python3 src/event_manager.py organizers add --name "Kulturverein Hof"
 """
 
-import json
 import logging
 import os
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timezone
 
+from . import fast_json
 from .entity_models import Organizer, generate_organizer_id
 
 logger = logging.getLogger(__name__)
@@ -59,17 +59,17 @@ class OrganizerManager:
                 'organizers': []
             }
             with open(self.organizers_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+                fast_json.dump(data, f, indent=2, ensure_ascii=False)
     
     def _load_data(self) -> dict:
         """Load organizers.json"""
         with open(self.organizers_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+            return fast_json.load(f)
     
     def _save_data(self, data: dict):
         """Save organizers.json"""
         with open(self.organizers_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+            fast_json.dump(data, f, indent=2, ensure_ascii=False)
     
     def add_organizer(self, organizer: Organizer) -> str:
         """
@@ -611,7 +611,7 @@ class OrganizerCLI:
         
         if output_format == 'json':
             data = [org.to_dict() for org in organizers]
-            print(json.dumps(data, indent=2, ensure_ascii=False))
+            print(fast_json.dumps(data, indent=2, ensure_ascii=False))
         else:
             print(f"Total organizers: {len(organizers)}")
             print()
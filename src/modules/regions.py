@@ -5,10 +5,10 @@ Provides TUI and CLI interfaces for managing multi-region configuration.
 Allows adding, editing, listing, and removing regions without manual JSON editing.
 """
 
-import json
 import os
 from pathlib import Path
 
+from . import fast_json
 from .region_utils import (
     get_all_regions, 
     get_default_region,
@@ -142,13 +142,13 @@ class RegionTUI:
         
         # Confirm
         print("\nNew Region Configuration:")
-        print(json.dumps(new_region, indent=2))
+        print(fast_json.dumps(new_region, indent=2))
         confirm = input("\nSave this region? (y/n): ").strip().lower()
         
         if confirm == 'y':
             # Load config, add region, save
             with open(self.config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+                config = fast_json.load(f)
             
             if 'regions' not in config:
                 config['regions'] = {}
@@ -156,7 +156,7 @@ class RegionTUI:
             config['regions'][region_id] = new_region
             
             with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
+                fast_json.dump(config, f, indent=2, ensure_ascii=False)
             
             print(f"\n✅ Region '{region_id}' added successfully")
         else:
@@ -188,7 +188,7 @@ class RegionTUI:
         
         print(f"\n📍 Region: {region_id}")
         print("-" * 70)
-        print(json.dumps(region_config, indent=2, ensure_ascii=False))
+        print(fast_json.dumps(region_config, indent=2, ensure_ascii=False))
         
         input("\nPress Enter to continue...")
     
@@ -218,12 +218,12 @@ class RegionTUI:
         if confirm == 'y':
             # Load config, remove region, save
             with open(self.config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+                config = fast_json.load(f)
             
             del config['regions'][region_id]
             
             with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
+                fast_json.dump(config, f, indent=2, ensure_ascii=False)
             
             print(f"\n✅ Region '{region_id}' removed successfully")
         else:
@@ -259,12 +259,12 @@ class RegionTUI:
         
         # Load config, set default, save
         with open(self.config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+            config = fast_json.load(f)
         
         config['defaultRegion'] = region_id
         
         with open(self.config_path, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
+            fast_json.dump(config, f, indent=2, ensure_ascii=False)
         
         print(f"\n✅ Default region set to '{region_id}'")
         input("\nPress Enter to continue...")
@@ -377,7 +377,7 @@ class RegionTUI:
         
         # Load config
         with open(self.config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+            config = fast_json.load(f)
         
         # Add filter
         if 'customFilters' not in config['regions'][region_id]:
@@ -387,7 +387,7 @@ class RegionTUI:
         
         # Save config
         with open(self.config_path, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
+            fast_json.dump(config, f, indent=2, ensure_ascii=False)
         
         print(f"\n✅ Custom filter '{filter_id}' added to region '{region_id}'")
         input("\nPress Enter to continue...")
@@ -415,7 +415,7 @@ class RegionTUI:
         
         # Load config
         with open(self.config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+            config = fast_json.load(f)
         
         # Find and remove filter
         filters_list = config['regions'][region_id].get('customFilters', [])
@@ -429,7 +429,7 @@ class RegionTUI:
             
             # Save config
             with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
+                fast_json.dump(config, f, indent=2, ensure_ascii=False)
             
             print(f"✅ Custom filter '{filter_id}' removed from region '{region_id}'")
         
@@ -503,7 +503,7 @@ class RegionCLI:
                 "defaultRegion": default_region,
                 "regions": regions
             }
-            print(json.dumps(output, indent=2, ensure_ascii=False))
+            print(fast_json.dumps(output, indent=2, ensure_ascii=False))
         else:
             # Text output
             print(f"Default Region: {default_region}\n")
@@ -579,7 +579,7 @@ class RegionCLI:
         
         # Load config, add region, save
         with open(self.config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+            config = fast_json.load(f)
         
         if 'regions' not in config:
             config['regions'] = {}
@@ -587,7 +587,7 @@ class RegionCLI:
         config['regions'][region_id] = new_region
         
         with open(self.config_path, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
+            fast_json.dump(config, f, indent=2, ensure_ascii=False)
         
         print(f"✅ Region '{region_id}' added successfully")
         return 0
@@ -607,12 +607,12 @@ class RegionCLI:
         
         # Load config, remove region, save
         with open(self.config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+            config = fast_json.load(f)
         
         del config['regions'][region_id]
         
         with open(self.config_path, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
+            fast_json.dump(config, f, indent=2, ensure_ascii=False)
         
         print(f"✅ Region '{region_id}' removed successfully")
         return 0
@@ -631,7 +631,7 @@ class RegionCLI:
             return 1
         
         region_config = get_region_config(region_id, self.base_path)
-        print(json.dumps(region_config, indent=2, ensure_ascii=False))
+        print(fast_json.dumps(region_config, indent=2, ensure_ascii=False))
         return 0
     
     def set_default_region(self, args):
@@ -649,12 +649,12 @@ class RegionCLI:
         
         # Load config, set default, save
         with open(self.config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+            config = fast_json.load(f)
         
         config['defaultRegion'] = region_id
         
         with open(self.config_path, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
+            fast_json.dump(config, f, indent=2, ensure_ascii=False)
         
         print(f"✅ Default region set to '{region_id}'")
         return 0
@@ -676,7 +676,7 @@ class RegionCLI:
         filters = region_config.get('customFilters', [])
         
         if getattr(args, 'format', 'text') == 'json':
-            print(json.dumps(filters, indent=2, ensure_ascii=False))
+            print(fast_json.dumps(filters, indent=2, ensure_ascii=False))
         else:
             print(f"Custom Filters for '{region_id}':")
             print("-" * 70)
@@ -732,7 +732,7 @@ class RegionCLI:
         
         # Load config
         with open(self.config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+            config = fast_json.load(f)
         
         # Add filter
         if 'customFilters' not in config['regions'][region_id]:
@@ -742,7 +742,7 @@ class RegionCLI:
         
         # Save config
         with open(self.config_path, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
+            fast_json.dump(config, f, indent=2, ensure_ascii=False)
         
         print(f"✅ Custom filter '{args.filter_id}' added to region '{region_id}'")
         return 0
@@ -768,7 +768,7 @@ class RegionCLI:
         
         # Load config
         with open(self.config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+            config = fast_json.load(f)
         
         # Find and remove filter
         filters_list = config['regions'][region_id].get('customFilters', [])
@@ -783,7 +783,7 @@ class RegionCLI:
         
         # Save config
         with open(self.config_path, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
+            fast_json.dump(config, f, indent=2, ensure_ascii=False)
         
         print(f"✅ Custom filter '{filter_id}' removed from region '{region_id}'")
         return 0
@@ -0,0 +1,184 @@
+"""
+Review Batch Module
+
+Unit of work for publishing and rejecting pending events.
+
+Bulk publish/reject used to write every affected file once per event: one
+backup append, one rejected_events.json rewrite (after reloading it and
+rebuilding its dedup set) and a list.pop() per event, plus a linear id search
+for every requested id. A ReviewBatch stages all decisions in memory with an
+id -> position index and commits them with exactly one write per affected
+file:
+- assets/json/old/ backup archive: one append of all published events
+- events.json: one save (pending_count included, so it is not rewritten)
+- rejected_events.json: one save
+- pending_events.json: one save
+
+With the SQLite event store enabled, events.json and pending_events.json
+are not rewritten: published events are inserted and decided events deleted
+as rows in one transaction each (see utils.add_published_events and
+utils.remove_pending_events).
+
+All files are written only after every decision has been staged; nothing is
+written if the batch is discarded.
+
+Usage:
+    from modules.review_batch import ReviewBatch
+
+    batch = ReviewBatch(base_path)
+    found, missing = batch.find(event_ids)
+    for event_id, event in found:
+        batch.reject(event_id)
+    batch.commit()
+"""
+
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .utils import (add_published_events, load_pending_events, load_rejected_events,
+                    remove_pending_events, save_rejected_events,
+                    update_pending_count_in_events)
+
+logger = logging.getLogger(__name__)
+
+
+class ReviewBatch:
+    """Staged publish/reject decisions for pending events."""
+
+    def __init__(self, base_path: Path, pending_data: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            base_path: Repository root
+            pending_data: Pending document to operate on (default: load it).
+                          Its pending_events list is updated in place on commit.
+        """
+        self.base_path = Path(base_path)
+        self.pending_data = pending_data if pending_data is not None else load_pending_events(self.base_path)
+        self.events: List[Dict[str, Any]] = self.pending_data.setdefault('pending_events', [])
+        self._positions: Dict[str, int] = {}
+        for index, event in enumerate(self.events):
+            self._positions.setdefault(event.get('id'), index)
+        self._removed = set()
+        self.published: List[Dict[str, Any]] = []
+        self.rejected: List[Dict[str, Any]] = []
+
+    def get(self, event_id: str) -> Optional[Dict[str, Any]]:
+        """Pending event with this id that is not staged yet."""
+        index = self._positions.get(event_id)
+        if index is None or index in self._removed:
+            return None
+        return self.events[index]
+
+    def find(self, event_ids: List[str]) -> Tuple[List[Tuple[str, Dict[str, Any]]], List[str]]:
+        """
+        Look up pending events by id.
+
+        Returns:
+            Tuple of ([(id, event), ...] in request order, missing ids)
+        """
+        found, missing = [], []
+        for event_id in event_ids:
+            event = self.get(event_id)
+            if event is None:
+                missing.append(event_id)
+            else:
+                found.append((event_id, event))
+        return found, missing
+
+    def _take(self, event_id: str) -> Dict[str, Any]:
+        event = self.get(event_id)
+        if event is None:
+            raise KeyError(f"Event '{event_id}' not found in pending queue")
+        self._removed.add(self._positions[event_id])
+        return event
+
+    def publish(self, event_id: str, published_event: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Stage publishing a pending event.
+
+        Args:
+            event_id: Pending event id
+            published_event: Event dict to publish instead of the pending one
+                             (e.g. a validated model dump)
+
+        Returns:
+            The event as it will be published
+
+        Raises:
+            KeyError: If the id is not (or no longer) pending
+        """
+        event = self._take(event_id)
+        if published_event is not None:
+            event.update(published_event)
+        event['status'] = 'published'
+        event['published_at'] = datetime.now().isoformat()
+        self.published.append(event)
+        return event
+
+    def reject(self, event_id: str) -> Dict[str, Any]:
+        """
+        Stage rejecting a pending event (its title/source go to the auto-reject list).
+
+        Raises:
+            KeyError: If the id is not (or no longer) pending
+        """
+        event = self._take(event_id)
+        self.rejected.append(event)
+        return event
+
+    def commit(self) -> Dict[str, int]:
+        """
+        Write all staged decisions, one write per affected file.
+
+        Returns:
+            Dict with published, rejected and remaining (pending) counts
+        """
+        if not self._removed:
+            return {'published': 0, 'rejected': 0, 'remaining': len(self.events)}
+
+        decided_ids = [self.events[index].get('id') for index in sorted(self._removed)]
+        self.events[:] = [event for index, event in enumerate(self.events) if index not in self._removed]
+
+        if self.published:
+            from .backup_archive import get_backup_archive
+            get_backup_archive(self.base_path).append_many(self.published)
+
+            # pending_count is saved here already, so update_pending_count_in_events()
+            # below finds it unchanged and skips a second events.json write
+            add_published_events(self.base_path, self.published, pending_count=len(self.events))
+
+        if self.rejected:
+            self._save_rejected()
+
+        remove_pending_events(self.base_path, decided_ids)
+        update_pending_count_in_events(self.base_path)
+
+        result = {'published': len(self.published), 'rejected': len(self.rejected), 'remaining': len(self.events)}
+        logger.info(f"Review batch committed: {result}")
+        self.published, self.rejected = [], []
+        self._removed = set()
+        self._positions = {}
+        for index, event in enumerate(self.events):
+            self._positions.setdefault(event.get('id'), index)
+        return result
+
+    def _save_rejected(self) -> None:
+        """Append new (title, source) rejection records in one save."""
+        rejected_data = load_rejected_events(self.base_path)
+        records = rejected_data.setdefault('rejected_events', [])
+        known = {
+            (r.get('title', '').lower().strip(), r.get('source', '').lower().strip())
+            for r in records
+        }
+        rejected_at = datetime.now().isoformat()
+        for event in self.rejected:
+            title = event.get('title') or ''
+            source = event.get('source') or 'unknown'
+            key = (title.lower().strip(), source.lower().strip())
+            if key in known:
+                continue
+            known.add(key)
+            records.append({'title': title, 'source': source, 'rejected_at': rejected_at})
+        save_rejected_events(self.base_path, rejected_data)
@@ -14,7 +14,8 @@ Key features:
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 from pathlib import Path
-import json
+
+from . import fast_json
 
 
 class LocationConfidence:
@@ -151,14 +152,14 @@ class ReviewerNotes:
         
         try:
             with open(self.notes_file, 'r') as f:
-                return json.load(f)
+                return fast_json.load(f)
         except Exception:
             return {}
     
     def _save_notes(self, notes: Dict[str, List[Dict[str, Any]]]):
         """Save reviewer notes to file."""
         with open(self.notes_file, 'w') as f:
-            json.dump(notes, f, indent=2)
+            fast_json.dump(notes, f, indent=2)
 
 
 class LocationExtractionHelper:
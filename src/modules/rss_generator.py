@@ -6,6 +6,7 @@ Mirrors the frontend's "sunrise filtering" behavior.
 
 Functions:
 - generate_sunrise_feeds() - Generate RSS feeds for all regions
+- sunrise_feed_selection() - Events each region's feed lists right now
 - create_rss_feed() - Create RSS 2.0 XML string for events
 """
 
@@ -54,6 +55,83 @@ def _parse_event_timestamp(event: Dict) -> datetime:
     return start_dt
 
 
+def select_sunrise_events(events: List[Dict], next_sunrise: datetime, now: datetime = None,
+                           warn: bool = True) -> List[Dict]:
+    """
+    Events starting between now and the next sunrise, deduplicated by ID.
+    
+    Args:
+        events: Published events
+        next_sunrise: End of the feed window
+        now: Start of the window (default: current time)
+        warn: Log events with invalid timestamps
+        
+    Returns:
+        Events in the window (first occurrence of each ID)
+    """
+    now = now or datetime.now()
+    sunrise_events = []
+    seen_ids = set()
+    
+    for event in events:
+        # Skip if no start_time
+        if 'start_time' not in event or not event['start_time']:
+            continue
+        
+        try:
+            # Parse event start time using helper function
+            event_start = _parse_event_timestamp(event)
+        except (ValueError, AttributeError) as e:
+            if warn:
+                logger.warning(f"Skipping event {event.get('id', 'unknown')}: invalid timestamp - {e}")
+            continue
+        
+        # Filter: events starting between now and next sunrise
+        if not now < event_start <= next_sunrise:
+            continue
+        
+        # Deduplicate events by ID (keep first occurrence)
+        event_id = event.get('id')
+        if event_id and event_id not in seen_ids:
+            seen_ids.add(event_id)
+            sunrise_events.append(event)
+    
+    return sunrise_events
+
+
+def sunrise_feed_selection(base_path: Path) -> Dict[str, Dict]:
+    """
+    What each region's feed would contain if generated now.
+    
+    The feeds depend on the current time, not only on files; the site
+    build uses this as an input to decide whether the feeds are stale.
+    
+    Args:
+        base_path: Base path of the project
+        
+    Returns:
+        {region_id: {'until': next sunrise (ISO), 'events': [event, ...]}}
+    """
+    from .utils import load_config, load_events, get_next_sunrise
+    from .region_utils import get_all_regions
+    
+    config = load_config(base_path)
+    all_events = load_events(base_path).get('events', [])
+    selection = {'base_url': config.get('app', {}).get('url', 'https://krwl.in')}
+    for region_id, region_config in get_all_regions(base_path).items():
+        center = region_config.get('center', {})
+        lat, lon = center.get('lat'), center.get('lng')
+        if lat is None or lon is None:
+            continue
+        next_sunrise = get_next_sunrise(lat, lon)
+        selection[region_id] = {
+            'name': region_config.get('displayName', region_id),
+            'until': next_sunrise.isoformat(),
+            'events': select_sunrise_events(all_events, next_sunrise, warn=False),
+        }
+    return selection
+
+
 def generate_sunrise_feeds(base_path: Path) -> None:
     """
     Generate RSS feeds with events until next sunrise for each region.
@@ -110,38 +188,9 @@ def generate_sunrise_feeds(base_path: Path) -> None:
                 print(f"  ⚠️  Skipping region {region_id}: missing coordinates")
                 continue
             
-            # Calculate next sunrise for this region
+            # Events between now and the next sunrise for this region
             next_sunrise = get_next_sunrise(lat, lon)
-            
-            # Filter events until next sunrise
-            now = datetime.now()
-            sunrise_events = []
-            
-            for event in all_events:
-                # Skip if no start_time
-                if 'start_time' not in event or not event['start_time']:
-                    continue
-                
-                try:
-                    # Parse event start time using helper function
-                    event_start = _parse_event_timestamp(event)
-                    
-                    # Filter: events starting between now and next sunrise
-                    if now < event_start <= next_sunrise:
-                        sunrise_events.append(event)
-                except (ValueError, AttributeError) as e:
-                    logger.warning(f"Skipping event {event.get('id', 'unknown')}: invalid timestamp - {e}")
-                    continue
-            
-            # Deduplicate events by ID (keep first occurrence)
-            seen_ids = set()
-            deduplicated_events = []
-            for event in sunrise_events:
-                event_id = event.get('id')
-                if event_id and event_id not in seen_ids:
-                    seen_ids.add(event_id)
-                    deduplicated_events.append(event)
-            sunrise_events = deduplicated_events
+            sunrise_events = select_sunrise_events(all_events, next_sunrise)
             
             # Generate RSS feed
             region_display_name = region_config.get('displayName', region_id)
@@ -5,6 +5,8 @@ import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
+from .utils import load_json_document
+
 
 class ScheduleConfig:
     """Handle schedule configuration for automated scraping"""
@@ -17,13 +19,21 @@ class ScheduleConfig:
             config_path = base_path / 'config.json'
         
         self.config_path = Path(config_path)
-        self.config = self._load_config()
+        self._config = self._load_config()
+    
+    @property
+    def config(self):
+        """Current configuration - re-parsed only when config.json changed on disk"""
+        try:
+            self._config = load_json_document(self.config_path, copy=False)
+        except (OSError, json.JSONDecodeError):
+            pass  # Keep the last good configuration (already warned in _load_config)
+        return self._config
     
     def _load_config(self):
-        """Load configuration from JSON file"""
+        """Load configuration from JSON file (read-only, via the document cache)"""
         try:
-            with open(self.config_path, 'r') as f:
-                return json.load(f)
+            return load_json_document(self.config_path, copy=False)
         except FileNotFoundError:
             print(f"Warning: Config file not found: {self.config_path}")
             return {}
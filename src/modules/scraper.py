@@ -1,18 +1,30 @@
 """Event scraper module with robust error handling and retry logic"""
 
-import json
 import logging
 import re
 import sys
 from datetime import datetime, timedelta
 from urllib.parse import urljoin, urlparse
 
-from .utils import load_pending_events, save_pending_events
+from . import fast_json
+from .utils import load_pending_events, save_pending_events, upsert_pending_event
 from .exceptions import SourceUnavailableError, NetworkError, ParsingError
+from .scrape_pool import get_concurrency_settings, run_sources
+from .circuit_breaker import CircuitOpenError, get_circuit_breaker, is_host_failure
+from .http_cache import get_http_cache
+from .smart_scraper.ai_providers.result_cache import get_ai_result_cache
+from .smart_scraper.image_analyzer.flyer_cache import get_flyer_cache
+from .smart_scraper.image_analyzer.ocr_service import configure_ocr_services
+from .smart_scraper.image_analyzer.perceptual_hash import (
+    DEFAULT_MAX_DISTANCE as DEFAULT_FLYER_DISTANCE, FlyerEventIndex
+)
 
 # Configure module logger
 logger = logging.getLogger(__name__)
 
+# Per-event validation failures listed in .scrape_status (the count is always complete)
+MAX_REPORTED_VALIDATION_ERRORS = 50
+
 try:
     import requests
     from bs4 import BeautifulSoup
@@ -21,18 +33,24 @@ try:
         retry,
         stop_after_attempt,
         wait_exponential,
+        retry_if_exception,
         retry_if_exception_type,
         before_sleep_log
     )
     SCRAPING_ENABLED = True
     
     # Define retry decorator for use in class methods
-    def make_retry_decorator():
+    def make_retry_decorator(allow_retry=None):
+        """Retry request errors up to 3 attempts; allow_retry(error) can veto a retry"""
+        condition = retry_if_exception_type((requests.exceptions.RequestException, requests.exceptions.Timeout))
+        if allow_retry is not None:
+            condition = condition & retry_if_exception(allow_retry)
         return retry(
             stop=stop_after_attempt(3),
             wait=wait_exponential(multiplier=1, min=2, max=10),
-            retry=retry_if_exception_type((requests.exceptions.RequestException, requests.exceptions.Timeout)),
-            before_sleep=before_sleep_log(logger, logging.WARNING)
+            retry=condition,
+            before_sleep=before_sleep_log(logger, logging.WARNING),
+            reraise=True
         )
     
 except ImportError as e:
@@ -42,7 +60,7 @@ except ImportError as e:
     # not at import time to avoid interference with other modules
     
     # Dummy decorator when libraries not available
-    def make_retry_decorator():
+    def make_retry_decorator(allow_retry=None):
         def dummy_decorator(func):
             return func
         return dummy_decorator
@@ -50,6 +68,7 @@ except ImportError as e:
 # Try to import SmartScraper for enhanced functionality
 try:
     from .smart_scraper import SmartScraper
+    from .smart_scraper.base import SourceOptions
     SMART_SCRAPER_AVAILABLE = True
 except ImportError:
     SMART_SCRAPER_AVAILABLE = False
@@ -62,7 +81,24 @@ class EventScraper:
         self.config = config
         self.base_path = base_path
         self.failed_sources = []  # Track failed sources for reporting
+        self.max_workers = None  # Override scraping.concurrency.max_workers (None = config)
+        self.source_name = None  # Only scrape the enabled source of this name (None = all, case-insensitive)
         self._scraping_warning_shown = False  # Track if warning has been shown
+        self._event_schema = None  # Built on first ingest, shared by all events
+        # Skip items seen by earlier runs and remember new ones (off for --replay)
+        self.use_item_cache = True
+        # Return the scraped events without storing anything (--replay)
+        self.dry_run = False
+        # Conditional-request cache shared with the SmartScraper sources
+        self.http_cache = get_http_cache(base_path, config.get('scraping', {}).get('http_cache', {}))
+        # Per-host breakers and the run's retry budget, shared with the SmartScraper sources
+        self.circuit_breaker = get_circuit_breaker(base_path, config.get('scraping', {}).get('circuit_breaker', {}))
+        # AI answers cached across runs, shared by the categorizer and all AI providers
+        self.ai_cache = get_ai_result_cache(base_path, config.get('ai', {}).get('result_cache', {}))
+        # Flyer images and OCR results by content hash, shared by the social sources
+        self.flyer_cache = get_flyer_cache(base_path, config.get('scraping', {}).get('image_cache', {}))
+        # Warm OCR worker pool (started on the first flyer)
+        configure_ocr_services(config.get('scraping', {}).get('ocr', {}))
         
         # Try to initialize SmartScraper for enhanced functionality
         self.smart_scraper = None
@@ -84,6 +120,7 @@ class EventScraper:
             })
             # Set default timeout for all requests
             self.timeout = 30
+        self._session_pool_size = None  # Connections per host, see _prepare_session_pool()
     
     def _check_scraping_available(self):
         """Check if scraping libraries are available and show warning if not."""
@@ -95,7 +132,8 @@ class EventScraper:
             return False
         return SCRAPING_ENABLED
         
-    def _write_scrape_status(self, scraped_count, added_count, duplicate_count, rejected_count, error=None):
+    def _write_scrape_status(self, scraped_count, added_count, duplicate_count, rejected_count, error=None,
+                             validation_failures=None, near_duplicates=None):
         """Write scrape status file for workflow automation"""
         status = {
             'scraped': scraped_count,
@@ -106,10 +144,30 @@ class EventScraper:
         }
         if error:
             status['error'] = error
+        if validation_failures:
+            status['invalid'] = len(validation_failures)
+            status['validation_errors'] = [
+                {'title': event.get('title', 'Unknown'), 'source': event.get('source'), 'error': message[:300]}
+                for event, message in validation_failures[:MAX_REPORTED_VALIDATION_ERRORS]
+            ]
+        if near_duplicates:
+            status['near_duplicates'] = {
+                'merged': near_duplicates['merged'],
+                'marked': near_duplicates['marked'],
+                'flyer_copies': near_duplicates.get('flyer_copies', 0)
+            }
+        if self.http_cache.enabled:
+            status['http_cache'] = self.http_cache.get_stats()
+        if self.circuit_breaker.enabled:
+            status['circuit_breaker'] = self.circuit_breaker.get_stats()
+        if self.ai_cache.enabled:
+            status['ai_cache'] = self.ai_cache.get_stats()
+        if self.flyer_cache.enabled:
+            status['image_cache'] = self.flyer_cache.get_stats()
         
         status_file = self.base_path / '.scrape_status'
         with open(status_file, 'w') as f:
-            json.dump(status, f, indent=2)
+            fast_json.dump(status, f, indent=2)
     
     def _write_pending_count(self):
         """
@@ -125,8 +183,15 @@ class EventScraper:
         logger.info(f"Updated pending count in events.json: {pending_count} events")
     
     def scrape_all_sources(self):
-        """Scrape events from all configured sources with graceful degradation"""
+        """Scrape events from all configured sources with graceful degradation
+        
+        With dry_run set the scraped events are only returned: pending
+        events, the fingerprint index, the caches and the status files are
+        left untouched.
+        """
         if not self._check_scraping_available():
+            if self.dry_run:
+                return []
             # Write status file even if scraping is disabled
             self._write_scrape_status(0, 0, 0, 0, error='Scraping libraries not installed')
             # Still generate pending count JSON even if scraping failed
@@ -134,130 +199,120 @@ class EventScraper:
             return []
         
         logger.info("Starting event scraping from all sources")
-        pending_data = load_pending_events(self.base_path)
         new_events = []
         self.failed_sources = []
+        self.http_cache.reset_stats()
+        self.circuit_breaker.reset_stats()
+        self.ai_cache.reset_stats()
+        self.flyer_cache.reset_stats()
         
+        sources = []
         for source in self.config['scraping']['sources']:
             if not source.get('enabled', False):
                 logger.debug(f"Skipping disabled source: {source['name']}")
                 continue
-            
-            logger.info(f"Scraping from: {source['name']}")
-            try:
-                events = self.scrape_source(source)
-                new_events.extend(events)
-                logger.info(f"Found {len(events)} events from {source['name']}")
-            except SourceUnavailableError as e:
-                logger.error(f"Source unavailable: {e}")
-                self.failed_sources.append({
-                    'name': source['name'],
-                    'error': str(e),
-                    'type': 'unavailable'
-                })
-            except NetworkError as e:
-                logger.error(f"Network error: {e}")
-                self.failed_sources.append({
-                    'name': source['name'],
-                    'error': str(e),
-                    'type': 'network'
-                })
-            except ParsingError as e:
-                logger.error(f"Parsing error: {e}")
-                self.failed_sources.append({
-                    'name': source['name'],
-                    'error': str(e),
-                    'type': 'parsing'
-                })
-            except Exception as e:
-                logger.exception(f"Unexpected error scraping {source['name']}: {e}")
-                self.failed_sources.append({
-                    'name': source['name'],
-                    'error': str(e),
-                    'type': 'unknown'
-                })
+            if self.source_name and source.get('name', '').lower() != self.source_name.lower():
+                continue
+            sources.append(source)
+        
+        # Sources run on a bounded worker pool (scraping.concurrency in
+        # config.json); results are merged in configuration order
+        settings = get_concurrency_settings(self.config, self.max_workers)
+        self._prepare_session_pool(settings['max_workers'], sources)
+        for result in run_sources(sources, self._scrape_source_logged, **settings):
+            if result.error is None:
+                new_events.extend(result.events)
+                logger.info(f"Found {len(result.events)} events from {result.name} ({result.duration:.1f}s)")
+            else:
+                self._record_failed_source(result.source, result.error)
+        if self.dry_run:
+            if self.smart_scraper:
+                self.smart_scraper.discard_item_caches()
+            logger.info(f"Dry run: {len(new_events)} events scraped, nothing saved")
+            return new_events
+        pending_data = load_pending_events(self.base_path)
+        self.circuit_breaker.flush()
+        if self.smart_scraper:
+            self.smart_scraper.save_ai_stats()
         
         # Report on failed sources
         if self.failed_sources:
             logger.warning(f"{len(self.failed_sources)} source(s) failed to scrape")
             for failed in self.failed_sources:
                 logger.warning(f"  - {failed['name']}: {failed['error']}")
+        breaker_stats = self.circuit_breaker.get_stats()
+        if breaker_stats['tripped'] or breaker_stats['skipped']:
+            logger.warning(f"Circuit breaker tripped for {', '.join(breaker_stats['tripped']) or 'no new hosts'}; "
+                           f"{breaker_stats['skipped']} request(s) skipped, open: {', '.join(breaker_stats['open'])}")
         
-        # Load historical events for deduplication
-        from .utils import load_historical_events, load_events, load_rejected_events, is_event_rejected
-        historical_events = load_historical_events(self.base_path)
-        published_events = load_events(self.base_path).get('events', [])
-        
-        # Load rejected events
-        rejected_data = load_rejected_events(self.base_path)
-        rejected_events = rejected_data.get('rejected_events', [])
-        
-        # OPTIMIZATION: Build lookup sets once for all duplicate checks
-        # This avoids rebuilding sets for every scraped event
-        pending_keys = {
-            (event.get('title'), event.get('start_time'))
-            for event in pending_data['pending_events']
-        }
-        published_keys = {
-            (event.get('title'), event.get('start_time'))
-            for event in published_events
-        }
-        historical_keys = {
-            (event.get('title'), event.get('start_time'))
-            for event in historical_events
-        }
-        rejected_keys = {
-            (rejected.get('title', '').lower().strip(), 
-             rejected.get('source', '').lower().strip())
-            for rejected in rejected_events
-        }
+        # Pending, published and rejected keys come from the persistent
+        # fingerprint index, historical keys from the backup archive's index -
+        # no event document is parsed for exact dedup
+        from .fingerprint_index import get_fingerprint_index
+        fingerprints = get_fingerprint_index(self.base_path)
+        batch_keys = set()
         
         # Add new events to pending (check against pending, published, historical, and rejected)
-        added_count = 0
         skipped_duplicate = 0
         skipped_rejected = 0
-        skipped_invalid = 0
+        candidates = []
         
         for event in new_events:
-            # Check if event was previously rejected (using pre-built set)
-            event_key_rejected = (
-                event.get('title', '').lower().strip(),
-                event.get('source', '').lower().strip()
-            )
-            if event_key_rejected in rejected_keys:
+            # Check if event was previously rejected
+            if fingerprints.is_rejected(event.get('title', ''), event.get('source', '')):
                 skipped_rejected += 1
                 continue
             
-            # Check for duplicates using pre-built sets (O(1) lookups)
+            # Check for duplicates (binary searches over sorted key hashes)
             event_key = (event.get('title'), event.get('start_time'))
             
-            if event_key in pending_keys:
+            if event_key in batch_keys:
                 skipped_duplicate += 1
                 continue
             
-            if event_key in published_keys:
+            if fingerprints.contains_event(*event_key):
                 skipped_duplicate += 1
                 continue
             
-            if event_key in historical_keys:
-                skipped_duplicate += 1
-                continue
-            
-            # Validate and add event (this ensures data integrity)
-            if self._validate_and_add_event(event, pending_data):
-                added_count += 1
-                # Update the pending_keys set so we don't add duplicates within this batch
-                pending_keys.add(event_key)
-            else:
-                skipped_invalid += 1
+            candidates.append(event)
+            # Remember the key so we don't add duplicates within this batch
+            batch_keys.add(event_key)
+        
+        # The same flyer posted on Facebook, reposted on Instagram or sent via
+        # Telegram: linked by perceptual hash (see image_analyzer/perceptual_hash.py)
+        candidates, flyer_copies = self._link_flyer_copies(candidates, pending_data['pending_events'])
+        
+        # Fuzzy dedup: the same event from several sources with slightly
+        # different titles or times (MinHash/LSH, see near_duplicates.py)
+        candidates, near_duplicates = self._filter_near_duplicates(
+            candidates, pending_data['pending_events']
+        )
+        near_duplicates['flyer_copies'] = flyer_copies['linked']
+        near_duplicates['pending_updated'] |= flyer_copies['pending_updated']
+        skipped_duplicate += near_duplicates['merged'] + flyer_copies['linked']
+        
+        # Validate and add events in one batch (this ensures data integrity)
+        validation_failures = self._validate_and_add_events(candidates, pending_data)
+        skipped_invalid = len(validation_failures)
+        added_count = len(candidates) - skipped_invalid
         
         # Only save (and update timestamp) if events were actually added
-        if added_count > 0:
+        # or merged into pending events
+        if added_count > 0 or near_duplicates['pending_updated']:
             save_pending_events(self.base_path, pending_data)
         
+        # Validators and items are remembered only now that their events are
+        # stored - a crash before this point must not turn the next run's
+        # fetches into 304s or cache hits for events that were never saved
+        self.http_cache.flush()
+        if self.smart_scraper:
+            self.smart_scraper.save_item_caches()
+        
         logger.info(
             f"Scraping complete: {len(new_events)} scraped, "
-            f"{added_count} new, {skipped_duplicate} duplicates, "
+            f"{added_count} new, {skipped_duplicate} duplicates "
+            f"({near_duplicates['merged']} fuzzy, {flyer_copies['linked']} flyer copies), "
+            f"{near_duplicates['marked']} possible duplicates, "
             f"{skipped_rejected} rejected, {skipped_invalid} invalid"
         )
         
@@ -267,7 +322,9 @@ class EventScraper:
             error_summary = f"{len(self.failed_sources)} sources failed"
         self._write_scrape_status(
             len(new_events), added_count, skipped_duplicate, 
-            skipped_rejected, error=error_summary
+            skipped_rejected, error=error_summary,
+            validation_failures=validation_failures,
+            near_duplicates=near_duplicates
         )
         
         # Write pending count JSON for frontend notifications
@@ -275,11 +332,161 @@ class EventScraper:
         
         return new_events
         
+    def _filter_near_duplicates(self, candidates, pending_events, published_events=None):
+        """
+        Merge or mark probable duplicates among scraped events.
+        
+        Events at least merge_threshold similar to a pending event or an
+        earlier event of this batch are merged into it (their source is added
+        to additional_sources); against published/historical events they are
+        dropped. Events at least threshold similar are kept but carry a
+        possible_duplicate summary (with the similarity score) for review.
+        
+        Published events are only loaded (when not passed in) if there are
+        candidates left after exact dedup.
+        
+        Returns:
+            Tuple of (kept events, stats dict with merged, marked, pending_updated)
+        """
+        stats = {'merged': 0, 'marked': 0, 'pending_updated': False}
+        settings = self.config.get('scraping', {}).get('near_duplicates', {})
+        if not candidates or not settings.get('enabled', True):
+            return candidates, stats
+        
+        if published_events is None:
+            from .utils import load_events
+            try:
+                published_events = load_events(self.base_path).get('events', [])
+            except FileNotFoundError:
+                published_events = []
+        
+        from .near_duplicates import NearDuplicateDetector
+        detector = NearDuplicateDetector(self.base_path, settings)
+        detector.prepare(candidates, pending_events, published_events)
+        
+        kept = []
+        for event in candidates:
+            match = detector.find(event)
+            if match is not None and detector.merge_threshold is not None \
+                    and match.similarity >= detector.merge_threshold:
+                if match.event is not None and match.origin in ('batch', 'pending'):
+                    self._merge_duplicate(match.event, event)
+                    stats['pending_updated'] |= match.origin == 'pending'
+                logger.info(
+                    f"Merged near-duplicate '{event.get('title')}' into "
+                    f"{match.origin} '{match.title}' ({match.similarity:.0%})"
+                )
+                stats['merged'] += 1
+                continue
+            if match is not None:
+                event['possible_duplicate'] = match.to_dict()
+                stats['marked'] += 1
+            kept.append(event)
+            detector.add(event)
+        return kept, stats
+    
+    def _link_flyer_copies(self, candidates, pending_events):
+        """
+        Merge events built from a copy of an already known flyer.
+        
+        Events carry the perceptual hash of their flyer (flyer_hash); one
+        within scraping.image_cache.perceptual_max_distance bits of a pending
+        event or an earlier event of this batch is the same poster re-encoded
+        by another platform and is merged into that event.
+        
+        Returns:
+            Tuple of (kept events, stats dict with linked, pending_updated)
+        """
+        stats = {'linked': 0, 'pending_updated': False}
+        max_distance = self.config.get('scraping', {}).get('image_cache', {}).get(
+            'perceptual_max_distance', DEFAULT_FLYER_DISTANCE)
+        if max_distance is None or not any(event.get('flyer_hash') for event in candidates):
+            return candidates, stats
+        
+        index = FlyerEventIndex(pending_events, max_distance)
+        pending_ids = {id(event) for event in pending_events}
+        kept = []
+        for event in candidates:
+            match = index.find(event)
+            if match is not None:
+                target, distance = match
+                self._merge_duplicate(target, event)
+                stats['pending_updated'] |= id(target) in pending_ids
+                stats['linked'] += 1
+                logger.info(
+                    f"Linked flyer copy '{event.get('title')}' ({event.get('source')}) to "
+                    f"'{target.get('title')}' (distance {distance})"
+                )
+                continue
+            kept.append(event)
+            index.add(event)
+        return kept, stats
+    
+    def _merge_duplicate(self, target, duplicate):
+        """Fold a near-duplicate into the event it duplicates"""
+        source = duplicate.get('source')
+        sources = target.setdefault('additional_sources', [])
+        if source and source != target.get('source') and source not in sources:
+            sources.append(source)
+        for field in ('url', 'end_time'):
+            if not target.get(field) and duplicate.get(field):
+                target[field] = duplicate[field]
+    
+    def _scrape_source_logged(self, source):
+        """Worker entry point for run_sources()"""
+        logger.info(f"Scraping from: {source['name']}")
+        return self.scrape_source(source)
+    
+    def _record_failed_source(self, source, error):
+        """Add a source failure to failed_sources (reported after the run)"""
+        if isinstance(error, SourceUnavailableError):
+            logger.error(f"Source unavailable: {error}")
+            failure_type = 'unavailable'
+        elif isinstance(error, NetworkError):
+            logger.error(f"Network error: {error}")
+            failure_type = 'network'
+        elif isinstance(error, ParsingError):
+            logger.error(f"Parsing error: {error}")
+            failure_type = 'parsing'
+        else:
+            logger.error(f"Unexpected error scraping {source['name']}: {error}", exc_info=error)
+            failure_type = 'unknown'
+        
+        self.failed_sources.append({
+            'name': source['name'],
+            'error': str(error),
+            'type': failure_type
+        })
+    
+    def _prepare_session_pool(self, max_workers, sources=()):
+        """Size the shared session's connection pool once for the run
+        
+        The pool holds a connection per parallel source worker and per
+        concurrent detail-page request (the largest options.detail_concurrency
+        of the sources), so fetch_detail_pages() never has to remount it.
+        """
+        if self.session is None:
+            return
+        default_detail = SourceOptions.detail_concurrency if SMART_SCRAPER_AVAILABLE else 1
+        detail_concurrency = max((source.get('options', {}).get('detail_concurrency', default_detail)
+                                  for source in sources), default=1)
+        pool_size = max(max_workers, detail_concurrency)
+        if pool_size <= 1 or pool_size == self._session_pool_size:
+            return
+        adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self._session_pool_size = pool_size
+    
     def scrape_source(self, source):
         """Scrape events from a single source with error handling"""
         if not SCRAPING_ENABLED:
             return []
         
+        # Without the item cache every item is parsed and none is remembered
+        if not self.use_item_cache:
+            source = dict(source, options=dict(source.get('options', {}), skip_unchanged=False))
+        
         # Try SmartScraper first for enhanced functionality
         if self.smart_scraper:
             try:
@@ -325,22 +532,46 @@ class EventScraper:
         Returns:
             Response object
             
+        Requests to a host whose circuit breaker is open are not sent, and
+        retries stop once the host's breaker opens or the run's retry
+        budget is spent. 4xx answers other than 429 are not retried.
+            
         Raises:
             NetworkError: If request fails after retries
         """
+        breaker = self.circuit_breaker
+
+        def _allow_retry(error):
+            if isinstance(error, CircuitOpenError):
+                return False
+            if isinstance(error, requests.exceptions.HTTPError) and not is_host_failure(error):
+                return False  # 4xx - retrying won't help
+            return breaker.allow_retry(url)
+
         # Apply retry decorator dynamically
-        @make_retry_decorator()
+        @make_retry_decorator(_allow_retry)
         def _do_request():
             # Set timeout if not provided
             if 'timeout' not in kwargs:
                 kwargs['timeout'] = self.timeout
 
-            response = self.session.request(method, url, **kwargs)
-            response.raise_for_status()
+            breaker.check(url)
+            try:
+                if method == 'GET':
+                    response = self.http_cache.get(self.session, url, **kwargs)
+                else:
+                    response = self.session.request(method, url, **kwargs)
+                response.raise_for_status()
+            except requests.exceptions.RequestException as e:
+                breaker.record(url, error=e)
+                raise
+            breaker.record(url, status_code=response.status_code)
             return response
 
         try:
             return _do_request()
+        except CircuitOpenError as e:
+            raise NetworkError(url, str(e), None) from e
         except requests.exceptions.Timeout as e:
             # Raised after all retry attempts are exhausted
             raise NetworkError(url, "Request timed out after retries", None) from e
@@ -358,7 +589,11 @@ class EventScraper:
         events = []
         try:
             logger.debug(f"Parsing RSS feed: {source['url']}")
-            feed = feedparser.parse(source['url'])
+            response = self._make_request(source['url'])
+            if response.not_modified:
+                logger.info(f"Feed unchanged since last scrape (HTTP 304): {source['name']}")
+                return []
+            feed = feedparser.parse(response.content, response_headers={'content-location': source['url']})
             
             if feed.bozo and not feed.entries:
                 # Feed has parsing errors and no entries
@@ -376,7 +611,7 @@ class EventScraper:
                     })
             
             logger.debug(f"Successfully parsed {len(events)} events from RSS")
-        except ParsingError:
+        except (ParsingError, NetworkError):
             raise
         except Exception as e:
             raise ParsingError('RSS', str(e), None)
@@ -389,6 +624,9 @@ class EventScraper:
         try:
             logger.debug(f"Fetching from API: {source['url']}")
             response = self._make_request(source['url'])
+            if response.not_modified:
+                logger.info(f"API unchanged since last scrape (HTTP 304): {source['name']}")
+                return []
             data = response.json()
             
             # API-specific parsing would go here
@@ -419,6 +657,9 @@ class EventScraper:
         try:
             logger.debug(f"Fetching HTML page: {source['url']}")
             response = self._make_request(source['url'])
+            if response.not_modified:
+                logger.info(f"Page unchanged since last scrape (HTTP 304): {source['name']}")
+                return []
             soup = BeautifulSoup(response.content, 'lxml')
             
             # Generic HTML event scraping
@@ -612,47 +853,85 @@ class EventScraper:
             }
         return self._extract_location_from_text('', source)
         
-    def _validate_and_add_event(self, event_data: dict, pending_data: dict) -> bool:
+    def _get_event_schema(self):
+        """EventSchema shared by every ingested event of this scraper
+        
+        Building an EventSchema also builds an AICategorizer (and its
+        provider connection check), so it is done once, not per event.
         """
-        Validate event data using Pydantic and add to pending if valid
+        if self._event_schema is None:
+            from .event_schema import EventSchema
+            self._event_schema = EventSchema(self.config, self.base_path)
+        return self._event_schema
+    
+    # Event keys that are not model fields but must survive validation:
+    # flyer_hash links later copies of a flyer, possible_duplicate and
+    # additional_sources come from near-duplicate handling and are shown
+    # in the review editor
+    UNVALIDATED_FIELDS = ('flyer_hash', 'possible_duplicate', 'additional_sources')
+    
+    def _validate_and_add_events(self, events: list, pending_data: dict) -> list:
+        """
+        Migrate and validate a batch of events, add the valid ones to pending
         
-        Uses AI categorization (if enabled) to assign category before validation.
+        Uses AI categorization (if enabled) to assign categories before
+        validation. All events are validated with one list-level pydantic call.
         
         Args:
-            event_data: Event dictionary to validate
+            events: Event dictionaries to validate
             pending_data: Pending events data structure
             
         Returns:
-            True if event was added, False otherwise
+            List of (event, error message) tuples for events that were not added
         """
-        try:
-            from .models import validate_event_data
-            from .event_schema import EventSchema
-            
-            # Initialize EventSchema with AI categorization
-            schema = EventSchema(self.config, self.base_path)
-            
-            # Apply full schema migration BEFORE validation (fail-fast approach)
-            # This ensures all required fields (teaser, category, etc.) are generated
-            # Note: Migration is idempotent, so it's safe if called multiple times
-            event_data = schema.migrate_event(event_data)
-            
-            # Validate event structure
-            validated_event = validate_event_data(event_data)
-            
+        from .models import validate_events_bulk
+        
+        if not events:
+            return []
+        schema = self._get_event_schema()
+        
+        # Apply full schema migration BEFORE validation (fail-fast approach)
+        # This ensures all required fields (teaser, category, etc.) are generated
+        # Note: Migration is idempotent, so it's safe if called multiple times
+        # Events without a category are categorized in batches (one AI
+        # request per batch, not per event)
+        failures = []
+        migrated = schema.migrate_events(events, failures)
+        
+        # Validate event structure (one call for the whole batch)
+        models, errors = validate_events_bulk(migrated)
+        for index, (event_data, validated_event) in enumerate(zip(migrated, models)):
+            if validated_event is None:
+                failures.append((event_data, errors[index]))
+                continue
             # Convert back to dict for storage
             event_dict = validated_event.model_dump()
+            # Not model fields: flyer link and review hints are kept as scraped
+            for field in self.UNVALIDATED_FIELDS:
+                if event_data.get(field):
+                    event_dict[field] = event_data[field]
             pending_data['pending_events'].append(event_dict)
-            
             logger.debug(f"Event validated and added: {event_dict['title']} (category: {event_dict.get('category', 'none')})")
-            return True
-            
-        except ValueError as e:
-            logger.warning(f"Event validation failed: {e}", extra={
+        
+        for event_data, message in failures:
+            logger.warning(f"Event validation failed: {message}", extra={
                 'event_title': event_data.get('title', 'Unknown'),
                 'event_id': event_data.get('id', 'Unknown')
             })
-            return False
+        return failures
+    
+    def _validate_and_add_event(self, event_data: dict, pending_data: dict) -> bool:
+        """
+        Validate event data using Pydantic and add to pending if valid
+        
+        Args:
+            event_data: Event dictionary to validate
+            pending_data: Pending events data structure
+            
+        Returns:
+            True if event was added, False otherwise
+        """
+        return not self._validate_and_add_events([event_data], pending_data)
     
     def _clean_html(self, html_text):
         """Remove HTML tags from text"""
@@ -681,10 +960,8 @@ class EventScraper:
             'status': 'pending'
         }
         
-        # Add to pending events
-        pending_data = load_pending_events(self.base_path)
-        pending_data['pending_events'].append(event)
-        save_pending_events(self.base_path, pending_data)
+        # Add to pending events (a single row write with the event store)
+        upsert_pending_event(self.base_path, event)
         
         return event
     
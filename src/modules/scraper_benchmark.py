@@ -0,0 +1,144 @@
+"""
+Scraper Benchmark
+
+Times every configured source against a recorded HTTP corpus (see
+http_replay.py), so parser optimizations can be measured offline.
+
+Per source it measures:
+- parse: scrape_source() on the replayed responses (HTTP is served from
+  disk, so this is almost entirely HTML/JSON/feed parsing and extraction)
+- normalize: EventSchema.migrate_event() + pydantic validation of the
+  scraped events (keyword categorization only - AI providers are not called)
+- peak memory of one parse + normalize pass (tracemalloc)
+
+Usage:
+    python3 src/event_manager.py scrape --record corpus/
+    python3 src/event_manager.py bench scrapers corpus/ --rounds 5
+"""
+
+import contextlib
+import io
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .http_replay import HTTPCorpus, find_source_exchange
+
+
+@dataclass
+class SourceBenchmark:
+    """Benchmark result for one source"""
+    name: str
+    source_type: str
+    events: int = 0
+    valid: int = 0
+    parse_ms: float = 0.0
+    normalize_ms: float = 0.0
+    peak_kb: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def total_ms(self) -> float:
+        return self.parse_ms + self.normalize_ms
+
+    @property
+    def events_per_second(self) -> float:
+        return self.events / (self.total_ms / 1000) if self.total_ms else 0.0
+
+
+def benchmark_sources(config: Dict[str, Any], base_path: Path, corpus_dir,
+                      rounds: int = 3, source_name: Optional[str] = None) -> List[SourceBenchmark]:
+    """
+    Benchmark enabled sources on a recorded corpus.
+
+    Args:
+        config: Full configuration dictionary
+        base_path: Repository root
+        corpus_dir: Directory written by `scrape --record`
+        rounds: Timing rounds per source (best time is reported)
+        source_name: Only benchmark this source (case-insensitive)
+
+    Returns:
+        One SourceBenchmark per enabled source, in configuration order.
+        Sources missing from the corpus have error set.
+
+    Raises:
+        FileNotFoundError: If corpus_dir holds no recording
+    """
+    from .scraper import EventScraper
+    from .event_schema import EventSchema
+
+    corpus = HTTPCorpus(corpus_dir).load()
+    scraper = EventScraper(config, base_path)
+    schema = EventSchema()
+    cache_enabled = scraper.http_cache.enabled
+    # Every round must parse the full recorded response, not a cached 304
+    scraper.http_cache.enabled = False
+
+    results = []
+    try:
+        with corpus.replay():
+            for source in config.get('scraping', {}).get('sources', []):
+                if not source.get('enabled', False):
+                    continue
+                if source_name and source.get('name', '').lower() != source_name.lower():
+                    continue
+                result = SourceBenchmark(source.get('name', 'Unknown'), source.get('type', 'unknown'))
+                if find_source_exchange(corpus, source.get('url', '')) is None:
+                    result.error = 'not recorded'
+                else:
+                    # Every round must parse every item - and must not mark
+                    # items as seen for the next real scrape
+                    source = dict(source, options=dict(source.get('options', {}), skip_unchanged=False))
+                    _benchmark_source(scraper, schema, source, result, max(1, rounds))
+                results.append(result)
+    finally:
+        scraper.http_cache.enabled = cache_enabled
+    return results
+
+
+def _benchmark_source(scraper, schema, source, result, rounds):
+    """Fill in timings and peak memory for one source"""
+    # Sources report progress with print() - keep the benchmark output clean
+    with contextlib.redirect_stdout(io.StringIO()):
+        try:
+            parse_times, normalize_times = [], []
+            for _ in range(rounds):
+                start = time.perf_counter()
+                events = scraper.scrape_source(source)
+                parsed = time.perf_counter()
+                valid = _normalize(schema, events)
+                parse_times.append(parsed - start)
+                normalize_times.append(time.perf_counter() - parsed)
+
+            tracemalloc.start()
+            try:
+                _normalize(schema, scraper.scrape_source(source))
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+        except Exception as e:
+            result.error = str(e)[:80]
+            return
+
+    result.events = len(events)
+    result.valid = valid
+    result.parse_ms = min(parse_times) * 1000
+    result.normalize_ms = min(normalize_times) * 1000
+    result.peak_kb = peak / 1024
+
+
+def _normalize(schema, events) -> int:
+    """Migrate and validate events like the scrape pipeline; returns the valid count"""
+    from .models import validate_event_data
+
+    valid = 0
+    for event in events:
+        try:
+            validate_event_data(schema.migrate_event(event))
+            valid += 1
+        except ValueError:
+            pass
+    return valid
@@ -8,17 +8,21 @@ Provides command-line interface for:
 - Fixing broken scrapers
 """
 
-import json
 import sys
 from pathlib import Path
 from typing import Dict, Any, List
 
+try:
+    from . import fast_json
+except ImportError:
+    import fast_json  # Running as a script from src/modules/
+
 
 def list_sources(config_path: str = 'config.json'):
     """List all configured sources."""
     try:
         with open(config_path, 'r') as f:
-            config = json.load(f)
+            config = fast_json.load(f)
         
         sources = config.get('scraping', {}).get('sources', [])
         
@@ -58,7 +62,7 @@ def add_source(name: str, url: str, source_type: str = 'html',
     try:
         # Load config
         with open(config_path, 'r') as f:
-            config = json.load(f)
+            config = fast_json.load(f)
         
         # Create source
         source = {
@@ -82,7 +86,7 @@ def add_source(name: str, url: str, source_type: str = 'html',
         
         # Save config
         with open(config_path, 'w') as f:
-            json.dump(config, f, indent=2)
+            fast_json.dump(config, f, indent=2)
         
         print(f"✓ Added source: {name}")
         
@@ -103,7 +107,7 @@ def test_source(name: str, config_path: str = 'config.json',
     try:
         # Load config
         with open(config_path, 'r') as f:
-            config = json.load(f)
+            config = fast_json.load(f)
         
         # Find source
         sources = config.get('scraping', {}).get('sources', [])
@@ -160,7 +164,7 @@ def _toggle_source(name: str, enabled: bool, config_path: str):
     """Toggle source enabled/disabled."""
     try:
         with open(config_path, 'r') as f:
-            config = json.load(f)
+            config = fast_json.load(f)
         
         sources = config.get('scraping', {}).get('sources', [])
         found = False
@@ -176,7 +180,7 @@ def _toggle_source(name: str, enabled: bool, config_path: str):
             sys.exit(1)
         
         with open(config_path, 'w') as f:
-            json.dump(config, f, indent=2)
+            fast_json.dump(config, f, indent=2)
         
         status = "enabled" if enabled else "disabled"
         print(f"✓ Source '{name}' {status}!")
@@ -191,7 +195,7 @@ def test_all_sources(config_path: str = 'config.json',
     """Test all configured sources."""
     try:
         with open(config_path, 'r') as f:
-            config = json.load(f)
+            config = fast_json.load(f)
         
         sources = config.get('scraping', {}).get('sources', [])
         
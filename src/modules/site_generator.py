@@ -23,6 +23,8 @@ from typing import Dict, List, Tuple
 from datetime import datetime
 import html
 
+from . import fast_json
+
 # Configure module logger
 logger = logging.getLogger(__name__)
 
@@ -726,19 +728,19 @@ class SiteGenerator:
         events_file = data_path / 'events.json'
         if events_file.exists():
             with open(events_file, 'r') as f:
-                events.extend(json.load(f).get('events', []))
+                events.extend(fast_json.load(f).get('events', []))
         
         # Always load Antarctica showcase events
         antarctica_file = data_path / 'events.antarctica.json'
         if antarctica_file.exists():
             with open(antarctica_file, 'r') as f:
-                events.extend(json.load(f).get('events', []))
+                events.extend(fast_json.load(f).get('events', []))
         
         # Always load Atlantis 404 events
         atlantis_file = data_path / 'events.atlantis.json'
         if atlantis_file.exists():
             with open(atlantis_file, 'r') as f:
-                events.extend(json.load(f).get('events', []))
+                events.extend(fast_json.load(f).get('events', []))
         
         logger.debug(f"Loaded {len(events)} events (real + antarctica + atlantis)")
         return events
@@ -763,7 +765,7 @@ class SiteGenerator:
             path = self.base_path / config_file
             if path.exists():
                 with open(path, 'r', encoding='utf-8') as f:
-                    configs.append(json.load(f))
+                    configs.append(fast_json.load(f))
         
         return configs
     
@@ -1134,7 +1136,7 @@ class SiteGenerator:
         all_icons = {**MAP_ICONS_MAP, **DASHBOARD_ICONS_MAP}
         
         # Convert Python dict to JSON-safe JavaScript object
-        icons_json = json.dumps(all_icons, indent=2)
+        icons_json = fast_json.dumps(all_icons, indent=2)
         
         # Generate minimal createIcons implementation
         lucide_js = f'''
@@ -1205,7 +1207,7 @@ class SiteGenerator:
         if weather_cache_path.exists():
             try:
                 with open(weather_cache_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                    return fast_json.load(f)
             except Exception as e:
                 logger.warning(f"Failed to load weather cache: {e}")
                 return {}
@@ -1232,7 +1234,7 @@ class SiteGenerator:
             
             try:
                 with open(translation_file, 'r', encoding='utf-8') as f:
-                    translations[lang_code] = json.load(f)
+                    translations[lang_code] = fast_json.load(f)
                     logger.info(f"Loaded translations for language: {lang_code}")
             except Exception as e:
                 logger.error(f"Failed to load translation file {translation_file}: {e}")
@@ -1484,16 +1486,14 @@ class SiteGenerator:
         Returns:
             JavaScript code string that defines window.MARKER_ICONS and window.DASHBOARD_ICONS
         """
-        import json
-        
         # Generate inline JavaScript for icon maps
         all_ui_icons = {**MAP_ICONS_MAP, **DASHBOARD_ICONS_MAP}
         js_code = f'''// Icon Maps - Inlined by site_generator.py
 // Map markers for event categories (base64 encoded gyro-wrapped icons)
-window.MARKER_ICONS = {json.dumps(marker_icons, ensure_ascii=False)};
+window.MARKER_ICONS = {fast_json.dumps(marker_icons, ensure_ascii=False, separators=fast_json.COMPACT)};
 
 // Dashboard & Map UI icons (Lucide SVG for speech bubbles, controls, debug UI)
-window.DASHBOARD_ICONS = {json.dumps(all_ui_icons, ensure_ascii=False)};'''
+window.DASHBOARD_ICONS = {fast_json.dumps(all_ui_icons, ensure_ascii=False, separators=fast_json.COMPACT)};'''
         
         return js_code
     
@@ -1714,7 +1714,7 @@ window.DASHBOARD_ICONS = {json.dumps(all_ui_icons, ensure_ascii=False)};'''
             return {}
         
         with open(config_file, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+            config = fast_json.load(f)
         
         return config.get('design', {})
     
@@ -1840,7 +1840,7 @@ window.DASHBOARD_ICONS = {json.dumps(all_ui_icons, ensure_ascii=False)};'''
             pending_count = 0
             if pending_file.exists():
                 with open(pending_file, 'r', encoding='utf-8') as f:
-                    pending_data = json.load(f)
+                    pending_data = fast_json.load(f)
                     # Handle both dict format {'pending_events': [...]} and list format
                     if isinstance(pending_data, dict):
                         pending_count = len(pending_data.get('pending_events', []))
@@ -1850,7 +1850,7 @@ window.DASHBOARD_ICONS = {json.dumps(all_ui_icons, ensure_ascii=False)};'''
             archived_count = 0
             if archived_file.exists():
                 with open(archived_file, 'r', encoding='utf-8') as f:
-                    archived_data = json.load(f)
+                    archived_data = fast_json.load(f)
                     # Handle both dict format {'archived_events': [...]} and list format
                     if isinstance(archived_data, dict):
                         archived_count = len(archived_data.get('archived_events', []))
@@ -1870,7 +1870,7 @@ window.DASHBOARD_ICONS = {json.dumps(all_ui_icons, ensure_ascii=False)};'''
             if unverified_file.exists():
                 try:
                     with open(unverified_file, 'r', encoding='utf-8') as f:
-                        unverified_data = json.load(f)
+                        unverified_data = fast_json.load(f)
                         unverified_locations = unverified_data.get('locations', {})
                         unverified_count = len(unverified_locations)
                 except Exception as e:
@@ -2074,6 +2074,17 @@ window.DASHBOARD_ICONS = {json.dumps(all_ui_icons, ensure_ascii=False)};'''
         
         return sizes
     
+    def embed_json(self, data) -> str:
+        """
+        Serialize data for embedding in the generated HTML.
+        
+        Compact (no whitespace) in production; indented when debug comments
+        are enabled. Uses the fast JSON backend (see fast_json.py).
+        """
+        if self.enable_debug_comments:
+            return fast_json.dumps(data, ensure_ascii=False, indent=2)
+        return fast_json.dumps(data, ensure_ascii=False, separators=fast_json.COMPACT)
+    
     def build_html_from_components(
         self,
         configs: List[Dict],
@@ -2187,13 +2198,13 @@ window.DASHBOARD_ICONS = {json.dumps(all_ui_icons, ensure_ascii=False)};'''
         
         # Build embedded data strings with individual wrapping
         all_ui_icons = {**MAP_ICONS_MAP, **DASHBOARD_ICONS_MAP}
-        app_config_json = json.dumps(runtime_config, ensure_ascii=False, indent=2 if self.enable_debug_comments else None)
+        app_config_json = self.embed_json(runtime_config)
         app_config_size_kb = len(app_config_json.encode('utf-8')) / 1024
-        events_json = json.dumps(events, ensure_ascii=False, indent=2 if self.enable_debug_comments else None)
-        marker_icons_json = json.dumps(marker_icons, ensure_ascii=False, indent=2 if self.enable_debug_comments else None)
-        dashboard_icons_json = json.dumps(all_ui_icons, ensure_ascii=False, indent=2 if self.enable_debug_comments else None)
-        debug_info_json = json.dumps(debug_info, ensure_ascii=False, indent=2 if self.enable_debug_comments else None)
-        translations_json = json.dumps(translations, ensure_ascii=False, indent=2 if self.enable_debug_comments else None)
+        events_json = self.embed_json(events)
+        marker_icons_json = self.embed_json(marker_icons)
+        dashboard_icons_json = self.embed_json(all_ui_icons)
+        debug_info_json = self.embed_json(debug_info)
+        translations_json = self.embed_json(translations)
         translations_size_kb = len(translations_json.encode('utf-8')) / 1024
         
         # Wrap each data section with debug comments
@@ -2355,7 +2366,7 @@ window.DEBUG_INFO = {debug_info_json};'''
         
         return '\n'.join(html_parts)
     
-    def generate_site(self, skip_lint: bool = False) -> bool:
+    def generate_site(self, skip_lint: bool = False, force: bool = False, explain: bool = False) -> bool:
         """
         Generate complete static site with inlined HTML.
         
@@ -2371,8 +2382,17 @@ window.DEBUG_INFO = {debug_info_json};'''
         7. Lints and validates generated content (HTML, CSS, JS, SVG)
         9. Writes output to public/index.html (German - primary language)
         
+        The build is incremental: index.html (with its lint report),
+        404.html, the RSS feeds and their public copies are nodes of a
+        BuildGraph (modules/build_graph.py) that records the content hashes
+        of their inputs in .cache/build_manifest.json. Only nodes whose
+        inputs or outputs changed are rebuilt (steps 3-7 run only for a
+        stale index.html).
+        
         Args:
             skip_lint: If True, skip linting validation (useful for testing)
+            force: Rebuild every output, even if up to date
+            explain: Print why each output was rebuilt (or that it was up to date)
         
         Returns:
             True if generation succeeds, False otherwise
@@ -2384,8 +2404,138 @@ window.DEBUG_INFO = {debug_info_json};'''
         if not self.ensure_dependencies_present():
             return False
         
+        # The build reads the JSON snapshots - flush pending event store changes
+        from .utils import export_event_snapshots
+        export_event_snapshots(self.base_path)
+        
         print("\nLoading configurations...")
         configs = self.load_all_configs()
+        
+        graph = self.create_build_graph(configs, skip_lint=skip_lint)
+        report = graph.run(force=force)
+        
+        if explain:
+            self.print_build_explanation(graph, report)
+        
+        if 'index.html' in report.failed:
+            print("\n❌ Static site generation failed")
+            return False
+        
+        print(f"\n✅ Static site generated successfully!")
+        if report.built:
+            print(f"   Rebuilt: {', '.join(report.built)}")
+        if report.skipped:
+            print(f"   Up to date: {', '.join(report.skipped)}")
+        if report.failed:
+            print(f"   Failed (retried next build): {', '.join(report.failed)}")
+        print(f"   Configs: {len(configs)} (runtime-selected)")
+        print(f"   Build time: {report.duration:.2f}s")
+        print("\n" + "=" * 60)
+        return True
+    
+    # Files index.html is built from (relative to the repository root)
+    SITE_INPUT_FILES = [
+        'config.json',
+        'assets/css', 'assets/js', 'assets/html', 'assets/svg', 'assets/*.svg', 'lib',
+        'assets/json/events.json', 'assets/json/events.antarctica.json', 'assets/json/events.atlantis.json',
+        'assets/json/weather_cache.json', 'assets/json/translations',
+        # Counts shown in DEBUG_INFO
+        'assets/json/pending_events.json', 'assets/json/archived_events.json',
+        'assets/json/unverified_locations.json',
+        # The generator itself
+        'src/modules/site_generator.py', 'src/modules/lucide_markers.py', 'src/modules/linter.py',
+    ]
+    
+    def create_build_graph(self, configs: List[Dict], skip_lint: bool = False):
+        """
+        Build graph of the site's outputs.
+        
+        Args:
+            configs: Loaded configurations (load_all_configs())
+            skip_lint: Build index.html without linting
+        
+        Returns:
+            BuildGraph with the index.html, 404.html, rss-feeds and
+            public-feeds nodes
+        """
+        from .build_graph import BuildGraph, BuildNode
+        from .rss_generator import sunrise_feed_selection
+        
+        primary_config = configs[0] if configs else {}
+        graph = BuildGraph(self.base_path)
+        
+        def visible_events():
+            # Past events drop out of the noscript list as time passes
+            return [(entry['event'].get('id'), entry['is_running'])
+                    for entry in self.filter_and_sort_future_events(self.load_all_events(primary_config))]
+        
+        graph.add(BuildNode(
+            'index.html',
+            build=lambda: self.build_index_html(configs, skip_lint=skip_lint),
+            outputs=['public/index.html'] + ([] if skip_lint else ['public/wcag_protocol.txt']),
+            files=self.SITE_INPUT_FILES,
+            values={
+                'configs': lambda: configs,
+                'visible_events': visible_events,
+                'debug_comments': lambda: self.enable_debug_comments,
+                'lint': lambda: not skip_lint,
+                'git_commit': self.get_git_commit,
+            },
+        ))
+        graph.add(BuildNode(
+            '404.html',
+            build=self.generate_404_html,
+            outputs=['public/404.html'],
+            files=['src/modules/site_generator.py'],
+        ))
+        graph.add(BuildNode(
+            'rss-feeds',
+            build=lambda: self.generate_feeds(primary_config),
+            outputs=['assets/feeds/*-til-sunrise.xml'],
+            files=['src/modules/rss_generator.py'],
+            values={'feeds': lambda: sunrise_feed_selection(self.base_path)},
+        ))
+        graph.add(BuildNode(
+            'public-feeds',
+            build=self._copy_feeds_to_public,
+            outputs=['public/assets/feeds/*.xml'],
+            files=['assets/feeds/*.xml'],
+        ))
+        return graph
+    
+    def print_build_explanation(self, graph, report) -> None:
+        """Print why each node of a build was rebuilt or skipped (generate --explain)"""
+        print("\n🔎 Build explanation")
+        for node in graph.nodes:
+            if node.name in report.skipped:
+                print(f"   ✓ {node.name}: up to date")
+                continue
+            status = '❌' if node.name in report.failed else '🔁'
+            print(f"   {status} {node.name}:")
+            for reason in report.reasons.get(node.name, []):
+                print(f"      - {reason}")
+    
+    def get_git_commit(self) -> str:
+        """Current git commit (embedded in DEBUG_INFO); 'unknown' outside a repository"""
+        import subprocess
+        try:
+            return subprocess.check_output(
+                ['git', 'rev-parse', 'HEAD'], cwd=self.base_path, stderr=subprocess.DEVNULL
+            ).decode('utf-8').strip()
+        except Exception:
+            return 'unknown'
+    
+    def build_index_html(self, configs: List[Dict], skip_lint: bool = False) -> bool:
+        """
+        Build and write public/index.html (and the lint report).
+        
+        Args:
+            configs: Loaded configurations (load_all_configs())
+            skip_lint: If True, skip linting validation
+        
+        Returns:
+            True once index.html is written
+        """
         primary_config = configs[0] if configs else {}
         
         print("Loading stylesheets...")
@@ -2520,7 +2670,7 @@ window.DEBUG_INFO = {debug_info_json};'''
                 # Extract current DEBUG_INFO
                 current_debug_json = html_de[debug_info_start + len(debug_info_marker):debug_info_end + 1]
                 try:
-                    debug_data = json.loads(current_debug_json)
+                    debug_data = fast_json.loads(current_debug_json)
                     debug_data['html_sizes'] = html_sizes
                     debug_data['language'] = 'de'
                     # Add lint results if available
@@ -2528,7 +2678,7 @@ window.DEBUG_INFO = {debug_info_json};'''
                         debug_data['lint_results'] = lint_data
                         print(f"✅ Embedded {len(lint_data.get('structured_warnings', []))} lint warnings in DEBUG_INFO")
                     # Replace with updated DEBUG_INFO
-                    updated_debug_json = json.dumps(debug_data, ensure_ascii=False)
+                    updated_debug_json = self.embed_json(debug_data)
                     html_de = html_de[:debug_info_start + len(debug_info_marker)] + updated_debug_json + html_de[debug_info_end + 1:]
                 except Exception as e:
                     logger.warning(f"Could not update DEBUG_INFO: {e}")
@@ -2540,11 +2690,17 @@ window.DEBUG_INFO = {debug_info_json};'''
         with open(output_file, 'w', encoding='utf-8') as f:
             f.write(html_de)
         
-        # Generate 404.html for SPA routing (GitHub Pages)
-        # This redirects /hof, /nbg, /bth etc. to index.html with path preserved
-        self.generate_404_html()
+        print(f"   Output: {output_file} ({len(html_de) / 1024:.1f} KB)")
+        print(f"   Total events: {len(events)}")
+        return True
+    
+    def generate_feeds(self, primary_config: Dict) -> bool:
+        """
+        Generate RSS feeds for each region (assets/feeds/).
         
-        # Generate RSS feeds for each region
+        Returns:
+            False if the feeds could not be generated (the build goes on)
+        """
         try:
             from .rss_generator import generate_sunrise_feeds
             generate_sunrise_feeds(self.base_path)
@@ -2552,6 +2708,7 @@ window.DEBUG_INFO = {debug_info_json};'''
             # Import errors are often configuration issues (missing module, etc.)
             logger.error(f"RSS feed generation skipped: unable to import rss_generator: {e}")
             print(f"\n⚠️  RSS feed generation skipped: unable to import rss_generator: {e}")
+            return False
         except Exception as e:
             # Runtime errors while generating feeds should not break builds
             logger.error(f"RSS feed generation failed: {e}")
@@ -2560,16 +2717,8 @@ window.DEBUG_INFO = {debug_info_json};'''
             if primary_config.get('debug', False):
                 import traceback
                 traceback.print_exc()
+            return False
         
-        # Copy RSS feeds to public directory for serving
-        self._copy_feeds_to_public()
-        
-        print(f"\n✅ Static site generated successfully!")
-        print(f"   Output: {output_file} ({len(html_de) / 1024:.1f} KB)")
-        print(f"   Total events: {len(events)}")
-        print(f"   Configs: {len(configs)} (runtime-selected)")
-        print(f"   Language: English")
-        print("\n" + "=" * 60)
         return True
     
     def generate_404_html(self) -> None:
@@ -2662,7 +2811,7 @@ window.DEBUG_INFO = {debug_info_json};'''
         if end == -1:
             return 0
         try:
-            configs = json.loads(html[start:end+1])
+            configs = fast_json.loads(html[start:end+1])
             return len(configs) if isinstance(configs, list) else 0
         except:
             return 0
@@ -2708,7 +2857,7 @@ window.DEBUG_INFO = {debug_info_json};'''
             print("\n⚠️  Warning: Events data marker not found")
             return False
         
-        new_html = html[:start] + json.dumps(events) + html[end:]
+        new_html = html[:start] + self.embed_json(events) + html[end:]
         
         with open(html_file, 'w', encoding='utf-8') as f:
             f.write(new_html)
@@ -2788,7 +2937,7 @@ window.DEBUG_INFO = {debug_info_json};'''
         
         try:
             # Parse the APP_CONFIG JSON
-            app_config = json.loads(app_config_json_str)
+            app_config = fast_json.loads(app_config_json_str)
             
             # Update weather.data field
             if 'weather' not in app_config:
@@ -2797,10 +2946,7 @@ window.DEBUG_INFO = {debug_info_json};'''
             app_config['weather']['data'] = weather_data
             
             # Serialize back to JSON (preserve formatting based on debug mode)
-            if self.enable_debug_comments:
-                updated_json = json.dumps(app_config, ensure_ascii=False, indent=2)
-            else:
-                updated_json = json.dumps(app_config, ensure_ascii=False)
+            updated_json = self.embed_json(app_config)
             
             # Replace in HTML
             new_html = html[:app_config_start] + updated_json + html[app_config_end:]
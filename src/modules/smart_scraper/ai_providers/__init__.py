@@ -1,7 +1,13 @@
-"""AI Providers - Multiple AI backends for content extraction."""
+"""AI Providers - Multiple AI backends for content extraction.
+
+Configured providers are returned as LazyProvider stand-ins: a provider's
+module (and SDK) is imported and the provider constructed - including
+connection checks - on its first use.
+"""
 
 import importlib
-from typing import Dict, Any
+import threading
+from typing import Dict, Any, Optional
 
 
 # Provider registry: name -> (module, class_name)
@@ -38,24 +44,122 @@ def _load_provider(name: str, module_name: str, class_name: str, provider_config
         return None
 
 
-def get_available_providers(config: Dict[str, Any]) -> Dict[str, Any]:
-    """Get all available and configured AI providers.
+class LazyProvider:
+    """Stand-in for a configured provider, constructed on first use.
+    
+    Any attribute access (is_available(), extract_event_info(), model,
+    rate_limiter, ...) imports the provider's module and constructs it once;
+    the attribute is then that of the real provider. A provider whose module
+    cannot be imported is not available.
+    """
+    
+    def __init__(self, name: str, module_name: str, class_name: str,
+                 provider_config: Dict[str, Any], result_cache: Any = None):
+        self.name = name
+        self._target = (module_name, class_name, provider_config)
+        self._result_cache = result_cache
+        self._provider = None
+        self._failed = False
+        self._lock = threading.Lock()
+    
+    @property
+    def loaded(self) -> bool:
+        """Whether the provider has been constructed."""
+        return self._provider is not None
+    
+    def resolve(self) -> Optional[Any]:
+        """Construct the provider if not done yet.
+        
+        Returns:
+            Provider instance or None if its import failed
+        """
+        if self._provider is None and not self._failed:
+            with self._lock:
+                if self._provider is None and not self._failed:
+                    module_name, class_name, provider_config = self._target
+                    provider = _load_provider(self.name, module_name, class_name, provider_config)
+                    if provider is None:
+                        self._failed = True
+                    else:
+                        provider.result_cache = self._result_cache
+                        self._provider = provider
+        return self._provider
+    
+    def is_available(self) -> bool:
+        provider = self.resolve()
+        return provider is not None and bool(provider.is_available())
+    
+    def __getattr__(self, attribute: str) -> Any:
+        # Only called for attributes not set in __init__
+        if attribute.startswith('__') or attribute in ('_provider', '_failed', '_lock', '_target'):
+            raise AttributeError(attribute)
+        provider = self.resolve()
+        if provider is None:
+            raise AttributeError(f"AI provider '{self.name}' could not be loaded (no attribute {attribute!r})")
+        return getattr(provider, attribute)
+    
+    def __repr__(self) -> str:
+        state = 'loaded' if self.loaded else ('failed' if self._failed else 'not loaded')
+        return f"<LazyProvider {self.name} ({state})>"
+
+
+def get_available_providers(config: Dict[str, Any], base_path: Optional[str] = None,
+                            lazy: bool = True) -> Dict[str, Any]:
+    """Get all configured AI providers.
     
     Args:
         config: AI configuration section
+        base_path: Repository root - if given, providers share its
+                   AI result cache (config: ai.result_cache)
+        lazy: Return LazyProvider stand-ins that construct the provider on
+              first use (False = construct now and drop providers whose
+              import fails)
         
     Returns:
-        Dictionary of provider_name -> provider_instance
+        Dictionary of provider_name -> provider (or LazyProvider)
     """
     providers = {}
+    result_cache = None
+    if base_path is not None:
+        from .result_cache import get_ai_result_cache
+        result_cache = get_ai_result_cache(base_path, config.get('result_cache', {}))
     
     for name, (module_name, class_name) in PROVIDER_REGISTRY.items():
-        if name in config:
-            provider = _load_provider(name, module_name, class_name, config[name])
-            if provider:
-                providers[name] = provider
+        if name not in config:
+            continue
+        if lazy:
+            providers[name] = LazyProvider(name, module_name, class_name, config[name], result_cache)
+            continue
+        provider = _load_provider(name, module_name, class_name, config[name])
+        if provider:
+            provider.result_cache = result_cache
+            providers[name] = provider
     
     return providers
 
 
-__all__ = ['get_available_providers']
+def build_provider_router(config: Dict[str, Any], base_path: Optional[str] = None) -> Dict[str, Any]:
+    """Get the configured AI providers behind a ProviderRouter.
+    
+    The router is a drop-in for the provider dict: router[name] answers
+    like the provider but fails over to the others, skips providers with an
+    open circuit and records latency statistics (config: ai.router).
+    
+    Args:
+        config: AI configuration section
+        base_path: Repository root - shared result cache and persistent
+                   router statistics
+        
+    Returns:
+        ProviderRouter, or the plain provider dict if ai.router.enabled is
+        false or no provider is configured
+    """
+    providers = get_available_providers(config, base_path)
+    settings = config.get('router', {})
+    if not providers or not settings.get('enabled', True):
+        return providers
+    from .router import ProviderRouter
+    return ProviderRouter(providers, settings, base_path)
+
+
+__all__ = ['get_available_providers', 'build_provider_router', 'LazyProvider']
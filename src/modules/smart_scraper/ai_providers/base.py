@@ -1,26 +1,103 @@
 """Base AI provider and rate limiting."""
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Optional, Tuple
+import functools
+import inspect
+import threading
 import time
-import random
+
+from .result_cache import result_key
+
+
+class TokenBucket:
+    """Token bucket: `rate` tokens per second, at most `capacity` saved up.
+    
+    Thread-safe. Idle time fills the bucket, so up to `capacity` requests
+    go out at once after a pause and the long-run rate never exceeds
+    `rate`.
+    """
+    
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """
+        Args:
+            rate: Tokens added per second (inf = no limit)
+            capacity: Bucket size (burst)
+        """
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+    
+    def wait_time(self) -> float:
+        """Seconds until a token is available (0 = now)."""
+        if self.rate == float('inf'):
+            return 0.0
+        with self._lock:
+            self._refill(time.monotonic())
+            return 0.0 if self._tokens >= 1 else (1 - self._tokens) / self.rate
+    
+    def acquire(self) -> float:
+        """Take a token, sleeping until one is available.
+        
+        Returns:
+            Seconds waited
+        """
+        if self.rate == float('inf'):
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            # Reserve the token now; concurrent callers queue up behind it
+            self._tokens -= 1
+            wait = 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+    
+    def drain(self):
+        """Empty the bucket (after the server said we are too fast)."""
+        if self.rate == float('inf'):
+            return
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, 0.0)
 
 
 class RateLimiter:
-    """Rate limiter for API requests."""
+    """Rate limiter for API requests (token bucket per provider).
+    
+    The sustained rate is one request per average of min_delay and
+    max_delay (or rate_limit.requests_per_minute), with bursts of up to
+    rate_limit.burst requests after idle time.
+    """
     
     def __init__(self, min_delay: float = 1.0, max_delay: float = 5.0,
-                 max_requests_per_session: int = 10):
+                 max_requests_per_session: int = 10,
+                 requests_per_minute: Optional[float] = None, burst: float = 1):
         """Initialize rate limiter.
         
         Args:
             min_delay: Minimum delay between requests (seconds)
             max_delay: Maximum delay between requests (seconds)
             max_requests_per_session: Max requests before rotation
+            requests_per_minute: Sustained rate (default: from min/max delay)
+            burst: Requests allowed back to back after idle time
         """
         self.min_delay = min_delay
         self.max_delay = max_delay
         self.max_requests_per_session = max_requests_per_session
+        if requests_per_minute:
+            rate = requests_per_minute / 60.0
+        else:
+            average_delay = (min_delay + max_delay) / 2
+            rate = 1.0 / average_delay if average_delay > 0 else float('inf')
+        self.bucket = TokenBucket(rate, burst)
         self.request_count = 0
         self.last_request_time = 0
         self.retry_after = 0
@@ -36,19 +113,16 @@ class RateLimiter:
             time.sleep(wait_time)
             self.retry_after = 0
         
-        # Calculate delay since last request
-        elapsed = now - self.last_request_time
-        
-        # Random delay between min and max
-        target_delay = random.uniform(self.min_delay, self.max_delay)
-        
-        if elapsed < target_delay:
-            wait_time = target_delay - elapsed
-            time.sleep(wait_time)
+        # Take a token (sleeps until the bucket has one)
+        self.bucket.acquire()
         
         self.last_request_time = time.time()
         self.request_count += 1
     
+    def wait_time(self) -> float:
+        """Seconds the next wait() would block."""
+        return max(self.bucket.wait_time(), self.retry_after - time.time(), 0.0)
+    
     def handle_rate_limit(self, retry_after: float = 60):
         """Handle rate limit response.
         
@@ -56,6 +130,7 @@ class RateLimiter:
             retry_after: Seconds to wait before retrying
         """
         self.retry_after = time.time() + retry_after
+        self.bucket.drain()
         print(f"  ⚠ Rate limited, waiting {retry_after}s")
     
     def should_rotate(self) -> bool:
@@ -67,8 +142,105 @@ class RateLimiter:
         self.request_count = 0
 
 
+# Provider methods answered from the result cache (see result_cache.py),
+# with the arguments that make up the cache key
+CACHED_METHODS: Dict[str, Tuple[str, ...]] = {
+    'extract_event_info': ('text', 'prompt'),
+    'analyze_image': ('image_data', 'prompt'),
+    'generate_json': ('prompt',),
+}
+
+# Providers with a cached call in progress on this thread: a provider method
+# calling another one (or super()) is cached once, at the outermost call
+_active_calls = threading.local()
+
+
+def served_from_cache() -> bool:
+    """Whether the last provider call on this thread was answered from the result cache.
+    
+    Cleared by reading, so callers timing provider calls (ProviderRouter)
+    can leave cache hits out of their latency statistics.
+    """
+    hit = getattr(_active_calls, 'cache_hit', False)
+    _active_calls.cache_hit = False
+    return hit
+
+
+def report_call_failure() -> None:
+    """Mark the current provider call on this thread as failed.
+    
+    For providers that catch request errors, timeouts and error statuses
+    and return None: the router counts the call as a failure (not as a
+    well-formed "no answer") and fails over, and the None is not cached.
+    """
+    _active_calls.call_failed = True
+
+
+def call_failed() -> bool:
+    """Whether the last provider call on this thread reported a failure.
+    
+    Cleared by reading (see report_call_failure()).
+    """
+    failed = getattr(_active_calls, 'call_failed', False)
+    _active_calls.call_failed = False
+    return failed
+
+
+def _with_result_cache(method_name: str, inputs: Tuple[str, ...], func: Callable) -> Callable:
+    """Wrap a provider method so answers are looked up in / stored to result_cache."""
+    signature = inspect.signature(func)
+    
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        cache = getattr(self, 'result_cache', None)
+        active = getattr(_active_calls, 'providers', None)
+        if active is None:
+            active = _active_calls.providers = set()
+        if cache is None or not cache.enabled or id(self) in active:
+            return func(self, *args, **kwargs)
+        if not active:
+            _active_calls.call_failed = False  # Left by an earlier, uncached call
+        
+        arguments = signature.bind(self, *args, **kwargs).arguments
+        key = result_key(self.get_name(), self.get_model_name(), self.PROMPT_VERSION, method_name,
+                         *(arguments.get(name) for name in inputs))
+        found, value = cache.get(key)
+        if found:
+            _active_calls.cache_hit = True
+            return value
+        
+        active.add(id(self))
+        try:
+            value = func(self, *args, **kwargs)
+        finally:
+            active.discard(id(self))
+        # None answers are cached too (with their own, shorter TTL) unless
+        # the provider reported the call as failed; the flag is left for the
+        # router to read
+        if value is not None or not getattr(_active_calls, 'call_failed', False):
+            cache.put(key, self.get_name(), value)
+        return value
+    
+    wrapper._result_cached = True
+    return wrapper
+
+
 class BaseAIProvider(ABC):
-    """Abstract base class for AI providers."""
+    """Abstract base class for AI providers.
+    
+    extract_event_info(), analyze_image() and generate_json() of every
+    subclass are answered from result_cache when one is attached.
+    """
+    
+    # Part of every cache key - bump in a subclass when its default prompts change
+    PROMPT_VERSION = 1
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name, inputs in CACHED_METHODS.items():
+            func = cls.__dict__.get(name)
+            if inspect.isfunction(func) and not getattr(func, '_result_cached', False):
+                setattr(cls, name, _with_result_cache(name, inputs, func))
     
     def __init__(self, config: Dict[str, Any]):
         """Initialize provider.
@@ -83,8 +255,13 @@ class BaseAIProvider(ABC):
         self.rate_limiter = RateLimiter(
             min_delay=rate_limit.get('min_delay', 1.0),
             max_delay=rate_limit.get('max_delay', 5.0),
-            max_requests_per_session=rate_limit.get('max_requests_per_session', 10)
+            max_requests_per_session=rate_limit.get('max_requests_per_session', 10),
+            requests_per_minute=rate_limit.get('requests_per_minute'),
+            burst=rate_limit.get('burst', 1)
         )
+        
+        # AIResultCache, attached by whoever creates the provider
+        self.result_cache = None
     
     @abstractmethod
     def extract_event_info(self, text: str, prompt: Optional[str] = None) -> Optional[Dict[str, Any]]:
@@ -127,3 +304,14 @@ class BaseAIProvider(ABC):
             Provider name
         """
         return self.__class__.__name__
+    
+    def get_model_name(self) -> str:
+        """Get the model answering requests (part of result cache keys).
+        
+        Returns:
+            Model name, or '' if the provider has none
+        """
+        model = getattr(self, 'model', None)
+        if isinstance(model, str):
+            return model
+        return str(self.config.get('model', ''))
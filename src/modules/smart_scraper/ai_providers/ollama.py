@@ -3,7 +3,7 @@
 from typing import Dict, Any, Optional
 import json
 import logging
-from .base import BaseAIProvider
+from .base import BaseAIProvider, report_call_failure
 
 try:
     import requests
@@ -13,6 +13,26 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Category overview shared by the single-event and batch categorization prompts
+CATEGORY_GUIDE = """Available categories:
+- Performance & Stage: on-stage, music, opera-house, theatre, concert
+- Social & Community: pub-games, festivals, community, social, meetup
+- Learning & Skills: workshops, school, education, training, seminar
+- Shopping & Commerce: shopping, market, bazaar, fair, trade-show
+- Sports & Fitness: sports, sports-field, swimming, fitness, athletics
+- Arts & Culture: arts, museum, gallery, exhibition, cultural
+- Food & Drink: food, restaurant, cafe, dining, culinary
+- Religious & Spiritual: church, religious, spiritual, worship, ceremony
+- Historical & Monuments: castle, monument, tower, ruins, palace
+- Parks & Nature: park, nature, garden, outdoors, recreation
+- Government & Civic: parliament, mayors-office, civic, government, public-office
+- Education & Research: library, national-archive, research, academic, study
+- Technology & Innovation: tech, innovation, startup, hackathon, coding
+- Health & Wellness: health, wellness, medical, therapy, healing
+- Family & Kids: family, kids, children, youth, playground
+- Business & Networking: business, networking, conference, corporate, professional
+- Default fallback: default, other, miscellaneous, general"""
+
 
 class OllamaProvider(BaseAIProvider):
     """Ollama local LLM provider for event categorization."""
@@ -22,7 +42,20 @@ class OllamaProvider(BaseAIProvider):
         self.host = config.get('host', 'http://localhost:11434')
         self.model = config.get('model', 'llama3.2')
         self.timeout = config.get('timeout', 30)
-        self.available = REQUESTS_AVAILABLE and self._check_connection()
+        # Tokens the model may use for prompt + response (Ollama's num_ctx)
+        self.context_window = config.get('context_window', 4096)
+        self._available = None  # Checked on first use
+    
+    @property
+    def available(self) -> bool:
+        """Whether Ollama answers (checked once, on first use)."""
+        if self._available is None:
+            self._available = REQUESTS_AVAILABLE and self._check_connection()
+        return self._available
+    
+    @available.setter
+    def available(self, value: bool):
+        self._available = value
     
     def _check_connection(self) -> bool:
         """Check if Ollama is running."""
@@ -48,7 +81,26 @@ class OllamaProvider(BaseAIProvider):
         Returns:
             Dictionary with extracted info, or None on failure
         """
+        # Use default prompt if none provided
+        if prompt is None:
+            prompt = self._build_categorization_prompt(text)
+        else:
+            prompt = f"{prompt}\n\nText: {text}"
+        
+        return self.generate_json(prompt)
+    
+    def generate_json(self, prompt: str, timeout: Optional[float] = None) -> Optional[Any]:
+        """Run a complete prompt and parse the model's JSON answer.
+        
+        Args:
+            prompt: Full prompt text
+            timeout: Request timeout in seconds (default: configured timeout)
+            
+        Returns:
+            Parsed JSON value, or None on failure
+        """
         if not self.available:
+            report_call_failure()
             return None
         
         self.rate_limiter.wait()
@@ -56,12 +108,6 @@ class OllamaProvider(BaseAIProvider):
         try:
             import requests
             
-            # Use default prompt if none provided
-            if prompt is None:
-                prompt = self._build_categorization_prompt(text)
-            else:
-                prompt = f"{prompt}\n\nText: {text}"
-            
             # Call Ollama API
             response = requests.post(
                 f"{self.host}/api/generate",
@@ -69,13 +115,15 @@ class OllamaProvider(BaseAIProvider):
                     "model": self.model,
                     "prompt": prompt,
                     "stream": False,
-                    "format": "json"
+                    "format": "json",
+                    "options": {"num_ctx": self.context_window}
                 },
-                timeout=self.timeout
+                timeout=timeout or self.timeout
             )
             
             if response.status_code != 200:
                 logger.warning(f"Ollama API returned status {response.status_code}")
+                report_call_failure()
                 return None
             
             # Parse response
@@ -84,14 +132,14 @@ class OllamaProvider(BaseAIProvider):
             
             # Parse JSON from response
             try:
-                extracted = json.loads(response_text)
-                return extracted
+                return json.loads(response_text)
             except json.JSONDecodeError:
                 logger.warning(f"Failed to parse Ollama JSON response: {response_text[:100]}")
                 return None
                 
         except Exception as e:
-            logger.warning(f"Ollama extraction failed: {e}")
+            logger.warning(f"Ollama request failed: {e}")
+            report_call_failure()
             return None
     
     def _build_categorization_prompt(self, text: str) -> str:
@@ -108,24 +156,7 @@ class OllamaProvider(BaseAIProvider):
 Event text:
 {text}
 
-Available categories:
-- Performance & Stage: on-stage, music, opera-house, theatre, concert
-- Social & Community: pub-games, festivals, community, social, meetup
-- Learning & Skills: workshops, school, education, training, seminar
-- Shopping & Commerce: shopping, market, bazaar, fair, trade-show
-- Sports & Fitness: sports, sports-field, swimming, fitness, athletics
-- Arts & Culture: arts, museum, gallery, exhibition, cultural
-- Food & Drink: food, restaurant, cafe, dining, culinary
-- Religious & Spiritual: church, religious, spiritual, worship, ceremony
-- Historical & Monuments: castle, monument, tower, ruins, palace
-- Parks & Nature: park, nature, garden, outdoors, recreation
-- Government & Civic: parliament, mayors-office, civic, government, public-office
-- Education & Research: library, national-archive, research, academic, study
-- Technology & Innovation: tech, innovation, startup, hackathon, coding
-- Health & Wellness: health, wellness, medical, therapy, healing
-- Family & Kids: family, kids, children, youth, playground
-- Business & Networking: business, networking, conference, corporate, professional
-- Default fallback: default, other, miscellaneous, general
+{CATEGORY_GUIDE}
 
 Respond with ONLY a JSON object in this exact format:
 {{"category": "selected_category", "confidence": 0.95, "reasoning": "brief explanation"}}
@@ -143,6 +174,7 @@ Choose the most appropriate category. Use "default" if uncertain."""
             Extracted event data or None
         """
         if not self.available:
+            report_call_failure()
             return None
         
         self.rate_limiter.wait()
@@ -0,0 +1,266 @@
+"""Persistent result cache for AI provider calls.
+
+Recurring events (weekly courses, re-posted social media posts) used to be
+sent to the LLM again on every run. Every BaseAIProvider answer is stored in
+one SQLite database (data/scraper_cache/ai_results.sqlite3), keyed by a hash
+of:
+- provider name and model
+- the provider's PROMPT_VERSION (bump it when a default prompt changes)
+- the called method, the prompt and the input text or image bytes
+
+Answers expire after ttl_days. A well-formed None answer ("not an event",
+a method the provider does not implement) is stored too, as a JSON null,
+and expires after the shorter negative_ttl_days; calls the provider
+reported as failed (report_call_failure()) are never stored. When the
+database grows beyond max_size_mb the least recently used entries are
+evicted. The cache is shared by all providers of a
+repository root and is safe to use from parallel sources.
+
+Usage:
+    from modules.smart_scraper.ai_providers.result_cache import get_ai_result_cache
+
+    provider.result_cache = get_ai_result_cache(base_path, config['ai'].get('result_cache'))
+    provider.extract_event_info(text)  # Answered from disk if seen before
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_DAYS = 30
+DEFAULT_NEGATIVE_TTL_DAYS = 3
+DEFAULT_MAX_SIZE_MB = 20
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key       TEXT PRIMARY KEY,
+    provider  TEXT NOT NULL,
+    value     TEXT NOT NULL,
+    size      INTEGER NOT NULL,
+    created   REAL NOT NULL,
+    last_used REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_results_last_used ON results (last_used);
+"""
+
+
+def get_ai_cache_path(base_path: Path) -> Path:
+    """Return the AI result cache database path for a repository root."""
+    return Path(base_path) / "data" / "scraper_cache" / "ai_results.sqlite3"
+
+
+def result_key(*parts: Any) -> str:
+    """Content address of a provider call (str, bytes or None parts)."""
+    digest = hashlib.sha256()
+    for part in parts:
+        if part is None:
+            data = b""
+        elif isinstance(part, bytes):
+            data = part
+        else:
+            data = str(part).encode("utf-8")
+        # Length prefix keeps ("ab", "c") and ("a", "bc") apart
+        digest.update(len(data).to_bytes(8, "little"))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+class AIResultCache:
+    """Disk cache of AI provider answers keyed by content address."""
+
+    def __init__(self, db_path: Path, ttl_days: Optional[float] = DEFAULT_TTL_DAYS,
+                 max_size_mb: float = DEFAULT_MAX_SIZE_MB, enabled: bool = True,
+                 negative_ttl_days: Optional[float] = DEFAULT_NEGATIVE_TTL_DAYS):
+        """
+        Args:
+            db_path: SQLite database (created on first store)
+            ttl_days: Answers older than this expire (None = never)
+            negative_ttl_days: None answers older than this expire (None = ttl_days)
+            max_size_mb: Size cap, least recently used answers are evicted
+            enabled: False turns every lookup into a miss and stores nothing
+        """
+        self.db_path = Path(db_path)
+        self.ttl_days = ttl_days
+        self.negative_ttl_days = negative_ttl_days
+        self.max_size_mb = max_size_mb
+        self.enabled = enabled
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self.stats = self._empty_stats()
+
+    @staticmethod
+    def _empty_stats() -> Dict[str, int]:
+        return {"hits": 0, "misses": 0, "stores": 0, "evicted": 0}
+
+    def configure(self, settings: Dict[str, Any]) -> None:
+        """Apply an ai.result_cache config section."""
+        self.enabled = settings.get("enabled", True)
+        self.ttl_days = settings.get("ttl_days", DEFAULT_TTL_DAYS)
+        self.negative_ttl_days = settings.get("negative_ttl_days", DEFAULT_NEGATIVE_TTL_DAYS)
+        self.max_size_mb = settings.get("max_size_mb", DEFAULT_MAX_SIZE_MB)
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def _cutoff(self) -> float:
+        return time.time() - self.ttl_days * 86400 if self.ttl_days else 0.0
+
+    def _negative_cutoff(self) -> float:
+        if self.negative_ttl_days is None:
+            return self._cutoff()
+        return max(time.time() - self.negative_ttl_days * 86400, self._cutoff())
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """
+        Look up a stored answer.
+
+        Returns:
+            Tuple of (found, answer) - a found answer may be None
+        """
+        if not self.enabled:
+            return False, None
+        with self._lock:
+            try:
+                conn = self._connect()
+                row = conn.execute(
+                    "SELECT value FROM results WHERE key = ? "
+                    "AND created >= CASE value WHEN 'null' THEN ? ELSE ? END",
+                    (key, self._negative_cutoff(), self._cutoff())
+                ).fetchone()
+                if row is None:
+                    self.stats["misses"] += 1
+                    return False, None
+                with conn:
+                    conn.execute("UPDATE results SET last_used = ? WHERE key = ?", (time.time(), key))
+            except sqlite3.Error as e:
+                logger.warning(f"AI result cache lookup failed: {e}")
+                self.stats["misses"] += 1
+                return False, None
+            self.stats["hits"] += 1
+            return True, json.loads(row[0])
+
+    def put(self, key: str, provider: str, value: Any) -> None:
+        """Store an answer (None for "no answer"), then apply the TTLs and the size cap."""
+        if not self.enabled:
+            return
+        try:
+            data = json.dumps(value, ensure_ascii=False)
+        except (TypeError, ValueError):
+            logger.debug(f"Not caching non-JSON answer from {provider}")
+            return
+        now = time.time()
+        with self._lock:
+            try:
+                conn = self._connect()
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO results (key, provider, value, size, created, last_used) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (key, provider, data, len(data.encode("utf-8")), now, now)
+                    )
+                    self._evict(conn)
+            except sqlite3.Error as e:
+                logger.warning(f"AI result cache store failed: {e}")
+                return
+            self.stats["stores"] += 1
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Drop expired answers and the least recently used ones above the size cap."""
+        evicted = conn.execute(
+            "DELETE FROM results WHERE created < ? OR (value = 'null' AND created < ?)",
+            (self._cutoff(), self._negative_cutoff())
+        ).rowcount
+        max_bytes = self.max_size_mb * 1024 * 1024
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+        if total > max_bytes:
+            doomed = []
+            for key, size in conn.execute("SELECT key, size FROM results ORDER BY last_used"):
+                if total <= max_bytes:
+                    break
+                doomed.append((key,))
+                total -= size
+            conn.executemany("DELETE FROM results WHERE key = ?", doomed)
+            evicted += len(doomed)
+        self.stats["evicted"] += max(evicted, 0)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Lookup statistics of this process plus the current cache size."""
+        with self._lock:
+            stats = dict(self.stats)
+            stats["entries"], stats["size_bytes"] = 0, 0
+            if self.db_path.exists():
+                try:
+                    stats["entries"], stats["size_bytes"] = self._connect().execute(
+                        "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results").fetchone()
+                except sqlite3.Error:
+                    pass
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups * 100, 1) if lookups else 0.0
+        return stats
+
+    def reset_stats(self) -> None:
+        """Start counting a new run."""
+        with self._lock:
+            self.stats = self._empty_stats()
+
+    def clear(self) -> None:
+        """Forget all stored answers."""
+        with self._lock:
+            if self.db_path.exists():
+                with self._connect() as conn:
+                    conn.execute("DELETE FROM results")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# Process-wide caches by base path
+_caches: Dict[str, AIResultCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_ai_result_cache(base_path: Path, settings: Optional[Dict[str, Any]] = None) -> AIResultCache:
+    """
+    Shared AIResultCache for a repository root.
+
+    Args:
+        base_path: Repository root
+        settings: Optional ai.result_cache config section to apply
+
+    Returns:
+        The process-wide AIResultCache for base_path
+    """
+    key = os.path.abspath(base_path)
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = _caches[key] = AIResultCache(get_ai_cache_path(base_path))
+    if settings is not None:
+        cache.configure(settings)
+    return cache
+
+
+def close_ai_result_caches() -> None:
+    """Close all shared caches (tests, end of process)."""
+    with _caches_lock:
+        for cache in _caches.values():
+            cache.close()
+        _caches.clear()
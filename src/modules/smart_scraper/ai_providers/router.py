@@ -0,0 +1,454 @@
+"""Provider router: health tracking, circuit breaking and hedged failover.
+
+Every AI call used to go to one provider; when it timed out the caller got
+nothing, and the next call went to the same provider again. ProviderRouter
+sits in front of all configured providers and is a drop-in for the provider
+dict it replaces (router['ollama'].extract_event_info(...)):
+
+- Rolling statistics per provider: latency p50/p95 and outcome of the last
+  `window` calls (cache hits are not counted)
+- Circuit breaking: after failure_threshold failed calls in a row (an
+  exception, or a timeout/request error the provider reported with
+  report_call_failure()) a provider is skipped for cooldown_minutes; then
+  one probe call decides whether it is used again. A None answer ("not an
+  event", a method the provider does not implement) is a valid answer: it
+  is counted as 'empty' but neither opens the circuit nor fails over
+- Failover: a call for a provider that is skipped or fails goes to the next
+  one in `order`; providers whose token bucket would make the caller wait
+  longer than max_token_wait_seconds are tried after those that can answer
+  now
+- Hedging (hedged() view, for latency-critical callers such as the Telegram
+  bot): if the first provider has not answered after its p95 latency, the
+  same call is also sent to the next provider and the first answer wins
+
+Statistics and circuit state are kept in data/scraper_cache/ai_router.json
+so the next run starts with the known latencies, and the CLI can show them
+(event_manager.py ai-providers stats).
+
+Usage:
+    from modules.smart_scraper.ai_providers.router import ProviderRouter
+
+    router = ProviderRouter(providers, config['ai'].get('router'), base_path)
+    router['ollama'].extract_event_info(text)       # ollama, else the next provider
+    router.hedged()['ollama'].analyze_image(data)   # second provider after p95
+    router.flush()
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .base import call_failed, served_from_cache
+
+logger = logging.getLogger(__name__)
+
+# Used for settings missing from config.json's ai.router section
+DEFAULT_ROUTER_SETTINGS: Dict[str, Any] = {
+    'enabled': True,                # False: callers get the plain provider dict
+    'order': None,                  # Failover order (default: configuration order)
+    'window': 50,                   # Calls kept per provider for the statistics
+    'failure_threshold': 3,
+    'cooldown_minutes': 5,
+    'max_token_wait_seconds': 5,
+    'hedge': {
+        'enabled': False,           # Only used by hedged() views
+        'min_delay_ms': 250,        # Never hedge sooner than this
+        'default_delay_ms': 2000,   # Until a provider has min_samples calls
+        'min_samples': 5,
+    },
+}
+
+# Provider methods the router routes
+ROUTED_METHODS = ('extract_event_info', 'analyze_image', 'generate_json')
+
+
+def get_router_stats_path(base_path: Path) -> Path:
+    """Return the router statistics file for a repository root."""
+    return Path(base_path) / "data" / "scraper_cache" / "ai_router.json"
+
+
+def router_settings(settings: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """ai.router config section merged over the defaults (without _comment keys)."""
+    merged = dict(DEFAULT_ROUTER_SETTINGS, hedge=dict(DEFAULT_ROUTER_SETTINGS['hedge']))
+    for key, value in (settings or {}).items():
+        if key.startswith('_'):
+            continue
+        if key == 'hedge' and isinstance(value, dict):
+            merged['hedge'].update({k: v for k, v in value.items() if not k.startswith('_')})
+        else:
+            merged[key] = value
+    return merged
+
+
+class ProviderHealth:
+    """Rolling call statistics and circuit state of one provider."""
+
+    def __init__(self, window: int = 50):
+        self.samples = deque(maxlen=window)  # (latency seconds, ok)
+        self.calls = 0
+        self.errors = 0          # Raised an exception or reported a failure
+        self.empty = 0           # Answered None (not a failure)
+        self.hedges = 0          # Calls this provider got as the hedge
+        self.hedge_wins = 0      # ... and answered first
+        self.consecutive_failures = 0
+        self.open_until = 0.0
+        self.probing = False
+
+    def record(self, latency: float, outcome: str):
+        """Record a call ('ok', 'empty' or 'error'; only errors count toward the circuit)."""
+        self.calls += 1
+        self.samples.append((latency, outcome != 'error'))
+        if outcome == 'error':
+            self.errors += 1
+            self.consecutive_failures += 1
+        else:
+            if outcome == 'empty':
+                self.empty += 1
+            self.consecutive_failures = 0
+            self.open_until = 0.0
+        self.probing = False
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        """Latency percentile of the successful calls in the window (None without any)."""
+        latencies = sorted(latency for latency, ok in self.samples if ok)
+        if not latencies:
+            return None
+        return latencies[min(len(latencies) - 1, int(fraction * len(latencies)))]
+
+    def error_rate(self) -> float:
+        """Share of failed calls in the window."""
+        if not self.samples:
+            return 0.0
+        return sum(1 for _, ok in self.samples if not ok) / len(self.samples)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'samples': [[round(latency, 4), ok] for latency, ok in self.samples],
+            'calls': self.calls, 'errors': self.errors, 'empty': self.empty,
+            'hedges': self.hedges, 'hedge_wins': self.hedge_wins,
+            'consecutive_failures': self.consecutive_failures,
+            'open_until': self.open_until,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], window: int) -> 'ProviderHealth':
+        health = cls(window)
+        health.samples.extend((float(latency), bool(ok)) for latency, ok in data.get('samples', []))
+        for key in ('calls', 'errors', 'empty', 'hedges', 'hedge_wins', 'consecutive_failures'):
+            setattr(health, key, int(data.get(key, 0)))
+        health.open_until = float(data.get('open_until') or 0.0)
+        return health
+
+
+class RoutedProvider:
+    """A provider as seen through the router: calls fail over to the others.
+
+    Other attributes (model, rate_limiter, result_cache, ...) are those of
+    the underlying provider.
+    """
+
+    def __init__(self, router: 'ProviderRouter', name: str, hedge: bool = False):
+        self._router = router
+        self._name = name
+        self._hedge = hedge
+        self.provider = router.providers[name]
+
+    def __getattr__(self, attribute: str) -> Any:
+        return getattr(self.provider, attribute)
+
+    def extract_event_info(self, text: str, prompt: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        return self._router.call('extract_event_info', text, prompt, preferred=self._name, hedge=self._hedge)
+
+    def analyze_image(self, image_data: bytes, prompt: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        return self._router.call('analyze_image', image_data, prompt, preferred=self._name, hedge=self._hedge)
+
+    def generate_json(self, prompt: str, **kwargs) -> Optional[Any]:
+        return self._router.call('generate_json', prompt, preferred=self._name, hedge=self._hedge, **kwargs)
+
+    def is_available(self) -> bool:
+        """True if this or any failover provider can take calls."""
+        return bool(self._router.candidates('extract_event_info', self._name))
+
+    def get_name(self) -> str:
+        return self.provider.get_name()
+
+
+class ProviderRouter(dict):
+    """Provider dict whose values are RoutedProviders sharing health tracking.
+
+    A drop-in for the dict of get_available_providers(): get(), values(),
+    `in` and iteration work as before, in failover order.
+    """
+
+    def __init__(self, providers: Dict[str, Any], settings: Optional[Dict[str, Any]] = None,
+                 base_path: Optional[Path] = None):
+        """
+        Args:
+            providers: Provider instances by name (get_available_providers())
+            settings: ai.router config section
+            base_path: Repository root - statistics persist between runs if given
+        """
+        self.providers = dict(providers)
+        self.settings = router_settings(settings)
+        self.stats_file = get_router_stats_path(base_path) if base_path is not None else None
+        order = [name for name in (self.settings['order'] or []) if name in self.providers]
+        self.order = order + [name for name in self.providers if name not in order]
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.health = self._load()
+        super().__init__((name, RoutedProvider(self, name)) for name in self.order)
+
+    def hedged(self) -> 'HedgedProviders':
+        """Provider mapping whose calls are hedged (if ai.router.hedge.enabled).
+
+        Shares providers, statistics and circuit state with this router.
+        """
+        return HedgedProviders(self)
+
+    # ------------------------------------------------------------------
+    # Routing
+    # ------------------------------------------------------------------
+
+    def candidates(self, method: str, preferred: Optional[str] = None) -> List[str]:
+        """Providers to try for a call, in order.
+
+        Skips providers without the method, unavailable ones and those with
+        an open circuit (or a probe call in progress after the cool-down).
+        """
+        names = ([preferred] if preferred in self.providers else []) + \
+                [name for name in self.order if name != preferred]
+        now = time.time()
+        ready, throttled = [], []
+        for name in names:
+            provider = self.providers[name]
+            if not callable(getattr(provider, method, None)) or not self._is_available(provider):
+                continue
+            with self._lock:
+                health = self.health[name]
+                if health.open_until > now or health.probing:
+                    continue
+            limiter = getattr(provider, 'rate_limiter', None)
+            if limiter is not None and limiter.wait_time() > self.settings['max_token_wait_seconds']:
+                throttled.append(name)
+            else:
+                ready.append(name)
+        return ready + throttled
+
+    @staticmethod
+    def _is_available(provider: Any) -> bool:
+        try:
+            return provider.is_available() if hasattr(provider, 'is_available') else True
+        except Exception:
+            return False
+
+    def call(self, method: str, *args, preferred: Optional[str] = None, hedge: bool = False, **kwargs) -> Any:
+        """
+        Call a provider method, failing over until one answers.
+
+        Args:
+            method: One of ROUTED_METHODS
+            *args, **kwargs: Passed to the provider method
+            preferred: Provider to try first
+            hedge: Send the call to the next provider too if the first is slow
+
+        Returns:
+            The answer of the first provider that did not fail (which may
+            be None), or None if every provider failed or was skipped
+        """
+        names = self.candidates(method, preferred)
+        if hedge and len(names) > 1:
+            result, names = self._call_hedged(names, method, args, kwargs)
+            if not names:
+                return result
+        for name in names:
+            result, answered = self._invoke(name, method, args, kwargs)
+            if answered:
+                return result
+        return None
+
+    def _invoke(self, name: str, method: str, args: tuple, kwargs: Dict[str, Any]):
+        """Call one provider and record the outcome.
+
+        Returns:
+            (answer, answered) - answered is False if the call failed or the
+            provider's circuit is open
+        """
+        with self._lock:
+            health = self.health[name]
+            if health.open_until > time.time() or health.probing:
+                return None, False
+            # First call after the cool-down: the probe
+            probe = health.probing = bool(health.open_until)
+        # Clear flags left by an earlier call on this thread
+        served_from_cache()
+        call_failed()
+        recorded = False
+        start = time.perf_counter()
+        try:
+            try:
+                result = getattr(self.providers[name], method)(*args, **kwargs)
+                failed = call_failed()
+                outcome = 'ok' if result is not None else 'error' if failed else 'empty'
+            except Exception as e:
+                logger.warning(f"AI provider {name} failed: {e}")
+                result, outcome = None, 'error'
+            if not served_from_cache():
+                self._record(name, time.perf_counter() - start, outcome)
+                recorded = True
+        finally:
+            # A probe answered from the result cache (or interrupted) proved
+            # nothing - let the next call probe
+            if probe and not recorded:
+                with self._lock:
+                    health.probing = False
+        return result, outcome != 'error'
+
+    def _call_hedged(self, names: List[str], method: str, args: tuple, kwargs: Dict[str, Any]):
+        """Run names[0], and names[1] too if names[0] is slower than its p95.
+
+        Returns:
+            (answer, providers still to try sequentially - empty once one answered)
+        """
+        primary, backup = names[0], names[1]
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='ai-hedge')
+        futures = {self._executor.submit(self._invoke, primary, method, args, kwargs): primary}
+        done, _ = wait(futures, timeout=self.hedge_delay(primary))
+        if done:
+            result, answered = next(iter(done)).result()
+            # Answered in time: no hedge; failed: plain failover
+            return result, [] if answered else names[1:]
+
+        with self._lock:
+            self.health[backup].hedges += 1
+            self._dirty = True
+        futures[self._executor.submit(self._invoke, backup, method, args, kwargs)] = backup
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                result, answered = future.result()
+                if answered:
+                    if futures[future] == backup:
+                        with self._lock:
+                            self.health[backup].hedge_wins += 1
+                    return result, []
+        return None, names[2:]
+
+    def hedge_delay(self, name: str) -> float:
+        """Seconds to wait for a provider before hedging: its p95 latency."""
+        hedge = self.settings['hedge']
+        with self._lock:
+            health = self.health[name]
+            p95 = health.percentile(0.95) if len(health.samples) >= hedge['min_samples'] else None
+        delay = p95 if p95 is not None else hedge['default_delay_ms'] / 1000
+        return max(delay, hedge['min_delay_ms'] / 1000)
+
+    def _record(self, name: str, latency: float, outcome: str):
+        with self._lock:
+            health = self.health[name]
+            health.record(latency, outcome)
+            if outcome == 'error' and health.consecutive_failures >= self.settings['failure_threshold']:
+                health.open_until = time.time() + self.settings['cooldown_minutes'] * 60
+                logger.warning(f"AI provider {name} failed {health.consecutive_failures} times in a row; "
+                               f"skipping it for {self.settings['cooldown_minutes']:g} minutes")
+            self._dirty = True
+
+    # ------------------------------------------------------------------
+    # Statistics
+    # ------------------------------------------------------------------
+
+    def _load(self) -> Dict[str, ProviderHealth]:
+        window = self.settings['window']
+        stored = {}
+        if self.stats_file is not None:
+            try:
+                with open(self.stats_file, encoding='utf-8') as f:
+                    stored = json.load(f).get('providers', {})
+            except FileNotFoundError:
+                pass
+            except (ValueError, OSError, AttributeError) as e:
+                logger.warning(f"AI router statistics unreadable, starting fresh: {e}")
+        return {name: ProviderHealth.from_dict(stored[name], window) if name in stored else ProviderHealth(window)
+                for name in self.providers}
+
+    def flush(self):
+        """Write the statistics to disk if they changed (needs base_path)."""
+        with self._lock:
+            if not self._dirty or self.stats_file is None:
+                return
+            data = {'version': 1, 'updated': time.time(),
+                    'providers': {name: health.to_dict() for name, health in self.health.items()}}
+            self._dirty = False
+        self.stats_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.stats_file.with_suffix('.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_file, self.stats_file)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-provider statistics in failover order."""
+        with self._lock:
+            return {name: summarize_health(self.health[name]) for name in self.order}
+
+    def shutdown(self):
+        """Flush statistics and stop the hedging threads."""
+        self.flush()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+class HedgedProviders(dict):
+    """Provider dict for latency-critical callers (ProviderRouter.hedged())."""
+
+    def __init__(self, router: ProviderRouter):
+        self.router = router
+        hedge = bool(router.settings['hedge']['enabled'])
+        super().__init__((name, RoutedProvider(router, name, hedge=hedge)) for name in router.order)
+
+    def flush(self):
+        self.router.flush()
+
+
+def summarize_health(health: ProviderHealth) -> Dict[str, Any]:
+    """Display form of a provider's statistics (latencies in ms)."""
+    p50, p95 = health.percentile(0.5), health.percentile(0.95)
+    return {
+        'calls': health.calls,
+        'errors': health.errors,
+        'empty': health.empty,
+        'window': len(health.samples),
+        'error_rate': round(health.error_rate() * 100, 1),
+        'p50_ms': round(p50 * 1000) if p50 is not None else None,
+        'p95_ms': round(p95 * 1000) if p95 is not None else None,
+        'hedges': health.hedges,
+        'hedge_wins': health.hedge_wins,
+        'circuit': 'open' if health.open_until > time.time() else 'closed',
+        'open_until': health.open_until if health.open_until > time.time() else None,
+    }
+
+
+def load_router_stats(base_path: Path) -> Dict[str, Dict[str, Any]]:
+    """Statistics stored by the last router of a repository root (for the CLI).
+
+    Returns:
+        summarize_health() output by provider name ({} if none stored)
+    """
+    try:
+        with open(get_router_stats_path(base_path), encoding='utf-8') as f:
+            stored = json.load(f).get('providers', {})
+    except (FileNotFoundError, ValueError, OSError):
+        return {}
+    window = DEFAULT_ROUTER_SETTINGS['window']
+    return {name: summarize_health(ProviderHealth.from_dict(data, max(window, len(data.get('samples', [])))))
+            for name, data in stored.items()}
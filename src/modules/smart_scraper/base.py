@@ -2,15 +2,59 @@
 
 Provides:
 - SourceOptions: Per-source configuration
-- BaseSource: Abstract base class for scrapers
-- ScraperRegistry: Registry for source type handlers
+- DetailPage: Result of one detail-page fetch
+- BaseSource: Abstract base class for scrapers (incl. cached HTTP GETs,
+  unchanged-item skipping and concurrent detail fetching)
+- ScraperRegistry: Registry for source type handlers (built-in sources
+  resolve lazily from SOURCE_ENTRY_POINTS)
 """
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Callable
+import importlib
+import logging
 import re
+import threading
+import time
+
+try:
+    import requests
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
+from ..circuit_breaker import CircuitOpenError, get_circuit_breaker, host_of
+from ..http_cache import get_http_cache
+from .source_cache import ItemCache, fingerprint, get_item_cache_path
+
+logger = logging.getLogger(__name__)
+
+# Built-in source types: type -> 'module:Class'. Modules starting with '.'
+# are relative to the smart_scraper package. Only the module of a type that
+# is actually scraped gets imported.
+SOURCE_ENTRY_POINTS = {
+    # Traditional web sources
+    'rss': '.sources.web.rss:RSSSource',
+    'html': '.sources.web.html:HTMLSource',
+    'api': '.sources.web.api:APISource',
+    'atom': '.sources.web.atom:AtomSource',
+    # Social media sources
+    'facebook': '.sources.social.facebook:FacebookSource',
+    'instagram': '.sources.social.instagram:InstagramSource',
+    'tiktok': '.sources.social.tiktok:TikTokSource',
+    'x': '.sources.social.x_twitter:XTwitterSource',
+    'twitter': '.sources.social.x_twitter:XTwitterSource',  # Alias
+    'telegram': '.sources.social.telegram:TelegramSource',
+    'whatsapp': '.sources.social.whatsapp:WhatsAppSource',
+    # Custom handlers for specific sites
+    'frankenpost': '.sources.frankenpost:FrankenpostSource',
+    'freiheitshalle': '.sources.custom.freiheitshalle:FreiheitshalleSource',
+    'vhs': '.sources.custom.vhs:VHSSource',
+    'hofstadt': '.sources.custom.hof_stadt:HofStadtSource',
+}
 
 
 @dataclass
@@ -46,6 +90,18 @@ class SourceOptions:
     rate_limit_delay: Optional[float] = None
     max_retries: int = 3
     
+    # Detail pages (listing + detail sources like Frankenpost)
+    max_detail_pages: Optional[int] = 20  # None = follow every listing link
+    detail_concurrency: int = 4  # Parallel detail-page requests per source
+    detail_timeout: float = 10
+    
+    # Incremental scraping: return no events for a page that answered 304
+    # Not Modified or for items whose content hash is unchanged since the
+    # previous run
+    skip_unchanged: bool = True
+    item_cache_max_entries: int = 2000  # Per source, least recently seen evicted
+    item_cache_ttl_days: Optional[float] = 30  # Forget items not seen for this long
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'SourceOptions':
         """Create SourceOptions from dictionary."""
@@ -90,6 +146,19 @@ class SourceOptions:
         return False
 
 
+@dataclass
+class DetailPage:
+    """Result of fetching one detail page."""
+    
+    url: str
+    content: Optional[bytes] = None
+    error: Optional[Exception] = None
+    
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
 class BaseSource(ABC):
     """Abstract base class for all source scrapers."""
     
@@ -111,6 +180,7 @@ class BaseSource(ABC):
         self.source_type = source_config.get('type', 'unknown')
         self.base_path = Path(base_path) if base_path else None
         self.ai_providers = ai_providers or {}
+        self._item_cache: Optional[ItemCache] = None
     
     @abstractmethod
     def scrape(self) -> List[Dict[str, Any]]:
@@ -136,14 +206,239 @@ class BaseSource(ABC):
         combined_text = f"{title} {description}"
         
         return self.options.should_filter(combined_text)
+    
+    def http_get(self, url: str, session=None, **kwargs):
+        """GET a URL through the shared HTTP conditional-request cache.
+        
+        Sends If-None-Match/If-Modified-Since for pages stored by an earlier
+        run. Without a base_path (no cache directory) this is a plain GET.
+        With one, the host's circuit breaker is consulted first and told
+        the outcome.
+        
+        Args:
+            url: URL to fetch
+            session: requests.Session to use (default: self.session)
+            **kwargs: Passed to session.get (timeout, headers, ...)
+            
+        Returns:
+            requests.Response with from_cache/not_modified attributes
+            
+        Raises:
+            CircuitOpenError: If the host's circuit breaker is open
+        """
+        session = session or getattr(self, 'session', None) or requests
+        if self.base_path is None:
+            response = session.get(url, **kwargs)
+            response.from_cache = response.not_modified = False
+            return response
+        breaker = self.circuit_breaker
+        breaker.check(url)
+        try:
+            response = get_http_cache(self.base_path).get(session, url, **kwargs)
+        except requests.exceptions.RequestException as e:
+            breaker.record(url, error=e)
+            raise
+        breaker.record(url, status_code=response.status_code)
+        return response
+    
+    def guarded_get(self, url: str, timeout: float, delay: float = 0.0):
+        """GET a URL with self.session, guarded by the host's circuit breaker.
+        
+        For sources that fetch with their own session instead of http_get
+        (the social media sources). Errors are printed, not raised.
+        
+        Args:
+            url: URL to fetch
+            timeout: Request timeout in seconds
+            delay: Seconds to sleep before the request (anti-scraping delay)
+            
+        Returns:
+            Response object, or None on error or if the host's circuit
+            breaker is open (then without delay or request)
+        """
+        breaker = self.circuit_breaker
+        if breaker is not None and not breaker.allow(url):
+            print(f"      Skipped: circuit breaker open for {host_of(url)}")
+            return None
+        
+        if delay > 0:
+            time.sleep(delay)
+        
+        try:
+            response = self.session.get(url, timeout=timeout)
+            response.raise_for_status()
+        except Exception as e:
+            print(f"      Request error: {e}")
+            if breaker is not None:
+                breaker.record(url, error=e)
+            return None
+        if breaker is not None:
+            breaker.record(url, status_code=response.status_code)
+        return response
+    
+    @property
+    def circuit_breaker(self):
+        """The shared per-host CircuitBreaker (None without base_path)."""
+        return get_circuit_breaker(self.base_path) if self.base_path is not None else None
+    
+    def is_unchanged(self, response) -> bool:
+        """Check if a listing answered 304 and parsing can be skipped.
+        
+        Events from an unchanged page were already seen by the last run, so
+        sources return no events for it (unless options.skip_unchanged is off).
+        """
+        if self.options.skip_unchanged and getattr(response, 'not_modified', False):
+            print("    ⏭ Unchanged since last scrape (HTTP 304)")
+            return True
+        return False
+    
+    @property
+    def item_cache(self) -> Optional[ItemCache]:
+        """This source's item fingerprint cache.
+        
+        None without base_path and with options.skip_unchanged off (a full
+        rescan neither reads nor updates the cache).
+        """
+        if not self.options.skip_unchanged:
+            return None
+        if self._item_cache is None and self.base_path is not None:
+            self._item_cache = ItemCache(
+                get_item_cache_path(self.base_path), self.name,
+                max_entries=self.options.item_cache_max_entries,
+                ttl_days=self.options.item_cache_ttl_days
+            )
+        return self._item_cache
+    
+    def is_item_unchanged(self, content: Any, key: Optional[str] = None) -> bool:
+        """Check if an item was processed by an earlier run with the same content.
+        
+        Sources call this before extracting an event from a listing entry,
+        feed entry or API record, and skip the item if it returns True.
+        
+        Args:
+            content: The item's raw content (text, bytes or JSON-like data)
+            key: Stable item identity (URL, id); default: the content hash,
+                 i.e. any change makes it a new item
+        """
+        if self.item_cache is None:
+            return False
+        item_fingerprint = fingerprint(content)
+        return self.item_cache.is_unchanged(key or item_fingerprint, item_fingerprint)
+    
+    def remember_item(self, content: Any, key: Optional[str] = None) -> None:
+        """Record an item as processed (same arguments as is_item_unchanged).
+        
+        Sources only remember items whose event they emit; items that were
+        filtered out or yielded no event are checked again by the next run.
+        """
+        if self.item_cache is None:
+            return
+        item_fingerprint = fingerprint(content)
+        self.item_cache.remember(key or item_fingerprint, item_fingerprint)
+    
+    def save_item_cache(self) -> None:
+        """Persist the item cache and report skipped items.
+        
+        Called by SmartScraper.save_item_caches() after the scraped events
+        were saved to pending_events.json.
+        """
+        if self._item_cache is None:
+            return
+        skipped = self._item_cache.stats['unchanged']
+        if skipped:
+            print(f"    ⏭ {skipped} unchanged items skipped")
+        self._item_cache.save()
+    
+    def limit_detail_links(self, links: List[Any]) -> List[Any]:
+        """Apply options.max_detail_pages to a list of listing links."""
+        limit = self.options.max_detail_pages
+        return links[:limit] if limit else links
+    
+    def fetch_detail_pages(self, urls: List[str], session=None) -> List[DetailPage]:
+        """Fetch detail pages concurrently, keeping the listing order.
+        
+        Runs up to options.detail_concurrency requests at a time. Each request
+        uses options.detail_timeout and is retried up to options.max_retries
+        times on timeouts, connection errors and 5xx/429 responses, with
+        exponential backoff, while the host's circuit breaker is closed and
+        the run's retry budget lasts. Failures are returned per page, not
+        raised.
+        
+        Args:
+            urls: Detail page URLs in listing order
+            session: requests.Session to use (default: self.session)
+            
+        Returns:
+            One DetailPage per URL, in the order of `urls`
+        """
+        if not urls:
+            return []
+        if not REQUESTS_AVAILABLE:
+            return [DetailPage(url, error=ImportError('requests not installed')) for url in urls]
+        
+        # The session's adapter is not touched here: EventScraper sizes the
+        # shared pool once per run (_prepare_session_pool), and a requests
+        # pool holds 10 connections per host by default
+        session = session or getattr(self, 'session', None) or requests.Session()
+        workers = max(1, min(self.options.detail_concurrency, len(urls)))
+        
+        if workers == 1:
+            return [self._fetch_detail_page(session, url) for url in urls]
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='detail') as pool:
+            return list(pool.map(lambda url: self._fetch_detail_page(session, url), urls))
+    
+    def _fetch_detail_page(self, session, url: str) -> DetailPage:
+        """Fetch one detail page with timeout and retries."""
+        attempts = max(0, self.options.max_retries) + 1
+        for attempt in range(attempts):
+            if self.options.rate_limit_delay:
+                time.sleep(self.options.rate_limit_delay)
+            try:
+                response = self.http_get(url, session=session, timeout=self.options.detail_timeout)
+                response.raise_for_status()
+                return DetailPage(url, content=response.content)
+            except CircuitOpenError as e:
+                error = e
+                break
+            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+                error = e
+            except requests.exceptions.HTTPError as e:
+                error = e
+                status = e.response.status_code if e.response is not None else None
+                if status is not None and status != 429 and status < 500:
+                    break  # 4xx - retrying won't help
+            except requests.exceptions.RequestException as e:
+                error = e
+                break
+            if attempt + 1 < attempts:
+                breaker = self.circuit_breaker
+                if breaker is not None and not breaker.allow_retry(url):
+                    break
+                time.sleep(min(0.5 * 2 ** attempt, 4.0))
+        return DetailPage(url, error=error)
 
 
 class ScraperRegistry:
-    """Registry for source type handlers."""
+    """Registry for source type handlers.
     
-    def __init__(self):
-        """Initialize empty registry."""
+    Handlers are either registered directly (register()) or as entry points
+    (register_entry_point()): a 'module:Class' string that is imported on
+    the first get_handler() call for its type. Source classes are then
+    instantiated as cls(config, options, **source_kwargs).
+    """
+    
+    def __init__(self, entry_points: Optional[Dict[str, str]] = None, **source_kwargs):
+        """Initialize registry.
+        
+        Args:
+            entry_points: Source type -> 'module:Class' (e.g. SOURCE_ENTRY_POINTS)
+            **source_kwargs: Keyword arguments for entry point source classes
+                             (e.g. base_path, ai_providers)
+        """
         self._handlers: Dict[str, Callable] = {}
+        self._entry_points: Dict[str, str] = dict(entry_points or {})
+        self._source_kwargs = source_kwargs
+        self._lock = threading.Lock()
     
     def register(self, source_type: str, handler: Callable):
         """Register a handler for a source type.
@@ -152,21 +447,86 @@ class ScraperRegistry:
             source_type: Source type identifier (e.g., 'facebook', 'rss')
             handler: Callable that returns a BaseSource instance
         """
-        self._handlers[source_type] = handler
+        with self._lock:
+            self._handlers[source_type] = handler
+            self._entry_points.pop(source_type, None)
+    
+    def register_entry_point(self, source_type: str, target: str):
+        """Register a source class to be imported on first use.
+        
+        Args:
+            source_type: Source type identifier
+            target: 'module:Class'; a module starting with '.' is relative
+                    to the smart_scraper package
+        """
+        with self._lock:
+            self._entry_points[source_type] = target
+            self._handlers.pop(source_type, None)
     
     def get_handler(self, source_type: str) -> Optional[Callable]:
         """Get handler for a source type.
         
+        Imports the source module if the type is a not yet loaded entry
+        point.
+        
         Args:
             source_type: Source type identifier
             
         Returns:
-            Handler callable or None if not found
+            Handler callable or None if not found (or its module failed to import)
+        """
+        handler = self._handlers.get(source_type)
+        if handler is None and source_type in self._entry_points:
+            handler = self._load_entry_point(source_type)
+        return handler
+    
+    def _load_entry_point(self, source_type: str) -> Optional[Callable]:
+        """Import an entry point's class and register its handler."""
+        with self._lock:
+            if source_type in self._handlers:
+                return self._handlers[source_type]
+            target = self._entry_points.get(source_type)
+            if target is None:
+                return None
+            module_name, _, class_name = target.partition(':')
+            try:
+                module = importlib.import_module(module_name, package=__package__)
+                source_class = getattr(module, class_name)
+            except (ImportError, AttributeError) as e:
+                # Same as a type that was never registered: legacy fallback
+                logger.debug(f"Source type '{source_type}' unavailable ({target}): {e}")
+                del self._entry_points[source_type]
+                return None
+            
+            def handler(cfg, opts, cls=source_class, kwargs=self._source_kwargs):
+                return cls(cfg, opts, **kwargs)
+            
+            self._handlers[source_type] = handler
+            del self._entry_points[source_type]
+            return handler
+    
+    def load_all(self) -> List[str]:
+        """Import every entry point now.
+        
+        Returns:
+            Source types whose module could not be imported
         """
-        return self._handlers.get(source_type)
+        failed = []
+        for source_type in list(self._entry_points):
+            if self._load_entry_point(source_type) is None:
+                failed.append(source_type)
+        return failed
     
     def list_types(self) -> List[str]:
-        """List all registered source types.
+        """List all registered source types (loaded or not).
+        
+        Returns:
+            List of source type identifiers
+        """
+        return list(self._handlers.keys()) + [t for t in self._entry_points if t not in self._handlers]
+    
+    def loaded_types(self) -> List[str]:
+        """List the source types whose handler is loaded.
         
         Returns:
             List of source type identifiers
@@ -182,4 +542,4 @@ class ScraperRegistry:
         Returns:
             True if registered, False otherwise
         """
-        return source_type in self._handlers
+        return source_type in self._handlers or source_type in self._entry_points
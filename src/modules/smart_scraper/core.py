@@ -2,9 +2,10 @@
 
 import logging
 import sys
+import threading
 from datetime import datetime
 from typing import Dict, List, Optional, Any
-from .base import SourceOptions, ScraperRegistry
+from .base import SOURCE_ENTRY_POINTS, SourceOptions, ScraperRegistry
 
 # Configure module logger
 logger = logging.getLogger(__name__)
@@ -22,13 +23,17 @@ class SmartScraper:
         """
         self.config = config
         self.base_path = base_path
-        self.registry = ScraperRegistry()
         self.ai_providers = {}
         self.image_analyzer = None
+        # Sources whose item caches are written by save_item_caches()
+        self._staged_sources = []
+        self._staged_lock = threading.Lock()
         
-        # Initialize components
+        # Initialize components (AI providers connect and source modules
+        # are imported on first use)
         self._init_ai_providers()
         self._init_image_analyzer()
+        self.registry = ScraperRegistry(base_path=base_path, ai_providers=self.ai_providers)
         self._register_sources()
     
     def _init_ai_providers(self):
@@ -37,18 +42,46 @@ class SmartScraper:
         if not ai_config:
             return
         
-        # Try to import and initialize AI providers
+        # Try to import and initialize AI providers (behind the failover router)
         try:
-            from .ai_providers import get_available_providers
-            providers = get_available_providers(ai_config)
+            from .ai_providers import build_provider_router
+            providers = build_provider_router(ai_config, self.base_path)
             self.ai_providers = providers
             if providers:
-                logger.info(f"Initialized {len(providers)} AI provider(s)")
+                logger.info(f"Configured {len(providers)} AI provider(s)")
         except ImportError:
             logger.debug("AI providers not available (optional)")
         except Exception as e:
             logger.warning(f"AI provider initialization warning: {e}")
     
+    def save_ai_stats(self):
+        """Persist the AI router's provider statistics (no-op without router)."""
+        flush = getattr(self.ai_providers, 'flush', None)
+        if flush is not None:
+            flush()
+    
+    def save_item_caches(self):
+        """Write the item caches and HTTP validators of the sources scraped since the last call.
+        
+        Called once the scraped events are stored (pending_events saved), so
+        an item is only remembered as processed, and a page only answered
+        304 next run, if its events were kept.
+        """
+        from ..http_cache import get_http_cache
+        get_http_cache(self.base_path).flush()
+        with self._staged_lock:
+            staged, self._staged_sources = self._staged_sources, []
+        for source_instance in staged:
+            try:
+                source_instance.save_item_cache()
+            except Exception as e:
+                logger.warning(f"Could not save item cache of {source_instance.name}: {e}")
+    
+    def discard_item_caches(self):
+        """Forget staged item caches (the scraped events were not stored)."""
+        with self._staged_lock:
+            self._staged_sources = []
+    
     def _init_image_analyzer(self):
         """Initialize image analyzer if enabled."""
         img_config = self.config.get('image_analysis', {})
@@ -65,152 +98,63 @@ class SmartScraper:
             logger.warning(f"Image analyzer initialization warning: {e}")
     
     def _register_sources(self):
-        """Register all available source types."""
-        # Register traditional web sources
-        self._register_web_sources()
-        
-        # Register social media sources
-        self._register_social_sources()
+        """Register all built-in source types.
         
-        # Register custom source handlers
-        self._register_custom_sources()
-    
-    def _register_web_sources(self):
-        """Register traditional web source handlers."""
-        try:
-            from .sources.web import rss, html, api, atom
-            
-            # Register with factory functions
-            self.registry.register('rss', 
-                lambda cfg, opts, base_path=self.base_path,
-                ai_providers=self.ai_providers: rss.RSSSource(
-                    cfg, opts, base_path=base_path, ai_providers=ai_providers
-                ))
-            self.registry.register('html', 
-                lambda cfg, opts, base_path=self.base_path,
-                ai_providers=self.ai_providers: html.HTMLSource(
-                    cfg, opts, base_path=base_path, ai_providers=ai_providers
-                ))
-            self.registry.register('api', 
-                lambda cfg, opts, base_path=self.base_path,
-                ai_providers=self.ai_providers: api.APISource(
-                    cfg, opts, base_path=base_path, ai_providers=ai_providers
-                ))
-            self.registry.register('atom', 
-                lambda cfg, opts, base_path=self.base_path,
-                ai_providers=self.ai_providers: atom.AtomSource(
-                    cfg, opts, base_path=base_path, ai_providers=ai_providers
-                ))
-        except ImportError as e:
-            logger.warning(f"Some web sources unavailable: {e}")
-    
-    def _register_social_sources(self):
-        """Register social media source handlers."""
-        try:
-            from .sources import social
-            
-            # Try to register each social platform
-            social_platforms = [
-                ('facebook', 'FacebookSource'),
-                ('instagram', 'InstagramSource'),
-                ('tiktok', 'TikTokSource'),
-                ('x', 'XTwitterSource'),
-                ('twitter', 'XTwitterSource'),  # Alias
-                ('telegram', 'TelegramSource'),
-                ('whatsapp', 'WhatsAppSource')
-            ]
-            
-            for platform_type, class_name in social_platforms:
-                try:
-                    source_class = getattr(social, class_name, None)
-                    if source_class:
-                        self.registry.register(
-                            platform_type,
-                            lambda cfg, opts, cls=source_class, base_path=self.base_path,
-                            ai_providers=self.ai_providers: cls(
-                                cfg, opts, base_path=base_path, ai_providers=ai_providers
-                            )
-                        )
-                except AttributeError:
-                    pass  # Platform not yet implemented
-        except ImportError:
-            pass  # Social sources not yet implemented
-    
-    def _register_custom_sources(self):
-        """Register custom source handlers for specific sites."""
-        try:
-            from .sources import frankenpost
-            from .sources.custom import FreiheitshalleSource, VHSSource, HofStadtSource
-            
-            # Register Frankenpost custom handler
-            self.registry.register('frankenpost',
-                lambda cfg, opts, base_path=self.base_path,
-                ai_providers=self.ai_providers: frankenpost.FrankenpostSource(
-                    cfg, opts, base_path=base_path, ai_providers=ai_providers
-                ))
-            
-            # Register Freiheitshalle custom handler
-            self.registry.register('freiheitshalle',
-                lambda cfg, opts, base_path=self.base_path,
-                ai_providers=self.ai_providers: FreiheitshalleSource(
-                    cfg, opts, base_path=base_path, ai_providers=ai_providers
-                ))
-            
-            # Register VHS custom handler
-            self.registry.register('vhs',
-                lambda cfg, opts, base_path=self.base_path,
-                ai_providers=self.ai_providers: VHSSource(
-                    cfg, opts, base_path=base_path, ai_providers=ai_providers
-                ))
-            
-            # Register Hof Stadt custom handler
-            self.registry.register('hofstadt',
-                lambda cfg, opts, base_path=self.base_path,
-                ai_providers=self.ai_providers: HofStadtSource(
-                    cfg, opts, base_path=base_path, ai_providers=ai_providers
-                ))
-                
-        except ImportError as e:
-            logger.debug(f"Custom sources unavailable: {e}")
+        Web, social media and custom handlers are registered as entry points
+        (SOURCE_ENTRY_POINTS): a source's module is imported the first time a
+        source of its type is scraped, so a single-source run imports just
+        that module.
+        """
+        for source_type, target in SOURCE_ENTRY_POINTS.items():
+            self.registry.register_entry_point(source_type, target)
     
-    def scrape_all_sources(self) -> List[Dict[str, Any]]:
+    def scrape_all_sources(self, max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
         """Scrape events from all enabled sources.
         
+        Sources run on a bounded worker pool (scraping.concurrency in
+        config.json); results are merged in configuration order.
+        
+        Args:
+            max_workers: Override for scraping.concurrency.max_workers
+        
         Returns:
-            List of scraped event dictionaries
+            List of scraped event dictionaries (call save_item_caches() once
+            they are stored)
         """
-        all_events = []
-        sources = self.config.get('scraping', {}).get('sources', [])
+        from ..scrape_pool import get_concurrency_settings, run_sources
         
-        for source in sources:
+        all_events = []
+        sources = []
+        for source in self.config.get('scraping', {}).get('sources', []):
             if not source.get('enabled', False):
                 print(f"⊘ Skipping disabled source: {source['name']}")
                 continue
-            
+            sources.append(source)
+        
+        settings = get_concurrency_settings(self.config, max_workers)
+        
+        def _scrape_and_filter(source):
             print(f"🔍 Scraping from: {source['name']}")
-            try:
-                events = self.scrape_source(source)
-                
-                # Apply filtering
-                events = self._filter_events(events, source)
-                
-                all_events.extend(events)
-                print(f"  ✓ Found {len(events)} events")
-            except Exception as e:
-                print(f"  ✗ Error: {str(e)}")
+            return self._filter_events(self.scrape_source(source), source)
+        
+        for result in run_sources(sources, _scrape_and_filter, **settings):
+            if result.error is None:
+                all_events.extend(result.events)
+                print(f"  ✓ {result.name}: found {len(result.events)} events")
+            else:
+                print(f"  ✗ {result.name}: Error: {result.error}")
         
         return all_events
     
-    def scrape_source(self, source: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Scrape events from a single source.
+    def resolve_source_type(self, source: Dict[str, Any]) -> str:
+        """Registry type that handles a source.
         
         Args:
             source: Source configuration dictionary
             
         Returns:
-            List of event dictionaries
+            Custom handler type for sites with one, otherwise the source's type
         """
-        source_type = source.get('type', 'html')
         source_name = str(source.get('name', '')).strip().lower()
         
         # Check for custom source handlers first (by normalized source name)
@@ -223,8 +167,18 @@ class SmartScraper:
             'wochenmarkt hof': 'hofstadt',
         }
         
-        if source_name in custom_mappings:
-            source_type = custom_mappings[source_name]
+        return custom_mappings.get(source_name, source.get('type', 'html'))
+    
+    def scrape_source(self, source: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Scrape events from a single source.
+        
+        Args:
+            source: Source configuration dictionary
+            
+        Returns:
+            List of event dictionaries
+        """
+        source_type = self.resolve_source_type(source)
         
         # Get source-specific options
         options = SourceOptions.from_dict(source.get('options', {}))
@@ -240,6 +194,9 @@ class SmartScraper:
         try:
             source_instance = handler_factory(source, options)
             events = source_instance.scrape()
+            # Written by save_item_caches() after the events were stored
+            with self._staged_lock:
+                self._staged_sources.append(source_instance)
             return events
         except Exception as e:
             print(f"    Error in {source_type} scraper: {e}")
@@ -6,17 +6,29 @@ from images (particularly event flyers). It combines:
 - EXIF metadata extraction (GPS, datetime)
 - Optional AI-powered content analysis
 
-Designed to be reusable across all social media scrapers.
+Designed to be reusable across all social media scrapers. With a
+FlyerCache attached (result_cache), URL and bytes analysis is answered by
+image content hash, so each image is downloaded and OCR'd once. OCR runs
+on the shared worker pool (ocr_service.py); analyze_urls/analyze_batch OCR
+several images in parallel. Each image is decoded once (preprocess.py): the
+OCR worker reads its metadata from the same decoded image, and AI analysis
+gets the bytes that were already in memory. Re-encoded copies of a known
+flyer are recognised by perceptual hash (perceptual_hash.py) and answered
+from the original's result; results carry flyer_hash so events built from
+the same flyer can be linked.
 """
 
-from typing import Dict, Any, Optional, Union, List
+from typing import Dict, Any, Iterable, Optional, Union, List
 from io import BytesIO
+from .flyer_cache import content_hash
 from .metadata import extract_metadata
 from .ocr import (
     extract_text, extract_text_from_url, extract_dates, extract_times,
     extract_urls, extract_prices, extract_event_keywords,
-    extract_event_data_from_image, is_ocr_available
+    extract_event_data_from_image, extract_event_data_from_text, is_ocr_available
 )
+from .ocr_service import get_ocr_service
+from .perceptual_hash import format_hash, perceptual_hash
 
 
 class ImageAnalyzer:
@@ -37,6 +49,13 @@ class ImageAnalyzer:
         
         # Analyze from bytes (e.g., downloaded image)
         result = analyzer.analyze_bytes(image_bytes)
+        
+        # Several images: OCR'd in parallel on the shared worker pool
+        results = analyzer.analyze_urls([url1, url2, url3])
+        
+        # Repeat encounters answered from disk (see flyer_cache.py)
+        analyzer.result_cache = get_flyer_cache(base_path)
+        result = analyzer.analyze_url(url, source_key='instagram:POST_ID:0')
     """
     
     def __init__(self, config: Dict[str, Any], ai_providers: Dict[str, Any] = None):
@@ -51,6 +70,10 @@ class ImageAnalyzer:
         self.ocr_enabled = config.get('ocr_enabled', True)
         self.ocr_provider = config.get('ocr_provider', 'tesseract')
         self.languages = config.get('languages', ['eng', 'deu'])
+        # Optional FlyerCache shared with other analyzers
+        self.result_cache = None
+        # Warm OCR workers shared by all analyzers with these languages
+        self.ocr_service = get_ocr_service(self.languages)
     
     @staticmethod
     def is_available() -> bool:
@@ -70,76 +93,213 @@ class ImageAnalyzer:
         Returns:
             Extracted event data or None
         """
-        result = {}
-        
-        # Extract metadata (GPS, datetime, etc.)
-        self._extract_image_metadata(image_path, result)
-        
-        # Extract text with OCR
-        if self.ocr_enabled:
-            self._extract_text_data(image_path, result)
+        return self.analyze_files([image_path])[0]
+    
+    def analyze_files(self, image_paths: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """Analyze several image files, OCR'd in parallel.
         
-        return result if result else None
+        Args:
+            image_paths: Paths to image files
+            
+        Returns:
+            Extracted event data (or None) per file, in input order
+        """
+        if not (self.ocr_enabled and is_ocr_available()):
+            results = []
+            for image_path in image_paths:
+                result = {}
+                # Extract metadata (GPS, datetime, etc.)
+                self._extract_image_metadata(extract_metadata(str(image_path)), result)
+                results.append(result if result else None)
+            return results
+        
+        # Read each file once; the worker decodes it for metadata and OCR,
+        # AI analysis reuses the bytes
+        images = []
+        for image_path in image_paths:
+            try:
+                with open(image_path, 'rb') as f:
+                    images.append(f.read())
+            except OSError as e:
+                print(f"  Image read error: {e}")
+                images.append(None)
+        readable = [index for index, data in enumerate(images) if data is not None]
+        analyzed = self._analyze_images([images[index] for index in readable], None,
+                                        self._build_file_result, self._cache_variant() + ':file')
+        results: List[Optional[Dict[str, Any]]] = [None] * len(image_paths)
+        for index, result in zip(readable, analyzed):
+            results[index] = result
+        return results
     
-    def analyze_url(self, image_url: str, timeout: int = 10) -> Optional[Dict[str, Any]]:
+    def analyze_url(self, image_url: str, timeout: int = 10, source_key: Optional[str] = None,
+                    session=None) -> Optional[Dict[str, Any]]:
         """Analyze image from URL to extract event information.
         
         This is useful for social media scrapers that get image URLs from posts.
+        The image is downloaded once and shared by OCR and AI analysis; with a
+        result_cache, a known source_key or URL needs no download at all.
         
         Args:
             image_url: URL of the image to analyze
             timeout: Request timeout in seconds
+            source_key: Stable key of the image (e.g. 'facebook:POST_ID:0'),
+                        for CDN URLs that change between runs
+            session: requests.Session to download with (default: requests)
             
         Returns:
             Extracted event data or None
         """
-        if not self.ocr_enabled:
-            return None
-        
-        result = {}
-        
-        # Extract text directly from URL
-        ocr_data = extract_event_data_from_image_url(image_url, self.languages, timeout)
-        if ocr_data:
-            result.update(self._format_ocr_result(ocr_data))
+        return self.analyze_urls([image_url], [source_key], timeout, session)[0]
+    
+    def analyze_urls(self, image_urls: List[str], source_keys: Optional[List[Optional[str]]] = None,
+                     timeout: int = 10, session=None) -> List[Optional[Dict[str, Any]]]:
+        """Analyze several image URLs (e.g. all images of a post).
         
-        # Use AI if available and confidence is low
-        if self.ai_providers and ocr_data.get('confidence', 0) < 0.5:
-            ai_result = self._ai_extract_from_url(image_url)
-            if ai_result:
-                result.update(ai_result)
+        Same as analyze_url for each URL, but the downloaded images are OCR'd
+        in parallel on the shared worker pool.
         
-        return result if result else None
+        Args:
+            image_urls: URLs of the images
+            source_keys: Stable key per image (see analyze_url), or None
+            timeout: Request timeout in seconds
+            session: requests.Session to download with (default: requests)
+            
+        Returns:
+            Extracted event data (or None) per URL, in input order
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(image_urls)
+        if not self.ocr_enabled:
+            return results
+        
+        downloaded = []  # (index, image bytes, source keys)
+        for index, image_url in enumerate(image_urls):
+            keys = [source_keys[index] if source_keys else None, image_url]
+            if self.result_cache:
+                image_hash = self.result_cache.lookup_source(keys)
+                if image_hash:
+                    found, result = self.result_cache.get_result(
+                        image_hash, self._cache_variant(), keys, downloaded=False)
+                    if found:
+                        results[index] = result
+                        continue
+            image_data = _download_image(image_url, timeout, session)
+            if image_data is not None:
+                downloaded.append((index, image_data, keys))
+        
+        analyzed = self.analyze_batch([data for _, data, _ in downloaded],
+                                      [keys for _, _, keys in downloaded])
+        for (index, _, _), result in zip(downloaded, analyzed):
+            results[index] = result
+        return results
     
-    def analyze_bytes(self, image_data: bytes) -> Optional[Dict[str, Any]]:
+    def analyze_bytes(self, image_data: bytes,
+                      source_keys: Iterable[Optional[str]] = ()) -> Optional[Dict[str, Any]]:
         """Analyze image from bytes to extract event information.
         
         This is useful when you already have the image data in memory.
         
         Args:
             image_data: Image data as bytes
+            source_keys: Post/URL keys to link to the image in the result cache
             
         Returns:
             Extracted event data or None
         """
-        if not self.ocr_enabled:
-            return None
+        return self.analyze_batch([image_data], [source_keys])[0]
+    
+    def analyze_batch(self, images: List[bytes],
+                      source_keys: Optional[List[Iterable[Optional[str]]]] = None) -> List[Optional[Dict[str, Any]]]:
+        """Analyze several images in memory, OCR'd in parallel.
         
+        Cached images (by content hash, or re-encoded copies of a known
+        flyer by perceptual hash) are answered from the result cache; the
+        others are submitted to the OCR worker pool together.
+        
+        Args:
+            images: Image data as bytes
+            source_keys: Post/URL keys per image for the result cache, or None
+            
+        Returns:
+            Extracted event data (or None) per image, in input order
+        """
+        if not self.ocr_enabled:
+            return [None] * len(images)
+        return self._analyze_images(images, source_keys, self._build_result, self._cache_variant())
+    
+    def _analyze_images(self, images: List[bytes], source_keys: Optional[List[Iterable[Optional[str]]]],
+                        build, variant: str) -> List[Optional[Dict[str, Any]]]:
+        """Cache lookups, one OCR batch for the rest, build(image_data, analysis) per image."""
+        results: List[Optional[Dict[str, Any]]] = [None] * len(images)
+        hashes: List[Optional[str]] = [None] * len(images)
+        dhashes: List[Optional[int]] = [None] * len(images)
+        todo = []
+        for index, image_data in enumerate(images):
+            keys = list(source_keys[index]) if source_keys else []
+            if self.result_cache:
+                hashes[index] = content_hash(image_data)
+                found, result = self.result_cache.get_result(hashes[index], variant, keys)
+                if found:
+                    results[index] = result
+                    continue
+                if self.result_cache.perceptual_max_distance is not None:
+                    dhashes[index] = perceptual_hash(image_data)
+                    if dhashes[index] is not None:
+                        # Re-encoded copy of a known flyer: no OCR, no AI
+                        found, result = self.result_cache.get_similar_result(
+                            dhashes[index], variant, hashes[index], keys)
+                        if found:
+                            results[index] = result
+                            continue
+            todo.append(index)
+        
+        ocr_available = is_ocr_available()
+        futures = self.ocr_service.submit_batch([images[index] for index in todo]) if ocr_available else []
+        for position, index in enumerate(todo):
+            analysis = (futures[position].result() if ocr_available else None) or {}
+            result = build(images[index], analysis)
+            if result and dhashes[index] is not None:
+                result['flyer_hash'] = format_hash(dhashes[index])
+            # Without Tesseract an empty result says nothing about the image
+            if hashes[index] and ocr_available:
+                keys = [key for key in (source_keys[index] if source_keys else ()) if key]
+                self.result_cache.put(hashes[index], variant, result, images[index], keys)
+                if dhashes[index] is not None:
+                    self.result_cache.add_perceptual(hashes[index], dhashes[index], keys[0] if keys else None)
+            results[index] = result
+        return results
+    
+    def _build_file_result(self, image_data: bytes, analysis: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Metadata and OCR data of an image file, AI (text first) when OCR confidence is low."""
         result = {}
         
-        # Extract comprehensive event data
-        ocr_data = extract_event_data_from_image(image_data, self.languages)
+        # Metadata (GPS, datetime, etc.) from the decoded image
+        self._extract_image_metadata(analysis.get('metadata'), result)
+        
+        # Extract text with OCR
+        ocr_data = extract_event_data_from_text(analysis.get('text'))
+        self._extract_text_data(image_data, ocr_data, result)
+        
+        return result if result else None
+    
+    def _build_result(self, image_data: bytes, analysis: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Format OCR data and add AI analysis when OCR confidence is low."""
+        ocr_data = extract_event_data_from_text(analysis.get('text'))
+        result = {}
         if ocr_data:
             result.update(self._format_ocr_result(ocr_data))
         
         # Use AI if available and confidence is low
-        if self.ai_providers and ocr_data.get('confidence', 0) < 0.5:
+        if self.ai_providers and (ocr_data or {}).get('confidence', 0) < 0.5:
             ai_result = self._ai_extract_from_bytes(image_data)
             if ai_result:
                 result.update(ai_result)
         
         return result if result else None
     
+    def _cache_variant(self) -> str:
+        """Analyzer settings a cached result depends on."""
+        return '+'.join(self.languages) + (':ai' if self.ai_providers else '')
+    
     def extract_event_from_flyer(self, image_source: Union[str, bytes],
                                   source_name: str = None) -> Optional[Dict[str, Any]]:
         """Extract event data from a flyer image optimized for event creation.
@@ -258,14 +418,13 @@ class ImageAnalyzer:
         
         return event if event else None
     
-    def _extract_image_metadata(self, image_path: str, result: Dict[str, Any]) -> None:
-        """Extract and process image metadata.
+    def _extract_image_metadata(self, metadata: Optional[Dict[str, Any]], result: Dict[str, Any]) -> None:
+        """Add image metadata to result.
         
         Args:
-            image_path: Path to image file
+            metadata: Metadata from extract_metadata or the OCR worker
             result: Dictionary to update with extracted data
         """
-        metadata = extract_metadata(image_path)
         if not metadata:
             return
         
@@ -283,15 +442,14 @@ class ImageAnalyzer:
         if 'datetime' in metadata:
             result['start_time'] = metadata['datetime']
     
-    def _extract_text_data(self, image_path: str, result: Dict[str, Any]) -> None:
-        """Extract text data from image using OCR.
+    def _extract_text_data(self, image_data: bytes, ocr_data: Dict[str, Any], result: Dict[str, Any]) -> None:
+        """Add OCR text data of an image file to result.
         
         Args:
-            image_path: Path to image file
+            image_data: Image file contents
+            ocr_data: extract_event_data_from_text() of its OCR text
             result: Dictionary to update with extracted data
         """
-        # Use comprehensive extraction
-        ocr_data = extract_event_data_from_image(image_path, self.languages)
         if not ocr_data or not ocr_data.get('text'):
             return
         
@@ -299,16 +457,16 @@ class ImageAnalyzer:
         
         # Use AI to extract structured event info if confidence is low
         if self.ai_providers and ocr_data.get('confidence', 0) < 0.5:
-            ai_result = self._ai_extract(ocr_data.get('text', ''), image_path)
+            ai_result = self._ai_extract(ocr_data.get('text', ''), image_data)
             if ai_result:
                 result.update(ai_result)
     
-    def _ai_extract(self, text: str, image_path: str) -> Optional[Dict[str, Any]]:
+    def _ai_extract(self, text: str, image_data: bytes) -> Optional[Dict[str, Any]]:
         """Use AI to extract structured event information.
         
         Args:
             text: OCR extracted text
-            image_path: Path to image
+            image_data: Image data as bytes
             
         Returns:
             Extracted event data or None
@@ -337,36 +495,12 @@ class ImageAnalyzer:
         
         # Try image analysis if provider supports it
         try:
-            with open(image_path, 'rb') as f:
-                image_data = f.read()
             result = provider.analyze_image(image_data)
             return result
         except Exception as e:
             print(f"  AI image analysis error: {e}")
             return None
     
-    def _ai_extract_from_url(self, image_url: str) -> Optional[Dict[str, Any]]:
-        """Use AI to extract event info from image URL.
-        
-        Args:
-            image_url: URL of the image
-            
-        Returns:
-            Extracted event data or None
-        """
-        provider = self._get_ai_provider()
-        if not provider:
-            return None
-        
-        try:
-            import requests
-            response = requests.get(image_url, timeout=10)
-            response.raise_for_status()
-            return provider.analyze_image(response.content)
-        except Exception as e:
-            print(f"  AI URL analysis error: {e}")
-            return None
-    
     def _ai_extract_from_bytes(self, image_data: bytes) -> Optional[Dict[str, Any]]:
         """Use AI to extract event info from image bytes.
         
@@ -402,6 +536,19 @@ class ImageAnalyzer:
         return next(iter(self.ai_providers.values()), None)
 
 
+def _download_image(image_url: str, timeout: int = 10, session=None) -> Optional[bytes]:
+    """Download an image; None on errors."""
+    try:
+        if session is None:
+            import requests as session
+        response = session.get(image_url, timeout=timeout)
+        response.raise_for_status()
+        return response.content
+    except Exception as e:
+        print(f"  Image download error: {e}")
+        return None
+
+
 def extract_event_data_from_image_url(image_url: str, languages: List = None,
                                        timeout: int = 10) -> Optional[Dict[str, Any]]:
     """Extract event data from an image URL.
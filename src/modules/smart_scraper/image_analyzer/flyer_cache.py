@@ -0,0 +1,420 @@
+"""Content-addressed cache of flyer images and their OCR results.
+
+Social media sources see the same flyers on every run (and often under new
+CDN URLs). Each image is downloaded once, hashed (SHA-256 of its bytes) and
+its analysis result is stored under that hash, so Tesseract never runs twice
+on the same image:
+- results: analysis result per (image hash, analyzer variant), None results
+  included (photos without text are not re-OCR'd either)
+- sources: post/URL keys -> image hash, so a repeat encounter of a post is
+  answered without downloading the image at all
+- images: the image bytes under data/image_cache/blobs/, capped at
+  max_size_mb with least-recently-used eviction (each file is stored once,
+  whichever platform it came from)
+- perceptual: dHash of every analysed image (perceptual_hash.py); a
+  re-encoded copy of a known flyer (different bytes, hash within
+  perceptual_max_distance bits) gets the original's result without OCR or
+  AI, marked with duplicate_flyer. Lookups go through an in-memory BK-tree
+
+All bookkeeping lives in one SQLite database (data/image_cache/flyers.sqlite3)
+shared by all sources of a repository root and safe to use from parallel
+sources.
+
+Usage:
+    from modules.smart_scraper.image_analyzer.flyer_cache import get_flyer_cache
+
+    analyzer.result_cache = get_flyer_cache(base_path, config['scraping'].get('image_cache'))
+    analyzer.analyze_url(url, source_key='facebook:123:0')  # Instant on repeat
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from .perceptual_hash import DEFAULT_MAX_DISTANCE, BKTree
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_SIZE_MB = 200
+DEFAULT_TTL_DAYS = 90
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    hash      TEXT NOT NULL,
+    variant   TEXT NOT NULL,
+    value     TEXT NOT NULL,
+    created   REAL NOT NULL,
+    PRIMARY KEY (hash, variant)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS sources (
+    key       TEXT PRIMARY KEY,
+    hash      TEXT NOT NULL,
+    last_used REAL NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS images (
+    hash      TEXT PRIMARY KEY,
+    size      INTEGER NOT NULL,
+    last_used REAL NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS perceptual (
+    hash       TEXT PRIMARY KEY,
+    dhash      INTEGER NOT NULL,
+    source_key TEXT,
+    created    REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_images_last_used ON images (last_used);
+CREATE INDEX IF NOT EXISTS idx_sources_last_used ON sources (last_used);
+"""
+
+
+def get_image_cache_dir(base_path: Path) -> Path:
+    """Return the image cache directory for a repository root."""
+    return Path(base_path) / "data" / "image_cache"
+
+
+def content_hash(data: bytes) -> str:
+    """Content address of an image."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def _to_signed(value: int) -> int:
+    """64-bit hash as SQLite INTEGER (signed)."""
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+def _to_unsigned(value: int) -> int:
+    return value + (1 << 64) if value < 0 else value
+
+
+class FlyerCache:
+    """Disk cache of flyer images and analysis results keyed by content hash."""
+
+    def __init__(self, cache_dir: Path, max_size_mb: float = DEFAULT_MAX_SIZE_MB,
+                 ttl_days: Optional[float] = DEFAULT_TTL_DAYS, enabled: bool = True,
+                 perceptual_max_distance: Optional[int] = DEFAULT_MAX_DISTANCE):
+        """
+        Args:
+            cache_dir: Directory for the database and image files
+            max_size_mb: Size cap of the stored images (LRU eviction)
+            ttl_days: Results and source keys older than this expire (None = never)
+            enabled: False turns every lookup into a miss and stores nothing
+            perceptual_max_distance: dHash bits a copy of a flyer may differ
+                                     in (None = no near-duplicate lookup)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.db_path = self.cache_dir / "flyers.sqlite3"
+        self.blob_dir = self.cache_dir / "blobs"
+        self.max_size_mb = max_size_mb
+        self.ttl_days = ttl_days
+        self.enabled = enabled
+        self.perceptual_max_distance = perceptual_max_distance
+        self._conn: Optional[sqlite3.Connection] = None
+        self._tree: Optional[BKTree] = None  # Loaded on the first similarity lookup
+        self._lock = threading.Lock()
+        self.stats = self._empty_stats()
+
+    @staticmethod
+    def _empty_stats() -> Dict[str, int]:
+        return {"hits": 0, "misses": 0, "similar_hits": 0, "downloads_saved": 0, "stores": 0, "evicted": 0}
+
+    def configure(self, settings: Dict[str, Any]) -> None:
+        """Apply a scraping.image_cache config section."""
+        self.enabled = settings.get("enabled", True)
+        self.max_size_mb = settings.get("max_size_mb", DEFAULT_MAX_SIZE_MB)
+        self.ttl_days = settings.get("ttl_days", DEFAULT_TTL_DAYS)
+        self.perceptual_max_distance = settings.get("perceptual_max_distance", DEFAULT_MAX_DISTANCE)
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def _cutoff(self) -> float:
+        return time.time() - self.ttl_days * 86400 if self.ttl_days else 0.0
+
+    def blob_path(self, image_hash: str) -> Path:
+        """Path of a stored image (which may have been evicted)."""
+        return self.blob_dir / image_hash[:2] / image_hash
+
+    def lookup_source(self, keys: Iterable[Optional[str]]) -> Optional[str]:
+        """Image hash stored for the first known post/URL key, if any."""
+        if not self.enabled:
+            return None
+        keys = [key for key in keys if key]
+        if not keys:
+            return None
+        with self._lock:
+            try:
+                conn = self._connect()
+                for key in keys:
+                    row = conn.execute(
+                        "SELECT hash FROM sources WHERE key = ? AND last_used >= ?",
+                        (key, self._cutoff())
+                    ).fetchone()
+                    if row:
+                        return row[0]
+            except sqlite3.Error as e:
+                logger.warning(f"Image cache lookup failed: {e}")
+        return None
+
+    def get_result(self, image_hash: str, variant: str,
+                   source_keys: Iterable[Optional[str]] = (), downloaded: bool = True) -> Tuple[bool, Any]:
+        """
+        Look up the analysis result of an image.
+
+        Args:
+            image_hash: Content hash of the image
+            variant: Analyzer settings the result depends on (languages, AI)
+            source_keys: Post/URL keys to (re)link to the image on a hit
+            downloaded: False if the hit saved downloading the image
+
+        Returns:
+            Tuple of (found, result); result may be None (nothing extracted)
+        """
+        if not self.enabled:
+            return False, None
+        with self._lock:
+            try:
+                conn = self._connect()
+                row = conn.execute(
+                    "SELECT value FROM results WHERE hash = ? AND variant = ? AND created >= ?",
+                    (image_hash, variant, self._cutoff())
+                ).fetchone()
+                if row is None:
+                    self.stats["misses"] += 1
+                    return False, None
+                now = time.time()
+                with conn:
+                    self._link(conn, source_keys, image_hash, now)
+                    conn.execute("UPDATE images SET last_used = ? WHERE hash = ?", (now, image_hash))
+            except sqlite3.Error as e:
+                logger.warning(f"Image cache lookup failed: {e}")
+                self.stats["misses"] += 1
+                return False, None
+            self.stats["hits"] += 1
+            if not downloaded:
+                self.stats["downloads_saved"] += 1
+            return True, json.loads(row[0])
+
+    def put(self, image_hash: str, variant: str, result: Any, image_data: Optional[bytes] = None,
+            source_keys: Iterable[Optional[str]] = ()) -> None:
+        """Store a result (and the image), then apply TTL and the size cap."""
+        if not self.enabled:
+            return
+        try:
+            value = json.dumps(result, ensure_ascii=False)
+        except (TypeError, ValueError):
+            logger.debug("Not caching non-JSON image analysis result")
+            return
+        now = time.time()
+        with self._lock:
+            try:
+                conn = self._connect()
+                if image_data is not None:
+                    self._write_blob(image_hash, image_data)
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO results (hash, variant, value, created) VALUES (?, ?, ?, ?)",
+                        (image_hash, variant, value, now)
+                    )
+                    if image_data is not None:
+                        conn.execute(
+                            "INSERT OR REPLACE INTO images (hash, size, last_used) VALUES (?, ?, ?)",
+                            (image_hash, len(image_data), now)
+                        )
+                    self._link(conn, source_keys, image_hash, now)
+                    self._evict(conn)
+            except (sqlite3.Error, OSError) as e:
+                logger.warning(f"Image cache store failed: {e}")
+                return
+            self.stats["stores"] += 1
+
+    def add_perceptual(self, image_hash: str, dhash: int, source_key: Optional[str] = None) -> None:
+        """Register the perceptual hash of an analysed image."""
+        if not self.enabled or self.perceptual_max_distance is None:
+            return
+        with self._lock:
+            try:
+                conn = self._connect()
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO perceptual (hash, dhash, source_key, created) VALUES (?, ?, ?, ?)",
+                        (image_hash, _to_signed(dhash), source_key, time.time())
+                    )
+            except sqlite3.Error as e:
+                logger.warning(f"Image cache store failed: {e}")
+                return
+            if self._tree is not None:
+                self._tree.add(dhash, (image_hash, source_key))
+
+    def get_similar_result(self, dhash: int, variant: str, image_hash: Optional[str] = None,
+                           source_keys: Iterable[Optional[str]] = ()) -> Tuple[bool, Any]:
+        """
+        Look up the result of a near-identical image (re-encoded copy).
+
+        On a hit the result is also stored under image_hash, so the copy is
+        an exact hit next time.
+
+        Args:
+            dhash: Perceptual hash of the new image
+            variant: Analyzer settings the result depends on
+            image_hash: Content hash of the new image
+            source_keys: Post/URL keys of the new image
+
+        Returns:
+            Tuple of (found, result); a found result carries duplicate_flyer
+            (content hash, source key and distance of the original)
+        """
+        if not self.enabled or self.perceptual_max_distance is None:
+            return False, None
+        source_keys = list(source_keys)
+        with self._lock:
+            try:
+                conn = self._connect()
+                if self._tree is None:
+                    self._tree = BKTree(
+                        (_to_unsigned(row[1]), (row[0], row[2]))
+                        for row in conn.execute("SELECT hash, dhash, source_key FROM perceptual")
+                    )
+                for distance, (original_hash, original_key) in self._tree.search(dhash, self.perceptual_max_distance):
+                    if original_hash == image_hash:
+                        continue
+                    row = conn.execute(
+                        "SELECT value FROM results WHERE hash = ? AND variant = ? AND created >= ?",
+                        (original_hash, variant, self._cutoff())
+                    ).fetchone()
+                    if row is None:
+                        continue
+                    if image_hash:
+                        with conn:
+                            conn.execute(
+                                "INSERT OR REPLACE INTO results (hash, variant, value, created) VALUES (?, ?, ?, ?)",
+                                (image_hash, variant, row[0], time.time())
+                            )
+                            self._link(conn, source_keys, image_hash, time.time())
+                    break
+                else:
+                    return False, None
+            except sqlite3.Error as e:
+                logger.warning(f"Image cache lookup failed: {e}")
+                return False, None
+            self.stats["similar_hits"] += 1
+        result = json.loads(row[0])
+        if isinstance(result, dict):
+            result["duplicate_flyer"] = {"image_hash": original_hash, "source_key": original_key,
+                                         "distance": distance}
+        return True, result
+
+    @staticmethod
+    def _link(conn: sqlite3.Connection, source_keys: Iterable[Optional[str]],
+              image_hash: str, now: float) -> None:
+        conn.executemany(
+            "INSERT OR REPLACE INTO sources (key, hash, last_used) VALUES (?, ?, ?)",
+            [(key, image_hash, now) for key in source_keys if key]
+        )
+
+    def _write_blob(self, image_hash: str, image_data: bytes) -> None:
+        path = self.blob_path(image_hash)
+        if path.exists():
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(image_data)
+        tmp_path.replace(path)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Drop expired results/keys and the least recently used images above the size cap."""
+        cutoff = self._cutoff()
+        evicted = conn.execute("DELETE FROM results WHERE created < ?", (cutoff,)).rowcount
+        conn.execute("DELETE FROM sources WHERE last_used < ?", (cutoff,))
+        if conn.execute("DELETE FROM perceptual WHERE created < ?", (cutoff,)).rowcount:
+            self._tree = None  # Rebuilt on the next lookup
+        max_bytes = self.max_size_mb * 1024 * 1024
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM images").fetchone()[0]
+        if total > max_bytes:
+            doomed = []
+            for image_hash, size in conn.execute("SELECT hash, size FROM images ORDER BY last_used"):
+                if total <= max_bytes:
+                    break
+                doomed.append(image_hash)
+                total -= size
+            conn.executemany("DELETE FROM images WHERE hash = ?", [(h,) for h in doomed])
+            for image_hash in doomed:
+                self.blob_path(image_hash).unlink(missing_ok=True)
+            evicted += len(doomed)
+        self.stats["evicted"] += max(evicted, 0)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Lookup statistics of this process plus the current cache size."""
+        with self._lock:
+            stats = dict(self.stats)
+            stats["results"], stats["images"], stats["image_bytes"], stats["perceptual"] = 0, 0, 0, 0
+            if self.db_path.exists():
+                try:
+                    conn = self._connect()
+                    stats["results"] = conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+                    stats["images"], stats["image_bytes"] = conn.execute(
+                        "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM images").fetchone()
+                    stats["perceptual"] = conn.execute("SELECT COUNT(*) FROM perceptual").fetchone()[0]
+                except sqlite3.Error:
+                    pass
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups * 100, 1) if lookups else 0.0
+        return stats
+
+    def reset_stats(self) -> None:
+        """Start counting a new run."""
+        with self._lock:
+            self.stats = self._empty_stats()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            self._tree = None
+
+
+# Process-wide caches by base path
+_caches: Dict[str, FlyerCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_flyer_cache(base_path: Path, settings: Optional[Dict[str, Any]] = None) -> FlyerCache:
+    """
+    Shared FlyerCache for a repository root.
+
+    Args:
+        base_path: Repository root
+        settings: Optional scraping.image_cache config section to apply
+
+    Returns:
+        The process-wide FlyerCache for base_path
+    """
+    key = os.path.abspath(base_path)
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = _caches[key] = FlyerCache(get_image_cache_dir(base_path))
+    if settings is not None:
+        cache.configure(settings)
+    return cache
+
+
+def close_flyer_caches() -> None:
+    """Close all shared caches (tests, end of process)."""
+    with _caches_lock:
+        for cache in _caches.values():
+            cache.close()
+        _caches.clear()
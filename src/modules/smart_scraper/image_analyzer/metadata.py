@@ -114,6 +114,44 @@ def _extract_pil_data(image_path: str, metadata: Dict[str, Any]) -> None:
         print(f"  PIL metadata error: {e}")
 
 
+def extract_metadata_from_image(img) -> Dict[str, Any]:
+    """Extract the same metadata as extract_metadata from an opened PIL image.
+    
+    Only the image header is read, so this can run before decoding (see
+    preprocess.decode_image).
+    
+    Args:
+        img: PIL image (opened, not necessarily loaded)
+        
+    Returns:
+        Dictionary with metadata
+    """
+    metadata = {'width': img.width, 'height': img.height, 'format': img.format}
+    try:
+        exif = img.getexif()
+        gps = exif.get_ifd(0x8825)  # GPSInfo
+        if 2 in gps and 4 in gps:
+            lat = _rationals_to_degrees(gps[2])
+            lon = _rationals_to_degrees(gps[4])
+            if gps.get(1) == 'S':
+                lat = -lat
+            if gps.get(3) == 'W':
+                lon = -lon
+            metadata['gps'] = {'lat': lat, 'lon': lon}
+        date_str = exif.get_ifd(0x8769).get(0x9003)  # ExifIFD DateTimeOriginal
+        if date_str:
+            metadata['datetime'] = datetime.strptime(str(date_str).strip('\x00 '), '%Y:%m:%d %H:%M:%S').isoformat()
+    except Exception as e:
+        print(f"  EXIF extraction error: {e}")
+    return metadata
+
+
+def _rationals_to_degrees(values) -> float:
+    """Convert PIL GPS (degrees, minutes, seconds) rationals to degrees."""
+    d, m, s = (float(value) for value in values)
+    return d + (m / 60.0) + (s / 3600.0)
+
+
 def _convert_to_degrees(value) -> float:
     """Convert GPS coordinates to degrees."""
     d = float(value.values[0].num) / float(value.values[0].den)
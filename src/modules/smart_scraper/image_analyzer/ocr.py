@@ -4,28 +4,24 @@ This module provides OCR capabilities for extracting event information from imag
 particularly event flyers. It's designed to be reusable across all social media scrapers.
 
 Features:
-- Text extraction via Tesseract OCR
+- Text extraction via Tesseract OCR, on the shared warm worker pool
+  (ocr_service.py)
 - Date/time pattern recognition (German and English)
 - Event-specific keyword extraction
 - URL extraction from flyers
 """
 
 from typing import Dict, Any, Optional, List, Union
+from importlib.util import find_spec
 from io import BytesIO
 import re
-from datetime import datetime
 
-try:
-    import pytesseract
-    TESSERACT_AVAILABLE = True
-except ImportError:
-    TESSERACT_AVAILABLE = False
+# pytesseract and PIL are imported by the OCR workers (ocr_service.py);
+# here it is only checked that they are installed
+TESSERACT_AVAILABLE = find_spec('pytesseract') is not None
+PIL_AVAILABLE = find_spec('PIL') is not None
 
-try:
-    from PIL import Image
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
+from .ocr_service import get_ocr_service
 
 
 def is_ocr_available() -> bool:
@@ -41,6 +37,9 @@ def extract_text(image_source: Union[str, bytes, BytesIO],
                  languages: List[str] = None) -> Optional[str]:
     """Extract text from image using OCR.
     
+    Runs on the shared OCR worker pool (language models stay loaded); use
+    get_ocr_service(languages).submit_batch() to OCR several images at once.
+    
     Args:
         image_source: Path to image file, bytes data, or BytesIO object
         languages: List of language codes (e.g., ['eng', 'deu'])
@@ -51,24 +50,8 @@ def extract_text(image_source: Union[str, bytes, BytesIO],
     if not TESSERACT_AVAILABLE or not PIL_AVAILABLE:
         return None
     
-    try:
-        # Handle different input types
-        if isinstance(image_source, bytes):
-            img = Image.open(BytesIO(image_source))
-        elif isinstance(image_source, BytesIO):
-            img = Image.open(image_source)
-        else:
-            img = Image.open(image_source)
-        
-        # Configure languages (default: English + German for this project)
-        lang = '+'.join(languages) if languages else 'eng+deu'
-        
-        # Extract text
-        text = pytesseract.image_to_string(img, lang=lang)
-        return text.strip()
-    except Exception as e:
-        print(f"  OCR error: {e}")
-        return None
+    # Default languages: English + German for this project
+    return get_ocr_service(languages or ['eng', 'deu']).extract_text(image_source)
 
 
 def extract_text_from_url(image_url: str, languages: List[str] = None,
@@ -295,6 +278,23 @@ def extract_event_data_from_image(image_source: Union[str, bytes, BytesIO],
         - keywords: Event-related keywords
         - confidence: Estimated confidence score
     """
+    # Extract text
+    text = extract_text(image_source, languages or ['eng', 'deu'])
+    return extract_event_data_from_text(text)
+
+
+def extract_event_data_from_text(text: Optional[str]) -> Dict[str, Any]:
+    """Extract event data from OCR text.
+    
+    Second half of extract_event_data_from_image, for text that was OCR'd
+    in a batch (OCRService.submit_batch).
+    
+    Args:
+        text: OCR text (None or empty: nothing found)
+        
+    Returns:
+        Same dictionary as extract_event_data_from_image
+    """
     result = {
         'text': None,
         'dates': [],
@@ -305,8 +305,6 @@ def extract_event_data_from_image(image_source: Union[str, bytes, BytesIO],
         'confidence': 0.0
     }
     
-    # Extract text
-    text = extract_text(image_source, languages or ['eng', 'deu'])
     if not text:
         return result
     
@@ -0,0 +1,237 @@
+"""Shared pool of warm OCR worker processes.
+
+pytesseract.image_to_string starts a new tesseract process, which loads the
+eng+deu traineddata again, for every image, and the scrapers used to OCR
+one image at a time. OCRService keeps N long-lived worker processes and
+accepts single images or batches, returning futures:
+- Each worker loads the language models once: with tesserocr installed it
+  keeps one PyTessBaseAPI (the tesseract C++ API) for its whole life;
+  otherwise it falls back to pytesseract per image (still N in parallel)
+- Images are passed as bytes or file paths; each is decoded once in the
+  worker (preprocess.py), which reads its metadata from the same image,
+  preprocesses it for OCR and returns {'text', 'metadata'}
+- The service is shared process-wide per language set
+  (get_ocr_service), so ImageAnalyzer, the Facebook and Instagram sources
+  and the Telegram flyer path all use the same warm workers
+- If worker processes cannot be started (restricted sandboxes) or the pool
+  breaks, OCR runs on threads in this process instead
+
+Usage:
+    from modules.smart_scraper.image_analyzer.ocr_service import get_ocr_service
+
+    service = get_ocr_service(['eng', 'deu'])
+    futures = service.submit_batch([image_bytes, '/path/to/flyer.jpg'])
+    texts = [(future.result() or {}).get('text') for future in futures]
+"""
+
+import atexit
+import logging
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from .preprocess import load_for_ocr, preprocessing_settings
+
+logger = logging.getLogger(__name__)
+
+# Default worker count: one per core, at most this many
+MAX_DEFAULT_WORKERS = 4
+
+ImageSource = Union[str, bytes, BytesIO]
+
+# Worker process state (set by _init_worker)
+_worker_lang = 'eng+deu'
+_worker_api = None
+
+
+def _init_worker(lang: str) -> None:
+    """Load the language models once per worker process."""
+    global _worker_lang, _worker_api
+    _worker_lang = lang
+    try:
+        import tesserocr
+        _worker_api = tesserocr.PyTessBaseAPI(lang=lang)
+    except Exception:
+        _worker_api = None  # pytesseract per image
+
+
+def _ocr_image(image_source: Union[str, bytes], lang: str,
+               preprocessing: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Decode, preprocess and OCR one image in a worker (process or thread)."""
+    img, metadata = load_for_ocr(image_source, preprocessing)
+    # The tesseract API object is only used by the worker process itself
+    if _worker_api is not None and _worker_lang == lang \
+            and threading.current_thread() is threading.main_thread():
+        _worker_api.SetImage(img)
+        text = _worker_api.GetUTF8Text().strip()
+    else:
+        import pytesseract
+        text = pytesseract.image_to_string(img, lang=lang).strip()
+    return {'text': text, 'metadata': metadata}
+
+
+def default_workers() -> int:
+    return max(1, min(os.cpu_count() or 1, MAX_DEFAULT_WORKERS))
+
+
+class OCRService:
+    """Pool of OCR workers with the language models loaded."""
+
+    def __init__(self, languages: Optional[Iterable[str]] = None, workers: Optional[int] = None,
+                 preprocessing: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            languages: Tesseract language codes (default: eng, deu)
+            workers: Worker processes (default: CPU count, at most 4)
+            preprocessing: scraping.ocr.preprocessing settings (see preprocess.py)
+        """
+        self.lang = '+'.join(languages or ['eng', 'deu'])
+        self.workers = workers or default_workers()
+        self.preprocessing = preprocessing_settings(preprocessing)
+        self._executor = None
+        self._threaded = False
+        self._lock = threading.Lock()
+        self.stats = {'images': 0, 'errors': 0, 'restarts': 0}
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                try:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers, initializer=_init_worker, initargs=(self.lang,))
+                except (OSError, NotImplementedError, PermissionError) as e:
+                    logger.warning(f"OCR worker processes unavailable ({e}), using threads")
+                    self._start_threads()
+            return self._executor
+
+    def _start_threads(self) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='ocr')
+        self._threaded = True
+
+    def submit(self, image_source: ImageSource) -> 'Future[Optional[Dict[str, Any]]]':
+        """
+        Queue one image for OCR.
+
+        Args:
+            image_source: Image bytes, BytesIO or file path
+
+        Returns:
+            Future resolving to {'text': OCR text, 'metadata': image metadata}
+            (None on errors)
+        """
+        if isinstance(image_source, BytesIO):
+            image_source = image_source.getvalue()
+        elif not isinstance(image_source, bytes):
+            image_source = str(image_source)
+        self.stats['images'] += 1
+
+        result: Future = Future()
+        self._submit(image_source, result, retry=True)
+        return result
+
+    def _submit(self, image_source: Union[str, bytes], result: Future, retry: bool) -> None:
+        try:
+            future = self._get_executor().submit(_ocr_image, image_source, self.lang, self.preprocessing)
+        except (BrokenProcessPool, RuntimeError) as e:
+            self._restart(e)
+            if retry:
+                self._submit(image_source, result, retry=False)
+            else:
+                result.set_result(None)
+            return
+
+        def done(future: Future) -> None:
+            try:
+                result.set_result(future.result())
+            except BrokenProcessPool as e:
+                self._restart(e)
+                if retry:
+                    self._submit(image_source, result, retry=False)
+                else:
+                    result.set_result(None)
+            except Exception as e:
+                self.stats['errors'] += 1
+                print(f"  OCR error: {e}")
+                result.set_result(None)
+
+        future.add_done_callback(done)
+
+    def _restart(self, error: Exception) -> None:
+        """Replace a broken pool with in-process threads."""
+        with self._lock:
+            if self._threaded:
+                return
+            logger.warning(f"OCR worker pool failed ({error}), continuing with threads")
+            self.stats['restarts'] += 1
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+            self._start_threads()
+
+    def submit_batch(self, image_sources: Iterable[ImageSource]) -> 'List[Future[Optional[Dict[str, Any]]]]':
+        """Queue several images at once; futures are in input order."""
+        return [self.submit(image_source) for image_source in image_sources]
+
+    def extract_text(self, image_source: ImageSource) -> Optional[str]:
+        """OCR one image and wait for the text."""
+        result = self.submit(image_source).result()
+        return result['text'] if result else None
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            'languages': self.lang,
+            'workers': self.workers,
+            'mode': 'not started' if self._executor is None else ('threads' if self._threaded else 'processes'),
+            **self.stats,
+        }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
+                self._threaded = False
+
+
+# Process-wide services by language set
+_services: Dict[str, OCRService] = {}
+_services_lock = threading.Lock()
+_settings: Dict[str, Any] = {}
+
+
+def configure_ocr_services(settings: Dict[str, Any]) -> None:
+    """Apply a scraping.ocr config section to services created from now on."""
+    _settings.clear()
+    _settings.update(settings or {})
+
+
+def get_ocr_service(languages: Optional[Iterable[str]] = None) -> OCRService:
+    """
+    Shared OCRService for a language set.
+
+    Args:
+        languages: Tesseract language codes (default: eng, deu)
+
+    Returns:
+        The process-wide OCRService for these languages
+    """
+    key = '+'.join(languages or ['eng', 'deu'])
+    with _services_lock:
+        service = _services.get(key)
+        if service is None:
+            service = _services[key] = OCRService(key.split('+'), _settings.get('workers') or None,
+                                                  _settings.get('preprocessing'))
+        return service
+
+
+def shutdown_ocr_services() -> None:
+    """Stop all shared worker pools (tests, end of process)."""
+    with _services_lock:
+        for service in _services.values():
+            service.shutdown()
+        _services.clear()
+
+
+atexit.register(shutdown_ocr_services)
@@ -0,0 +1,178 @@
+"""Perceptual hashes of flyer images and Hamming-distance lookup.
+
+The same poster shared on Facebook, reposted on Instagram and sent to the
+Telegram bot is re-encoded every time, so its bytes (and content hash)
+differ. A difference hash (dHash) survives re-encoding, resizing and small
+crops: the image is shrunk to 9x8 grayscale pixels and each bit says
+whether a pixel is brighter than its right neighbour. Two copies of a
+flyer differ in a few of the 64 bits, unrelated images in about 32.
+
+- perceptual_hash(): dHash of image bytes/path; JPEGs are draft-decoded at
+  1/8 size, so hashing costs a fraction of a full decode
+- BKTree: metric tree over hashes, finds all hashes within a Hamming
+  distance without comparing against every stored hash
+- FlyerEventIndex: events by their flyer_hash, used to link a new
+  submission of a known flyer to the existing event
+
+FlyerCache keeps the hashes of all analysed flyers (perceptual table) and
+answers near-identical images from the original's result, so they are not
+OCR'd or sent to AI again.
+
+Usage:
+    from modules.smart_scraper.image_analyzer.perceptual_hash import perceptual_hash, BKTree
+
+    tree = BKTree()
+    tree.add(perceptual_hash(flyer_bytes), 'facebook:123:0')
+    tree.search(perceptual_hash(repost_bytes), max_distance=6)  # [(2, 'facebook:123:0')]
+"""
+
+from io import BytesIO
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+# Copies of one flyer differ in a few bits, different flyers in ~32 of 64
+DEFAULT_MAX_DISTANCE = 6
+HASH_SIZE = 8
+
+
+def dhash(img: 'Image.Image', size: int = HASH_SIZE) -> int:
+    """Difference hash (size*size bits) of a PIL image."""
+    small = img.convert('L').resize((size + 1, size), Image.BILINEAR)
+    pixels = small.tobytes()  # One byte per pixel in mode L
+    value = 0
+    for row in range(size):
+        offset = row * (size + 1)
+        for col in range(size):
+            value = (value << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+    return value
+
+
+def perceptual_hash(image_source: Union[str, bytes]) -> Optional[int]:
+    """
+    dHash of an image file or bytes.
+
+    Args:
+        image_source: Image bytes or file path
+
+    Returns:
+        64-bit hash, or None if Pillow is missing or the image is unreadable
+    """
+    if not PIL_AVAILABLE:
+        return None
+    try:
+        with Image.open(BytesIO(image_source) if isinstance(image_source, bytes) else image_source) as img:
+            img.draft('L', (64, 64))  # JPEG: decode at reduced size
+            return dhash(img)
+    except Exception:
+        return None
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin(a ^ b).count('1')
+
+
+def format_hash(value: int) -> str:
+    """Hex form stored on results and events."""
+    return f'{value:016x}'
+
+
+def parse_hash(value: Any) -> Optional[int]:
+    """Inverse of format_hash; None for missing or malformed values."""
+    if not isinstance(value, str):
+        return None
+    try:
+        return int(value, 16)
+    except ValueError:
+        return None
+
+
+class BKTree:
+    """Burkhard-Keller tree over 64-bit hashes with Hamming distance.
+
+    Each node keeps its children by their distance to it; by the triangle
+    inequality a search only descends into children whose distance lies
+    within max_distance of the query's distance to the node.
+    """
+
+    def __init__(self, items: Iterable[Tuple[int, Any]] = ()):
+        self._root = None  # [hash, value, {distance: child}]
+        self._size = 0
+        for value_hash, value in items:
+            self.add(value_hash, value)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, value_hash: int, value: Any) -> None:
+        node = [value_hash, value, {}]
+        self._size += 1
+        if self._root is None:
+            self._root = node
+            return
+        current = self._root
+        while True:
+            distance = hamming_distance(value_hash, current[0])
+            child = current[2].get(distance)
+            if child is None:
+                current[2][distance] = node
+                return
+            current = child
+
+    def search(self, value_hash: int, max_distance: int) -> List[Tuple[int, Any]]:
+        """All (distance, value) within max_distance, nearest first."""
+        found = []
+        stack = [self._root] if self._root is not None else []
+        while stack:
+            node = stack.pop()
+            distance = hamming_distance(value_hash, node[0])
+            if distance <= max_distance:
+                found.append((distance, node[1]))
+            for child_distance, child in node[2].items():
+                if distance - max_distance <= child_distance <= distance + max_distance:
+                    stack.append(child)
+        found.sort(key=lambda item: item[0])
+        return found
+
+    def nearest(self, value_hash: int, max_distance: int) -> Optional[Tuple[int, Any]]:
+        """Closest (distance, value) within max_distance, or None."""
+        found = self.search(value_hash, max_distance)
+        return found[0] if found else None
+
+
+def event_flyer_hash(event: Dict[str, Any]) -> Optional[int]:
+    """Flyer hash of an event, if it was built from a flyer."""
+    return parse_hash(event.get('flyer_hash'))
+
+
+class FlyerEventIndex:
+    """Events by flyer hash, to link resubmissions of the same flyer."""
+
+    def __init__(self, events: Iterable[Dict[str, Any]] = (),
+                 max_distance: Optional[int] = DEFAULT_MAX_DISTANCE):
+        """
+        Args:
+            events: Known events (those without flyer_hash are ignored)
+            max_distance: Largest Hamming distance of the same flyer (None = off)
+        """
+        self.max_distance = max_distance
+        self._tree = BKTree()
+        for event in events:
+            self.add(event)
+
+    def add(self, event: Dict[str, Any]) -> None:
+        value_hash = event_flyer_hash(event)
+        if value_hash is not None:
+            self._tree.add(value_hash, event)
+
+    def find(self, event: Dict[str, Any]) -> Optional[Tuple[Dict[str, Any], int]]:
+        """(known event, distance) showing the same flyer, or None."""
+        value_hash = event_flyer_hash(event)
+        if value_hash is None or self.max_distance is None:
+            return None
+        match = self._tree.nearest(value_hash, self.max_distance)
+        return (match[1], match[0]) if match else None
@@ -0,0 +1,216 @@
+"""Single-decode image pipeline and OCR-oriented preprocessing.
+
+A flyer used to be opened and decoded by EXIF extraction, by PIL metadata
+extraction and by OCR separately, and full-resolution phone photos went to
+Tesseract unchanged. decode_image() opens an image once: metadata (size,
+format, EXIF GPS/datetime) is read from the header, JPEGs are decoded
+directly at reduced size and in grayscale (PIL draft mode), and
+prepare_for_ocr() turns the decoded image into what Tesseract reads best:
+- Downscaled to the OCR-optimal resolution (target_dpi, default 300, for a
+  flyer of page_long_side_inches, default A5), never upscaled
+- Grayscale and contrast normalisation (autocontrast)
+- Optional deskew (projection profile search over +-max_skew_degrees)
+- Optional binarization (Otsu threshold)
+
+The OCR workers run this pipeline (ocr_service.py) and return text and
+metadata together; the encoded bytes are kept for AI image analysis.
+
+Settings come from scraping.ocr.preprocessing (DEFAULT_PREPROCESSING).
+"""
+
+from io import BytesIO
+from typing import Any, Dict, Optional, Sequence, Tuple, Union
+
+try:
+    from PIL import Image, ImageOps
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+DEFAULT_PREPROCESSING = {
+    'enabled': True,
+    'target_dpi': 300,
+    'page_long_side_inches': 8.27,  # A5 flyer
+    'grayscale': True,
+    'normalize_contrast': True,
+    'deskew': False,
+    'max_skew_degrees': 5.0,
+    'binarize': False,
+}
+
+# Declared resolutions below this are screen defaults (72/96 dpi), not scans
+MIN_SCAN_DPI = 150
+
+# Relative profile score gain over 0 degrees needed before deskewing
+# (blank or flat images score about the same at every angle)
+MIN_SKEW_GAIN = 0.02
+
+
+def preprocessing_settings(settings: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """DEFAULT_PREPROCESSING updated with a scraping.ocr.preprocessing section."""
+    merged = dict(DEFAULT_PREPROCESSING)
+    merged.update({key: value for key, value in (settings or {}).items() if not key.startswith('_')})
+    return merged
+
+
+def target_scale(size: Tuple[int, int], dpi: Optional[float], settings: Dict[str, Any]) -> float:
+    """
+    Scale factor (<= 1) that brings an image to the OCR resolution.
+
+    Args:
+        size: Image width and height in pixels
+        dpi: Resolution declared by the file (None or screen default: unknown)
+        settings: Preprocessing settings
+
+    Returns:
+        Factor to resize by; 1.0 if the image is small enough
+    """
+    target_dpi = settings['target_dpi']
+    if dpi and dpi >= MIN_SCAN_DPI:
+        scale = target_dpi / dpi
+    else:
+        scale = target_dpi * settings['page_long_side_inches'] / max(size)
+    return min(scale, 1.0)
+
+
+def otsu_threshold(histogram: Sequence[int]) -> int:
+    """Gray level separating text from background (Otsu's method)."""
+    total = sum(histogram)
+    if not total:
+        return 128
+    sum_all = sum(level * count for level, count in enumerate(histogram))
+    sum_background, weight_background = 0.0, 0
+    best_level, best_variance = 0, -1.0
+    for level, count in enumerate(histogram):
+        weight_background += count
+        if weight_background == 0:
+            continue
+        weight_foreground = total - weight_background
+        if weight_foreground == 0:
+            break
+        sum_background += level * count
+        mean_background = sum_background / weight_background
+        mean_foreground = (sum_all - sum_background) / weight_foreground
+        variance = weight_background * weight_foreground * (mean_background - mean_foreground) ** 2
+        if variance > best_variance:
+            best_level, best_variance = level, variance
+    return best_level
+
+
+def _profile_score(inverted: 'Image.Image', angle: float) -> float:
+    """Variance of the row sums after rotating; highest when text lines are level."""
+    rotated = inverted.rotate(angle, resample=Image.BILINEAR, fillcolor=0)
+    rows = rotated.resize((1, rotated.height), Image.BOX).tobytes()
+    mean = sum(rows) / len(rows)
+    return sum((row - mean) ** 2 for row in rows)
+
+
+def estimate_skew(gray: 'Image.Image', max_degrees: float = 5.0) -> float:
+    """
+    Rotation (degrees, counter-clockwise) that levels the text lines.
+
+    Coarse 1 degree search over +-max_degrees on a thumbnail, then 0.25
+    degree steps around the best angle. Ties go to the smaller angle, and
+    0.0 is kept unless another angle scores clearly (MIN_SKEW_GAIN) higher.
+    """
+    thumb = ImageOps.invert(gray)
+    thumb.thumbnail((800, 800))
+    scores = {}
+
+    def score(angle):
+        if angle not in scores:
+            scores[angle] = _profile_score(thumb, angle)
+        return scores[angle]
+
+    def best(angles):
+        return max(angles, key=lambda angle: (score(angle), -abs(angle)))
+
+    coarse = best([float(a) for a in range(-int(max_degrees), int(max_degrees) + 1)])
+    angle = best([coarse + step * 0.25 for step in range(-3, 4)])
+    if score(angle) <= score(0.0) * (1 + MIN_SKEW_GAIN):
+        return 0.0
+    return angle
+
+
+def decode_image(image_source: Union[str, bytes], settings: Optional[Dict[str, Any]] = None
+                 ) -> Tuple['Image.Image', Dict[str, Any]]:
+    """
+    Open and decode an image once.
+
+    Args:
+        image_source: Image bytes or file path
+        settings: Preprocessing settings (draft decoding at OCR size)
+
+    Returns:
+        Tuple of (decoded image, metadata as returned by extract_metadata)
+    """
+    from .metadata import extract_metadata_from_image
+
+    settings = settings or preprocessing_settings()
+    img = Image.open(BytesIO(image_source) if isinstance(image_source, bytes) else image_source)
+    # Size, format and EXIF come from the header, before any pixels are decoded
+    metadata = extract_metadata_from_image(img)
+    if settings.get('enabled', True):
+        dpi = (img.info.get('dpi') or (None,))[0]
+        scale = target_scale(img.size, dpi, settings)
+        if scale < 1.0 or settings.get('grayscale', True):
+            # JPEG: decode at 1/2, 1/4 or 1/8 size and straight to grayscale
+            img.draft('L' if settings.get('grayscale', True) else img.mode,
+                      (int(img.width * scale), int(img.height * scale)))
+    img.load()
+    return img, metadata
+
+
+def prepare_for_ocr(img: 'Image.Image', settings: Optional[Dict[str, Any]] = None,
+                    original_size: Optional[Tuple[int, int]] = None) -> 'Image.Image':
+    """
+    Turn a decoded image into Tesseract input.
+
+    Args:
+        img: Decoded image (from decode_image)
+        settings: Preprocessing settings
+        original_size: Size before draft decoding (default: img.size)
+
+    Returns:
+        The preprocessed image (img itself with preprocessing disabled)
+    """
+    settings = settings or preprocessing_settings()
+    if not settings.get('enabled', True):
+        return img
+
+    img = ImageOps.exif_transpose(img)
+    if settings.get('grayscale', True) and img.mode != 'L':
+        img = img.convert('L')
+    elif img.mode not in ('L', 'RGB'):
+        img = img.convert('RGB')
+
+    # Scale relative to the original (draft decoding may have shrunk it already)
+    size = original_size or img.size
+    dpi = (img.info.get('dpi') or (None,))[0]
+    long_side = max(size) * target_scale(size, dpi, settings)
+    if long_side < max(img.size):
+        factor = long_side / max(img.size)
+        img = img.resize((max(1, int(img.width * factor)), max(1, int(img.height * factor))), Image.LANCZOS)
+
+    if settings.get('normalize_contrast', True):
+        img = ImageOps.autocontrast(img, cutoff=1)
+
+    if settings.get('deskew') and img.mode == 'L':
+        angle = estimate_skew(img, settings.get('max_skew_degrees', 5.0))
+        if angle:
+            # Same size as before: the corners rotated out are margin
+            img = img.rotate(angle, resample=Image.BICUBIC, fillcolor=255)
+
+    if settings.get('binarize') and img.mode == 'L':
+        threshold = otsu_threshold(img.histogram())
+        img = img.point(lambda level: 255 if level > threshold else 0)
+
+    return img
+
+
+def load_for_ocr(image_source: Union[str, bytes], settings: Optional[Dict[str, Any]] = None
+                 ) -> Tuple['Image.Image', Dict[str, Any]]:
+    """decode_image() followed by prepare_for_ocr(): (OCR input, metadata)."""
+    img, metadata = decode_image(image_source, settings)
+    original_size = (metadata['width'], metadata['height']) if 'width' in metadata else None
+    return prepare_for_ocr(img, settings, original_size), metadata
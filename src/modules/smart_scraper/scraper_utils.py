@@ -8,11 +8,12 @@ Provides common functionality like:
 - Location tracking for unverified locations
 """
 
-import json
 import re
 from pathlib import Path
 from typing import Dict, Any, Optional, Tuple
 
+from .. import fast_json
+
 
 def round_coordinate(coord: float) -> float:
     """
@@ -158,7 +159,7 @@ class LocationNormalizer:
         try:
             if verified_file.exists():
                 with open(verified_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                    data = fast_json.load(f)
                     self.verified_locations = data.get('locations', {})
         except Exception as e:
             print(f"  ⚠ Warning: Could not load verified locations: {e}")
@@ -632,7 +633,7 @@ class GeolocationResolver:
         try:
             if verified_file.exists():
                 with open(verified_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                    data = fast_json.load(f)
                     self.verified_locations = data.get('locations', {})
         except Exception as e:
             print(f"  ⚠ Warning: Could not load verified locations: {e}")
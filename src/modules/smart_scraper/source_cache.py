@@ -1,52 +1,205 @@
-"""Simple cache for tracking processed source items."""
+"""Item fingerprint cache for incremental scraping.
 
-from dataclasses import dataclass, field
-from datetime import datetime
-from pathlib import Path
-from typing import List, Optional, Set
+Remembers a content hash per scraped item (listing entry, feed entry, API
+record, social post) so that sources can skip re-extraction, re-geocoding and
+re-validation of items that have not changed since the previous run.
+
+All sources share one SQLite database (data/scraper_cache/items.sqlite3),
+partitioned by source name:
+- Only items seen or changed during a run are written (no full rewrites)
+- last_seen is refreshed whenever an item is seen, eviction is true LRU on
+  last_seen (max_entries per source) plus a TTL (ttl_days)
+- Safe for parallel sources: each ItemCache writes in its own transaction
+"""
+
+import hashlib
 import json
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 2000
+DEFAULT_TTL_DAYS = 30
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    source      TEXT NOT NULL,
+    key         TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    first_seen  REAL NOT NULL,
+    last_seen   REAL NOT NULL,
+    PRIMARY KEY (source, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_items_last_seen ON items (source, last_seen);
+"""
+
+
+def get_item_cache_path(base_path: Path) -> Path:
+    """Return the item cache database path for a repository root."""
+    return Path(base_path) / "data" / "scraper_cache" / "items.sqlite3"
+
+
+def fingerprint(content: Any) -> str:
+    """Stable content hash of an item (str/bytes or JSON-serializable data)."""
+    if isinstance(content, bytes):
+        data = content
+    elif isinstance(content, str):
+        data = content.encode("utf-8")
+    else:
+        data = json.dumps(content, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
+    return hashlib.sha1(data).hexdigest()
+
+
+class ItemCache:
+    """Content hashes and last-seen times of one source's items."""
+
+    def __init__(self, db_path: Path, source: str,
+                 max_entries: int = DEFAULT_MAX_ENTRIES,
+                 ttl_days: Optional[float] = DEFAULT_TTL_DAYS):
+        """Load the source's entries.
 
+        Args:
+            db_path: SQLite database (created on first save)
+            source: Source name the entries belong to
+            max_entries: Entries kept per source (least recently seen evicted)
+            ttl_days: Entries not seen for this long expire (None = never)
+        """
+        self.db_path = Path(db_path)
+        self.source = source
+        self.max_entries = max_entries
+        self.ttl_days = ttl_days
+        # key -> (fingerprint, first_seen, last_seen)
+        self.entries: Dict[str, Tuple[str, float, float]] = {}
+        self._dirty = set()
+        self.stats = {"new": 0, "changed": 0, "unchanged": 0, "evicted": 0}
+        self._load()
 
-@dataclass
-class SourceCache:
-    """Persistent cache of processed item keys for a source."""
-    cache_path: Optional[Path]
-    max_entries: int = 500
-    processed_keys: Set[str] = field(default_factory=set)
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(SCHEMA)
+        return conn
 
-    def load(self) -> None:
-        """Load cache from disk."""
-        if not self.cache_path or not self.cache_path.exists():
+    def _cutoff(self) -> float:
+        return time.time() - self.ttl_days * 86400 if self.ttl_days else 0.0
+
+    def _load(self) -> None:
+        if not self.db_path.exists():
             return
-        
         try:
-            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError):
-            return
-        
-        self.processed_keys = set(data.get("processed_keys", []))
-    
-    def is_processed(self, key: str) -> bool:
-        """Check if key was already processed."""
-        return key in self.processed_keys
-    
-    def mark_processed(self, key: str) -> None:
-        """Record a processed key."""
-        if key in self.processed_keys:
+            conn = self._connect()
+            try:
+                rows = conn.execute(
+                    "SELECT key, fingerprint, first_seen, last_seen FROM items "
+                    "WHERE source = ? AND last_seen >= ?",
+                    (self.source, self._cutoff())
+                ).fetchall()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.warning(f"Item cache unreadable, starting empty: {e}")
             return
-        self.processed_keys.add(key)
-        if len(self.processed_keys) > self.max_entries:
-            trimmed = sorted(self.processed_keys)
-            self.processed_keys = set(trimmed[-self.max_entries:])
-    
+        self.entries = {key: (fp, first, last) for key, fp, first, last in rows}
+
+    def is_unchanged(self, key: str, item_fingerprint: str) -> bool:
+        """Check if an item was seen before with the same content.
+
+        An unchanged item counts as seen again (its last_seen is refreshed);
+        changed and new items are refreshed by remember().
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            return False
+        if entry[0] != item_fingerprint:
+            return False
+        self.entries[key] = (entry[0], entry[1], time.time())
+        self._dirty.add(key)
+        self.stats["unchanged"] += 1
+        return True
+
+    def remember(self, key: str, item_fingerprint: str) -> None:
+        """Record the content hash of a processed item."""
+        now = time.time()
+        entry = self.entries.get(key)
+        if entry is None:
+            self.stats["new"] += 1
+            first_seen = now
+        else:
+            if entry[0] != item_fingerprint:
+                self.stats["changed"] += 1
+            first_seen = entry[1]
+        self.entries[key] = (item_fingerprint, first_seen, now)
+        self._dirty.add(key)
+
+    def import_legacy(self, path: Path) -> int:
+        """Import a legacy SourceCache JSON file (processed_keys) and delete it.
+
+        Legacy keys were content hashes already, so each key is its own
+        fingerprint.
+        """
+        path = Path(path)
+        if not path.exists():
+            return 0
+        try:
+            keys = json.loads(path.read_text(encoding="utf-8")).get("processed_keys", [])
+        except (json.JSONDecodeError, OSError, AttributeError):
+            return 0
+        for key in keys:
+            if key not in self.entries:
+                self.remember(key, key)
+        self.save()
+        path.unlink()
+        return len(keys)
+
     def save(self) -> None:
-        """Persist cache to disk."""
-        if not self.cache_path:
+        """Write seen/changed entries and apply TTL and LRU eviction."""
+        if not self._dirty:
             return
-        
-        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
-        payload = {
-            "processed_keys": sorted(self.processed_keys),
-            "updated_at": datetime.now().isoformat()
-        }
-        self.cache_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        rows = [(self.source, key) + self.entries[key] for key in self._dirty if key in self.entries]
+
+        # LRU: keep the max_entries most recently seen items
+        evicted = []
+        if self.max_entries and len(self.entries) > self.max_entries:
+            by_age = sorted(self.entries, key=lambda k: self.entries[k][2])
+            evicted = by_age[:len(self.entries) - self.max_entries]
+            for key in evicted:
+                del self.entries[key]
+            self.stats["evicted"] += len(evicted)
+
+        conn = self._connect()
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT INTO items (source, key, fingerprint, first_seen, last_seen) "
+                    "VALUES (?, ?, ?, ?, ?) ON CONFLICT (source, key) DO UPDATE SET "
+                    "fingerprint = excluded.fingerprint, last_seen = excluded.last_seen",
+                    rows
+                )
+                conn.executemany(
+                    "DELETE FROM items WHERE source = ? AND key = ?",
+                    [(self.source, key) for key in evicted]
+                )
+                conn.execute(
+                    "DELETE FROM items WHERE source = ? AND last_seen < ?",
+                    (self.source, self._cutoff())
+                )
+        finally:
+            conn.close()
+        self._dirty.clear()
+
+    def clear(self) -> None:
+        """Forget all items of this source."""
+        self.entries = {}
+        self._dirty.clear()
+        if self.db_path.exists():
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.execute("DELETE FROM items WHERE source = ?", (self.source,))
+            finally:
+                conn.close()
@@ -1,18 +1,23 @@
-"""Smart scraper source modules."""
+"""Smart scraper source modules.
 
-# Web sources
-from . import web
+Subpackages are imported on first attribute access, so importing one source
+module (e.g. sources.web.rss) does not import all the others.
+"""
 
-# Social sources (optional)
-try:
-    from . import social
-except ImportError:
-    social = None
-
-# Custom sources
-try:
-    from . import frankenpost
-except ImportError:
-    frankenpost = None
+import importlib
 
 __all__ = ['web', 'social', 'frankenpost']
+
+
+def __getattr__(name):
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        module = importlib.import_module(f'.{name}', __name__)
+    except ImportError:
+        # Social and custom sources are optional
+        if name == 'web':
+            raise
+        module = None
+    globals()[name] = module
+    return module
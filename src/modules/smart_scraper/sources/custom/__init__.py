@@ -2,37 +2,31 @@
 
 This module contains custom implementations for sites that need
 specific parsing logic beyond the generic HTML/Facebook scrapers.
+Source classes are imported on first attribute access.
 """
 
+import importlib
 import logging
 
 logger = logging.getLogger(__name__)
 
-__all__ = []
+# Class name -> module
+_SOURCE_MODULES = {
+    'FreiheitshalleSource': 'freiheitshalle',
+    'VHSSource': 'vhs',
+    'HofStadtSource': 'hof_stadt',
+}
 
-try:
-    from .freiheitshalle import FreiheitshalleSource
-    __all__.append('FreiheitshalleSource')
-except ImportError as exc:
-    logger.debug(
-        "Optional custom source 'FreiheitshalleSource' could not be imported: %s",
-        exc,
-    )
+__all__ = list(_SOURCE_MODULES)
 
-try:
-    from .vhs import VHSSource
-    __all__.append('VHSSource')
-except ImportError as exc:
-    logger.debug(
-        "Optional custom source 'VHSSource' could not be imported: %s",
-        exc,
-    )
 
-try:
-    from .hof_stadt import HofStadtSource
-    __all__.append('HofStadtSource')
-except ImportError as exc:
-    logger.debug(
-        "Optional custom source 'HofStadtSource' could not be imported: %s",
-        exc,
-    )
+def __getattr__(name):
+    if name not in _SOURCE_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        source_class = getattr(importlib.import_module(f'.{_SOURCE_MODULES[name]}', __name__), name)
+    except ImportError as exc:
+        logger.debug("Optional custom source '%s' could not be imported: %s", name, exc)
+        raise AttributeError(f"custom source {name!r} unavailable: {exc}") from exc
+    globals()[name] = source_class
+    return source_class
@@ -51,8 +51,10 @@ class FreiheitshalleSource(BaseSource):
         
         events = []
         try:
-            response = self.session.get(self.url, timeout=15)
+            response = self.http_get(self.url, timeout=15)
             response.raise_for_status()
+            if self.is_unchanged(response):
+                return []
             soup = BeautifulSoup(response.content, 'lxml')
             
             # Look for event containers
@@ -72,11 +74,17 @@ class FreiheitshalleSource(BaseSource):
             print(f"    Found {len(event_containers)} potential events")
             
             for i, container in enumerate(event_containers[:20], 1):  # Limit to 20
+                # Unchanged since the last run - already extracted
+                content = str(container)
+                if self.is_item_unchanged(content):
+                    continue
                 try:
                     event = self._parse_event(container)
                     if event and not self.filter_event(event):
                         events.append(event)
                         print(f"    [{i}/{min(len(event_containers), 20)}] ✓ {event['title'][:50]}")
+                        # Only emitted events: filtered ones are re-checked next run
+                        self.remember_item(content)
                 except Exception as e:
                     print(f"    [{i}] ✗ Parse error: {str(e)[:50]}")
                     
@@ -66,8 +66,10 @@ class VHSSource(BaseSource):
         
         events = []
         try:
-            response = self.session.get(self.url, timeout=15)
+            response = self.http_get(self.url, timeout=15)
             response.raise_for_status()
+            if self.is_unchanged(response):
+                return []
             soup = BeautifulSoup(response.content, 'lxml')
             
             # Look for course containers
@@ -88,11 +90,17 @@ class VHSSource(BaseSource):
             print(f"    Found {len(course_containers)} potential courses")
             
             for i, container in enumerate(course_containers[:20], 1):
+                # Unchanged since the last run - already extracted
+                content = str(container)
+                if self.is_item_unchanged(content):
+                    continue
                 try:
                     event = self._parse_course(container)
                     if event and not self.filter_event(event):
                         events.append(event)
                         print(f"    [{i}/{min(len(course_containers), 20)}] ✓ {event['title'][:50]}")
+                        # Only emitted events: filtered ones are re-checked next run
+                        self.remember_item(content)
                 except Exception as e:
                     print(f"    [{i}] ✗ Parse error: {str(e)[:50]}")
                     
@@ -81,23 +81,36 @@ class FrankenpostSource(BaseSource):
         events = []
         try:
             # Step 1: Get list of events from main page
-            response = self.session.get(self.url, timeout=10)
+            response = self.http_get(self.url, timeout=10)
             response.raise_for_status()
+            if self.is_unchanged(response):
+                return []
             soup = BeautifulSoup(response.content, 'lxml')
             
             # Extract basic event info from listing
             event_links = self._extract_event_links(soup)
             print(f"    Found {len(event_links)} event links")
             
-            # Step 2: Fetch each detail page to get location
-            for i, (title, url, date_text) in enumerate(event_links[:20], 1):  # Limit to 20
+            # Listing entries unchanged since the last run were already
+            # fetched, geocoded and validated - skip their detail pages
+            event_links = [link for link in event_links if not self.is_item_unchanged(link, key=link[1])]
+            
+            # Step 2: Fetch detail pages concurrently (options.max_detail_pages,
+            # detail_concurrency), then parse them in listing order
+            event_links = self.limit_detail_links(event_links)
+            pages = self.fetch_detail_pages([url for _, url, _ in event_links], session=self.session)
+            for i, ((title, url, date_text), page) in enumerate(zip(event_links, pages), 1):
                 try:
-                    event = self._scrape_detail_page(title, url, date_text)
+                    if not page.ok:
+                        raise page.error
+                    event = self._parse_detail_page(title, url, date_text, page.content)
                     if event and not self.filter_event(event):
                         events.append(event)
-                        print(f"    [{i}/{min(len(event_links), 20)}] ✓ {title[:50]}")
+                        print(f"    [{i}/{len(event_links)}] ✓ {title[:50]}")
+                        # Only emitted events: filtered ones are re-checked next run
+                        self.remember_item((title, url, date_text), key=url)
                 except Exception as e:
-                    print(f"    [{i}/{min(len(event_links), 20)}] ✗ Error: {str(e)[:50]}")
+                    print(f"    [{i}/{len(event_links)}] ✗ Error: {str(e)[:50]}")
                     
         except Exception as e:
             print(f"    Frankenpost scraping error: {str(e)}")
@@ -168,9 +181,24 @@ class FrankenpostSource(BaseSource):
         Returns:
             Complete event dictionary with location
         """
-        response = self.session.get(url, timeout=10)
+        response = self.http_get(url, timeout=self.options.detail_timeout)
         response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'lxml')
+        return self._parse_detail_page(title, url, date_text, response.content)
+    
+    def _parse_detail_page(self, title: str, url: str, date_text: str, content: bytes) -> Dict[str, Any]:
+        """
+        Build the event from a fetched detail page.
+        
+        Args:
+            title: Event title from listing
+            url: Detail page URL
+            date_text: Date text from listing
+            content: Detail page HTML
+            
+        Returns:
+            Complete event dictionary with location
+        """
+        soup = BeautifulSoup(content, 'lxml')
         
         # Extract location from detail page (returns location + extraction details)
         location, extraction_details = self._extract_location_from_detail(soup)
@@ -1,40 +1,30 @@
-"""Social media source scrapers."""
+"""Social media source scrapers.
 
-try:
-    from .facebook import FacebookSource
-except ImportError:
-    FacebookSource = None
+Source classes are imported on first attribute access; a platform whose
+module cannot be imported resolves to None.
+"""
 
-try:
-    from .instagram import InstagramSource
-except ImportError:
-    InstagramSource = None
+import importlib
 
-try:
-    from .tiktok import TikTokSource
-except ImportError:
-    TikTokSource = None
+# Class name -> module
+_SOURCE_MODULES = {
+    'FacebookSource': 'facebook',
+    'InstagramSource': 'instagram',
+    'TikTokSource': 'tiktok',
+    'XTwitterSource': 'x_twitter',
+    'TelegramSource': 'telegram',
+    'WhatsAppSource': 'whatsapp',
+}
 
-try:
-    from .x_twitter import XTwitterSource
-except ImportError:
-    XTwitterSource = None
+__all__ = list(_SOURCE_MODULES)
 
-try:
-    from .telegram import TelegramSource
-except ImportError:
-    TelegramSource = None
 
-try:
-    from .whatsapp import WhatsAppSource
-except ImportError:
-    WhatsAppSource = None
-
-__all__ = [
-    'FacebookSource',
-    'InstagramSource', 
-    'TikTokSource',
-    'XTwitterSource',
-    'TelegramSource',
-    'WhatsAppSource'
-]
+def __getattr__(name):
+    if name not in _SOURCE_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        source_class = getattr(importlib.import_module(f'.{_SOURCE_MODULES[name]}', __name__), name)
+    except ImportError:
+        source_class = None
+    globals()[name] = source_class
+    return source_class
@@ -1,7 +1,7 @@
 """Base class for social media scrapers with image caching support.
 
 This module provides common functionality for social media scrapers including:
-- Image caching by post ID
+- OCR results cached by image content hash and post ID (flyer_cache.py)
 - Metadata extraction from images
 - Anti-scraping measures (delays, realistic headers)
 - Reusable OCR integration
@@ -9,7 +9,6 @@ This module provides common functionality for social media scrapers including:
 
 from typing import Dict, Any, List, Optional
 from pathlib import Path
-import time
 from ...base import BaseSource, SourceOptions
 
 try:
@@ -20,6 +19,7 @@ except ImportError:
 
 try:
     from ...image_analyzer import ImageAnalyzer
+    from ...image_analyzer.flyer_cache import get_flyer_cache
     IMAGE_ANALYZER_AVAILABLE = True
 except ImportError:
     IMAGE_ANALYZER_AVAILABLE = False
@@ -29,7 +29,7 @@ class BaseSocialMediaSource(BaseSource):
     """Base class for social media scrapers with image caching.
     
     Provides common functionality:
-    - Image caching by post ID to avoid re-downloading
+    - OCR result caching by image hash and post ID to avoid re-downloading
     - Metadata extraction (alt text, captions, titles)
     - Anti-scraping measures (delays, realistic headers)
     - OCR integration for flyer analysis
@@ -80,6 +80,8 @@ class BaseSocialMediaSource(BaseSource):
                     'languages': ['eng', 'deu']
                 }
                 self.image_analyzer = ImageAnalyzer(img_config, ai_providers=ai_providers)
+                if self.base_path:
+                    self.image_analyzer.result_cache = get_flyer_cache(self.base_path)
             except Exception as e:
                 print(f"    ⚠ Image analyzer init failed: {e}")
     
@@ -91,38 +93,19 @@ class BaseSocialMediaSource(BaseSource):
             delay: Whether to add delay before request (default True)
             
         Returns:
-            Response object or None on error
+            Response object or None on error (or if the host's circuit
+            breaker is open - then without delay or request)
         """
-        if delay and self.request_delay > 0:
-            time.sleep(self.request_delay)
-        
-        try:
-            response = self.session.get(url, timeout=self.request_timeout)
-            response.raise_for_status()
-            return response
-        except Exception as e:
-            print(f"      Request error: {e}")
-            return None
-    
-    def _get_image_cache_dir(self) -> Optional[Path]:
-        """Get platform-specific image cache directory.
-        
-        Returns:
-            Cache directory path or None if base_path not set
-        """
-        if not self.base_path:
-            return None
-        
-        cache_dir = self.base_path / "data" / "image_cache" / self.PLATFORM_NAME
-        cache_dir.mkdir(parents=True, exist_ok=True)
-        return cache_dir
+        return self.guarded_get(url, timeout=self.request_timeout, delay=self.request_delay if delay else 0)
     
     def _analyze_post_images(self, image_urls: List[str], post_id: Optional[str] = None,
                             image_metadata: Optional[List[Dict[str, str]]] = None) -> Optional[Dict[str, Any]]:
         """Analyze post images for event content using OCR with caching.
         
-        Images are cached by post_id to avoid re-downloading and re-processing.
-        Image metadata (alt text, captions) is incorporated into OCR results.
+        Each image is downloaded once and its OCR result is stored under its
+        content hash (data/image_cache/, size-capped); posts seen before are
+        answered without downloading again. Image metadata (alt text,
+        captions) is incorporated into OCR results.
         
         Args:
             image_urls: List of image URLs
@@ -135,55 +118,28 @@ class BaseSocialMediaSource(BaseSource):
         if not self.image_analyzer:
             return None
         
-        # Get cache directory
-        image_cache_dir = self._get_image_cache_dir()
-        
         best_result = None
         best_confidence = 0.0
         
-        for idx, url in enumerate(image_urls[:3]):  # Limit to first 3 images
-            try:
-                # Get metadata for this image if available
-                metadata = None
-                if image_metadata and idx < len(image_metadata):
-                    metadata = image_metadata[idx]
-                
-                # Check if we have a cached version of this image
-                cached_image_path = None
-                if image_cache_dir and post_id:
-                    cached_image_path = image_cache_dir / f"{post_id}_{idx}.jpg"
-                    if cached_image_path.exists():
-                        # Use cached image
-                        result = self.image_analyzer.analyze(str(cached_image_path))
-                        if result:
-                            # Enhance with metadata
-                            result = self._enhance_ocr_with_metadata(result, metadata)
-                            if result.get('ocr_confidence', 0) > best_confidence:
-                                best_confidence = result.get('ocr_confidence', 0)
-                                best_result = result
-                        continue
-                
-                # Download and analyze new image
-                result = self.image_analyzer.analyze_url(url, timeout=10)
-                if result:
-                    # Enhance with metadata
-                    result = self._enhance_ocr_with_metadata(result, metadata)
-                    if result.get('ocr_confidence', 0) > best_confidence:
-                        best_confidence = result.get('ocr_confidence', 0)
-                        best_result = result
-                        
-                        # Cache the image for future use
-                        if cached_image_path:
-                            try:
-                                response = self._make_request(url, delay=False)
-                                if response:
-                                    cached_image_path.write_bytes(response.content)
-                            except Exception as e:
-                                print(f"      Failed to cache image: {e}")
-                                
-            except Exception as e:
-                print(f"      OCR analysis error: {e}")
+        image_urls = image_urls[:3]  # Limit to first 3 images
+        source_keys = [f"{self.PLATFORM_NAME}:{post_id}:{idx}" if post_id else None for idx in range(len(image_urls))]
+        try:
+            # One download per image, OCR'd in parallel on the shared workers
+            results = self.image_analyzer.analyze_urls(
+                image_urls, source_keys, timeout=10, session=getattr(self, 'session', None))
+        except Exception as e:
+            print(f"      OCR analysis error: {e}")
+            return None
+        
+        for idx, result in enumerate(results):
+            if not result:
                 continue
+            # Enhance with metadata of this image if available
+            if image_metadata and idx < len(image_metadata):
+                result = self._enhance_ocr_with_metadata(result, image_metadata[idx])
+            if result.get('ocr_confidence', 0) > best_confidence:
+                best_confidence = result.get('ocr_confidence', 0)
+                best_result = result
         
         # Only return if confidence is above threshold (configurable, default 0.3)
         min_confidence = getattr(self, 'min_ocr_confidence', 0.3)
@@ -18,10 +18,9 @@ from urllib.parse import urljoin, urlparse, parse_qs
 import re
 import json
 import hashlib
-import time
 from ...base import BaseSource, SourceOptions
 from ...date_utils import resolve_relative_date, extract_time_from_text, resolve_year_for_date
-from ...source_cache import SourceCache
+from ...source_cache import ItemCache
 from ...ai_event_extractor import LocalEventExtractor
 
 if TYPE_CHECKING:
@@ -37,6 +36,7 @@ except ImportError:
 # Import image analyzer for OCR-based flyer extraction
 try:
     from ...image_analyzer import ImageAnalyzer
+    from ...image_analyzer.flyer_cache import get_flyer_cache
     from ...image_analyzer.ocr import extract_event_data_from_image, is_ocr_available
     IMAGE_ANALYZER_AVAILABLE = True
 except ImportError:
@@ -108,6 +108,8 @@ class FacebookSource(BaseSource):
                     'languages': ['eng', 'deu']
                 }
                 self.image_analyzer = ImageAnalyzer(img_config, ai_providers=self.ai_providers)
+                if self.base_path:
+                    self.image_analyzer.result_cache = get_flyer_cache(self.base_path)
             except Exception as e:
                 print(f"    ⚠ Image analyzer init failed: {e}")
         
@@ -202,19 +204,11 @@ class FacebookSource(BaseSource):
             delay: Whether to add delay before request (default True)
             
         Returns:
-            Response object or None on error
+            Response object or None on error (or if the host's circuit
+            breaker is open - then without delay or request)
         """
-        if delay and hasattr(self, 'request_delay'):
-            time.sleep(self.request_delay)
-        
-        try:
-            timeout = getattr(self, 'request_timeout', 15)
-            response = self.session.get(url, timeout=timeout)
-            response.raise_for_status()
-            return response
-        except Exception as e:
-            print(f"      Request error: {e}")
-            return None
+        return self.guarded_get(url, timeout=getattr(self, 'request_timeout', 15),
+                                delay=getattr(self, 'request_delay', 0) if delay else 0)
     
     def _scrape_events_page(self) -> List[Dict[str, Any]]:
         """Scrape events from a Facebook events page.
@@ -320,16 +314,15 @@ class FacebookSource(BaseSource):
         new_path = f"/{'/'.join(path_parts)}" if path_parts else ''
         return parsed._replace(path=new_path, params='', query='', fragment='').geturl()
     
-    def _init_post_cache(self) -> Optional[SourceCache]:
-        """Initialize persistent cache for processed posts."""
-        if not self.base_path:
+    def _init_post_cache(self) -> Optional[ItemCache]:
+        """Initialize persistent cache for processed posts (the shared item cache)."""
+        cache = self.item_cache
+        if cache is None:
             return None
         
-        cache_dir = self.base_path / "data" / "scraper_cache"
+        # Migrate the former per-page JSON cache
         source_slug = self.name.lower().replace(' ', '_')
-        cache_path = cache_dir / f"facebook_posts_{source_slug}.json"
-        cache = SourceCache(cache_path=cache_path)
-        cache.load()
+        cache.import_legacy(self.base_path / "data" / "scraper_cache" / f"facebook_posts_{source_slug}.json")
         return cache
     
     def _get_post_cache_key(self, post: Dict[str, Any]) -> Optional[str]:
@@ -355,7 +348,8 @@ class FacebookSource(BaseSource):
         """Check if post should be skipped based on cache."""
         if not post_key or not self.post_cache or self.force_scan:
             return False
-        return self.post_cache.is_processed(post_key)
+        # The key is a hash of the post content, so it is its own fingerprint
+        return self.post_cache.is_unchanged(post_key, post_key)
     
     def _process_posts(self, posts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Convert posts to events with caching."""
@@ -369,8 +363,10 @@ class FacebookSource(BaseSource):
             event = self._convert_post_to_event(post)
             if event:
                 events.append(event)
-                if self.post_cache and post_key:
-                    self.post_cache.mark_processed(post_key)
+            # Posts without an event are remembered too - OCR and AI
+            # extraction of an unchanged post would give the same result
+            if self.post_cache and post_key:
+                self.post_cache.remember(post_key, post_key)
         
         if self.post_cache:
             self.post_cache.save()
@@ -685,8 +681,10 @@ class FacebookSource(BaseSource):
     def _analyze_post_images(self, image_urls: List[str], post_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """Analyze post images for event flyer content using OCR.
         
-        Images are cached by post_id to avoid re-downloading and re-processing
-        the same images on subsequent scrapes.
+        Each image is downloaded once; its OCR result is cached by content
+        hash (see image_analyzer/flyer_cache.py), and posts seen before are
+        answered without downloading their images again. The images of a
+        post are OCR'd in parallel.
         
         Args:
             image_urls: List of image URLs
@@ -698,48 +696,23 @@ class FacebookSource(BaseSource):
         if not self.image_analyzer:
             return None
         
-        # Setup image cache directory
-        image_cache_dir = None
-        if self.base_path and post_id:
-            image_cache_dir = self.base_path / "data" / "image_cache" / "facebook"
-            image_cache_dir.mkdir(parents=True, exist_ok=True)
-        
         best_result = None
         best_confidence = 0.0
         
-        for idx, url in enumerate(image_urls[:3]):  # Limit to first 3 images
-            try:
-                # Check if we have a cached version of this image
-                cached_image_path = None
-                if image_cache_dir and post_id:
-                    cached_image_path = image_cache_dir / f"{post_id}_{idx}.jpg"
-                    if cached_image_path.exists():
-                        # Use cached image
-                        result = self.image_analyzer.analyze(str(cached_image_path))
-                        if result and result.get('ocr_confidence', 0) > best_confidence:
-                            best_confidence = result.get('ocr_confidence', 0)
-                            best_result = result
-                        continue
-                
-                # Download and analyze new image
-                result = self.image_analyzer.analyze_url(url, timeout=10)
-                if result and result.get('ocr_confidence', 0) > best_confidence:
-                    best_confidence = result.get('ocr_confidence', 0)
-                    best_result = result
-                    
-                    # Cache the image for future use
-                    if cached_image_path:
-                        try:
-                            import requests
-                            response = requests.get(url, timeout=10)
-                            response.raise_for_status()
-                            cached_image_path.write_bytes(response.content)
-                        except Exception as e:
-                            print(f"      Failed to cache image: {e}")
-                            
-            except Exception as e:
-                print(f"      OCR analysis error: {e}")
-                continue
+        image_urls = image_urls[:3]  # Limit to first 3 images
+        source_keys = [f"facebook:{post_id}:{idx}" if post_id else None for idx in range(len(image_urls))]
+        try:
+            # One download per image, OCR'd in parallel on the shared workers
+            results = self.image_analyzer.analyze_urls(
+                image_urls, source_keys, timeout=10, session=getattr(self, 'session', None))
+        except Exception as e:
+            print(f"      OCR analysis error: {e}")
+            return None
+        
+        for result in results:
+            if result and result.get('ocr_confidence', 0) > best_confidence:
+                best_confidence = result.get('ocr_confidence', 0)
+                best_result = result
         
         # Only return if confidence is above threshold
         if best_result and best_confidence >= self.min_ocr_confidence:
@@ -868,7 +841,9 @@ class FacebookSource(BaseSource):
             'scraped_at': datetime.now().isoformat(),
             'status': 'pending',
             'extraction_method': 'ocr_flyer' if image_data else 'text_analysis',
-            'ocr_confidence': image_data.get('ocr_confidence') if image_data else None
+            'ocr_confidence': image_data.get('ocr_confidence') if image_data else None,
+            # Perceptual hash of the flyer: links copies posted elsewhere
+            'flyer_hash': image_data.get('flyer_hash') if image_data else None
         }
     
     def _default_event_title(self) -> str:
@@ -45,10 +45,8 @@ from datetime import datetime, timedelta
 import re
 import json
 import hashlib
-import time
 from ...base import BaseSource, SourceOptions
 from ...date_utils import resolve_relative_date, extract_time_from_text, resolve_year_for_date
-from ...source_cache import SourceCache
 from ...ai_event_extractor import LocalEventExtractor
 
 if TYPE_CHECKING:
@@ -64,6 +62,7 @@ except ImportError:
 # Import image analyzer for OCR-based flyer extraction
 try:
     from ...image_analyzer import ImageAnalyzer
+    from ...image_analyzer.flyer_cache import get_flyer_cache
     IMAGE_ANALYZER_AVAILABLE = True
 except ImportError:
     IMAGE_ANALYZER_AVAILABLE = False
@@ -105,7 +104,6 @@ class InstagramSource(BaseSource):
         )
         self.available = SCRAPING_AVAILABLE
         options_config = source_config.get('options') or {}
-        self.post_cache = self._init_post_cache()
         
         # Initialize session with realistic headers to avoid detection
         if self.available:
@@ -137,6 +135,8 @@ class InstagramSource(BaseSource):
                     'languages': ['eng', 'deu']
                 }
                 self.image_analyzer = ImageAnalyzer(img_config, ai_providers=self.ai_providers)
+                if self.base_path:
+                    self.image_analyzer.result_cache = get_flyer_cache(self.base_path)
             except Exception as e:
                 print(f"    ⚠ Image analyzer init failed: {e}")
         
@@ -145,15 +145,6 @@ class InstagramSource(BaseSource):
         self.min_ocr_confidence = options_config.get('min_ocr_confidence', 0.3)
         self.event_extractor = LocalEventExtractor(self.ai_providers)
     
-    def _init_post_cache(self) -> Optional[SourceCache]:
-        """Initialize post cache for deduplication."""
-        if not self.base_path:
-            return None
-        try:
-            return SourceCache(self.base_path, f"instagram_{self.name}")
-        except Exception:
-            return None
-    
     def scrape(self) -> List[Dict[str, Any]]:
         """Scrape events from Instagram profile.
         
@@ -202,19 +193,11 @@ class InstagramSource(BaseSource):
             delay: Whether to add delay before request (default True)
             
         Returns:
-            Response object or None on error
+            Response object or None on error (or if the host's circuit
+            breaker is open - then without delay or request)
         """
-        if delay and hasattr(self, 'request_delay'):
-            time.sleep(self.request_delay)
-        
-        try:
-            timeout = getattr(self, 'request_timeout', 15)
-            response = self.session.get(url, timeout=timeout)
-            response.raise_for_status()
-            return response
-        except Exception as e:
-            print(f"      Request error: {e}")
-            return None
+        return self.guarded_get(url, timeout=getattr(self, 'request_timeout', 15),
+                                delay=getattr(self, 'request_delay', 0) if delay else 0)
     
     def _scrape_profile_posts(self) -> List[Dict[str, Any]]:
         """Scrape posts from Instagram profile.
@@ -471,18 +454,19 @@ class InstagramSource(BaseSource):
         events = []
         
         for post in posts:
-            # Check if already processed (cached)
-            if self.post_cache and post.get('post_id'):
-                if self.post_cache.is_cached(post['post_id']):
-                    continue
+            # Skip posts processed by an earlier run (same caption and time);
+            # image URLs are left out, Instagram re-signs them on every visit
+            post_id = post.get('post_id')
+            content = (post.get('text'), post.get('timestamp'))
+            if post_id and self.is_item_unchanged(content, key=post_id):
+                continue
             
             event = self._extract_event_from_post(post)
             if event:
                 events.append(event)
-                
-                # Cache the processed post
-                if self.post_cache and post.get('post_id'):
-                    self.post_cache.add(post['post_id'], event)
+                # Only posts that yielded an event: others are re-checked next run
+                if post_id:
+                    self.remember_item(content, key=post_id)
         
         return events
     
@@ -595,13 +579,18 @@ class InstagramSource(BaseSource):
             'scraped_at': datetime.now().isoformat(),
             'status': 'pending',
             'extraction_method': 'ocr_flyer' if image_data else 'text_analysis',
-            'ocr_confidence': image_data.get('ocr_confidence') if image_data else None
+            'ocr_confidence': image_data.get('ocr_confidence') if image_data else None,
+            # Perceptual hash of the flyer: links copies posted elsewhere
+            'flyer_hash': image_data.get('flyer_hash') if image_data else None
         }
     
     def _analyze_post_images(self, image_urls: List[str], post_id: Optional[str] = None,
                             image_metadata: Optional[List[Dict[str, str]]] = None) -> Optional[Dict[str, Any]]:
         """Analyze post images for event content using OCR.
         
+        OCR results are cached by image content hash (and post ID), so a
+        flyer is downloaded and OCR'd once across runs.
+        
         Args:
             image_urls: List of image URLs
             post_id: Optional post ID for caching
@@ -616,27 +605,25 @@ class InstagramSource(BaseSource):
         best_result = None
         best_confidence = 0.0
         
-        for idx, url in enumerate(image_urls[:3]):  # Limit to first 3 images
-            try:
-                # Get metadata for this image if available
-                metadata = None
-                if image_metadata and idx < len(image_metadata):
-                    metadata = image_metadata[idx]
-                
-                # Analyze image URL
-                result = self.image_analyzer.analyze_url(url, timeout=10)
-                if result:
-                    # Enhance with metadata
-                    if metadata:
-                        result = self._enhance_ocr_with_metadata(result, metadata)
-                    
-                    if result.get('ocr_confidence', 0) > best_confidence:
-                        best_confidence = result.get('ocr_confidence', 0)
-                        best_result = result
-                        
-            except Exception as e:
-                print(f"      OCR analysis error: {e}")
+        image_urls = image_urls[:3]  # Limit to first 3 images
+        source_keys = [f"instagram:{post_id}:{idx}" if post_id else None for idx in range(len(image_urls))]
+        try:
+            # One download per image, OCR'd in parallel on the shared workers
+            results = self.image_analyzer.analyze_urls(
+                image_urls, source_keys, timeout=10, session=getattr(self, 'session', None))
+        except Exception as e:
+            print(f"      OCR analysis error: {e}")
+            return None
+        
+        for idx, result in enumerate(results):
+            if not result:
                 continue
+            # Enhance with metadata of this image if available
+            if image_metadata and idx < len(image_metadata):
+                result = self._enhance_ocr_with_metadata(result, image_metadata[idx])
+            if result.get('ocr_confidence', 0) > best_confidence:
+                best_confidence = result.get('ocr_confidence', 0)
+                best_result = result
         
         # Only return if confidence is above threshold
         if best_result and best_confidence >= self.min_ocr_confidence:
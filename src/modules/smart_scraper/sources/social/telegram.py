@@ -6,6 +6,9 @@ This module provides Telegram integration for the smart scraper:
 
 The flyer processing uses the same image_analyzer that Instagram, Facebook,
 and other social media scrapers use, ensuring consistent event extraction.
+With a base_path, flyers share the FlyerCache of the other sources: a
+flyer already seen on Facebook or Instagram (even re-encoded) is not OCR'd
+again, and the event carries flyer_hash to be linked to the existing one.
 """
 
 from typing import Dict, Any, List, Optional, Union
@@ -16,6 +19,7 @@ import logging
 
 from ...base import BaseSource, SourceOptions
 from ...image_analyzer import ImageAnalyzer
+from ...image_analyzer.flyer_cache import get_flyer_cache
 from ...image_analyzer.ocr import extract_event_data_from_image, is_ocr_available
 
 logger = logging.getLogger(__name__)
@@ -37,18 +41,25 @@ class TelegramSource(BaseSource):
         events = source.scrape()
     """
     
-    def __init__(self, config: Dict[str, Any], options: SourceOptions):
+    def __init__(self, config: Dict[str, Any], options: SourceOptions,
+                 base_path: Optional[Path] = None,
+                 ai_providers: Optional[Dict[str, Any]] = None):
         """Initialize Telegram source.
         
         Args:
             config: Smart scraper configuration
             options: Source options
+            base_path: Repository root (enables the shared flyer cache)
+            ai_providers: Optional AI provider mapping (flyers OCR'd with low
+                          confidence are sent to AI image analysis)
         """
-        super().__init__(config, options)
+        super().__init__(config, options, base_path=base_path, ai_providers=ai_providers)
         
         # Initialize image analyzer for flyer processing
         image_config = config.get('image_analysis', {})
-        self.image_analyzer = ImageAnalyzer(image_config)
+        self.image_analyzer = ImageAnalyzer(image_config, ai_providers=self.ai_providers)
+        if self.base_path:
+            self.image_analyzer.result_cache = get_flyer_cache(self.base_path)
         
         # Cache directory for downloaded files
         self.cache_dir = Path(options.cache_path or '.cache/telegram')
@@ -63,21 +74,12 @@ class TelegramSource(BaseSource):
         Returns:
             List of scraped events
         """
-        events = []
-        
         # Check for any cached flyers that haven't been processed
-        for flyer_path in self.cache_dir.glob('flyer_*.jpg'):
-            metadata_path = flyer_path.with_suffix('.json')
-            if metadata_path.exists():
-                # Already processed, skip
-                continue
-            
-            try:
-                event = self.process_flyer(str(flyer_path))
-                if event:
-                    events.append(event)
-            except Exception as e:
-                logger.error(f"Error processing cached flyer {flyer_path}: {e}")
+        flyer_paths = [
+            flyer_path for flyer_path in sorted(self.cache_dir.glob('flyer_*.jpg'))
+            if not flyer_path.with_suffix('.json').exists()  # Already processed
+        ]
+        events = [event for event in self.process_flyers(flyer_paths) if event]
         
         if not events:
             print(f"    ℹ️ No new Telegram flyers to process")
@@ -115,11 +117,43 @@ class TelegramSource(BaseSource):
                 result = self.image_analyzer.analyze_bytes(image_source)
             else:
                 result = self.image_analyzer.analyze(str(image_source))
+            return self._build_flyer_event(result, user_id, username, caption, file_name)
+        except Exception as e:
+            logger.error(f"Error processing flyer: {e}")
+            return None
+    
+    def process_flyers(self, image_paths: List[Union[str, Path]]) -> List[Optional[Dict[str, Any]]]:
+        """Process several flyer files at once, OCR'd in parallel.
+        
+        Args:
+            image_paths: Paths to flyer images
             
-            if not result:
-                logger.warning("No event data extracted from flyer")
-                return None
-            
+        Returns:
+            Extracted event dictionary (or None) per flyer, in input order
+        """
+        if not image_paths:
+            return []
+        if not is_ocr_available():
+            logger.warning("OCR not available - cannot process flyers")
+            return [None] * len(image_paths)
+        
+        try:
+            results = self.image_analyzer.analyze_files([str(path) for path in image_paths])
+        except Exception as e:
+            logger.error(f"Error processing cached flyers: {e}")
+            return [None] * len(image_paths)
+        return [self._build_flyer_event(result, file_name=Path(path).name)
+                for path, result in zip(image_paths, results)]
+    
+    def _build_flyer_event(self, result: Optional[Dict[str, Any]], user_id: str = None,
+                           username: str = None, caption: str = None,
+                           file_name: str = None) -> Optional[Dict[str, Any]]:
+        """Convert an image analysis result into a pending event."""
+        if not result:
+            logger.warning("No event data extracted from flyer")
+            return None
+        
+        try:
             # Convert to event format
             timestamp = datetime.now().isoformat()
             event = {
@@ -139,6 +173,8 @@ class TelegramSource(BaseSource):
                 'scraped_at': timestamp,
                 'status': 'pending',
                 'category': self._categorize_event(result.get('keywords', {})),
+                # Perceptual hash of the flyer: links copies posted elsewhere
+                'flyer_hash': result.get('flyer_hash'),
                 'metadata': {
                     'telegram_user_id': user_id,
                     'telegram_username': username,
@@ -149,6 +185,7 @@ class TelegramSource(BaseSource):
                     'dates_found': result.get('dates_found', []),
                     'times_found': result.get('times_found', []),
                     'prices_found': result.get('prices_found', []),
+                    'duplicate_flyer': result.get('duplicate_flyer'),
                     'needs_review': True
                 }
             }
@@ -205,7 +242,9 @@ class TelegramSource(BaseSource):
 def process_telegram_flyer(image_path: str, 
                            user_id: str = None,
                            username: str = None,
-                           caption: str = None) -> Optional[Dict[str, Any]]:
+                           caption: str = None,
+                           base_path: Optional[Path] = None,
+                           ai_providers: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
     """Convenience function to process a Telegram flyer.
     
     This function can be used by the GitHub Actions workflow to process
@@ -216,11 +255,15 @@ def process_telegram_flyer(image_path: str,
         user_id: Telegram user ID
         username: Telegram username
         caption: Original caption
+        base_path: Repository root; flyers already seen by any source
+                   (also re-encoded copies) are then not OCR'd again
+        ai_providers: Optional AI provider mapping, e.g. a hedged
+                      ProviderRouter view for fast answers
         
     Returns:
         Extracted event dictionary or None
     """
     config = {}
     options = SourceOptions(name='telegram')
-    source = TelegramSource(config, options)
+    source = TelegramSource(config, options, base_path=base_path, ai_providers=ai_providers)
     return source.process_flyer(image_path, user_id, username, caption)
@@ -1,5 +1,14 @@
-"""Web source scrapers."""
+"""Web source scrapers.
 
-from . import rss, html, api, atom
+Modules are imported on first attribute access (see SOURCE_ENTRY_POINTS).
+"""
+
+import importlib
 
 __all__ = ['rss', 'html', 'api', 'atom']
+
+
+def __getattr__(name):
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return importlib.import_module(f'.{name}', __name__)
@@ -39,8 +39,10 @@ class APISource(BaseSource):
         
         events = []
         try:
-            response = self.session.get(self.url, timeout=10)
+            response = self.http_get(self.url, timeout=10)
             response.raise_for_status()
+            if self.is_unchanged(response):
+                return []
             data = response.json()
             
             # Handle different response structures
@@ -53,9 +55,15 @@ class APISource(BaseSource):
                 items = []
             
             for item in items:
+                # Records unchanged since the last run were already processed
+                key = str(item['id']) if isinstance(item, dict) and item.get('id') is not None else None
+                if self.is_item_unchanged(item, key=key):
+                    continue
                 event = self._parse_item(item)
                 if event and not self.filter_event(event):
                     events.append(event)
+                    # Only emitted records: filtered ones are re-checked next run
+                    self.remember_item(item, key=key)
                     
         except Exception as e:
             print(f"    API error: {str(e)}")
@@ -41,8 +41,10 @@ class HTMLSource(BaseSource):
         
         events = []
         try:
-            response = self.session.get(self.url, timeout=10)
+            response = self.http_get(self.url, timeout=10)
             response.raise_for_status()
+            if self.is_unchanged(response):
+                return []
             soup = BeautifulSoup(response.content, 'lxml')
             
             events = self._extract_events(soup)
@@ -65,9 +67,14 @@ class HTMLSource(BaseSource):
             items = soup.select(selector)
             if items:
                 for item in items[:20]:  # Limit to 20 events
+                    content = str(item)
+                    if self.is_item_unchanged(content):
+                        continue
                     event = self._parse_element(item)
                     if event and not self.filter_event(event):
                         events.append(event)
+                        # Only emitted items: filtered ones are re-checked next run
+                        self.remember_item(content)
                 break  # Stop after first matching selector
         
         return events
@@ -2,7 +2,7 @@
 
 from typing import Dict, Any, List
 from datetime import datetime, timedelta
-from ...base import BaseSource, SourceOptions
+from ...base import BaseSource, SourceOptions, REQUESTS_AVAILABLE
 
 try:
     import feedparser
@@ -32,11 +32,27 @@ class RSSSource(BaseSource):
         
         events = []
         try:
-            feed = feedparser.parse(self.url)
+            if REQUESTS_AVAILABLE:
+                # Fetch through the HTTP cache so unchanged feeds cost a 304
+                response = self.http_get(self.url, timeout=15)
+                response.raise_for_status()
+                if self.is_unchanged(response):
+                    return []
+                feed = feedparser.parse(response.content,
+                                        response_headers={'content-location': self.url})
+            else:
+                feed = feedparser.parse(self.url)
             for entry in feed.entries:
+                # Entries unchanged since the last run were already processed
+                content = [entry.get(field) for field in ('title', 'summary', 'link', 'published', 'updated')]
+                key = entry.get('id') or entry.get('link')
+                if self.is_item_unchanged(content, key=key):
+                    continue
                 event = self._parse_entry(entry)
                 if event and not self.filter_event(event):
                     events.append(event)
+                    # Only emitted entries: filtered ones are re-checked next run
+                    self.remember_item(content, key=key)
         except Exception as e:
             print(f"    RSS error: {str(e)}")
         
@@ -60,11 +60,13 @@ except ImportError:
 try:
     from .smart_scraper.sources.social.telegram import TelegramSource, process_telegram_flyer
     from .smart_scraper.image_analyzer.ocr import is_ocr_available
+    from .smart_scraper.ai_providers import build_provider_router
     LOCAL_OCR_AVAILABLE = is_ocr_available()
 except ImportError:
     LOCAL_OCR_AVAILABLE = False
     TelegramSource = None
     process_telegram_flyer = None
+    build_provider_router = None
     logger.info("Local OCR not available - will dispatch to GitHub Actions for processing")
 
 
@@ -78,7 +80,8 @@ class SimpleTelegramBot:
     """
     
     def __init__(self, bot_token: str, github_token: Optional[str] = None, 
-                 github_repo: Optional[str] = None, use_local_ocr: bool = True):
+                 github_repo: Optional[str] = None, use_local_ocr: bool = True,
+                 ai_config: Optional[Dict[str, Any]] = None):
         """
         Initialize the simple Telegram bot.
         
@@ -87,12 +90,20 @@ class SimpleTelegramBot:
             github_token: GitHub personal access token (optional, for repository_dispatch)
             github_repo: GitHub repository in format "owner/repo" (optional)
             use_local_ocr: If True, process flyers locally when OCR is available
+            ai_config: config.json 'ai' section - low-confidence flyers are then
+                       sent to AI, hedged across providers (ai.router.hedge)
         """
         self.bot_token = bot_token
         self.github_token = github_token
         self.github_repo = github_repo
         self.use_local_ocr = use_local_ocr and LOCAL_OCR_AVAILABLE
         
+        # The user waits for the reply: hedge slow providers
+        self.ai_providers = None
+        if ai_config and self.use_local_ocr and build_provider_router:
+            providers = build_provider_router(ai_config, Path.cwd())
+            self.ai_providers = providers.hedged() if hasattr(providers, 'hedged') else providers
+        
         # Set up cache directory
         self.cache_dir = Path.cwd() / ".cache" / "telegram"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
@@ -204,8 +215,12 @@ class SimpleTelegramBot:
                     str(cache_path),
                     user_id=str(user.id),
                     username=user.username or 'unknown',
-                    caption=update.message.caption or ''
+                    caption=update.message.caption or '',
+                    base_path=Path.cwd(),
+                    ai_providers=self.ai_providers
                 )
+                if hasattr(self.ai_providers, 'flush'):
+                    self.ai_providers.flush()
                 
                 if event:
                     # Save extracted event to pending
@@ -357,7 +372,7 @@ class SimpleTelegramBot:
         """
         try:
             # Try to use shared utils
-            from .utils import load_pending_events, save_pending_events
+            from .utils import load_pending_events, upsert_pending_event, export_event_snapshots
             
             base_path = Path.cwd()
             pending = load_pending_events(base_path)
@@ -365,9 +380,25 @@ class SimpleTelegramBot:
             # Add to pending list
             if 'pending_events' not in pending:
                 pending['pending_events'] = []
-            pending['pending_events'].append(event)
             
-            save_pending_events(base_path, pending)
+            # A flyer already pending (e.g. scraped from Facebook) gets the
+            # submission as an additional source instead of a second event
+            from .smart_scraper.image_analyzer.perceptual_hash import FlyerEventIndex
+            match = FlyerEventIndex(pending['pending_events']).find(event)
+            if match is not None:
+                target = match[0]
+                sources = target.setdefault('additional_sources', [])
+                if event.get('source') not in sources and event.get('source') != target.get('source'):
+                    sources.append(event.get('source'))
+                upsert_pending_event(base_path, target)
+                export_event_snapshots(base_path)
+                logger.info(f"Flyer already pending as {target.get('id')} - linked submission")
+                return
+            
+            # Single-event write; the bot keeps running, so each submission
+            # is exported to pending_events.json right away
+            upsert_pending_event(base_path, event)
+            export_event_snapshots(base_path)
             logger.info(f"Saved event {event.get('id')} to pending_events.json")
             
         except ImportError:
@@ -484,8 +515,16 @@ def main():
     if not github_repo:
         logger.warning("GITHUB_REPOSITORY not set - repository_dispatch will not work")
     
+    # AI settings from config.json (optional)
+    ai_config = None
+    try:
+        with open(Path.cwd() / 'config.json', encoding='utf-8') as f:
+            ai_config = json.load(f).get('ai')
+    except (OSError, ValueError) as e:
+        logger.info(f"No AI configuration loaded ({e}) - flyers are processed with OCR only")
+    
     # Create and run bot
-    bot = SimpleTelegramBot(bot_token, github_token, github_repo)
+    bot = SimpleTelegramBot(bot_token, github_token, github_repo, ai_config=ai_config)
     
     # Use explicit event loop creation (GitHub Actions compatible)
     loop = asyncio.new_event_loop()
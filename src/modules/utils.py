@@ -3,9 +3,13 @@
 import json
 import logging
 import os
+import threading
 from pathlib import Path
 from datetime import datetime
 
+from . import fast_json
+from .event_store import get_event_store
+
 # Configure module logger
 logger = logging.getLogger(__name__)
 
@@ -176,6 +180,84 @@ def validate_config(config: dict) -> None:
     logger.debug("Configuration validation passed")
 
 
+# Process-wide cache of parsed JSON documents.
+# Entries are keyed by absolute path and stay valid while the file's stat
+# signature (mtime_ns, size) is unchanged, so repeated loads of the same file
+# within one command (or a long-running bot/scheduler) skip the JSON parse.
+# Writes through the save_* helpers invalidate the entry explicitly.
+_document_cache = {}
+_document_cache_stats = {'hits': 0, 'misses': 0, 'invalidations': 0}
+_document_cache_lock = threading.Lock()
+
+
+def _copy_json(value):
+    """Copy a parsed JSON value (dicts, lists and immutable scalars only)"""
+    if isinstance(value, dict):
+        return {k: _copy_json(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(v) for v in value]
+    return value
+
+
+def load_json_document(path, copy=True):
+    """
+    Load a JSON file through the process-wide document cache.
+    
+    Args:
+        path: Path to the JSON file
+        copy: Return a private copy (default). Pass False for read-only use
+              to get the shared cached object without copying - callers
+              must not mutate it.
+        
+    Returns:
+        Parsed JSON document
+        
+    Raises:
+        FileNotFoundError: If the file does not exist
+        json.JSONDecodeError: If the file is not valid JSON (not cached)
+    """
+    key = os.path.abspath(path)
+    stat = os.stat(key)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    
+    with _document_cache_lock:
+        entry = _document_cache.get(key)
+        if entry is not None and entry[0] == signature:
+            _document_cache_stats['hits'] += 1
+            data = entry[1]
+        else:
+            _document_cache_stats['misses'] += 1
+            data = fast_json.read_json(key)
+            _document_cache[key] = (signature, data)
+    
+    return _copy_json(data) if copy else data
+
+
+def invalidate_document(path=None):
+    """
+    Drop a file from the document cache (or the whole cache if path is None).
+    
+    Called by the save_* helpers after writing; code that writes JSON files
+    directly should call it too.
+    """
+    with _document_cache_lock:
+        if path is None:
+            _document_cache_stats['invalidations'] += len(_document_cache)
+            _document_cache.clear()
+        elif _document_cache.pop(os.path.abspath(path), None) is not None:
+            _document_cache_stats['invalidations'] += 1
+
+
+def get_document_cache_stats():
+    """Get document cache hit/miss counters for this process"""
+    with _document_cache_lock:
+        stats = dict(_document_cache_stats)
+        stats['entries'] = len(_document_cache)
+    lookups = stats['hits'] + stats['misses']
+    stats['hit_rate'] = (stats['hits'] / lookups * 100) if lookups else 0.0
+    return stats
+
+
 def load_config(base_path):
     """
     Load config.json with environment override support.
@@ -201,10 +283,9 @@ def load_config(base_path):
     # SSG Standard: config.json at root level (like Hugo's config.toml, Jekyll's _config.yml)
     config_path = base_path / 'config.json'
     
-    # Load base configuration
+    # Load base configuration (a private copy - overrides below mutate it)
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        config = load_json_document(config_path)
     except FileNotFoundError:
         logger.error(f"Configuration file not found: {config_path}")
         raise
@@ -289,19 +370,83 @@ def load_config(base_path):
     return config
 
 
+def _write_document(path, data):
+    """Write a JSON document atomically (temp file + rename), so readers never see a partial file"""
+    tmp_path = Path(path).with_name(Path(path).name + '.tmp')
+    with open(tmp_path, 'w') as f:
+        fast_json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _refresh_fingerprints(base_path, section, records):
+    """Keep the dedup fingerprint index in step with a saved document"""
+    from .fingerprint_index import refresh_fingerprints
+    refresh_fingerprints(base_path, section, records)
+
+
+def _invalidate_fingerprints(base_path, section):
+    """Drop a section of the dedup fingerprint index after row operations (rebuilt on next lookup)"""
+    from .fingerprint_index import invalidate_fingerprints
+    invalidate_fingerprints(base_path, section)
+
+
+def export_event_snapshots(base_path):
+    """
+    Write the JSON snapshots of event store collections changed since their
+    last export (no-op without the store).
+    
+    Saves and row operations only update the store; the command line calls
+    this once when a command finishes, and the site generator before it
+    reads events.json.
+    """
+    store = get_event_store(base_path)
+    if store is None:
+        return []
+    paths = store.export_dirty()
+    for path in paths:
+        invalidate_document(path)
+    if paths:
+        from .fingerprint_index import restamp_fingerprints, SECTION_FILES
+        restamp_fingerprints(base_path, [section for section, name in SECTION_FILES.items()
+                                         if any(path.name == name for path in paths)])
+    return paths
+
+
 def load_events(base_path):
-    """Load published events from events.json"""
+    """
+    Load published events from events.json.
+    
+    If the SQLite event store is enabled (see event_store.py), events are read
+    from the store, which re-imports events.json first if it changed on disk.
+    """
+    store = get_event_store(base_path)
+    if store is not None:
+        events_data = store.load_document('events')
+        if events_data is not None:
+            return events_data
+    
     events_path = base_path / 'assets' / 'json' / 'events.json'
-    with open(events_path, 'r') as f:
-        return json.load(f)
+    return load_json_document(events_path)
 
 
 def save_events(base_path, events_data):
-    """Save published events to events.json"""
+    """
+    Save published events to events.json.
+    
+    With the SQLite event store enabled only changed rows are written to the
+    store; events.json is exported by export_event_snapshots().
+    """
     events_path = base_path / 'assets' / 'json' / 'events.json'
     events_data['last_updated'] = datetime.now().isoformat()
-    with open(events_path, 'w') as f:
-        json.dump(events_data, f, indent=2)
+    
+    store = get_event_store(base_path)
+    if store is not None:
+        store.save_document('events', events_data)
+        invalidate_document(events_path)
+    else:
+        _write_document(events_path, events_data)
+        invalidate_document(events_path)
+    _refresh_fingerprints(base_path, 'published', events_data.get('events', []))
 
 
 def update_pending_count_in_events(base_path):
@@ -312,24 +457,51 @@ def update_pending_count_in_events(base_path):
     Note: This does NOT update the last_updated timestamp since it's only metadata,
     not a change to the actual events data.
     """
-    pending_data = load_pending_events(base_path)
+    store = get_event_store(base_path)
+    if store is not None:
+        # Indexed count and a single envelope update - no event list parsing.
+        # The event list is unchanged, so the fingerprint index stays valid.
+        store.sync_from_snapshot('pending')
+        store.sync_from_snapshot('events')
+        store.set_meta('events', 'pending_count', store.count('pending'))
+        return
+    
+    # Both files were usually just loaded by the caller - served from the
+    # document cache. Pending is only counted, so no copy is needed.
+    pending_path = base_path / 'assets' / 'json' / 'pending_events.json'
+    try:
+        pending_count = len(load_json_document(pending_path, copy=False).get('pending_events', []))
+    except (FileNotFoundError, json.JSONDecodeError):
+        pending_count = len(load_pending_events(base_path).get('pending_events', []))
     events_data = load_events(base_path)
     
     # Add or update pending_count field
-    events_data['pending_count'] = len(pending_data.get('pending_events', []))
+    if events_data.get('pending_count') == pending_count:
+        return  # Unchanged - skip the rewrite
+    events_data['pending_count'] = pending_count
     
     # Save back to events.json WITHOUT updating timestamp
     events_path = base_path / 'assets' / 'json' / 'events.json'
-    with open(events_path, 'w') as f:
-        json.dump(events_data, f, indent=2)
+    _write_document(events_path, events_data)
+    invalidate_document(events_path)
+    _refresh_fingerprints(base_path, 'published', events_data.get('events', []))
 
 
 def load_pending_events(base_path):
-    """Load pending events from pending_events.json"""
+    """Load pending events from pending_events.json (or the event store, if enabled)"""
     pending_path = base_path / 'assets' / 'json' / 'pending_events.json'
+    
+    store = get_event_store(base_path)
+    if store is not None:
+        try:
+            pending_data = store.load_document('pending')
+        except json.JSONDecodeError:
+            pending_data = None  # Malformed snapshot - handled below
+        if pending_data is not None:
+            return pending_data
+    
     try:
-        with open(pending_path, 'r') as f:
-            return json.load(f)
+        return load_json_document(pending_path)
     except FileNotFoundError:
         # Create empty pending events file if it doesn't exist
         pending_data = {'pending_events': [], 'last_scraped': None}
@@ -361,16 +533,124 @@ def save_pending_events(base_path, pending_data):
     # This avoids redundant migration on every save operation
     
     pending_data['last_scraped'] = datetime.now().isoformat()
-    with open(pending_path, 'w') as f:
-        json.dump(pending_data, f, indent=2)
+    
+    store = get_event_store(base_path)
+    if store is not None:
+        store.save_document('pending', pending_data)
+        invalidate_document(pending_path)
+    else:
+        _write_document(pending_path, pending_data)
+        invalidate_document(pending_path)
+    _refresh_fingerprints(base_path, 'pending', pending_data.get('pending_events', []))
+
+
+def get_pending_event(base_path, event_id):
+    """Get a pending event by id (indexed lookup with the event store), or None"""
+    store = get_event_store(base_path)
+    if store is not None:
+        store.sync_from_snapshot('pending')
+        return store.get_event('pending', event_id)
+    
+    for event in load_pending_events(base_path).get('pending_events', []):
+        if event.get('id') == event_id:
+            return event
+    return None
+
+
+def upsert_pending_event(base_path, event):
+    """
+    Insert a pending event, or replace the pending event with the same id.
+    
+    With the event store this is a single row write; otherwise
+    pending_events.json is rewritten via save_pending_events().
+    """
+    store = get_event_store(base_path)
+    if store is not None:
+        store.sync_from_snapshot('pending')
+        with store.transaction():
+            store.upsert_event('pending', event)
+            store.touch('pending', 'last_scraped')
+        _invalidate_fingerprints(base_path, 'pending')
+        return
+    
+    pending_data = load_pending_events(base_path)
+    pending_events = pending_data.setdefault('pending_events', [])
+    for i, existing in enumerate(pending_events):
+        if existing.get('id') == event.get('id'):
+            pending_events[i] = event
+            break
+    else:
+        pending_events.append(event)
+    save_pending_events(base_path, pending_data)
+
+
+def remove_pending_events(base_path, event_ids):
+    """
+    Remove pending events by id.
+    
+    Returns:
+        Number of removed events
+    """
+    event_ids = set(event_ids)
+    if not event_ids:
+        return 0
+    
+    store = get_event_store(base_path)
+    if store is not None:
+        store.sync_from_snapshot('pending')
+        removed = store.delete_events('pending', sorted(event_ids))
+        if removed:
+            _invalidate_fingerprints(base_path, 'pending')
+        return removed
+    
+    pending_data = load_pending_events(base_path)
+    pending_events = pending_data.get('pending_events', [])
+    remaining = [event for event in pending_events if event.get('id') not in event_ids]
+    removed = len(pending_events) - len(remaining)
+    if removed:
+        pending_data['pending_events'] = remaining
+        save_pending_events(base_path, pending_data)
+    return removed
+
+
+def add_published_events(base_path, events, pending_count=None):
+    """
+    Append events to the published events (events.json).
+    
+    Args:
+        base_path: Repository root
+        events: Events to publish (an event with an existing id replaces it)
+        pending_count: Also set pending_count in the same write, if given
+    """
+    store = get_event_store(base_path)
+    if store is not None:
+        store.sync_from_snapshot('events')
+        with store.transaction():
+            store.upsert_events('events', events)
+            store.touch('events')
+            if pending_count is not None:
+                store.set_meta('events', 'pending_count', pending_count)
+        _invalidate_fingerprints(base_path, 'published')
+        return
+    
+    events_data = load_events(base_path)
+    published = events_data.setdefault('events', [])
+    positions = {event.get('id'): i for i, event in enumerate(published)}
+    for event in events:
+        if event.get('id') in positions:
+            published[positions[event.get('id')]] = event
+        else:
+            published.append(event)
+    if pending_count is not None:
+        events_data['pending_count'] = pending_count
+    save_events(base_path, events_data)
 
 
 def load_rejected_events(base_path):
     """Load rejected events from rejected_events.json"""
     rejected_path = base_path / 'assets' / 'json' / 'rejected_events.json'
     try:
-        with open(rejected_path, 'r') as f:
-            return json.load(f)
+        return load_json_document(rejected_path)
     except FileNotFoundError:
         # Create empty rejected events file if it doesn't exist
         rejected_data = {'rejected_events': [], 'last_updated': datetime.now().isoformat()}
@@ -382,8 +662,9 @@ def save_rejected_events(base_path, rejected_data):
     """Save rejected events to rejected_events.json"""
     rejected_path = base_path / 'assets' / 'json' / 'rejected_events.json'
     rejected_data['last_updated'] = datetime.now().isoformat()
-    with open(rejected_path, 'w') as f:
-        json.dump(rejected_data, f, indent=2)
+    _write_document(rejected_path, rejected_data)
+    invalidate_document(rejected_path)
+    _refresh_fingerprints(base_path, 'rejected', rejected_data.get('rejected_events', []))
 
 
 def is_event_rejected(rejected_events, event_title, event_source):
@@ -541,8 +822,7 @@ def archive_old_events(base_path):
     if archived_events:
         archive_path = base_path / 'public' / 'archived_events.json'
         try:
-            with open(archive_path, 'r') as f:
-                archive_data = json.load(f)
+            archive_data = load_json_document(archive_path)
         except FileNotFoundError:
             archive_data = {'archived_events': []}
         
@@ -550,7 +830,8 @@ def archive_old_events(base_path):
         archive_data['last_updated'] = now.isoformat()
         
         with open(archive_path, 'w') as f:
-            json.dump(archive_data, f, indent=2)
+            fast_json.dump(archive_data, f, indent=2)
+        invalidate_document(archive_path)
     
     return archived_count
 
@@ -597,40 +878,21 @@ def filter_events_by_time(events, config):
 
 def backup_published_event(base_path, event):
     """
-    Backup a single published event to assets/json/old/ folder.
-    Each event is saved as a separate JSON file named by event ID.
+    Backup a single published event to the packed archive in assets/json/old/.
+    
+    Backups are appended to JSON-lines segment files with a compact id/offset
+    index (see backup_archive.py) instead of one JSON file per event.
     
     Args:
         base_path: Root path of the repository
         event: Event dictionary to backup
         
     Returns:
-        Path to the backup file created
+        Path to the segment file the backup was appended to
     """
-    import os
-    
-    # Create old directory structure
-    old_dir = base_path / 'assets' / 'json' / 'old'
-    old_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Generate filename from event ID and timestamp
-    event_id = event.get('id', 'unknown')
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    filename = f"{event_id}_{timestamp}.json"
+    from .backup_archive import get_backup_archive
     
-    backup_path = old_dir / filename
-    
-    # Add backup metadata
-    backup_data = {
-        'backed_up_at': datetime.now().isoformat(),
-        'event': event
-    }
-    
-    # Save backup
-    with open(backup_path, 'w') as f:
-        json.dump(backup_data, f, indent=2)
-    
-    return backup_path
+    return get_backup_archive(base_path).append(event)
 
 
 # Cache for historical events (in-memory, per process)
@@ -641,8 +903,14 @@ _historical_events_cache = None
 
 def load_historical_events(base_path):
     """
-    Load all historical events from assets/json/old/ folder.
-    Returns a list of event dictionaries from all backup files.
+    Load all historical events from the backup archive in assets/json/old/.
+    Returns a list of event dictionaries from all packed segments and any
+    legacy per-event backup files that have not been packed yet.
+    
+    NOTE: Deduplication does not need this - use
+    backup_archive.get_backup_archive(base_path).contains_key(title, start_time),
+    which only reads the memory-mapped index. This full load is for features
+    that need event bodies (e.g. similar-event hints in the editor).
     
     OPTIMIZATION: Uses in-memory caching to avoid re-reading disk on every call.
     Historical events don't change during a single process execution, so we can
@@ -652,45 +920,22 @@ def load_historical_events(base_path):
     In multi-threaded environments, wrap cache access with threading.Lock().
     Current usage (CLI/TUI) is single-threaded, so this is safe.
     
-    This is used by the scraper to check against historical data
-    and prevent re-scraping events that were already published.
-    
     Args:
         base_path: Root path of the repository
         
     Returns:
         List of event dictionaries
     """
+    from .backup_archive import get_backup_archive
+    
     global _historical_events_cache
     
     # Return cached data if available
     if _historical_events_cache is not None:
         return _historical_events_cache
     
-    old_dir = base_path / 'assets' / 'json' / 'old'
-    historical_events = []
-    
-    if not old_dir.exists():
-        _historical_events_cache = historical_events
-        return historical_events
-    
-    # Load all backup files
-    for backup_file in old_dir.glob('*.json'):
-        try:
-            with open(backup_file, 'r') as f:
-                backup_data = json.load(f)
-                # Extract the event from backup metadata
-                event = backup_data.get('event')
-                if event:
-                    historical_events.append(event)
-        except (json.JSONDecodeError, IOError) as e:
-            # Skip corrupted or unreadable backup files
-            logger.warning(f"Could not load backup file {backup_file}: {e}")
-            continue
-    
-    # Cache the results
-    _historical_events_cache = historical_events
-    return historical_events
+    _historical_events_cache = list(get_backup_archive(base_path).iter_events())
+    return _historical_events_cache
 
 
 def update_events_in_html(base_path):
@@ -724,7 +969,7 @@ def update_events_in_html(base_path):
         
         # Convert events to JSON string with proper formatting
         # Use ensure_ascii=False to handle unicode characters properly
-        events_json = json.dumps(events, indent=2, ensure_ascii=False)
+        events_json = fast_json.dumps(events, indent=2, ensure_ascii=False)
         
         # Replace EVENTS array using regex
         # Match: const EVENTS = [...]; (with any content between brackets)
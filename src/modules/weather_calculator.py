@@ -7,12 +7,13 @@ Updated twice daily (12-hour cache).
 """
 
 import os
-import json
 import requests
 from datetime import datetime, timedelta
 import logging
 import time
 
+from . import fast_json
+
 logger = logging.getLogger(__name__)
 
 
@@ -159,7 +160,7 @@ class WeatherCalculator:
                 return None
             
             with open(self.cache_file, 'r', encoding='utf-8') as f:
-                cache = json.load(f)
+                cache = fast_json.load(f)
             
             # Find matching entry
             key = self._cache_key(location_name, lat, lon)
@@ -185,7 +186,7 @@ class WeatherCalculator:
             cache = {}
             if os.path.exists(self.cache_file):
                 with open(self.cache_file, 'r', encoding='utf-8') as f:
-                    cache = json.load(f)
+                    cache = fast_json.load(f)
             
             # Add/update entry
             key = self._cache_key(location_name, lat, lon)
@@ -197,7 +198,7 @@ class WeatherCalculator:
             # Save
             os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
             with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache, f, indent=2, ensure_ascii=False)
+                fast_json.dump(cache, f, indent=2, ensure_ascii=False)
         except Exception as e:
             logger.error(f"Cache save failed: {e}")
     
@@ -6,7 +6,6 @@ Extracts dresscode, validates against whitelist, caches for 1 hour.
 """
 
 import os
-import json
 import requests
 from urllib.parse import quote
 from datetime import datetime, timedelta
@@ -14,6 +13,8 @@ from bs4 import BeautifulSoup
 import logging
 import time
 
+from . import fast_json
+
 logger = logging.getLogger(__name__)
 
 
@@ -173,7 +174,7 @@ class WeatherScraper:
         """Load accepted dresscodes list."""
         try:
             with open(self.dresscodes_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+                data = fast_json.load(f)
                 return [dc.lower() for dc in data.get('accepted_dresscodes', [])]
         except:
             return []
@@ -194,7 +195,7 @@ class WeatherScraper:
                 return None
             
             with open(self.cache_file, 'r', encoding='utf-8') as f:
-                cache = json.load(f)
+                cache = fast_json.load(f)
             
             # Find matching entry
             key = self._cache_key(location_name, lat, lon)
@@ -219,7 +220,7 @@ class WeatherScraper:
             cache = {}
             if os.path.exists(self.cache_file):
                 with open(self.cache_file, 'r', encoding='utf-8') as f:
-                    cache = json.load(f)
+                    cache = fast_json.load(f)
             
             # Add/update entry
             key = self._cache_key(location_name, lat, lon)
@@ -231,7 +232,7 @@ class WeatherScraper:
             # Save
             os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
             with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache, f, indent=2, ensure_ascii=False)
+                fast_json.dump(cache, f, indent=2, ensure_ascii=False)
         except Exception as e:
             logger.error(f"Cache save failed: {e}")
     
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Keyword Categorizer Benchmark
+
+Measures keyword categorization throughput on the pending queue
+(assets/json/pending_events.json): the compiled single-pass matcher
+(modules/keyword_matcher.py) against the per-keyword substring scan it
+replaced, for both keyword maps (AICategorizer fallback and
+EventSchema._infer_category). Also reports how many events get a different
+category, since the compiled matcher only matches keywords at word starts.
+
+Usage:
+    python3 src/tools/benchmark_categorizer.py              # pending queue
+    python3 src/tools/benchmark_categorizer.py --repeat 10 --rounds 10
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from modules.ai_categorizer import KEYWORD_CATEGORY_MAP, KEYWORD_MATCHER
+from modules.event_schema import FALLBACK_KEYWORD_MAP, FALLBACK_KEYWORD_MATCHER
+from modules.utils import load_pending_events
+
+
+def scan_scores(text):
+    """The replaced AICategorizer._score_categories loop"""
+    scores = []
+    for category, keywords in KEYWORD_CATEGORY_MAP.items():
+        match_count = sum(1 for keyword in keywords if keyword in text)
+        if match_count > 0:
+            scores.append((category, match_count / len(keywords)))
+    scores.sort(key=lambda x: x[1], reverse=True)
+    return scores[0][0] if scores else 'default'
+
+
+def compiled_scores(text):
+    counts = KEYWORD_MATCHER.count(text)
+    best = max(counts.items(), key=lambda item: (item[1] / len(KEYWORD_CATEGORY_MAP[item[0]]),
+                                                   -list(KEYWORD_CATEGORY_MAP).index(item[0])),
+               default=None)
+    return best[0] if best else 'default'
+
+
+def scan_first(text):
+    """The replaced EventSchema._infer_category loop"""
+    for category, keywords in FALLBACK_KEYWORD_MAP.items():
+        if any(keyword in text for keyword in keywords):
+            return category
+    return 'default'
+
+
+def compiled_first(text):
+    return FALLBACK_KEYWORD_MATCHER.first_match(text) or 'default'
+
+
+def time_it(func, texts, rounds):
+    """Best wall-clock time of `rounds` passes over texts in milliseconds"""
+    best = float('inf')
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for text in texts:
+            func(text)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the keyword categorizers')
+    parser.add_argument('--repeat', type=int, default=1, help='Repeat the pending queue N times (default: 1)')
+    parser.add_argument('--rounds', type=int, default=5, help='Timing rounds per matcher (default: 5)')
+    args = parser.parse_args()
+
+    base_path = Path(__file__).parent.parent.parent
+    events = load_pending_events(base_path).get('pending_events', [])
+    if not events:
+        print("❌ Pending queue is empty - nothing to benchmark")
+        return 1
+    texts = [f"{event.get('title', '')} {event.get('description', '')}".lower()
+             for event in events] * args.repeat
+
+    # Compile outside the timed runs, as in a scrape
+    KEYWORD_MATCHER.count('')
+    FALLBACK_KEYWORD_MATCHER.count('')
+
+    print("=" * 60)
+    print(f"⏱️  Keyword Categorizer Benchmark ({len(texts):,} events, "
+          f"{sum(map(len, texts)) / 1024:.0f} KB of text)")
+    print("=" * 60)
+    header = f"{'Keyword map':22s}{'substring scan':>16s}{'compiled':>22s}{'changed':>10s}"
+    print(header)
+    print("-" * len(header))
+    for label, scan, compiled in (('AICategorizer', scan_scores, compiled_scores),
+                                  ('EventSchema fallback', scan_first, compiled_first)):
+        scan_ms = time_it(scan, texts, args.rounds)
+        compiled_ms = time_it(compiled, texts, args.rounds)
+        changed = sum(1 for text in texts if scan(text) != compiled(text))
+        rate = len(texts) / (compiled_ms / 1000) if compiled_ms else float('inf')
+        print(f"{label:22s}{scan_ms:>13.1f} ms"
+              f"{f'{compiled_ms:.1f} ms ({scan_ms / compiled_ms:.1f}x)':>22s}{changed:>10,d}")
+        print(f"{'':22s}{'':>16s}{f'{rate:,.0f} events/s':>22s}")
+    print("=" * 60)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
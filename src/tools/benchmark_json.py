@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+JSON Backend Benchmark
+
+Compares the stdlib json module with the fast backend (orjson/ujson) used by
+modules/fast_json.py on a synthetic events file, for the operations the
+project actually performs: reading events.json, writing it with indent=2
+(ensure_ascii escapes included) and embedding events compactly in HTML.
+
+Usage:
+    python3 src/tools/benchmark_json.py              # 10,000 events
+    python3 src/tools/benchmark_json.py --events 50000 --rounds 10
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from modules import fast_json
+
+
+def make_events(count):
+    """Build a realistic events document (German text, nested location)"""
+    events = []
+    for i in range(count):
+        events.append({
+            'id': f'bench_{i:06d}',
+            'title': f'Konzert im Kulturzentrum Nr. {i} – Öffnung für alle',
+            'description': 'Gemütlicher Abend mit Live-Musik, Getränken und Überraschungen. ' * 3,
+            'teaser': 'Live-Musik & Grüße aus Hof',
+            'location': {
+                'name': 'Freiheitshalle Hof',
+                'address': 'Kulmbacher Straße 4, 95030 Hof',
+                'lat': 50.3167 + (i % 100) / 10000,
+                'lon': 11.9167 - (i % 100) / 10000,
+            },
+            'start_time': f'2026-{i % 12 + 1:02d}-{i % 28 + 1:02d}T19:30:00',
+            'end_time': None,
+            'category': 'music',
+            'source': 'https://www.example.org/events',
+            'status': 'published',
+            'tags': ['musik', 'live', 'kultur'],
+            'price': 12.5,
+        })
+    return {'events': events, 'last_updated': '2026-01-01T00:00:00', 'pending_count': 0}
+
+
+def time_it(func, rounds):
+    """Best wall-clock time of `rounds` runs in milliseconds"""
+    best = float('inf')
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the JSON backends')
+    parser.add_argument('--events', type=int, default=10000, help='Number of events (default: 10000)')
+    parser.add_argument('--rounds', type=int, default=5, help='Timing rounds per operation (default: 5)')
+    args = parser.parse_args()
+
+    document = make_events(args.events)
+    file_text = fast_json.dumps(document, indent=2)
+    file_bytes = file_text.encode('utf-8')
+
+    backends = ['json'] + [name for name, ok in (('orjson', fast_json.ORJSON_AVAILABLE),
+                                                ('ujson', fast_json.UJSON_AVAILABLE)) if ok]
+    operations = [
+        ('read events.json', lambda: fast_json.loads(file_bytes)),
+        ('write indent=2', lambda: fast_json.dumps(document, indent=2)),
+        ('embed compact', lambda: fast_json.dumps(document, ensure_ascii=False, separators=fast_json.COMPACT)),
+    ]
+
+    print("=" * 60)
+    print(f"⏱️  JSON Backend Benchmark ({args.events:,} events, {len(file_bytes) / 1024 / 1024:.1f} MB)")
+    print("=" * 60)
+
+    previous = fast_json.get_backend()
+    results = {}
+    try:
+        for backend in backends:
+            fast_json.set_backend(backend)
+            results[backend] = [time_it(func, args.rounds) for _, func in operations]
+            # The fast backends must produce exactly what the stdlib does
+            assert fast_json.dumps(document, indent=2) == file_text, f"{backend}: output differs"
+    finally:
+        fast_json.set_backend(previous)
+
+    header = f"{'Operation':20s}" + ''.join(f"{b:>18s}" for b in backends)
+    print(header)
+    print("-" * len(header))
+    for index, (label, _) in enumerate(operations):
+        baseline = results['json'][index]
+        cells = []
+        for backend in backends:
+            ms = results[backend][index]
+            cell = f"{ms:.1f} ms" if backend == 'json' else f"{ms:.1f} ms ({baseline / ms:.1f}x)"
+            cells.append(f"{cell:>18s}")
+        print(f"{label:20s}" + ''.join(cells))
+    print("=" * 60)
+    print(f"Active backend: {previous}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Flyer OCR Benchmark
+
+Measures OCR throughput on a batch of flyers: one pytesseract call after
+the other (the old per-image path, which starts tesseract and loads the
+language models for every image) against the shared OCRService worker pool
+(modules/smart_scraper/image_analyzer/ocr_service.py) at 1..N workers.
+
+With --preprocessing it instead compares the single-decode pipeline
+(modules/smart_scraper/image_analyzer/preprocess.py: decode once, shrink
+to OCR resolution, grayscale, contrast, optional deskew/binarization)
+with the previous path (metadata and OCR each opening the image, full
+resolution to Tesseract) on one core: time per flyer and accuracy
+(character similarity to the known text).
+
+Uses the images in a directory if given (accuracy needs a <name>.txt
+with the flyer text next to each image), otherwise renders synthetic
+phone-photo flyers (4032x3024 JPEG, slightly rotated, event title, date,
+time, price) with Pillow.
+
+Requires Pillow and Tesseract (eng+deu); tesserocr makes the workers keep
+the models loaded between images.
+
+Usage:
+    python3 src/tools/benchmark_ocr.py                      # 100 synthetic flyers
+    python3 src/tools/benchmark_ocr.py --images .cache/telegram --workers 8
+    python3 src/tools/benchmark_ocr.py --preprocessing --count 20
+    python3 src/tools/benchmark_ocr.py --preprocessing --images path/to/flyers
+"""
+
+import argparse
+import difflib
+import os
+import random
+import sys
+import time
+from io import BytesIO
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from modules.smart_scraper.image_analyzer.ocr import is_ocr_available
+from modules.smart_scraper.image_analyzer.ocr_service import OCRService, _ocr_image, default_workers
+from modules.smart_scraper.image_analyzer.preprocess import preprocessing_settings
+
+
+def _font(size):
+    from PIL import ImageFont
+    try:
+        return ImageFont.load_default(size=size)  # Pillow >= 10.1
+    except TypeError:
+        for name in ('DejaVuSans.ttf', 'Arial.ttf'):
+            try:
+                return ImageFont.truetype(name, size)
+            except OSError:
+                pass
+        return ImageFont.load_default()
+
+
+def synthetic_flyers(count):
+    """(JPEG bytes, text) of phone-photo sized flyers"""
+    from PIL import Image, ImageDraw
+
+    rng = random.Random(42)
+    font = _font(140)
+    flyers = []
+    for i in range(count):
+        img = Image.new('RGB', (4032, 3024), (235, 230, 220))
+        draw = ImageDraw.Draw(img)
+        lines = [f'Konzert Nr. {i}', f'{i % 28 + 1:02d}.05.2026', f'Einlass {18 + i % 4}:00 Uhr',
+                 f'Eintritt {5 + i % 10} EUR', 'Freiheitshalle Hof']
+        for row, line in enumerate(lines):
+            draw.text((300, 400 + row * 400), line, fill=(40, 40, 60), font=font)
+        img = img.rotate(rng.uniform(-3, 3), resample=Image.BICUBIC, fillcolor=(235, 230, 220))
+        buffer = BytesIO()
+        img.save(buffer, format='JPEG', quality=85)
+        flyers.append((buffer.getvalue(), '\n'.join(lines)))
+    return flyers
+
+
+def directory_flyers(path, count):
+    """(bytes, text or None) of the images in a directory"""
+    files = sorted(p for p in Path(path).iterdir() if p.suffix.lower() in ('.jpg', '.jpeg', '.png'))
+    return [(p.read_bytes(), p.with_suffix('.txt').read_text(encoding='utf-8')
+             if p.with_suffix('.txt').exists() else None) for p in files[:count]]
+
+
+def accuracy(expected, text):
+    """Character similarity (0-1) ignoring whitespace and case"""
+    normalize = lambda value: ' '.join((value or '').split()).lower()
+    return difflib.SequenceMatcher(None, normalize(expected), normalize(text)).ratio()
+
+
+def legacy_ocr(image_data, lang):
+    """The previous path: metadata and OCR each decode, full resolution"""
+    import pytesseract
+    from PIL import Image
+
+    with Image.open(BytesIO(image_data)) as img:
+        _ = img.width, img.height, img.format
+    img = Image.open(BytesIO(image_data))
+    return pytesseract.image_to_string(img, lang=lang).strip()
+
+
+def compare_preprocessing(flyers, lang):
+    """Time and accuracy of the old path and the pipeline variants on one core"""
+    variants = [
+        ('previous (no preprocessing)', lambda data: legacy_ocr(data, lang)),
+        ('pipeline (default)', lambda data: _ocr_image(data, lang, preprocessing_settings())['text']),
+        ('pipeline + deskew', lambda data: _ocr_image(
+            data, lang, preprocessing_settings({'deskew': True}))['text']),
+        ('pipeline + deskew + binarize', lambda data: _ocr_image(
+            data, lang, preprocessing_settings({'deskew': True, 'binarize': True}))['text']),
+    ]
+    scored = [text for _, text in flyers if text]
+    header = f"{'Path':32s}{'ms/flyer':>10s}{'accuracy':>11s}"
+    print(header)
+    print("-" * len(header))
+    for label, run in variants:
+        start = time.perf_counter()
+        texts = [run(data) for data, _ in flyers]
+        elapsed = (time.perf_counter() - start) / len(flyers) * 1000
+        score = (sum(accuracy(expected, text) for (_, expected), text in zip(flyers, texts) if expected)
+                 / len(scored) * 100) if scored else None
+        print(f"{label:32s}{elapsed:>10.0f}{f'{score:.1f} %' if score is not None else 'n/a':>11s}")
+
+
+def sequential(images, lang):
+    """The old path: one pytesseract call per image"""
+    import pytesseract
+    from PIL import Image
+
+    for image_data in images:
+        pytesseract.image_to_string(Image.open(BytesIO(image_data)), lang=lang)
+
+
+def pooled(images, languages, workers):
+    """Batch on a fresh pool; includes starting the workers"""
+    service = OCRService(languages, workers)
+    try:
+        for future in service.submit_batch(images):
+            future.result()
+        return service.get_status()['mode']
+    finally:
+        service.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark flyer OCR')
+    parser.add_argument('--count', type=int, default=100, help='Number of flyers (default: 100)')
+    parser.add_argument('--images', help='Directory with flyer images (default: synthetic flyers)')
+    parser.add_argument('--workers', type=int, default=max(default_workers(), os.cpu_count() or 1),
+                        help='Highest worker count to measure (default: CPU count)')
+    parser.add_argument('--preprocessing', action='store_true',
+                        help='Compare the preprocessing pipeline with the previous path instead')
+    args = parser.parse_args()
+
+    if not is_ocr_available():
+        print("❌ OCR not available - install Pillow, pytesseract and Tesseract (eng+deu)")
+        return 1
+    flyers = directory_flyers(args.images, args.count) if args.images else synthetic_flyers(args.count)
+    if not flyers:
+        print(f"❌ No images in {args.images}")
+        return 1
+    images = [data for data, _ in flyers]
+    languages = ['eng', 'deu']
+
+    print("=" * 60)
+    print(f"⏱️  Flyer OCR Benchmark ({len(images)} flyers, {sum(map(len, images)) / 1024:.0f} KB)")
+    print("=" * 60)
+    if args.preprocessing:
+        compare_preprocessing(flyers, '+'.join(languages))
+        print("=" * 60)
+        return 0
+    start = time.perf_counter()
+    sequential(images, '+'.join(languages))
+    baseline = time.perf_counter() - start
+    print(f"{'pytesseract, one by one':28s}{baseline:>9.2f} s{len(images) / baseline:>12.1f} img/s")
+    for workers in range(1, args.workers + 1):
+        start = time.perf_counter()
+        mode = pooled(images, languages, workers)
+        elapsed = time.perf_counter() - start
+        label = f"OCRService, {workers} {mode}"
+        print(f"{label:28s}{elapsed:>9.2f} s{len(images) / elapsed:>12.1f} img/s"
+              f"  ({baseline / elapsed:.1f}x)")
+    print("=" * 60)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+SmartScraper Start-up Benchmark
+
+Measures what creating a SmartScraper costs before the first request:
+import time, construction time and how many source modules and AI
+providers are loaded. Source classes resolve lazily from
+SOURCE_ENTRY_POINTS (modules/smart_scraper/base.py) and AI providers are
+LazyProvider stand-ins (modules/smart_scraper/ai_providers/__init__.py);
+the "eager" row loads everything up front as SmartScraper used to.
+
+Every measurement runs in a fresh interpreter (imported modules would
+otherwise be cached); the median of --runs is reported.
+
+Usage:
+    python3 src/tools/benchmark_startup.py                  # config.json, 5 runs
+    python3 src/tools/benchmark_startup.py --source "Frankenpost" --runs 10
+    python3 src/tools/benchmark_startup.py --importtime     # Slowest imports of the eager start
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).parent.parent
+ROOT = SRC.parent
+
+# Runs in the child interpreter: argv = mode, config path, source name, base path
+CHILD = r'''
+import json, sys, time
+mode, config_path, source_name, base_path = sys.argv[1:5]
+start = time.perf_counter()
+from modules.smart_scraper import SmartScraper
+imported = time.perf_counter()
+config = json.load(open(config_path, encoding='utf-8'))
+scraper = SmartScraper(config, base_path)
+providers = getattr(scraper.ai_providers, 'providers', scraper.ai_providers)
+if mode == 'eager':
+    scraper.registry.load_all()
+    for provider in providers.values():
+        provider.is_available()
+elif mode == 'source':
+    for source in config.get('scraping', {}).get('sources', []):
+        if source.get('name', '').lower() == source_name.lower():
+            scraper.registry.get_handler(scraper.resolve_source_type(source))
+done = time.perf_counter()
+from modules.smart_scraper.base import SOURCE_ENTRY_POINTS
+source_modules = {'modules.smart_scraper' + target.split(':')[0] for target in SOURCE_ENTRY_POINTS.values()}
+print(json.dumps({
+    'import_ms': (imported - start) * 1000,
+    'init_ms': (done - imported) * 1000,
+    'source_modules': sorted(source_modules & set(sys.modules)),
+    'providers_loaded': sum(1 for provider in providers.values() if getattr(provider, 'loaded', True)),
+    'providers': len(providers),
+}))
+'''
+
+
+def measure(mode, config_path, source_name, runs):
+    """Median timings of `runs` fresh interpreters"""
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, '-c', CHILD, mode, str(config_path), source_name or '', str(ROOT)],
+            cwd=SRC, capture_output=True, text=True, check=True,
+        ).stdout
+        samples.append(json.loads(output.strip().splitlines()[-1]))
+    result = dict(samples[-1])
+    for key in ('import_ms', 'init_ms'):
+        result[key] = statistics.median(sample[key] for sample in samples)
+    return result
+
+
+def slowest_imports(config_path, count=15):
+    """Cumulative times of the slowest imports during an eager start (python -X importtime)"""
+    stderr = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', CHILD, 'eager', str(config_path), '', str(ROOT)],
+        cwd=SRC, capture_output=True, text=True, check=True,
+    ).stderr
+    rows = []
+    for line in stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative_us, name = line[len('import time:'):].split('|')
+        rows.append((int(cumulative_us), name.strip()))
+    return sorted(rows, reverse=True)[:count]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark SmartScraper start-up')
+    parser.add_argument('--config', default=str(ROOT / 'config.json'), help='Configuration (default: config.json)')
+    parser.add_argument('--source', help='Source name for the single-source row (default: first enabled source)')
+    parser.add_argument('--runs', type=int, default=5, help='Interpreters per row (default: 5)')
+    parser.add_argument('--importtime', action='store_true', help='List the slowest imports of the eager start')
+    args = parser.parse_args()
+
+    config = json.loads(Path(args.config).read_text(encoding='utf-8'))
+    source_name = args.source or next((s.get('name') for s in config.get('scraping', {}).get('sources', [])
+                                       if s.get('enabled')), None)
+
+    print("=" * 78)
+    print(f"⏱️  SmartScraper Start-up Benchmark (median of {args.runs} interpreters)")
+    print("=" * 78)
+    print(f"{'Start':34s}{'Import':>9s}{'Init':>9s}{'Total':>9s}{'Sources':>9s}{'AI':>8s}")
+    print("-" * 78)
+    rows = [('eager (everything loaded)', 'eager'), ('lazy (SmartScraper only)', 'lazy')]
+    if source_name:
+        rows.append((f"--source {source_name}"[:33], 'source'))
+    for label, mode in rows:
+        result = measure(mode, args.config, source_name, max(1, args.runs))
+        total = result['import_ms'] + result['init_ms']
+        print(f"{label:34s}{result['import_ms']:>7.0f}ms{result['init_ms']:>7.0f}ms{total:>7.0f}ms"
+              f"{len(result['source_modules']):>9d}{result['providers_loaded']:>5d}/{result['providers']}")
+    print("=" * 78)
+    print("Sources: source modules imported; AI: providers constructed / configured")
+
+    if args.importtime:
+        print()
+        print("Slowest imports (eager start, cumulative):")
+        for cumulative_us, name in slowest_imports(args.config):
+            print(f"  {cumulative_us / 1000:8.1f}ms  {name}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
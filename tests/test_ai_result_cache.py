@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Tests for the persistent AI result cache
+(modules/smart_scraper/ai_providers/result_cache.py) and its use by every
+BaseAIProvider subclass.
+"""
+
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add src to path (go up one level from tests/ to project root, then to src/)
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from modules.smart_scraper.ai_providers.base import BaseAIProvider, call_failed, report_call_failure
+from modules.smart_scraper.ai_providers.result_cache import (
+    AIResultCache, close_ai_result_caches, get_ai_result_cache)
+
+
+class CountingProvider(BaseAIProvider):
+    """Provider that answers locally and counts the calls that reach it"""
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.calls = 0
+
+    def extract_event_info(self, text, prompt=None):
+        self.calls += 1
+        if 'offline' in text:
+            report_call_failure()
+            return None
+        if 'unknown' in text:
+            return None
+        return {'category': 'music' if 'Konzert' in text else 'default', 'prompt': prompt}
+
+    def analyze_image(self, image_data, prompt=None):
+        self.calls += 1
+        return {'size': len(image_data)}
+
+
+class PrefixProvider(CountingProvider):
+    """Subclass that delegates to super() - cached once per call"""
+
+    PROMPT_VERSION = 2
+
+    def extract_event_info(self, text, prompt=None):
+        return super().extract_event_info(text, prompt or 'Extract the event')
+
+
+def _provider(cls, cache, model='llama3.2'):
+    provider = cls({'model': model, 'rate_limit': {'min_delay': 0, 'max_delay': 0}})
+    provider.result_cache = cache
+    return provider
+
+
+def test_repeat_calls_are_answered_from_disk():
+    """Unchanged input makes no provider call, in this process or the next"""
+    test_path = Path(tempfile.mkdtemp(prefix='krwl_ai_cache_test_'))
+    try:
+        cache = get_ai_result_cache(test_path, {})
+        provider = _provider(CountingProvider, cache)
+        texts = [f"Konzert {i}" for i in range(10)]
+        first = [provider.extract_event_info(text) for text in texts]
+        assert provider.calls == 10
+        assert provider.analyze_image(b'\x89PNG flyer') == {'size': 10}
+
+        close_ai_result_caches()
+        reopened = _provider(CountingProvider, get_ai_result_cache(test_path, {}))
+        assert [reopened.extract_event_info(text) for text in texts] == first
+        assert reopened.analyze_image(b'\x89PNG flyer') == {'size': 10}
+        assert reopened.calls == 0
+        stats = reopened.result_cache.get_stats()
+        assert stats['hits'] == 11 and stats['misses'] == 0 and stats['hit_rate'] == 100.0
+        assert stats['entries'] == 11
+    finally:
+        close_ai_result_caches()
+        shutil.rmtree(test_path)
+
+
+def test_key_covers_model_prompt_and_version():
+    """Another model, prompt or prompt version is a miss"""
+    test_path = Path(tempfile.mkdtemp(prefix='krwl_ai_cache_test_'))
+    try:
+        cache = get_ai_result_cache(test_path, {})
+        provider = _provider(CountingProvider, cache)
+        provider.extract_event_info('Konzert')
+        provider.extract_event_info('Konzert', prompt='Only the date')
+        _provider(CountingProvider, cache, model='mistral').extract_event_info('Konzert')
+        assert provider.calls == 2
+
+        # Subclass: own key (name and version), one entry for the nested super() call
+        prefixed = _provider(PrefixProvider, cache)
+        before = cache.get_stats()['entries']
+        assert prefixed.extract_event_info('Konzert')['prompt'] == 'Extract the event'
+        assert prefixed.extract_event_info('Konzert')['prompt'] == 'Extract the event'
+        assert prefixed.calls == 1
+        assert cache.get_stats()['entries'] == before + 1
+    finally:
+        close_ai_result_caches()
+        shutil.rmtree(test_path)
+
+
+def test_ttl_and_size_cap():
+    """Expired answers are misses, the least recently used go first above the cap"""
+    test_path = Path(tempfile.mkdtemp(prefix='krwl_ai_cache_test_'))
+    try:
+        cache = AIResultCache(test_path / 'ai.sqlite3', ttl_days=1, max_size_mb=0.001)
+        cache.put('a', 'Test', {'text': 'x' * 400})
+        cache.put('b', 'Test', {'text': 'y' * 400})
+        time.sleep(0.01)
+        assert cache.get('a')[0]
+        cache.put('c', 'Test', {'text': 'z' * 400})
+        # 1 KB cap: 'b' was used least recently
+        assert not cache.get('b')[0]
+        assert cache.get('a')[0] and cache.get('c')[0]
+        assert cache.stats['evicted'] == 1
+
+        cache.ttl_days = 1e-9
+        assert cache.get('a') == (False, None)
+
+        disabled = AIResultCache(test_path / 'off.sqlite3', enabled=False)
+        disabled.put('a', 'Test', {})
+        assert disabled.get('a') == (False, None)
+        assert not (test_path / 'off.sqlite3').exists()
+        cache.close()
+    finally:
+        shutil.rmtree(test_path)
+
+
+def test_none_answers_are_cached_briefly():
+    """A None answer is cached with the negative TTL; a reported failure is not cached"""
+    test_path = Path(tempfile.mkdtemp(prefix='krwl_ai_cache_test_'))
+    try:
+        cache = AIResultCache(test_path / 'ai.sqlite3', ttl_days=30, negative_ttl_days=1)
+        provider = _provider(CountingProvider, cache)
+        assert provider.extract_event_info('unknown event') is None
+        assert provider.extract_event_info('unknown event') is None
+        assert provider.calls == 1
+        assert cache.get_stats()['hits'] == 1
+
+        # Failed calls reach the provider every time; the flag is left for the router
+        provider.extract_event_info('offline event')
+        assert call_failed()
+        provider.extract_event_info('offline event')
+        assert provider.calls == 3
+
+        # The negative TTL expires None answers before the answer TTL
+        provider.extract_event_info('Konzert')
+        cache.negative_ttl_days = 1e-9
+        assert cache.get_stats()['entries'] == 2
+        provider.extract_event_info('unknown event')
+        provider.extract_event_info('Konzert')
+        assert provider.calls == 5
+        cache.close()
+    finally:
+        shutil.rmtree(test_path)
+
+
+if __name__ == '__main__':
+    test_repeat_calls_are_answered_from_disk()
+    test_key_covers_model_prompt_and_version()
+    test_ttl_and_size_cap()
+    test_none_answers_are_cached_briefly()
+    print("✓ All AI result cache tests passed")
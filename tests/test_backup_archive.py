@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Tests for the packed published-event backup archive (assets/json/old/).
+"""
+
+import json
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path (go up one level from tests/ to project root, then to src/)
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from modules.backup_archive import BackupArchive
+
+
+def _event(i):
+    return {'id': f'vhs_{i:04d}', 'title': f'Kurs {i}', 'start_time': f'2026-02-{i % 28 + 1:02d}T18:00:00'}
+
+
+def test_append_and_lookup():
+    """Appended backups are found by key and id without loading bodies"""
+    test_path = Path(tempfile.mkdtemp(prefix='krwl_backup_test_'))
+    try:
+        archive = BackupArchive(test_path, log_max_records=8)
+        for i in range(20):
+            segment = archive.append(_event(i))
+        assert segment.name == 'backups-000001.jsonl'
+
+        # 20 appends with log_max_records=8 -> two compactions, 4 records in the log
+        stats = archive.get_stats()
+        assert stats['indexed'] == 20
+        assert stats['unsorted'] == 4
+
+        assert archive.contains_key('Kurs 3', _event(3)['start_time'])
+        assert archive.contains_key('Kurs 19', _event(19)['start_time'])
+        assert not archive.contains_key('Kurs 3', '2030-01-01T00:00:00')
+        assert archive.get_by_key('Kurs 5', _event(5)['start_time'])[0]['id'] == 'vhs_0005'
+        assert archive.get_by_id('vhs_0017')[0]['event']['title'] == 'Kurs 17'
+        assert len(list(archive.iter_events())) == 20
+        archive.close()
+
+        # A fresh instance (new process) reads the persisted index
+        reopened = BackupArchive(test_path)
+        assert reopened.contains_key('Kurs 12', _event(12)['start_time'])
+        reopened.close()
+    finally:
+        shutil.rmtree(test_path)
+
+
+def test_segment_rollover_and_rebuild():
+    """Segments roll over at the size cap and a stale index is rebuilt"""
+    test_path = Path(tempfile.mkdtemp(prefix='krwl_backup_test_'))
+    try:
+        archive = BackupArchive(test_path, segment_max_bytes=200)
+        for i in range(6):
+            archive.append(_event(i))
+        assert archive.get_stats()['segments'] > 1
+        archive.close()
+
+        # Simulate a lost index (e.g. not committed) - it is rebuilt on load
+        (archive.archive_dir / 'backups.idx').unlink(missing_ok=True)
+        (archive.archive_dir / 'backups.log').unlink()
+        rebuilt = BackupArchive(test_path, segment_max_bytes=200)
+        assert rebuilt.get_stats()['indexed'] == 6
+        assert rebuilt.contains_key('Kurs 4', _event(4)['start_time'])
+        rebuilt.close()
+    finally:
+        shutil.rmtree(test_path)
+
+
+def test_pack_legacy_files():
+    """Legacy per-event files are visible before packing and migrated by pack"""
+    test_path = Path(tempfile.mkdtemp(prefix='krwl_backup_test_'))
+    try:
+        old_dir = test_path / 'assets' / 'json' / 'old'
+        old_dir.mkdir(parents=True)
+        for i in range(3):
+            backup = {'backed_up_at': f'2026-01-0{i + 1}T10:00:00', 'event': _event(i)}
+            (old_dir / f'vhs_{i:04d}_20260101_100000.json').write_text(json.dumps(backup, indent=2))
+
+        archive = BackupArchive(test_path)
+        assert archive.contains_key('Kurs 1', _event(1)['start_time'])
+
+        assert archive.pack_legacy() == 3
+        assert archive.legacy_files() == []
+        assert archive.contains_key('Kurs 1', _event(1)['start_time'])
+        assert archive.get_by_id('vhs_0002')[0]['backed_up_at'] == '2026-01-03T10:00:00'
+        assert [e['id'] for e in archive.iter_events()] == ['vhs_0000', 'vhs_0001', 'vhs_0002']
+        archive.close()
+    finally:
+        shutil.rmtree(test_path)
+
+
+if __name__ == '__main__':
+    test_append_and_lookup()
+    test_segment_rollover_and_rebuild()
+    test_pack_legacy_files()
+    print("✓ All backup archive tests passed")
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Tests for batched AI categorization (AICategorizer.categorize_events) and
+EventSchema.migrate_events, using a scripted stand-in for the Ollama provider.
+"""
+
+import json
+import re
+import sys
+from pathlib import Path
+
+# Add src to path (go up one level from tests/ to project root, then to src/)
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from modules.ai_categorizer import AICategorizer
+from modules.event_schema import EventSchema
+
+
+class ScriptedProvider:
+    """Answers batch prompts like a model would; optionally garbles big batches."""
+
+    def __init__(self, context_window=4096, garble_above=None, drop_index=None):
+        self.context_window = context_window
+        self.timeout = 30
+        self.garble_above = garble_above
+        self.drop_index = drop_index
+        self.batch_sizes = []
+        self.single_calls = 0
+
+    def generate_json(self, prompt, timeout=None):
+        titles = re.findall(r'^\[(\d+)\] Title: (.*)$', prompt, re.MULTILINE)
+        self.batch_sizes.append(len(titles))
+        if self.garble_above and len(titles) > self.garble_above:
+            return None
+        results = [{'index': int(i), 'category': 'music' if 'Konzert' in title else 'sports',
+                    'confidence': 0.9}
+                   for i, title in titles if int(i) != self.drop_index]
+        return json.loads(json.dumps({'results': results}))
+
+    def extract_event_info(self, text, prompt=None):
+        self.single_calls += 1
+        return {'category': 'music' if 'Konzert' in text else 'sports', 'confidence': 0.7}
+
+
+def _categorizer(provider, batch_size=20):
+    categorizer = AICategorizer({'ai': {'categorization': {'enabled': False, 'batch_size': batch_size}}},
+                                Path('.'))
+    categorizer.enabled = True
+    categorizer.ai_provider = provider
+    return categorizer
+
+
+def _items(count):
+    return [(f"Konzert {i}" if i % 2 else f"Fussball {i}", "Beschreibung " * 10) for i in range(count)]
+
+
+def test_events_are_packed_into_batches():
+    """45 events with batch_size 20 are three requests, results in input order"""
+    provider = ScriptedProvider()
+    results = _categorizer(provider).categorize_events(_items(45))
+    assert provider.batch_sizes == [20, 20, 5]
+    assert provider.single_calls == 0
+    assert [category for category, _, _ in results] == ['sports', 'music'] * 22 + ['sports']
+    assert all(method == 'ai' for _, _, method in results)
+
+
+def test_batches_fit_the_context_window():
+    """A small context window yields smaller batches"""
+    provider = ScriptedProvider(context_window=1200)
+    _categorizer(provider).categorize_events(_items(20))
+    assert len(provider.batch_sizes) > 1
+    assert max(provider.batch_sizes) < 20
+    assert sum(provider.batch_sizes) == 20
+
+
+def test_malformed_batches_are_split_and_retried():
+    """Garbled answers split the batch; later batches start at the reduced size"""
+    provider = ScriptedProvider(garble_above=5)
+    categorizer = _categorizer(provider)
+    results = categorizer.categorize_events(_items(40))
+    assert [category for category, _, _ in results] == ['sports', 'music'] * 20
+    assert provider.batch_sizes[:3] == [20, 10, 5]
+    assert categorizer.stats['splits'] >= 2
+    # Later batches no longer start at 20 events
+    assert max(provider.batch_sizes[3:]) <= 10
+
+
+def test_missing_entries_are_retried():
+    """An answer without one index only retries that event"""
+    provider = ScriptedProvider(drop_index=3)
+    results = _categorizer(provider).categorize_events(_items(10))
+    assert provider.batch_sizes == [10]
+    assert provider.single_calls == 1
+    assert results[3] == ('music', 0.7, 'ai')
+
+
+def test_migrate_events_categorizes_in_one_request():
+    """EventSchema.migrate_events sends events without category as a batch"""
+    provider = ScriptedProvider()
+    schema = EventSchema()
+    schema.ai_categorizer = _categorizer(provider)
+    events = [{'id': f'e{i}', 'title': title, 'description': description}
+              for i, (title, description) in enumerate(_items(6))]
+    events[0]['category'] = 'arts'
+    failures = []
+    migrated = schema.migrate_events(events + [None], failures)
+    assert provider.batch_sizes == [5]
+    assert [event['category'] for event in migrated] == ['arts'] + ['music', 'sports'] * 2 + ['music']
+    assert len(failures) == 1 and failures[0][0] is None
+
+
+if __name__ == '__main__':
+    test_events_are_packed_into_batches()
+    test_batches_fit_the_context_window()
+    test_malformed_batches_are_split_and_retried()
+    test_missing_entries_are_retried()
+    test_migrate_events_categorizes_in_one_request()
+    print("✓ All batch categorization tests passed")
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Tests for the batch ingest stage of EventScraper (one EventSchema per run,
+list-level pydantic validation, per-event failure reporting).
+"""
+
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path (go up one level from tests/ to project root, then to src/)
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from modules import event_schema
+from modules.models import validate_events_bulk
+from modules.scraper import EventScraper
+
+
+def _event(i, **overrides):
+    event = {
+        'id': f'batch_{i}',
+        'title': f'VHS Kochkurs {i}',
+        'description': 'Traditionelle fränkische Küche zum Mitmachen in der Lehrküche',
+        'location': {'name': 'VHS Hofer Land', 'lat': 50.3167, 'lon': 11.9167,
+                     'address': 'Kirchplatz 3, 95028 Hof'},
+        'start_time': f'2030-02-{i + 1:02d}T18:00:00',
+        'source': 'https://www.vhshoferland.de/test',
+        'status': 'pending',
+    }
+    event.update(overrides)
+    return event
+
+
+def test_validate_events_bulk_reports_per_event_errors():
+    """Valid events become models, invalid ones get an error by index"""
+    schema = event_schema.EventSchema()
+    events = [schema.migrate_event(_event(i)) for i in range(4)]
+    events[1]['location'] = dict(events[1]['location'], lat=123.0)
+    del events[3]['title']
+
+    models, errors = validate_events_bulk(events)
+    assert [m is not None for m in models] == [True, False, True, False]
+    assert sorted(errors) == [1, 3]
+    assert 'location.lat' in errors[1]
+    assert 'title' in errors[3]
+    assert models[2].title == 'VHS Kochkurs 2'
+
+    models, errors = validate_events_bulk(events[:1])
+    assert errors == {} and len(models) == 1
+
+
+def test_batch_ingest_builds_schema_once():
+    """A whole scrape batch shares one EventSchema (and AICategorizer)"""
+    test_path = Path(tempfile.mkdtemp(prefix='krwl_ingest_test_'))
+    built = []
+    original_init = event_schema.EventSchema.__init__
+
+    def counting_init(self, *args, **kwargs):
+        built.append(self)
+        original_init(self, *args, **kwargs)
+
+    event_schema.EventSchema.__init__ = counting_init
+    try:
+        scraper = EventScraper({'scraping': {'sources': []}}, test_path)
+        pending_data = {'pending_events': []}
+
+        events = [_event(i) for i in range(20)]
+        events[5]['location'] = dict(events[5]['location'], lon=500.0)
+        failures = scraper._validate_and_add_events(events, pending_data)
+        assert len(pending_data['pending_events']) == 19
+        assert [event['id'] for event, _ in failures] == ['batch_5']
+        assert 'location.lon' in failures[0][1]
+
+        # The single-event helper reuses the same schema
+        assert scraper._validate_and_add_event(_event(25), pending_data) is True
+        assert len(built) == 1
+    finally:
+        event_schema.EventSchema.__init__ = original_init
+        shutil.rmtree(test_path)
+
+
+if __name__ == '__main__':
+    test_validate_events_bulk_reports_per_event_errors()
+    test_batch_ingest_builds_schema_once()
+    print("✓ All batch ingest tests passed")
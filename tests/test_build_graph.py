@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Tests for the incremental build graph (modules/build_graph.py) and the
+sunrise feed selection it hashes (modules/rss_generator.py).
+
+Builds run in a temporary directory with counting build steps.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add src to path (go up one level from tests/ to project root, then to src/)
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from modules.build_graph import BuildGraph, BuildNode
+from modules.rss_generator import select_sunrise_events
+
+
+class Site:
+    """Tiny site: two inputs concatenated into public/index.html"""
+
+    def __init__(self, path):
+        self.path = path
+        self.builds = 0
+        self.mode = 'light'
+        (path / 'assets' / 'css').mkdir(parents=True)
+        (path / 'assets' / 'css' / 'base.css').write_text('body {}')
+        (path / 'config.json').write_text('{}')
+
+    def build(self):
+        self.builds += 1
+        (self.path / 'public').mkdir(exist_ok=True)
+        css = (self.path / 'assets' / 'css' / 'base.css').read_text()
+        (self.path / 'public' / 'index.html').write_text(f'<style>{css}</style>{self.mode}')
+
+    def graph(self):
+        graph = BuildGraph(self.path)
+        graph.add(BuildNode('index.html', build=self.build, outputs=['public/index.html'],
+                            files=['assets/css', 'config.json'], values={'mode': lambda: self.mode}))
+        return graph
+
+
+def _site():
+    return Site(Path(tempfile.mkdtemp(prefix='krwl_build_graph_test_')))
+
+
+def test_noop_rebuild_skips_everything():
+    site = _site()
+    try:
+        report = site.graph().run()
+        assert report.built == ['index.html'] and report.reasons['index.html'] == ['never built']
+        assert (site.path / '.cache' / 'build_manifest.json').exists()
+
+        start = time.perf_counter()
+        report = site.graph().run()
+        assert time.perf_counter() - start < 0.5
+        assert report.skipped == ['index.html'] and report.built == [] and site.builds == 1
+
+        # Touching a file without changing it is not a change
+        os.utime(site.path / 'config.json')
+        assert site.graph().run().skipped == ['index.html']
+    finally:
+        shutil.rmtree(site.path)
+
+
+def test_changed_input_rebuilds_with_reason():
+    site = _site()
+    try:
+        site.graph().run()
+        (site.path / 'assets' / 'css' / 'base.css').write_text('body { color: red }')
+        report = site.graph().run()
+        assert report.built == ['index.html']
+        assert report.reasons['index.html'] == ['input changed: assets/css/base.css']
+
+        (site.path / 'assets' / 'css' / 'print.css').write_text('')
+        assert site.graph().explain() == {'index.html': ['input added: assets/css/print.css']}
+
+        site.mode = 'dark'
+        graph = site.graph()
+        assert graph.explain()['index.html'] == ['input added: assets/css/print.css', 'value changed: mode']
+        graph.run()
+        assert site.graph().explain() == {'index.html': []}
+    finally:
+        shutil.rmtree(site.path)
+
+
+def test_missing_or_edited_output_rebuilds():
+    site = _site()
+    try:
+        site.graph().run()
+        (site.path / 'public' / 'index.html').unlink()
+        report = site.graph().run()
+        assert report.reasons['index.html'] == ['output missing: public/index.html']
+        assert (site.path / 'public' / 'index.html').exists()
+
+        (site.path / 'public' / 'index.html').write_text('edited by hand')
+        report = site.graph().run()
+        assert report.reasons['index.html'] == ['output modified since last build: public/index.html']
+        assert site.builds == 3
+    finally:
+        shutil.rmtree(site.path)
+
+
+def test_force_and_failures():
+    site = _site()
+    try:
+        site.graph().run()
+        report = site.graph().run(force=True)
+        assert report.built == ['index.html'] and report.reasons['index.html'] == ['forced (--force)']
+
+        # A failed step is not recorded: it is retried by the next build
+        graph = site.graph()
+        graph.add(BuildNode('feeds', build=lambda: False, outputs=['feeds/*.xml']))
+        graph.add(BuildNode('broken', build=lambda: 1 / 0, outputs=['broken.txt']))
+        report = graph.run()
+        assert report.failed == ['feeds', 'broken'] and not report.ok
+        assert report.skipped == ['index.html']
+        assert site.graph().explain() == {'index.html': []}
+        graph = BuildGraph(site.path)
+        graph.add(BuildNode('feeds', build=lambda: None, outputs=['feeds/*.xml']))
+        assert graph.explain() == {'feeds': ['never built']}
+
+        graph.clear()
+        assert site.graph().explain() == {'index.html': ['never built']}
+    finally:
+        shutil.rmtree(site.path)
+
+
+def test_sunrise_selection():
+    now = datetime(2026, 5, 1, 20, 0)
+    sunrise = now + timedelta(hours=10)
+    events = [
+        {'id': 'tonight', 'start_time': (now + timedelta(hours=2)).isoformat()},
+        {'id': 'tonight', 'start_time': (now + timedelta(hours=2)).isoformat()},
+        {'id': 'over', 'start_time': (now - timedelta(hours=1)).isoformat()},
+        {'id': 'tomorrow', 'start_time': (sunrise + timedelta(hours=1)).isoformat()},
+        {'id': 'broken', 'start_time': 'soon'},
+    ]
+    selected = select_sunrise_events(events, sunrise, now=now, warn=False)
+    assert [event['id'] for event in selected] == ['tonight']
+
+
+if __name__ == '__main__':
+    test_noop_rebuild_skips_everything()
+    test_changed_input_rebuilds_with_reason()
+    test_missing_or_edited_output_rebuilds()
+    test_force_and_failures()
+    test_sunrise_selection()
+    print("✓ All build graph tests passed")
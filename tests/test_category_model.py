@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Tests for the offline category model (modules/category_model.py) and its
+use as the first categorization method of AICategorizer.
+"""
+
+import json
+import re
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add src to path (go up one level from tests/ to project root, then to src/)
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from modules.ai_categorizer import AICategorizer
+from modules.category_model import CategoryModel, collect_training_events
+
+TOPICS = {
+    'music': (['Konzert', 'Jazz Abend', 'Rock Nacht', 'Orchester'], 'Live Musik mit Band und Bühne'),
+    'sports': (['Fussball Turnier', 'Lauftreff', 'Volleyball Spiel', 'Schwimmen'], 'Sport für alle Mannschaft Training'),
+    'food': (['Weinprobe', 'Kochkurs', 'Brunch', 'Grillabend'], 'Essen und Trinken regionale Küche Genuss'),
+}
+
+
+def _examples(per_topic=12):
+    examples = []
+    for i in range(per_topic):
+        for category, (titles, description) in TOPICS.items():
+            examples.append((f"{titles[i % len(titles)]} {i}", description, category))
+    return examples
+
+
+def test_model_learns_and_calibrates():
+    """Predicts the right topic; mixed texts get a lower confidence"""
+    model = CategoryModel.train(_examples())
+    assert model.categories == ['food', 'music', 'sports']
+    category, confidence = model.predict("Jazz Konzert", "Musik im Park")
+    assert category == 'music'
+    assert model.predict("Konzert Fussball")[1] < confidence
+    # No known word: uniform confidence
+    assert model.predict("xyzzy")[1] == 1 / 3
+    assert model.metadata['heldout_accuracy'] > 0.9
+
+
+def test_rare_categories_are_skipped():
+    """Categories below min_examples are not learned; one category is an error"""
+    examples = _examples() + [("Lesung", "Buch", 'library')]
+    model = CategoryModel.train(examples, min_examples=3)
+    assert 'library' not in model.categories
+    assert model.metadata['skipped_categories'] == ['library']
+    try:
+        CategoryModel.train([e for e in examples if e[2] == 'music'])
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+
+
+def test_save_load_and_training_data():
+    """Model round-trips through JSON; events are collected once per id"""
+    test_path = Path(tempfile.mkdtemp(prefix='krwl_category_model_test_'))
+    try:
+        json_dir = test_path / 'assets' / 'json'
+        (json_dir / 'events' / 'archived').mkdir(parents=True)
+        events = [{'id': f'e{i}', 'title': title, 'description': description, 'category': category}
+                  for i, (title, description, category) in enumerate(_examples(4))]
+        (json_dir / 'events.json').write_text(json.dumps({'events': events[:6]}))
+        (json_dir / 'pending_events.json').write_text(json.dumps({'pending_events': events[4:]}))
+        (json_dir / 'events' / 'archived' / '202601.json').write_text(json.dumps(
+            {'archived_events': [{'id': 'old', 'title': 'Alt', 'category': 'default'}]}))
+        examples = collect_training_events(test_path)
+        assert len(examples) == len(events)
+
+        path = test_path / 'data' / 'models' / 'category_model.json'
+        model = CategoryModel.train(_examples())
+        model.save(path)
+        loaded = CategoryModel.load(path)
+        assert loaded.predict("Fussball", "Sport") == model.predict("Fussball", "Sport")
+        assert CategoryModel.load(test_path / 'missing.json') is None
+    finally:
+        shutil.rmtree(test_path)
+
+
+class CountingProvider:
+    """Batch-capable stand-in for Ollama that records the events it sees"""
+
+    context_window = 4096
+    timeout = 30
+
+    def __init__(self):
+        self.titles = []
+
+    def generate_json(self, prompt, timeout=None):
+        titles = re.findall(r'^\[(\d+)\] Title: (.*)$', prompt, re.MULTILINE)
+        self.titles.extend(title for _, title in titles)
+        return {'results': [{'index': int(i), 'category': 'family', 'confidence': 0.9} for i, _ in titles]}
+
+    def extract_event_info(self, text, prompt=None):
+        self.titles.append(text)
+        return {'category': 'family', 'confidence': 0.9}
+
+
+def test_categorizer_only_sends_unsure_events_to_ai():
+    """Confident model answers skip the LLM, the rest are batched"""
+    categorizer = AICategorizer({'ai': {'categorization': {'enabled': False}}}, Path('.'))
+    categorizer.model = CategoryModel.train(_examples())
+    categorizer.enabled = True
+    categorizer.ai_provider = CountingProvider()
+    items = [("Jazz Konzert", "Live Musik mit Band"), ("Unbekannt A", ""),
+             ("Fussball Turnier", "Sport Mannschaft"), ("Unbekannt B", "")]
+    results = categorizer.categorize_events(items)
+    assert [method for _, _, method in results] == ['model', 'ai', 'model', 'ai']
+    assert [category for category, _, _ in results] == ['music', 'family', 'sports', 'family']
+    assert categorizer.ai_provider.titles == ["Unbekannt A", "Unbekannt B"]
+
+    # Without AI a low-confidence guess beats the 'default' keyword result
+    categorizer.ai_provider = None
+    categorizer.model_threshold = 0.99
+    assert categorizer.categorize_event("Konzert Fussball", "")[::2] == ('sports', 'model')
+    assert categorizer.categorize_event("Unbekannt", "") == ('default', 0.5, 'keyword')
+    assert categorizer.categorize_event("Brunch", "Essen")[0] == 'food'
+
+
+def test_prediction_throughput():
+    """Thousands of events per second"""
+    model = CategoryModel.train(_examples(50))
+    items = [(title, description * 5) for title, description, _ in _examples(100)]
+    start = time.perf_counter()
+    for title, description in items:
+        model.predict(title, description)
+    assert len(items) / (time.perf_counter() - start) > 2000
+
+
+if __name__ == '__main__':
+    test_model_learns_and_calibrates()
+    test_rare_categories_are_skipped()
+    test_save_load_and_training_data()
+    test_categorizer_only_sends_unsure_events_to_ai()
+    test_prediction_throughput()
+    print("✓ All category model tests passed")
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Tests for the per-host circuit breaker (modules/circuit_breaker.py):
+opening after consecutive failures, the cool-down probe, persistence
+between runs, the run-wide retry budget and its use by the smart scraper
+sources.
+
+No network access: sessions are replaced by fakes. The source test needs
+requests and is skipped without it.
+"""
+
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+try:
+    import requests
+    Timeout, NetworkDown = requests.exceptions.Timeout, requests.exceptions.ConnectionError
+except ImportError:
+    requests = None
+    Timeout, NetworkDown = TimeoutError, ConnectionError
+
+# Add src to path (go up one level from tests/ to project root, then to src/)
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from modules.circuit_breaker import CircuitBreaker, CircuitOpenError, get_circuit_breaker, is_host_failure
+from modules.smart_scraper.base import BaseSource, SourceOptions
+
+DEAD = 'https://dead.example.org/events'
+ALIVE = 'https://alive.example.org/events'
+
+
+class FakeHTTPError(Exception):
+    """Like requests' HTTPError: carries the response"""
+
+    def __init__(self, status_code):
+        super().__init__(f'HTTP {status_code}')
+        self.response = SimpleNamespace(status_code=status_code)
+
+
+def test_failure_classification():
+    """Timeouts, connection errors and 5xx/429 count; 4xx and other errors don't"""
+    assert is_host_failure(Timeout())
+    assert is_host_failure(NetworkDown())
+    assert is_host_failure(FakeHTTPError(503)) and is_host_failure(FakeHTTPError(429))
+    assert is_host_failure(status_code=502)
+    assert not is_host_failure(FakeHTTPError(404))
+    assert not is_host_failure(status_code=200)
+    assert not is_host_failure(ValueError('bad html'))
+    assert not is_host_failure(CircuitOpenError('dead.example.org'))
+
+
+def test_opens_after_consecutive_failures_and_persists():
+    """N failures in a row open the breaker; the next run still skips the host"""
+    test_path = Path(tempfile.mkdtemp(prefix='krwl_breaker_test_'))
+    try:
+        breaker = CircuitBreaker(test_path, failure_threshold=3, cooldown_minutes=30)
+        for _ in range(2):
+            breaker.record(DEAD, error=Timeout())
+        # A success in between resets the count
+        breaker.record(DEAD, status_code=200)
+        for _ in range(2):
+            breaker.record(DEAD, error=Timeout())
+        assert breaker.allow(DEAD)
+        breaker.record(DEAD + '/detail/1', error=NetworkDown())
+        assert not breaker.allow(DEAD + '/detail/2')
+        assert breaker.allow(ALIVE)
+        # A 404 says the host is up; a parsing error says nothing
+        breaker.record(ALIVE, error=FakeHTTPError(404))
+        breaker.record(ALIVE, error=ValueError('bad html'))
+        assert breaker.allow(ALIVE)
+
+        stats = breaker.get_stats()
+        assert stats['tripped'] == ['dead.example.org'] and stats['open'] == ['dead.example.org']
+        assert stats['skipped'] == 1
+        breaker.flush()
+
+        next_run = CircuitBreaker(test_path)
+        try:
+            next_run.check(DEAD)
+            assert False, 'expected CircuitOpenError'
+        except CircuitOpenError as e:
+            assert e.host == 'dead.example.org'
+            # Sources treat it like an unreachable host
+            assert isinstance(e, NetworkDown)
+        assert next_run.get_stats()['tripped'] == []
+    finally:
+        shutil.rmtree(test_path)
+
+
+def test_cooldown_lets_one_probe_through():
+    """After the cool-down one request probes; its outcome closes or reopens"""
+    test_path = Path(tempfile.mkdtemp(prefix='krwl_breaker_test_'))
+    try:
+        breaker = CircuitBreaker(test_path, failure_threshold=1, cooldown_minutes=30)
+        breaker.record(DEAD, error=Timeout())
+        assert not breaker.allow(DEAD)
+
+        breaker._hosts['dead.example.org']['open_until'] = time.time() - 1
+        assert breaker.allow(DEAD)        # The probe
+        assert not breaker.allow(DEAD)    # Others wait for it
+        breaker.record(DEAD, error=Timeout())
+        assert breaker.is_open(DEAD)
+
+        # A probe ending in a non-network error decides nothing: the next
+        # request probes again (also for errors without a response)
+        breaker._hosts['dead.example.org']['open_until'] = time.time() - 1
+        assert breaker.allow(DEAD)
+        breaker.record(DEAD, error=ValueError('bad html'))
+        assert breaker.allow(DEAD)
+        if requests is not None:
+            breaker.record(DEAD, error=requests.exceptions.TooManyRedirects())
+            assert breaker.allow(DEAD)
+        breaker.record(DEAD, status_code=200)
+        assert breaker.allow(DEAD) and breaker.allow(DEAD)
+        assert breaker.get_stats()['open'] == []
+    finally:
+        shutil.rmtree(test_path)
+
+
+def test_retry_budget_is_run_wide():
+    """Retries stop when the budget is spent or the host's breaker is open"""
+    test_path = Path(tempfile.mkdtemp(prefix='krwl_breaker_test_'))
+    try:
+        breaker = CircuitBreaker(test_path, failure_threshold=1, retry_budget=2)
+        assert breaker.allow_retry(ALIVE) and breaker.allow_retry(ALIVE + '/2')
+        assert not breaker.allow_retry(ALIVE)
+        stats = breaker.get_stats()
+        assert stats['retries'] == 2 and stats['retries_denied'] == 1
+
+        breaker.reset_stats()
+        breaker.record(DEAD, error=Timeout())
+        assert not breaker.allow_retry(DEAD)
+        assert breaker.allow_retry(ALIVE)
+
+        breaker.configure({'enabled': False})
+        assert breaker.allow(DEAD) and breaker.allow_retry(DEAD)
+    finally:
+        shutil.rmtree(test_path)
+
+
+class FakeSession:
+    """Times out for dead.example.org, answers everything else"""
+
+    def __init__(self):
+        self.requested = []
+
+    def get(self, url, **kwargs):
+        self.requested.append(url)
+        if 'dead.example.org' in url:
+            raise requests.exceptions.ConnectTimeout('timed out')
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'<html></html>'
+        return response
+
+
+class DummySource(BaseSource):
+    def scrape(self):
+        return []
+
+
+def test_detail_pages_skip_a_dead_host():
+    """A dead host costs failure_threshold requests, not all pages with retries"""
+    if requests is None:
+        print("  (requests not installed - skipping detail page test)")
+        return
+    test_path = Path(tempfile.mkdtemp(prefix='krwl_breaker_test_'))
+    try:
+        breaker = get_circuit_breaker(test_path, {'failure_threshold': 3, 'retry_budget': 1})
+        options = SourceOptions(detail_concurrency=1, max_retries=2, rate_limit_delay=0)
+        source = DummySource({'name': 'Dead'}, options, base_path=test_path)
+        session = FakeSession()
+
+        urls = [f'{DEAD}/{i}' for i in range(10)] + [ALIVE]
+        pages = source.fetch_detail_pages(urls, session=session)
+        # First page: 1 request + 1 retry (budget), then 1 more failure opens
+        assert len([url for url in session.requested if 'dead' in url]) == 3
+        assert all(page.error is not None for page in pages[:10])
+        assert pages[-1].error is None and pages[-1].content == b'<html></html>'
+        stats = breaker.get_stats()
+        assert stats['tripped'] == ['dead.example.org'] and stats['skipped'] == 8
+        assert stats['retries'] == 1 and stats['retries_denied'] >= 1
+    finally:
+        shutil.rmtree(test_path)
+
+
+if __name__ == '__main__':
+    test_failure_classification()
+    test_opens_after_consecutive_failures_and_persists()
+    test_cooldown_lets_one_probe_through()
+    test_retry_budget_is_run_wide()
+    test_detail_pages_skip_a_dead_host()
+    print("✓ All circuit breaker tests passed")
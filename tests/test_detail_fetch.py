@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Tests for the concurrent detail-page fetch stage in smart_scraper/base.py.
+"""
+
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests
+
+# Add src to path (go up one level from tests/ to project root, then to src/)
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from modules.smart_scraper.base import BaseSource, SourceOptions
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Detail pages: /ok/N (slow), /flaky (503 once), /missing (404)"""
+    hits = {}
+
+    def do_GET(self):
+        _Handler.hits[self.path] = _Handler.hits.get(self.path, 0) + 1
+        if self.path.startswith('/ok/'):
+            time.sleep(0.2)
+            self._reply(200, f'<h1>Event {self.path[4:]}</h1>')
+        elif self.path == '/flaky' and _Handler.hits[self.path] == 1:
+            self._reply(503, 'busy')
+        elif self.path == '/flaky':
+            self._reply(200, 'recovered')
+        else:
+            self._reply(404, 'not found')
+
+    def _reply(self, status, body):
+        self.send_response(status)
+        self.end_headers()
+        self.wfile.write(body.encode('utf-8'))
+
+    def log_message(self, *args):
+        pass
+
+
+class _Source(BaseSource):
+    def scrape(self):
+        return []
+
+
+def test_fetch_detail_pages():
+    """Pages are fetched concurrently, in listing order, with retries"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f'http://127.0.0.1:{server.server_address[1]}'
+    try:
+        options = SourceOptions(detail_concurrency=4, max_retries=2, detail_timeout=5)
+        source = _Source({'name': 'Test', 'url': base}, options)
+        source.session = requests.Session()
+        adapter = source.session.get_adapter(base)
+
+        urls = [f'{base}/ok/{i}' for i in range(4)]
+        start = time.monotonic()
+        pages = source.fetch_detail_pages(urls)
+        elapsed = time.monotonic() - start
+
+        assert elapsed < 0.6  # Sequential would take > 0.8s
+        assert [p.url for p in pages] == urls
+        assert pages[2].content == b'<h1>Event 2</h1>'
+        assert source.session.get_adapter(base) is adapter  # Pool is not remounted
+
+        flaky, missing = source.fetch_detail_pages([f'{base}/flaky', f'{base}/missing'])
+        assert flaky.ok and flaky.content == b'recovered'
+        assert not missing.ok
+        assert _Handler.hits['/flaky'] == 2
+        assert _Handler.hits['/missing'] == 1  # 4xx is not retried
+    finally:
+        server.shutdown()
+
+
+def test_session_pool_sized_once_for_detail_concurrency():
+    """The shared session's pool fits the largest detail_concurrency"""
+    from modules.scraper import EventScraper
+
+    scraper = EventScraper({'scraping': {'sources': []}}, Path(tempfile.mkdtemp(prefix='krwl_pool_test_')))
+    try:
+        sources = [{'name': 'A'}, {'name': 'B', 'options': {'detail_concurrency': 12}}]
+        scraper._prepare_session_pool(2, sources)
+        adapter = scraper.session.get_adapter('https://example.org')
+        assert adapter._pool_maxsize == 12
+        scraper._prepare_session_pool(2, sources)
+        assert scraper.session.get_adapter('https://example.org') is adapter
+    finally:
+        shutil.rmtree(scraper.base_path)
+
+
+def test_detail_page_limit_is_an_option():
+    """max_detail_pages replaces the hard-coded 20-link cap"""
+    links = list(range(30))
+    assert len(_Source({'name': 'T'}, SourceOptions()).limit_detail_links(links)) == 20
+    assert len(_Source({'name': 'T'}, SourceOptions(max_detail_pages=5)).limit_detail_links(links)) == 5
+    unlimited = SourceOptions.from_dict({'max_detail_pages': None})
+    assert _Source({'name': 'T'}, unlimited).limit_detail_links(links) == links
+
+
+def test_generated_detail_template_compiles():
+    """The detail-page source template uses the shared fetch stage"""
+    from modules.custom_source_manager import CustomSourceManager
+
+    manager = CustomSourceManager(Path(__file__).parent.parent)
+    code = manager._get_detail_page_template('ExampleSource', 'Example', 'https://example.org/events')
+    compile(code, 'example.py', 'exec')
+    assert 'fetch_detail_pages' in code
+    assert '[:20]' not in code
+
+
+if __name__ == '__main__':
+    test_fetch_detail_pages()
+    test_session_pool_sized_once_for_detail_concurrency()
+    test_detail_page_limit_is_an_option()
+    test_generated_detail_template_compiles()
+    print("✓ All detail fetch tests passed")
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Tests for the process-wide parsed-JSON document cache in utils.py.
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path (go up one level from tests/ to project root, then to src/)
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from modules.utils import (
+    load_json_document, invalidate_document, get_document_cache_stats,
+    load_pending_events, save_pending_events, load_events,
+    update_pending_count_in_events
+)
+from modules.scheduler import ScheduleConfig
+
+
+def _make_repo():
+    """Create a temporary repository with events.json and pending_events.json"""
+    test_path = Path(tempfile.mkdtemp(prefix='krwl_doccache_test_'))
+    json_dir = test_path / 'assets' / 'json'
+    json_dir.mkdir(parents=True)
+    (json_dir / 'events.json').write_text(json.dumps({'events': [{'id': 'e1'}]}, indent=2))
+    (json_dir / 'pending_events.json').write_text(json.dumps(
+        {'pending_events': [{'id': 'p1'}, {'id': 'p2'}], 'last_scraped': None}, indent=2))
+    return test_path
+
+
+def test_unchanged_file_is_parsed_once():
+    """Repeated loads hit the cache and copies are independent"""
+    test_path = _make_repo()
+    try:
+        path = test_path / 'assets' / 'json' / 'events.json'
+        before = get_document_cache_stats()
+
+        first = load_json_document(path)
+        first['events'].append({'id': 'mutated'})
+        second = load_json_document(path)
+        shared = load_json_document(path, copy=False)
+
+        stats = get_document_cache_stats()
+        assert stats['misses'] - before['misses'] == 1
+        assert stats['hits'] - before['hits'] == 2
+        assert second == {'events': [{'id': 'e1'}]}
+        assert shared is load_json_document(path, copy=False)
+    finally:
+        invalidate_document()
+        shutil.rmtree(test_path)
+
+
+def test_stat_change_and_save_invalidate():
+    """External edits change the stat signature; save_* helpers invalidate"""
+    test_path = _make_repo()
+    try:
+        path = test_path / 'assets' / 'json' / 'pending_events.json'
+        assert len(load_pending_events(test_path)['pending_events']) == 2
+
+        # External edit (e.g. git pull) with a new mtime is picked up
+        path.write_text(json.dumps({'pending_events': [], 'last_scraped': None}))
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert load_pending_events(test_path)['pending_events'] == []
+
+        before = get_document_cache_stats()
+        save_pending_events(test_path, {'pending_events': [{'id': 'p3'}]})
+        assert get_document_cache_stats()['invalidations'] - before['invalidations'] == 1
+        assert [e['id'] for e in load_pending_events(test_path)['pending_events']] == ['p3']
+
+        update_pending_count_in_events(test_path)
+        assert load_events(test_path)['pending_count'] == 1
+    finally:
+        invalidate_document()
+        shutil.rmtree(test_path)
+
+
+def test_scheduler_reloads_changed_config():
+    """ScheduleConfig re-reads config.json only when it changed"""
+    test_path = Path(tempfile.mkdtemp(prefix='krwl_doccache_test_'))
+    try:
+        config_path = test_path / 'config.json'
+        config_path.write_text(json.dumps({'scraping': {'schedule': {'timezone': 'UTC'}}}))
+        scheduler = ScheduleConfig(config_path)
+        assert scheduler.get_timezone() == 'UTC'
+
+        config_path.write_text(json.dumps({'scraping': {'schedule': {'timezone': 'Europe/Berlin'}}}))
+        assert scheduler.get_timezone() == 'Europe/Berlin'
+
+        # A broken edit keeps the last good configuration
+        config_path.write_text('{broken')
+        assert scheduler.get_timezone() == 'Europe/Berlin'
+    finally:
+        invalidate_document()
+        shutil.rmtree(test_path)
+
+
+if __name__ == '__main__':
+    test_unchanged_file_is_parsed_once()
+    test_stat_change_and_save_invalidate()
+    test_scheduler_reloads_changed_config()
+    print("✓ All document cache tests passed")
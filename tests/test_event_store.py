@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Tests for the optional SQLite event store and the utils load/save adapters.
+"""
+
+import json
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path (go up one level from tests/ to project root, then to src/)
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from modules import utils
+from modules.backup_archive import close_backup_archives
+from modules.event_store import EventStore, get_event_store, close_event_stores
+from modules.utils import (
+    load_events, save_events, load_pending_events, save_pending_events,
+    update_pending_count_in_events, upsert_pending_event, export_event_snapshots
+)
+from event_manager import cli_publish_event, cli_reject_event
+
+
+def _make_repo():
+    """Create a temporary repository with events.json and pending_events.json"""
+    test_path = Path(tempfile.mkdtemp(prefix='krwl_store_test_'))
+    json_dir = test_path / 'assets' / 'json'
+    json_dir.mkdir(parents=True)
+    events = {
+        'events': [
+            {'id': 'e1', 'title': 'Konzert', 'start_time': '2026-03-01T20:00:00',
+             'source': 'vhs', 'status': 'published'},
+        ],
+        'last_updated': '2026-01-01T00:00:00'
+    }
+    pending = {
+        'pending_events': [
+            {'id': f'p{i}', 'title': f'Event {i}', 'start_time': f'2026-03-0{i}T18:00:00',
+             'source': 'frankenpost' if i % 2 else 'vhs', 'status': 'pending'}
+            for i in range(1, 6)
+        ],
+        'last_scraped': None
+    }
+    (json_dir / 'events.json').write_text(json.dumps(events, indent=2))
+    (json_dir / 'pending_events.json').write_text(json.dumps(pending, indent=2))
+    return test_path
+
+
+def test_store_disabled_by_default():
+    """Without a database the adapters use the JSON files directly"""
+    test_path = _make_repo()
+    try:
+        assert get_event_store(test_path) is None
+        assert len(load_pending_events(test_path)['pending_events']) == 5
+        assert not (test_path / '.cache').exists()
+    finally:
+        close_event_stores()
+        shutil.rmtree(test_path)
+
+
+def test_adapters_round_trip_through_store():
+    """load/save go through the store; the JSON snapshots are exported once"""
+    test_path = _make_repo()
+    try:
+        get_event_store(test_path, create=True)
+
+        pending = load_pending_events(test_path)
+        assert [e['id'] for e in pending['pending_events']] == ['p1', 'p2', 'p3', 'p4', 'p5']
+
+        # Remove one event and append one - only those rows should change
+        pending['pending_events'].pop(1)
+        pending['pending_events'].append({'id': 'p9', 'title': 'New', 'start_time': '2026-04-01T18:00:00'})
+        store = get_event_store(test_path)
+        save_pending_events(test_path, pending)
+        assert store.get_stats()['dirty'] == ['pending']
+
+        assert export_event_snapshots(test_path) == [test_path / 'assets' / 'json' / 'pending_events.json']
+        assert export_event_snapshots(test_path) == []
+        snapshot = json.loads((test_path / 'assets' / 'json' / 'pending_events.json').read_text())
+        assert [e['id'] for e in snapshot['pending_events']] == ['p1', 'p3', 'p4', 'p5', 'p9']
+        assert snapshot['last_scraped'] is not None
+        assert store.count('pending') == 5
+
+        events = load_events(test_path)
+        events['events'][0]['title'] = 'Konzert (verlegt)'
+        save_events(test_path, events)
+        assert store.get_event('events', 'e1')['title'] == 'Konzert (verlegt)'
+    finally:
+        close_event_stores()
+        shutil.rmtree(test_path)
+
+
+def test_diff_save_only_touches_changed_rows():
+    """save_document reports row-level inserts, updates and deletes"""
+    test_path = _make_repo()
+    try:
+        store = EventStore(test_path)
+        document = store.load_document('pending')
+
+        document['pending_events'][0]['title'] = 'Changed'
+        del document['pending_events'][2]
+        document['pending_events'].append({'id': 'p6', 'title': 'Appended'})
+
+        counts = store.save_document('pending', document, export=False)
+        assert counts == {'inserted': 1, 'updated': 1, 'deleted': 1}
+        assert store.find_by_source('pending', 'frankenpost')[0]['title'] == 'Changed'
+        store.close()
+    finally:
+        shutil.rmtree(test_path)
+
+
+def test_external_snapshot_change_is_reimported():
+    """A snapshot edited outside the store (e.g. git pull) wins on next load"""
+    test_path = _make_repo()
+    try:
+        store = get_event_store(test_path, create=True)
+        assert len(load_events(test_path)['events']) == 1
+
+        events_path = test_path / 'assets' / 'json' / 'events.json'
+        data = json.loads(events_path.read_text())
+        data['events'].append({'id': 'e2', 'title': 'Pulled', 'start_time': '2026-05-01T19:00:00'})
+        events_path.write_text(json.dumps(data, indent=2) + '\n')
+
+        assert [e['id'] for e in load_events(test_path)['events']] == ['e1', 'e2']
+        assert store.find_duplicates('Pulled', '2026-05-01T19:00:00')[0]['id'] == 'e2'
+    finally:
+        close_event_stores()
+        shutil.rmtree(test_path)
+
+
+def test_row_operations_and_pending_count():
+    """Row operations are exported once and pending_count uses the index"""
+    test_path = _make_repo()
+    try:
+        store = get_event_store(test_path, create=True)
+        load_pending_events(test_path)
+
+        assert store.delete_event('pending', 'p1')
+        assert not store.delete_event('pending', 'missing')
+        assert store.upsert_event('pending', {'id': 'p7', 'title': 'Row insert'})
+        assert not store.upsert_event('pending', {'id': 'p7', 'title': 'Row update'})
+        assert store.export_dirty()
+
+        update_pending_count_in_events(test_path)
+        export_event_snapshots(test_path)
+        events = json.loads((test_path / 'assets' / 'json' / 'events.json').read_text())
+        assert events['pending_count'] == 5
+        assert events['last_updated'] == '2026-01-01T00:00:00'
+    finally:
+        close_event_stores()
+        shutil.rmtree(test_path)
+
+
+def test_publish_and_reject_are_row_operations():
+    """Single-event insert, publish and reject never save or write whole documents"""
+    test_path = _make_repo()
+    json_dir = test_path / 'assets' / 'json'
+    saves, writes = [], []
+    original_save, original_write = EventStore.save_document, utils._write_document
+
+    def counting_save(store, collection, document, export=False):
+        saves.append(collection)
+        return original_save(store, collection, document, export)
+
+    def counting_write(path, data):
+        writes.append(Path(path).name)
+        original_write(path, data)
+
+    EventStore.save_document, utils._write_document = counting_save, counting_write
+    try:
+        store = get_event_store(test_path, create=True)
+        pending_before = (json_dir / 'pending_events.json').read_text()
+
+        upsert_pending_event(test_path, {
+            'id': 'p8', 'title': 'Lesung', 'start_time': '2026-03-08T19:00:00', 'category': 'culture',
+            'location': {'name': 'Stadtbücherei', 'lat': 50.31, 'lon': 11.91}, 'source': 'manual',
+        })
+        assert cli_publish_event(test_path, 'p8') == 0
+        assert cli_reject_event(test_path, 'p1') == 0
+        assert cli_publish_event(test_path, 'missing') == 1
+
+        assert saves == [] and 'pending_events.json' not in writes and 'events.json' not in writes
+        assert (json_dir / 'pending_events.json').read_text() == pending_before
+        assert store.get_event('events', 'p8')['status'] == 'published'
+
+        # Unexported changes survive a restart and are exported once
+        close_event_stores()
+        assert len(export_event_snapshots(test_path)) == 2
+        pending = json.loads((json_dir / 'pending_events.json').read_text())
+        assert [e['id'] for e in pending['pending_events']] == ['p2', 'p3', 'p4', 'p5']
+        events = json.loads((json_dir / 'events.json').read_text())
+        assert [e['id'] for e in events['events']] == ['e1', 'p8']
+        assert events['pending_count'] == 4
+    finally:
+        EventStore.save_document, utils._write_document = original_save, original_write
+        close_event_stores()
+        close_backup_archives()
+        shutil.rmtree(test_path)
+
+
+if __name__ == '__main__':
+    test_store_disabled_by_default()
+    test_adapters_round_trip_through_store()
+    test_diff_save_only_touches_changed_rows()
+    test_external_snapshot_change_is_reimported()
+    test_row_operations_and_pending_count()
+    test_publish_and_reject_are_row_operations()
+    print("✓ All event store tests passed")
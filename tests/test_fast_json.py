@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Tests for the pluggable JSON backend (byte-identical output to the stdlib).
+"""
+
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+# Add src to path (go up one level from tests/ to project root, then to src/)
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from modules import fast_json
+
+
+SAMPLE = {
+    'events': [
+        {'id': 'e1', 'title': 'Konzert – Grüße aus Hof 🎉', 'price': 12.5, 'tags': [],
+         'location': {'lat': 50.3167, 'lon': 11.9167, 'name': 'Straße "A"\\B\n'}},
+        {'id': 'e2', 'title': 'Ctrl \x00\x1f\x7f', 'end_time': None, 'big': 2 ** 63 - 1, 'ok': True},
+    ],
+    'empty': {},
+    'pending_count': 0,
+}
+
+
+@pytest.fixture(params=['json', 'orjson', 'ujson'])
+def backend(request):
+    """Run a test against every installed backend"""
+    try:
+        previous = fast_json.set_backend(request.param)
+    except ValueError:
+        pytest.skip(f"{request.param} not installed")
+    yield request.param
+    fast_json.set_backend(previous)
+
+
+def test_dumps_is_byte_identical(backend):
+    """Compact and indent=2 output match the stdlib, with and without ensure_ascii"""
+    for ensure_ascii in (True, False):
+        for kwargs in ({'separators': fast_json.COMPACT}, {'indent': 2}, {'indent': 2, 'sort_keys': True}, {}):
+            expected = json.dumps(SAMPLE, ensure_ascii=ensure_ascii, **kwargs)
+            assert fast_json.dumps(SAMPLE, ensure_ascii=ensure_ascii, **kwargs) == expected
+
+
+def test_unsupported_values_fall_back_to_stdlib(backend):
+    """Values the fast path cannot encode identically still match the stdlib"""
+    data = {1: 'int key', 'huge': 2 ** 70, 'when': datetime(2026, 1, 1, 20, 0)}
+    expected = json.dumps(data, separators=fast_json.COMPACT, default=str)
+    assert fast_json.dumps(data, separators=fast_json.COMPACT, default=str) == expected
+    with pytest.raises(TypeError):
+        fast_json.dumps({'when': datetime(2026, 1, 1)}, indent=2)
+
+
+def test_loads_and_files(backend, tmp_path):
+    """Parsing accepts str/bytes, stdlib extensions and raises JSONDecodeError"""
+    text = json.dumps(SAMPLE, indent=2)
+    assert fast_json.loads(text) == SAMPLE
+    assert fast_json.loads(text.encode('utf-8')) == SAMPLE
+    assert fast_json.loads('[NaN, 1]')[1] == 1
+    with pytest.raises(json.JSONDecodeError):
+        fast_json.loads('{"broken": ')
+
+    path = tmp_path / 'events.json'
+    fast_json.write_json(path, SAMPLE, indent=2)
+    assert path.read_text(encoding='utf-8') == text
+    assert fast_json.read_json(path) == SAMPLE
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, '-v']))
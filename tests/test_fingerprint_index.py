@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Tests for the persistent dedup fingerprint index (modules/fingerprint_index.py)
+and its upkeep by the save_* helpers in utils.py.
+"""
+
+import json
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path (go up one level from tests/ to project root, then to src/)
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from modules import utils
+from modules.backup_archive import close_backup_archives, get_backup_archive
+from modules.fingerprint_index import FingerprintIndex
+
+
+def _setup(test_path):
+    json_dir = test_path / 'assets' / 'json'
+    json_dir.mkdir(parents=True)
+    (json_dir / 'pending_events.json').write_text(json.dumps(
+        {'pending_events': [{'title': 'Flohmarkt', 'start_time': '2030-05-01T08:00:00'}]}))
+    (json_dir / 'events.json').write_text(json.dumps(
+        {'events': [{'title': 'Stadtfest', 'start_time': '2030-06-01T12:00:00'}]}))
+    (json_dir / 'rejected_events.json').write_text(json.dumps(
+        {'rejected_events': [{'title': 'Gewinnspiel', 'source': 'https://spam.example'}]}))
+    return json_dir
+
+
+def test_lookups_and_persistence():
+    """Keys are built once, persisted and answered without parsing documents"""
+    test_path = Path(tempfile.mkdtemp(prefix='krwl_fingerprint_test_'))
+    try:
+        _setup(test_path)
+        get_backup_archive(test_path).append({'title': 'Altstadtfest', 'start_time': '2029-07-01T12:00:00'})
+
+        index = FingerprintIndex(test_path)
+        assert index.contains_event('Flohmarkt', '2030-05-01T08:00:00')
+        assert index.contains_event('Stadtfest', '2030-06-01T12:00:00')
+        assert index.contains_event('Altstadtfest', '2029-07-01T12:00:00')
+        assert not index.contains_event('Flohmarkt', '2030-05-08T08:00:00')
+        assert index.is_rejected('  GEWINNSPIEL ', 'https://spam.example')
+        assert index.get_stats()['rebuilds'] == 3
+
+        # A fresh process trusts the stored sections while the files match
+        original_loader = FingerprintIndex._load_records
+        FingerprintIndex._load_records = lambda self, section: (_ for _ in ()).throw(AssertionError(section))
+        try:
+            reopened = FingerprintIndex(test_path)
+            assert reopened.contains_event('Stadtfest', '2030-06-01T12:00:00')
+            assert reopened.is_rejected('Gewinnspiel', 'https://spam.example')
+            assert reopened.get_stats()['rebuilds'] == 0
+        finally:
+            FingerprintIndex._load_records = original_loader
+    finally:
+        close_backup_archives()
+        shutil.rmtree(test_path)
+
+
+def test_saves_update_index_and_external_edits_rebuild():
+    """save_* helpers refresh sections, foreign writes trigger a section rebuild"""
+    test_path = Path(tempfile.mkdtemp(prefix='krwl_fingerprint_test_'))
+    try:
+        json_dir = _setup(test_path)
+        utils.add_rejected_event(test_path, 'Werbung', 'https://ads.example')
+        pending = utils.load_pending_events(test_path)
+        pending['pending_events'].append({'title': 'Lesung', 'start_time': '2030-05-02T19:00:00'})
+        utils.save_pending_events(test_path, pending)
+
+        index = FingerprintIndex(test_path)
+        assert index.is_rejected('Werbung', 'https://ads.example')
+        assert index.contains_event('Lesung', '2030-05-02T19:00:00')
+        # pending and rejected were refreshed on save
+        assert index.get_stats()['rebuilds'] == 0
+        assert index.contains_event('Stadtfest', '2030-06-01T12:00:00')
+        assert index.get_stats()['rebuilds'] == 1
+
+        (json_dir / 'events.json').write_text(json.dumps({'events': []}))
+        utils.invalidate_document()
+        assert not index.contains_event('Stadtfest', '2030-06-01T12:00:00')
+        assert index.get_stats()['rebuilds'] == 2
+    finally:
+        close_backup_archives()
+        shutil.rmtree(test_path)
+
+
+if __name__ == '__main__':
+    test_lookups_and_persistence()
+    test_saves_update_index_and_external_edits_rebuild()
+    print("✓ All fingerprint index tests passed")
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Tests for the content-addressed flyer cache
+(modules/smart_scraper/image_analyzer/flyer_cache.py) and its use by
+ImageAnalyzer.analyze_url/analyze_bytes.
+"""
+
+import shutil
+import sys
+import tempfile
+from concurrent.futures import Future
+from pathlib import Path
+
+# Add src to path (go up one level from tests/ to project root, then to src/)
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from modules.smart_scraper.image_analyzer import analyzer as analyzer_module
+from modules.smart_scraper.image_analyzer.analyzer import ImageAnalyzer
+from modules.smart_scraper.image_analyzer.flyer_cache import FlyerCache, content_hash
+
+
+class FakeResponse:
+    def __init__(self, content):
+        self.content = content
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    """Serves image bytes by URL and counts downloads"""
+
+    def __init__(self, images):
+        self.images = images
+        self.downloads = []
+
+    def get(self, url, timeout=None):
+        self.downloads.append(url)
+        return FakeResponse(self.images[url])
+
+
+class FakeOCRService:
+    """Reads the image bytes as text; photos have none"""
+
+    def __init__(self, ocr_calls):
+        self.ocr_calls = ocr_calls
+
+    def submit_batch(self, images):
+        futures = []
+        for image_data in images:
+            self.ocr_calls.append(image_data)
+            future = Future()
+            future.set_result({'text': None if image_data.startswith(b'photo') else image_data.decode(),
+                               'metadata': {}})
+            futures.append(future)
+        return futures
+
+
+def _analyzer(cache, ocr_calls):
+    analyzer_module.is_ocr_available = lambda: True
+    analyzer = ImageAnalyzer({'languages': ['eng', 'deu']})
+    analyzer.ocr_service = FakeOCRService(ocr_calls)
+    analyzer.result_cache = cache
+    return analyzer
+
+
+def test_images_are_downloaded_and_ocrd_once():
+    """Repeat posts need no download, re-posts under new URLs no OCR"""
+    test_path = Path(tempfile.mkdtemp(prefix='krwl_flyer_cache_test_'))
+    saved = analyzer_module.is_ocr_available
+    try:
+        cache = FlyerCache(test_path)
+        ocr_calls = []
+        analyzer = _analyzer(cache, ocr_calls)
+        session = FakeSession({'https://cdn/a?sig=1': b'Konzert 12.05.', 'https://cdn/a?sig=2': b'Konzert 12.05.',
+                               'https://cdn/photo': b'photo without text'})
+
+        first = analyzer.analyze_url('https://cdn/a?sig=1', source_key='facebook:1:0', session=session)
+        assert first['ocr_text'] == 'Konzert 12.05.'
+        assert session.downloads == ['https://cdn/a?sig=1']
+
+        # Same post, new CDN signature: answered by post key without download
+        again = analyzer.analyze_url('https://cdn/a?sig=2', source_key='facebook:1:0', session=session)
+        assert again == first and len(session.downloads) == 1
+
+        # Same image in another post: downloaded, but not OCR'd again
+        other = analyzer.analyze_url('https://cdn/a?sig=2', source_key='instagram:9:0', session=session)
+        assert other == first and len(ocr_calls) == 1
+
+        # Images without results are cached as well
+        assert analyzer.analyze_url('https://cdn/photo', session=session) is None
+        assert analyzer.analyze_url('https://cdn/photo', session=session) is None
+        assert len(ocr_calls) == 2
+
+        # Results survive the process (new cache object, same directory)
+        cache.close()
+        analyzer.result_cache = FlyerCache(test_path)
+        assert analyzer.analyze_bytes(b'Konzert 12.05.') == first
+        assert len(ocr_calls) == 2
+        assert analyzer.result_cache.get_stats()['hits'] == 1
+        analyzer.result_cache.close()
+    finally:
+        analyzer_module.is_ocr_available = saved
+        shutil.rmtree(test_path)
+
+
+def test_image_directory_is_size_capped():
+    """Least recently used images are evicted above max_size_mb"""
+    test_path = Path(tempfile.mkdtemp(prefix='krwl_flyer_cache_test_'))
+    try:
+        cache = FlyerCache(test_path, max_size_mb=2.5 / 1024)  # 2.5 KB
+        images = [bytes([i]) * 1024 for i in range(3)]
+        for image in images[:2]:
+            cache.put(content_hash(image), 'eng', {'ocr_text': 'x'}, image)
+        # Touch the first image so the second is least recently used
+        assert cache.get_result(content_hash(images[0]), 'eng')[0]
+        cache.put(content_hash(images[2]), 'eng', None, images[2])
+
+        assert cache.blob_path(content_hash(images[0])).exists()
+        assert not cache.blob_path(content_hash(images[1])).exists()
+        assert cache.blob_path(content_hash(images[2])).exists()
+        stats = cache.get_stats()
+        assert stats['images'] == 2 and stats['image_bytes'] == 2048
+        # Evicting an image keeps its (small) OCR result
+        assert cache.get_result(content_hash(images[1]), 'eng') == (True, {'ocr_text': 'x'})
+        # Other analyzer settings are a different result
+        assert cache.get_result(content_hash(images[1]), 'eng+deu') == (False, None)
+        cache.close()
+    finally:
+        shutil.rmtree(test_path)
+
+
+if __name__ == '__main__':
+    test_images_are_downloaded_and_ocrd_once()
+    test_image_directory_is_size_capped()
+    print("✓ All flyer cache tests passed")
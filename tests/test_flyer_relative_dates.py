@@ -4,7 +4,6 @@ Tests for flyer relative date parsing and AI fallback extraction.
 """
 
 import sys
-import json
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -139,15 +138,11 @@ def test_post_cache_skips_processed_posts(tmp_path):
     assert len(first_run) == 1
     assert second_run == []
 
-    cache_path = (
-        tmp_path / "data" / "scraper_cache" / "facebook_posts_test_source.json"
-    )
+    cache_path = tmp_path / "data" / "scraper_cache" / "items.sqlite3"
     assert cache_path.exists()
-    cached = json.loads(cache_path.read_text())
-    assert post_key in cached.get("processed_keys", [])
 
     new_source = build_source(base_path=tmp_path)
-    assert new_source.post_cache.is_processed(post_key)
+    assert new_source.post_cache.is_unchanged(post_key, post_key)
 
     source.force_scan = True
     third_run = source._process_posts(posts)
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Tests for the HTTP conditional-request cache (modules/http_cache.py).
+"""
+
+import shutil
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests
+
+# Add src to path (go up one level from tests/ to project root, then to src/)
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from modules import scraper as scraper_module
+from modules.http_cache import HTTPCache
+from modules.smart_scraper.sources.web.html import HTMLSource
+from modules.smart_scraper.base import SourceOptions
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """/etag/N and /dated answer 304 to matching validators, /plain has none"""
+    version = 'v1'
+
+    def do_GET(self):
+        if self.path.startswith('/etag/'):
+            etag = f'"{self.path[6:]}-{_Handler.version}"'
+            if self.headers.get('If-None-Match') == etag:
+                return self._reply(304, b'', {'ETag': etag})
+            body = f'<div class="event"><h3>Konzert {self.path[6:]}</h3><p>12.03.2030</p></div>'
+            self._reply(200, body.encode('utf-8') * 20, {'ETag': etag, 'Content-Type': 'text/html; charset=utf-8'})
+        elif self.path == '/dated':
+            modified = 'Wed, 01 Jan 2025 10:00:00 GMT'
+            if self.headers.get('If-Modified-Since') == modified:
+                return self._reply(304, b'', {})
+            self._reply(200, b'{"events": []}', {'Last-Modified': modified})
+        else:
+            self._reply(200, b'plain', {})
+
+    def _reply(self, status, body, headers):
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _serve():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f'http://127.0.0.1:{server.server_address[1]}'
+
+
+def test_revalidation_and_persistence():
+    """Second fetch sends validators, a 304 is served from disk"""
+    server, base = _serve()
+    test_path = Path(tempfile.mkdtemp(prefix='krwl_http_cache_test_'))
+    try:
+        session = requests.Session()
+        cache = HTTPCache(test_path)
+        first = cache.get(session, f'{base}/etag/1', timeout=5)
+        assert first.status_code == 200 and not first.not_modified
+        cache.get(session, f'{base}/dated', timeout=5)
+        cache.get(session, f'{base}/plain', timeout=5)
+        cache.flush()
+
+        # A new instance (next scrape run) reads the persisted index
+        cache = HTTPCache(test_path)
+        second = cache.get(session, f'{base}/etag/1', timeout=5)
+        assert second.not_modified and second.from_cache
+        assert second.status_code == 200
+        assert second.content == first.content
+        assert second.text == first.text
+        assert cache.get(session, f'{base}/dated', timeout=5).json() == {'events': []}
+        assert not cache.get(session, f'{base}/plain', timeout=5).not_modified
+
+        stats = cache.get_stats()
+        assert stats['requests'] == 3
+        assert stats['not_modified'] == 2
+        assert stats['entries'] == 2
+        assert stats['bytes_saved'] == len(first.content) + len(b'{"events": []}')
+
+        # A changed page is downloaded and stored again
+        _Handler.version = 'v2'
+        third = cache.get(session, f'{base}/etag/1', timeout=5)
+        assert not third.not_modified
+        assert cache.get(session, f'{base}/etag/1', timeout=5).not_modified
+    finally:
+        _Handler.version = 'v1'
+        server.shutdown()
+        shutil.rmtree(test_path)
+
+
+def test_lru_eviction():
+    """Least recently used bodies are dropped above the size cap"""
+    server, base = _serve()
+    test_path = Path(tempfile.mkdtemp(prefix='krwl_http_cache_test_'))
+    try:
+        session = requests.Session()
+        size = len(session.get(f'{base}/etag/0').content)
+        cache = HTTPCache(test_path, max_size_mb=(size * 2.5) / 1024 / 1024)
+        cache.get(session, f'{base}/etag/0', timeout=5)
+        cache.get(session, f'{base}/etag/1', timeout=5)
+        assert cache.get(session, f'{base}/etag/0', timeout=5).not_modified  # 0 is now newer than 1
+        cache.get(session, f'{base}/etag/2', timeout=5)
+
+        stats = cache.get_stats()
+        assert stats['evicted'] == 1
+        assert stats['entries'] == 2
+        assert stats['size_bytes'] <= cache.max_bytes
+        assert not cache.get(session, f'{base}/etag/1', timeout=5).not_modified
+        assert len(list(cache.cache_dir.glob('*.body'))) == 2
+    finally:
+        server.shutdown()
+        shutil.rmtree(test_path)
+
+
+def test_source_skips_unchanged_page():
+    """Sources parse a page once and return nothing while it answers 304"""
+    server, base = _serve()
+    test_path = Path(tempfile.mkdtemp(prefix='krwl_http_cache_test_'))
+    try:
+        config = {'name': 'Test', 'url': f'{base}/etag/source', 'type': 'html'}
+        source = HTMLSource(config, SourceOptions(), base_path=test_path)
+        assert len(source.scrape()) > 0
+        assert source.scrape() == []
+
+        # skip_unchanged=False still saves the download but parses the cached body
+        source = HTMLSource(config, SourceOptions(skip_unchanged=False), base_path=test_path)
+        assert len(source.scrape()) > 0
+    finally:
+        server.shutdown()
+        shutil.rmtree(test_path)
+
+
+def test_validators_persist_after_pending_is_saved():
+    """A run that crashes before pending events are saved leaves no validators"""
+    server, base = _serve()
+    test_path = Path(tempfile.mkdtemp(prefix='krwl_http_cache_test_'))
+    (test_path / 'assets' / 'json').mkdir(parents=True)
+    (test_path / 'assets' / 'json' / 'events.json').write_text('{"events": []}')
+    save_pending_events = scraper_module.save_pending_events
+    try:
+        scraper = scraper_module.EventScraper(
+            {'scraping': {'sources': [{'name': 'Fake', 'type': 'html', 'enabled': True}]}}, test_path
+        )
+        scraper._check_scraping_available = lambda: True
+
+        def scrape_source(source):
+            scraper.http_cache.get(scraper.session, f'{base}/etag/1', timeout=5)
+            return [{'id': f'{base}#konzert', 'title': 'Konzert 1', 'description': 'Konzert in der Freiheitshalle',
+                     'start_time': '2030-03-12T20:00:00', 'source': base,
+                     'location': {'name': 'Freiheitshalle Hof', 'lat': 50.3167, 'lon': 11.9167}}]
+
+        def crash(*args, **kwargs):
+            raise OSError('disk full')
+
+        scraper.scrape_source = scrape_source
+        scraper_module.save_pending_events = crash
+        try:
+            scraper.scrape_all_sources()
+        except OSError:
+            pass
+        assert not scraper.http_cache.index_file.exists()
+
+        scraper_module.save_pending_events = save_pending_events
+        scraper.scrape_all_sources()
+        assert scraper.http_cache.index_file.exists()
+    finally:
+        scraper_module.save_pending_events = save_pending_events
+        server.shutdown()
+        shutil.rmtree(test_path)
+
+
+if __name__ == '__main__':
+    test_revalidation_and_persistence()
+    test_lru_eviction()
+    test_source_skips_unchanged_page()
+    test_validators_persist_after_pending_is_saved()
+    print("✓ All HTTP cache tests passed")
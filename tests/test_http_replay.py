@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Tests for HTTP record/replay (modules/http_replay.py) and the offline
+scraper benchmark (modules/scraper_benchmark.py).
+"""
+
+import shutil
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests
+
+# Add src to path (go up one level from tests/ to project root, then to src/)
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from event_manager import cli_scrape
+from modules.http_replay import HTTPCorpus
+from modules.scraper_benchmark import benchmark_sources
+from modules.smart_scraper.base import SourceOptions
+from modules.smart_scraper.sources.web.api import APISource
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """/events returns a JSON event list, everything else 404"""
+
+    def do_GET(self):
+        if self.path == '/events':
+            body = b'{"events": [' + b','.join(
+                b'{"id": %d, "title": "Konzert %d", "description": "Live-Musik im Kulturzentrum Hof", '
+                b'"start_time": "2030-03-%02dT19:00:00"}' % (i, i, i + 1) for i in range(5)) + b']}'
+            self._reply(200, body, 'application/json')
+        else:
+            self._reply(404, b'not found', 'text/plain')
+
+    def _reply(self, status, body, content_type):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _record(corpus_dir):
+    """Record an API source scrape plus a 404; returns the source config"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f'http://127.0.0.1:{server.server_address[1]}'
+    source = {'name': 'Test API', 'url': f'{base}/events', 'type': 'api', 'enabled': True}
+    try:
+        with HTTPCorpus(corpus_dir).record():
+            events = APISource(source, SourceOptions()).scrape()
+            requests.get(f'{base}/missing', timeout=5)
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert len(events) == 5
+    return source
+
+
+def test_record_and_replay_offline():
+    """Recorded exchanges are served back after the server is gone"""
+    corpus_dir = Path(tempfile.mkdtemp(prefix='krwl_replay_test_'))
+    try:
+        source = _record(corpus_dir)
+        corpus = HTTPCorpus(corpus_dir).load()
+        assert corpus.get_stats()['exchanges'] == 2
+
+        with HTTPCorpus(corpus_dir).replay():
+            events = APISource(source, SourceOptions()).scrape()
+            missing = requests.get(source['url'].replace('/events', '/missing'), timeout=5)
+            try:
+                requests.get(source['url'] + '?page=2', timeout=5)
+                assert False, "unrecorded request must fail"
+            except requests.exceptions.ConnectionError:
+                pass
+        assert [e['title'] for e in events] == [f'Konzert {i}' for i in range(5)]
+        assert missing.status_code == 404
+
+        # Patch is removed after the block
+        try:
+            requests.get(source['url'], timeout=1)
+            assert False, "network must be live again (and the server is gone)"
+        except requests.exceptions.ConnectionError:
+            pass
+    finally:
+        shutil.rmtree(corpus_dir)
+
+
+def test_benchmark_sources():
+    """bench scrapers measures recorded sources and flags unrecorded ones"""
+    corpus_dir = Path(tempfile.mkdtemp(prefix='krwl_replay_test_'))
+    base_path = Path(tempfile.mkdtemp(prefix='krwl_replay_test_'))
+    try:
+        source = _record(corpus_dir)
+        config = {'scraping': {'sources': [
+            source,
+            {'name': 'Offline', 'url': 'http://127.0.0.1:9/feed', 'type': 'rss', 'enabled': True},
+            {'name': 'Disabled', 'url': source['url'], 'type': 'api', 'enabled': False},
+        ]}}
+        results = benchmark_sources(config, base_path, corpus_dir, rounds=2)
+        assert [r.name for r in results] == ['Test API', 'Offline']
+        assert results[0].error is None
+        assert results[0].events == 5
+        assert results[0].parse_ms > 0 and results[0].events_per_second > 0
+        assert results[0].peak_kb > 0
+        assert results[1].error == 'not recorded'
+    finally:
+        shutil.rmtree(corpus_dir)
+        shutil.rmtree(base_path)
+
+
+def test_replay_is_a_dry_run():
+    """scrape --replay returns the replayed events but saves nothing"""
+    corpus_dir = Path(tempfile.mkdtemp(prefix='krwl_replay_test_'))
+    base_path = Path(tempfile.mkdtemp(prefix='krwl_replay_test_'))
+    try:
+        source = _record(corpus_dir)
+        json_dir = base_path / 'assets' / 'json'
+        json_dir.mkdir(parents=True)
+        (json_dir / 'events.json').write_text('{"events": []}')
+        pending_file = json_dir / 'pending_events.json'
+        pending_file.write_text('{"pending_events": [], "last_scraped": "2030-01-01T00:00:00"}')
+        before = pending_file.read_bytes()
+
+        config = {'scraping': {'sources': [source]}}
+        assert cli_scrape(base_path, config, replay_dir=corpus_dir) == 0
+        assert pending_file.read_bytes() == before
+        assert not (base_path / '.scrape_status').exists()
+        assert not (base_path / '.cache' / 'http' / 'index.json').exists()
+    finally:
+        shutil.rmtree(corpus_dir)
+        shutil.rmtree(base_path)
+
+
+if __name__ == '__main__':
+    test_record_and_replay_offline()
+    test_benchmark_sources()
+    test_replay_is_a_dry_run()
+    print("✓ All HTTP record/replay tests passed")
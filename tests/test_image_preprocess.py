@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Tests for the single-decode OCR pipeline
+(modules/smart_scraper/image_analyzer/preprocess.py) and its use by
+ImageAnalyzer.analyze_files.
+
+The image operations need Pillow and are skipped without it; the scaling
+and threshold maths and the analyzer wiring are tested either way.
+"""
+
+import shutil
+import sys
+import tempfile
+from concurrent.futures import Future
+from io import BytesIO
+from pathlib import Path
+
+# Add src to path (go up one level from tests/ to project root, then to src/)
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from modules.smart_scraper.image_analyzer import analyzer as analyzer_module
+from modules.smart_scraper.image_analyzer.analyzer import ImageAnalyzer
+from modules.smart_scraper.image_analyzer.preprocess import (
+    PIL_AVAILABLE, otsu_threshold, preprocessing_settings, target_scale
+)
+
+
+def test_target_scale():
+    """Phone photos are scaled to A5 at 300 dpi, scans by their dpi, small images kept"""
+    settings = preprocessing_settings()
+    # 4032 px long side, no usable dpi: 300 * 8.27 = 2481 px
+    assert abs(target_scale((4032, 3024), 72, settings) - 2481 / 4032) < 0.001
+    assert abs(target_scale((3024, 4032), None, settings) - 2481 / 4032) < 0.001
+    # 600 dpi scan: halve
+    assert target_scale((4960, 7016), 600, settings) == 0.5
+    # Never upscale
+    assert target_scale((1080, 1350), 72, settings) == 1.0
+    assert target_scale((2000, 2000), 200, settings) == 1.0
+
+
+def test_otsu_threshold():
+    """Threshold lies between the text and the background peaks"""
+    histogram = [0] * 256
+    histogram[30] = 1000   # dark text
+    histogram[220] = 5000  # light paper
+    threshold = otsu_threshold(histogram)
+    assert 30 <= threshold < 220
+    assert otsu_threshold([0] * 256) == 128
+
+
+def test_settings_merge_over_defaults():
+    settings = preprocessing_settings({'deskew': True, '_comment': 'ignored'})
+    assert settings['deskew'] is True
+    assert settings['normalize_contrast'] is True
+    assert '_comment' not in settings
+
+
+def test_pipeline_decodes_once_and_shrinks():
+    """A large JPEG comes out grayscale at OCR size with its original metadata"""
+    if not PIL_AVAILABLE:
+        print("  (Pillow not installed - skipping image pipeline test)")
+        return
+    from PIL import Image
+    from modules.smart_scraper.image_analyzer.preprocess import load_for_ocr
+
+    buffer = BytesIO()
+    Image.new('RGB', (4000, 3000), 'white').save(buffer, format='JPEG')
+    img, metadata = load_for_ocr(buffer.getvalue(), preprocessing_settings({'deskew': True, 'binarize': True}))
+    assert metadata['width'] == 4000 and metadata['height'] == 3000 and metadata['format'] == 'JPEG'
+    assert img.mode == 'L'
+    assert max(img.size) <= 2481
+
+    untouched, _ = load_for_ocr(buffer.getvalue(), {'enabled': False})
+    assert untouched.size == (4000, 3000) and untouched.mode == 'RGB'
+
+
+def test_deskew_levels_text_and_keeps_blank_pages():
+    """Skewed text lines are levelled; a blank page is not rotated"""
+    if not PIL_AVAILABLE:
+        print("  (Pillow not installed - skipping deskew test)")
+        return
+    from PIL import Image, ImageDraw
+    from modules.smart_scraper.image_analyzer.preprocess import estimate_skew, prepare_for_ocr
+
+    assert estimate_skew(Image.new('L', (800, 600), 255)) == 0.0
+
+    page = Image.new('L', (800, 600), 255)
+    draw = ImageDraw.Draw(page)
+    for y in range(60, 560, 40):
+        draw.rectangle((80, y, 720, y + 12), fill=0)
+    skewed = page.rotate(3, resample=Image.BICUBIC, fillcolor=255)
+    assert abs(estimate_skew(skewed) + 3) <= 0.5
+
+    settings = preprocessing_settings({'deskew': True})
+    assert prepare_for_ocr(skewed, settings).size == skewed.size
+
+
+class FakeOCRService:
+    """Returns text and metadata like the OCR workers; records what it got"""
+
+    def __init__(self):
+        self.submitted = []
+
+    def submit_batch(self, images):
+        futures = []
+        for image_data in images:
+            self.submitted.append(image_data)
+            future = Future()
+            future.set_result({'text': 'Flyer 12.05.',
+                               'metadata': {'width': 10, 'height': 10, 'gps': {'lat': 50.3, 'lon': 11.9}}})
+            futures.append(future)
+        return futures
+
+
+class FakeProvider:
+    def __init__(self):
+        self.images = []
+
+    def extract_event_info(self, text):
+        return None
+
+    def analyze_image(self, image_data):
+        self.images.append(image_data)
+        return {'title_hint': 'AI title'}
+
+
+def test_analyze_files_reads_each_file_once():
+    """Worker metadata is used, OCR and AI share the bytes read from disk"""
+    test_path = Path(tempfile.mkdtemp(prefix='krwl_preprocess_test_'))
+    saved = analyzer_module.is_ocr_available
+    try:
+        analyzer_module.is_ocr_available = lambda: True
+        flyer = test_path / 'flyer.jpg'
+        flyer.write_bytes(b'flyer bytes')
+        provider = FakeProvider()
+        analyzer = ImageAnalyzer({'languages': ['eng', 'deu']}, ai_providers={'fake': provider})
+        analyzer.ocr_service = FakeOCRService()
+
+        result, missing = analyzer.analyze_files([str(flyer), str(test_path / 'missing.jpg')])
+        assert missing is None
+        assert analyzer.ocr_service.submitted == [b'flyer bytes']
+        assert result['location']['lat'] == 50.3
+        assert result['dates_found'] and result['ocr_text'] == 'Flyer 12.05.'
+        # OCR confidence below 0.5: AI image analysis got the same bytes
+        assert result['ocr_confidence'] < 0.5
+        assert provider.images == [b'flyer bytes'] and result['title_hint'] == 'AI title'
+    finally:
+        analyzer_module.is_ocr_available = saved
+        shutil.rmtree(test_path)
+
+
+if __name__ == '__main__':
+    test_target_scale()
+    test_otsu_threshold()
+    test_settings_merge_over_defaults()
+    test_pipeline_decodes_once_and_shrinks()
+    test_deskew_levels_text_and_keeps_blank_pages()
+    test_analyze_files_reads_each_file_once()
+    print("✓ All image preprocessing tests passed")
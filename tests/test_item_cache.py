@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Tests for the incremental-scrape item fingerprint cache
+(smart_scraper/source_cache.py) and its BaseSource integration.
+"""
+
+import json
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add src to path (go up one level from tests/ to project root, then to src/)
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from modules.smart_scraper.base import BaseSource, SourceOptions
+from modules.smart_scraper.core import SmartScraper
+from modules.smart_scraper.source_cache import ItemCache, fingerprint, get_item_cache_path
+
+
+class _Source(BaseSource):
+    """Extracts one event per item, counting extractions"""
+
+    def __init__(self, items, base_path, options=None):
+        super().__init__({'name': 'Test Source', 'url': 'https://example.org'},
+                         options or SourceOptions(), base_path=base_path)
+        self.items = items
+        self.extracted = 0
+
+    def scrape(self):
+        events = []
+        for item in self.items:
+            if self.is_item_unchanged(item, key=item['id']):
+                continue
+            self.extracted += 1
+            event = {'title': item['title']}
+            if not self.filter_event(event):
+                events.append(event)
+                self.remember_item(item, key=item['id'])
+        return events
+
+
+def test_unchanged_items_are_skipped():
+    """Only new or changed items are extracted on the next run"""
+    test_path = Path(tempfile.mkdtemp(prefix='krwl_item_cache_test_'))
+    try:
+        items = [{'id': str(i), 'title': f'Konzert {i}'} for i in range(5)]
+        source = _Source(items, test_path)
+        assert len(source.scrape()) == 5
+        source.save_item_cache()
+
+        items[2] = {'id': '2', 'title': 'Konzert 2 (verlegt)'}
+        items.append({'id': '5', 'title': 'Konzert 5'})
+        source = _Source(items, test_path)
+        assert [e['title'] for e in source.scrape()] == ['Konzert 2 (verlegt)', 'Konzert 5']
+        assert source.item_cache.stats == {'new': 1, 'changed': 1, 'unchanged': 4, 'evicted': 0}
+        source.save_item_cache()
+
+        # skip_unchanged=False extracts everything again
+        source = _Source(items, test_path, SourceOptions(skip_unchanged=False))
+        assert len(source.scrape()) == 6
+
+        # Without base_path there is no cache
+        assert _Source(items, None).item_cache is None
+        assert len(_Source(items, None).scrape()) == 6
+    finally:
+        shutil.rmtree(test_path)
+
+
+def test_lru_and_ttl_eviction():
+    """Least recently seen entries are evicted, expired entries are not loaded"""
+    test_path = Path(tempfile.mkdtemp(prefix='krwl_item_cache_test_'))
+    try:
+        db_path = get_item_cache_path(test_path)
+        cache = ItemCache(db_path, 'LRU', max_entries=3)
+        for key in ['a', 'b', 'c']:
+            cache.remember(key, fingerprint(key))
+        cache.save()
+
+        # Keys sort alphabetically but 'a' was seen most recently - 'b' goes
+        cache = ItemCache(db_path, 'LRU', max_entries=3)
+        time.sleep(0.01)
+        assert cache.is_unchanged('a', fingerprint('a'))
+        cache.remember('d', fingerprint('d'))
+        cache.save()
+        assert cache.stats['evicted'] == 1
+        assert sorted(ItemCache(db_path, 'LRU').entries) == ['a', 'c', 'd']
+
+        # Entries not seen within ttl_days are dropped
+        cache = ItemCache(db_path, 'TTL', ttl_days=1)
+        cache.remember('old', 'x')
+        cache.remember('new', 'y')
+        cache.entries['old'] = ('x', time.time() - 3 * 86400, time.time() - 2 * 86400)
+        cache.save()
+        assert list(ItemCache(db_path, 'TTL', ttl_days=1).entries) == ['new']
+
+        # Sources are partitioned
+        assert sorted(ItemCache(db_path, 'LRU').entries) == ['a', 'c', 'd']
+    finally:
+        shutil.rmtree(test_path)
+
+
+def test_import_legacy_source_cache():
+    """The former per-source JSON files are migrated once"""
+    test_path = Path(tempfile.mkdtemp(prefix='krwl_item_cache_test_'))
+    try:
+        legacy = test_path / 'data' / 'scraper_cache' / 'facebook_posts_test.json'
+        legacy.parent.mkdir(parents=True)
+        legacy.write_text(json.dumps({'processed_keys': ['k1', 'k2']}))
+
+        cache = ItemCache(get_item_cache_path(test_path), 'Test')
+        assert cache.import_legacy(legacy) == 2
+        assert not legacy.exists()
+        assert ItemCache(get_item_cache_path(test_path), 'Test').is_unchanged('k2', 'k2')
+    finally:
+        shutil.rmtree(test_path)
+
+
+def test_only_stored_events_are_remembered():
+    """Filtered items are not remembered; caches are written by save_item_caches()"""
+    test_path = Path(tempfile.mkdtemp(prefix='krwl_item_cache_test_'))
+    try:
+        items = [{'id': '1', 'title': 'Konzert'}, {'id': '2', 'title': 'Konzert (abgesagt)'}]
+        sources = []
+
+        def factory(source, options):
+            sources.append(_Source(items, test_path, options))
+            return sources[-1]
+
+        smart = SmartScraper({}, test_path)
+        smart.registry.register('test', factory)
+        source = {'name': 'Test Source', 'type': 'test', 'options': {'exclude_keywords': ['abgesagt']}}
+        db_path = get_item_cache_path(test_path)
+
+        assert [e['title'] for e in smart.scrape_source(source)] == ['Konzert']
+        assert not db_path.exists()
+        smart.save_item_caches()
+        assert list(ItemCache(db_path, 'Test Source').entries) == ['1']
+
+        # The filtered item is extracted again; a discarded run remembers nothing
+        items.append({'id': '3', 'title': 'Lesung'})
+        assert [e['title'] for e in smart.scrape_source(source)] == ['Lesung']
+        assert sources[-1].extracted == 2
+        smart.discard_item_caches()
+        smart.save_item_caches()
+        assert list(ItemCache(db_path, 'Test Source').entries) == ['1']
+    finally:
+        shutil.rmtree(test_path)
+
+
+if __name__ == '__main__':
+    test_unchanged_items_are_skipped()
+    test_lru_and_ttl_eviction()
+    test_import_legacy_source_cache()
+    test_only_stored_events_are_remembered()
+    print("✓ All item cache tests passed")
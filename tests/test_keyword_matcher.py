@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Tests for the compiled keyword matcher (modules/keyword_matcher.py) and the
+keyword categorizers built on it.
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path (go up one level from tests/ to project root, then to src/)
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from modules.keyword_matcher import KeywordMatcher
+from modules.ai_categorizer import AICategorizer
+from modules.event_schema import EventSchema
+
+
+def test_counts_distinct_keywords_per_category():
+    """Counts match one substring test per keyword, once per keyword"""
+    matcher = KeywordMatcher({'music': ['concert', 'band', 'jazz'], 'food': ['food', 'jazz']})
+    counts = matcher.count("jazz concert, jazz band and street food")
+    assert counts == {'music': 3, 'food': 2}
+    assert matcher.count("nothing here") == {}
+
+
+def test_keywords_match_at_word_boundaries():
+    """Keywords match word starts, long ones also word ends (compounds)"""
+    matcher = KeywordMatcher({'arts': ['art'], 'music': ['band'], 'sports': ['training', 'sport']})
+    assert matcher.count("start of the party") == {}
+    assert matcher.count("verband") == {}
+    assert matcher.count("artists and bands") == {'arts': 1, 'music': 1}
+    assert matcher.count("krafttraining") == {'sports': 1}
+    # Short keywords do not match inside words ("sport" is long enough)
+    assert matcher.count("gesundheitssport") == {'sports': 1}
+
+
+def test_overlapping_keywords_are_all_counted():
+    """A longer match also counts the keywords it starts or ends with"""
+    matcher = KeywordMatcher({'festivals': ['fest', 'festival'], 'community': ['social event', 'event']})
+    assert matcher.count("festival") == {'festivals': 2}
+    assert matcher.count("a social event") == {'community': 2}
+
+
+def test_first_match_follows_map_order():
+    """first_match returns the earliest category, not the earliest keyword"""
+    matcher = KeywordMatcher({'music': ['concert'], 'food': ['food']})
+    assert matcher.first_match("food before the concert") == 'music'
+    assert matcher.first_match("nothing") is None
+
+
+def test_categorizers_use_compiled_maps():
+    """Keyword fallbacks of AICategorizer and EventSchema"""
+    categorizer = AICategorizer({'ai': {'categorization': {'enabled': False}}}, Path('.'))
+    category, confidence, method = categorizer.categorize_event("Jazz night", "Live music with a band")
+    assert (category, method) == ('music', 'keyword')
+    assert confidence > 0
+    schema = EventSchema()
+    schema.ai_categorizer = None
+    assert schema._infer_category("Weekly market", "") == 'shopping'
+    assert schema._infer_category("Restart", "") == 'default'
+
+
+if __name__ == '__main__':
+    test_counts_distinct_keywords_per_category()
+    test_keywords_match_at_word_boundaries()
+    test_overlapping_keywords_are_all_counted()
+    test_first_match_follows_map_order()
+    test_categorizers_use_compiled_maps()
+    print("✓ All keyword matcher tests passed")
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Tests for lazy source and AI provider registration: SOURCE_ENTRY_POINTS in
+ScraperRegistry (modules/smart_scraper/base.py) and LazyProvider
+(modules/smart_scraper/ai_providers/__init__.py).
+
+Import checks run in a fresh interpreter, since other tests may already
+have imported the source modules.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).parent.parent / 'src'
+
+# Add src to path (go up one level from tests/ to project root, then to src/)
+sys.path.insert(0, str(SRC))
+
+from modules.smart_scraper.ai_providers import LazyProvider, build_provider_router, get_available_providers
+from modules.smart_scraper.ai_providers import ollama as ollama_module
+from modules.smart_scraper.ai_providers.ollama import OllamaProvider
+from modules.smart_scraper.base import SOURCE_ENTRY_POINTS, BaseSource, ScraperRegistry
+
+# Modules of the built-in source types
+SOURCE_MODULES = {'modules.smart_scraper' + target.split(':')[0] for target in SOURCE_ENTRY_POINTS.values()}
+
+CONFIG = {
+    'scraping': {'sources': [
+        {'name': 'Stadt Feed', 'type': 'rss', 'url': 'https://example.org/feed', 'enabled': True},
+        {'name': 'VHS Last Minute', 'type': 'html', 'url': 'https://example.org/vhs', 'enabled': True},
+    ]},
+    'ai': {'ollama': {'host': 'http://127.0.0.1:9', 'model': 'llama3.2'}},
+}
+
+
+def _imported_after(code):
+    """Source modules and provider state after running code in a fresh interpreter"""
+    script = f'''
+import json, sys
+sys.path.insert(0, {str(SRC)!r})
+from modules.smart_scraper import SmartScraper
+scraper = SmartScraper(json.loads({json.dumps(json.dumps(CONFIG))}), {str(SRC.parent)!r})
+{code}
+providers = scraper.ai_providers.providers
+print(json.dumps({{
+    'sources': sorted(m for m in sys.modules if m.startswith('modules.smart_scraper.sources.')),
+    'ollama_loaded': providers['ollama'].loaded,
+}}))
+'''
+    output = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def test_smart_scraper_imports_no_source_up_front():
+    """Creating a SmartScraper imports no source module and constructs no provider"""
+    state = _imported_after('')
+    assert state['sources'] == []
+    assert state['ollama_loaded'] is False
+
+
+def test_single_source_imports_only_its_module():
+    """Resolving one source type imports that module (and its helpers) only"""
+    state = _imported_after("scraper.registry.get_handler(scraper.resolve_source_type(scraper.config['scraping']['sources'][1]))")
+    assert SOURCE_MODULES.intersection(state['sources']) == {'modules.smart_scraper.sources.custom.vhs'}
+    assert not any('.web' in module or '.social' in module for module in state['sources'])
+    state = _imported_after("scraper.registry.get_handler('rss')")
+    assert SOURCE_MODULES.intersection(state['sources']) == {'modules.smart_scraper.sources.web.rss'}
+
+
+class DummySource(BaseSource):
+    """Returns the keyword arguments the registry passed"""
+
+    def __init__(self, source_config, options, **kwargs):
+        super().__init__(source_config, options)
+        self.kwargs_seen = kwargs
+
+    def scrape(self):
+        return [self.kwargs_seen]
+
+
+def test_registry_entry_points():
+    registry = ScraperRegistry({'dummy': f'{__name__}:DummySource', 'broken': '.no_such_module:Nothing'},
+                               base_path='/tmp/krwl', ai_providers={})
+    assert registry.is_registered('dummy') and registry.loaded_types() == []
+    assert sorted(registry.list_types()) == ['broken', 'dummy']
+
+    handler = registry.get_handler('dummy')
+    assert handler({'name': 'Dummy'}, None).scrape() == [{'base_path': '/tmp/krwl', 'ai_providers': {}}]
+    assert registry.get_handler('dummy') is handler and registry.loaded_types() == ['dummy']
+
+    # A module that fails to import behaves like an unregistered type
+    assert registry.get_handler('broken') is None
+    assert not registry.is_registered('broken')
+
+    # Direct registrations replace entry points and vice versa
+    registry.register_entry_point('broken', '.no_such_module:Nothing')
+    registry.register('broken', lambda cfg, opts: 'direct')
+    assert registry.get_handler('broken')(None, None) == 'direct'
+    assert registry.load_all() == []
+
+
+def test_providers_connect_on_first_use():
+    """No import or connection check until a provider is used"""
+    checks = []
+    saved = OllamaProvider._check_connection, ollama_module.REQUESTS_AVAILABLE
+    OllamaProvider._check_connection = lambda self: checks.append(self.host) or False
+    ollama_module.REQUESTS_AVAILABLE = True
+    try:
+        providers = get_available_providers(CONFIG['ai'])
+        ollama = providers['ollama']
+        assert isinstance(ollama, LazyProvider) and not ollama.loaded
+        # Attributes come from the real provider; construction does not probe
+        assert ollama.model == 'llama3.2' and ollama.loaded and checks == []
+        assert not ollama.is_available() and checks == ['http://127.0.0.1:9']
+        assert not ollama.is_available() and len(checks) == 1
+
+        router = build_provider_router(CONFIG['ai'])
+        assert not router.providers['ollama'].loaded
+        assert router['ollama'].extract_event_info('Konzert') is None
+        assert router.providers['ollama'].loaded
+
+        eager = get_available_providers(CONFIG['ai'], lazy=False)
+        assert isinstance(eager['ollama'], OllamaProvider)
+    finally:
+        OllamaProvider._check_connection, ollama_module.REQUESTS_AVAILABLE = saved
+
+
+def test_unimportable_provider_is_unavailable():
+    provider = LazyProvider('missing', 'no_such_provider', 'MissingProvider', {})
+    assert not provider.is_available() and not provider.loaded
+    try:
+        provider.extract_event_info('text')
+        assert False, 'expected AttributeError'
+    except AttributeError:
+        pass
+
+
+if __name__ == '__main__':
+    test_smart_scraper_imports_no_source_up_front()
+    test_single_source_imports_only_its_module()
+    test_registry_entry_points()
+    test_providers_connect_on_first_use()
+    test_unimportable_provider_is_unavailable()
+    print("✓ All lazy registry tests passed")
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Tests for MinHash/LSH near-duplicate detection (modules/near_duplicates.py)
+and the fuzzy dedup stage of EventScraper.
+"""
+
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path (go up one level from tests/ to project root, then to src/)
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from modules.backup_archive import BackupArchive, close_backup_archives
+from modules.near_duplicates import (
+    HistoricalLSHIndex, MinHasher, NearDuplicateDetector,
+    get_near_duplicate_index_path, shingles, similarity
+)
+from modules.scraper import EventScraper
+from modules.utils import load_pending_events
+
+
+def _event(title, day='2030-04-12', time='20:00', venue='Freiheitshalle Hof',
+           description='Das Trio Grande spielt modernen Jazz mit Latin und Funk', source='https://vhs.example'):
+    return {
+        'id': f'{source}#{title}',
+        'title': title,
+        'description': description,
+        'location': {'name': venue, 'lat': 50.3167, 'lon': 11.9167, 'address': 'Kulmbacher Str. 4, 95030 Hof'},
+        'start_time': f'{day}T{time}:00',
+        'source': source,
+    }
+
+
+def test_signature_similarity():
+    """MinHash agreement tracks how close two events are"""
+    hasher = MinHasher()
+    concert = hasher.signature(shingles(_event('Jazz-Konzert: Trio Grande')))
+    reordered = hasher.signature(shingles(_event('Trio Grande - Jazzkonzert', venue='Freiheitshalle')))
+    umlauts = hasher.signature(shingles(_event('Jazzkonzert Trio Grande in der Halle für Musik')))
+    spelled = hasher.signature(shingles(_event('Jazzkonzert Trio Grande in der Halle fuer Musik')))
+    meeting = hasher.signature(shingles(_event('Stadtratssitzung', venue='Rathaus Hof',
+                                               description='Öffentliche Sitzung des Stadtrats')))
+    assert similarity(concert, concert) == 1.0
+    assert similarity(concert, reordered) >= 0.5
+    assert similarity(umlauts, spelled) == 1.0
+    assert similarity(concert, meeting) < 0.2
+
+
+def test_historical_index_is_incremental():
+    """Archived events are indexed once and found by day"""
+    test_path = Path(tempfile.mkdtemp(prefix='krwl_near_dup_test_'))
+    try:
+        archive = BackupArchive(test_path)
+        archive.append(_event('Jazz-Konzert: Trio Grande'))
+        archive.append(_event('Jazz-Konzert: Trio Grande', day='2030-05-12'))
+        hasher = MinHasher()
+        index = HistoricalLSHIndex(get_near_duplicate_index_path(test_path))
+        assert index.sync(archive, hasher) == 2
+        assert index.sync(archive, hasher) == 0
+        archive.append(_event('Stadtratssitzung'))
+        assert index.sync(archive, hasher) == 1
+
+        detector = NearDuplicateDetector(test_path)
+        query = _event('Trio Grande - Jazzkonzert', source='https://frankenpost.example')
+        other_day = _event('Trio Grande - Jazzkonzert', day='2030-04-13')
+        detector.prepare([query, other_day], [], [])
+        match = detector.find(query)
+        assert match.origin == 'historical'
+        assert match.title == 'Jazz-Konzert: Trio Grande'
+        assert detector.find(other_day) is None
+    finally:
+        close_backup_archives()
+        shutil.rmtree(test_path)
+
+
+def test_scraper_merges_and_marks_near_duplicates():
+    """Same-day lookalikes are merged (high score) or marked (medium score)"""
+    test_path = Path(tempfile.mkdtemp(prefix='krwl_near_dup_test_'))
+    try:
+        scraper = EventScraper({'scraping': {'sources': []}}, test_path)
+        pending = [_event('Jazz-Konzert: Trio Grande')]
+        candidates = [
+            # Same event from another source - merged into the pending event
+            _event('Jazz-Konzert: Trio Grande!', time='19:30', source='https://hof.example'),
+            # Similar event - kept, but marked for the reviewer
+            _event('Trio Grande - Jazzkonzert', venue='Freiheitshalle', source='https://frankenpost.example'),
+            # Different day - untouched
+            _event('Jazz-Konzert: Trio Grande', day='2030-04-19'),
+        ]
+        kept, stats = scraper._filter_near_duplicates(candidates, pending, [])
+        assert stats == {'merged': 1, 'marked': 1, 'pending_updated': True}
+        assert pending[0]['additional_sources'] == ['https://hof.example']
+        assert [e['start_time'][:10] for e in kept] == ['2030-04-12', '2030-04-19']
+        assert kept[0]['possible_duplicate']['in'] == 'pending'
+        assert 0.5 <= kept[0]['possible_duplicate']['similarity'] < 0.9
+        assert 'possible_duplicate' not in kept[1]
+
+        # Disabled stage passes everything through
+        scraper.config['scraping']['near_duplicates'] = {'enabled': False}
+        kept, stats = scraper._filter_near_duplicates(candidates, [], [])
+        assert len(kept) == 3 and stats['merged'] == 0
+    finally:
+        close_backup_archives()
+        shutil.rmtree(test_path)
+
+
+def test_duplicate_marks_survive_into_pending_file():
+    """possible_duplicate and additional_sources are stored, not dropped by validation"""
+    test_path = Path(tempfile.mkdtemp(prefix='krwl_near_dup_test_'))
+    (test_path / 'assets' / 'json').mkdir(parents=True)
+    (test_path / 'assets' / 'json' / 'events.json').write_text('{"events": []}')
+    try:
+        scraper = EventScraper({'scraping': {'sources': [{'name': 'Fake', 'type': 'rss', 'enabled': True}]}},
+                               test_path)
+        scraper._check_scraping_available = lambda: True
+        scraper.scrape_source = lambda source: [
+            _event('Jazz-Konzert: Trio Grande'),
+            # Merged into the first event of the batch
+            _event('Jazz-Konzert: Trio Grande!', time='19:30', source='https://hof.example'),
+        ]
+        scraper.scrape_all_sources()
+        scraper.scrape_source = lambda source: [
+            _event('Trio Grande - Jazzkonzert', venue='Freiheitshalle', source='https://frankenpost.example'),
+        ]
+        scraper.scrape_all_sources()
+
+        pending = load_pending_events(test_path)['pending_events']
+        assert len(pending) == 2
+        assert pending[0]['additional_sources'] == ['https://hof.example']
+        assert pending[1]['possible_duplicate']['in'] == 'pending'
+        assert 'possible_duplicate' not in pending[0] and 'additional_sources' not in pending[1]
+    finally:
+        close_backup_archives()
+        shutil.rmtree(test_path)
+
+
+if __name__ == '__main__':
+    test_signature_similarity()
+    test_historical_index_is_incremental()
+    test_scraper_merges_and_marks_near_duplicates()
+    test_duplicate_marks_survive_into_pending_file()
+    print("✓ All near-duplicate detection tests passed")
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared OCR worker pool
+(modules/smart_scraper/image_analyzer/ocr_service.py).
+
+Tesseract is not needed: the per-image OCR function is replaced and the
+pool runs on threads.
+"""
+
+import sys
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+# Add src to path (go up one level from tests/ to project root, then to src/)
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from modules.smart_scraper.image_analyzer import ocr_service as ocr_service_module
+from modules.smart_scraper.image_analyzer.ocr_service import (
+    OCRService, configure_ocr_services, get_ocr_service, shutdown_ocr_services
+)
+
+
+def fake_ocr(image_source, lang, preprocessing=None):
+    if image_source == b'broken':
+        raise OSError('cannot identify image file')
+    text = f'{lang}:{image_source.decode() if isinstance(image_source, bytes) else image_source}'
+    return {'text': text, 'metadata': {'binarize': preprocessing['binarize']}}
+
+
+class BrokenExecutor:
+    """A process pool whose workers died"""
+
+    def submit(self, *args, **kwargs):
+        raise BrokenProcessPool('worker died')
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        pass
+
+
+def _threaded_service(workers=3):
+    service = OCRService(['eng', 'deu'], workers)
+    service._start_threads()
+    return service
+
+
+def test_batch_results_in_input_order():
+    """Futures of a batch resolve in input order, errors to None"""
+    saved = ocr_service_module._ocr_image
+    ocr_service_module._ocr_image = fake_ocr
+    try:
+        service = _threaded_service()
+        images = [f'flyer {i}'.encode() for i in range(20)] + [b'broken', '/tmp/flyer.jpg']
+        results = [future.result() for future in service.submit_batch(images)]
+        assert [result['text'] for result in results[:20]] == [f'eng+deu:flyer {i}' for i in range(20)]
+        assert results[20] is None
+        assert results[21] == {'text': 'eng+deu:/tmp/flyer.jpg', 'metadata': {'binarize': False}}
+        assert service.extract_text(b'single') == 'eng+deu:single'
+        status = service.get_status()
+        assert status['mode'] == 'threads'
+        assert status['images'] == 23 and status['errors'] == 1
+        service.shutdown()
+    finally:
+        ocr_service_module._ocr_image = saved
+
+
+def test_broken_pool_falls_back_to_threads():
+    """A broken process pool is replaced and the image retried once"""
+    saved = ocr_service_module._ocr_image
+    ocr_service_module._ocr_image = fake_ocr
+    try:
+        service = OCRService(['eng'], 2)
+        service._executor = BrokenExecutor()
+        assert service.extract_text(b'flyer') == 'eng:flyer'
+        status = service.get_status()
+        assert status['mode'] == 'threads' and status['restarts'] == 1
+        service.shutdown()
+    finally:
+        ocr_service_module._ocr_image = saved
+
+
+def test_services_are_shared_per_language_set():
+    """All analyzers with the same languages share one configured pool"""
+    shutdown_ocr_services()
+    try:
+        configure_ocr_services({'workers': 2, 'preprocessing': {'binarize': True}})
+        service = get_ocr_service(['eng', 'deu'])
+        assert get_ocr_service(['eng', 'deu']) is service
+        assert get_ocr_service(None) is service
+        assert get_ocr_service(['deu']) is not service
+        assert service.workers == 2
+        # Preprocessing settings are merged over the defaults
+        assert service.preprocessing['binarize'] is True
+        assert service.preprocessing['grayscale'] is True
+        # Nothing is started before the first image
+        assert service.get_status()['mode'] == 'not started'
+    finally:
+        configure_ocr_services({})
+        shutdown_ocr_services()
+
+
+if __name__ == '__main__':
+    test_batch_results_in_input_order()
+    test_broken_pool_falls_back_to_threads()
+    test_services_are_shared_per_language_set()
+    print("✓ All OCR service tests passed")
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Tests for perceptual-hash flyer deduplication
+(modules/smart_scraper/image_analyzer/perceptual_hash.py): the BK-tree,
+near-duplicate lookups in the FlyerCache, ImageAnalyzer skipping OCR for
+re-encoded copies and EventScraper linking events of the same flyer.
+"""
+
+import random
+import shutil
+import sys
+import tempfile
+from concurrent.futures import Future
+from pathlib import Path
+
+# Add src to path (go up one level from tests/ to project root, then to src/)
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from modules.smart_scraper.image_analyzer import analyzer as analyzer_module
+from modules.smart_scraper.image_analyzer.analyzer import ImageAnalyzer
+from modules.smart_scraper.image_analyzer.flyer_cache import FlyerCache
+from modules.smart_scraper.image_analyzer.perceptual_hash import (
+    BKTree, FlyerEventIndex, format_hash, hamming_distance
+)
+from modules.scraper import EventScraper
+
+FLYER = 0xF0F0_A5A5_3C3C_0FF0
+
+
+def test_bk_tree_matches_brute_force():
+    """Search finds exactly the hashes within the distance"""
+    rng = random.Random(7)
+    hashes = [rng.getrandbits(64) for _ in range(500)]
+    # Copies of the first hash with 1-4 flipped bits
+    for bits in range(1, 5):
+        hashes.append(hashes[0] ^ sum(1 << bit for bit in rng.sample(range(64), bits)))
+    tree = BKTree((value, index) for index, value in enumerate(hashes))
+    assert len(tree) == len(hashes)
+
+    for query in (hashes[0], rng.getrandbits(64)):
+        expected = sorted((hamming_distance(query, value), index) for index, value in enumerate(hashes)
+                          if hamming_distance(query, value) <= 6)
+        assert sorted(tree.search(query, 6)) == expected
+    assert tree.nearest(hashes[0], 6) == (0, 0)
+    assert [index for _, index in tree.search(hashes[0], 4)] == [0, 500, 501, 502, 503]
+    assert BKTree().nearest(FLYER, 6) is None
+
+
+def test_cache_answers_reencoded_copies():
+    """A copy within the distance gets the original's result, marked"""
+    test_path = Path(tempfile.mkdtemp(prefix='krwl_phash_test_'))
+    try:
+        cache = FlyerCache(test_path)
+        cache.put('original', 'eng', {'ocr_text': 'Konzert'}, b'original bytes', ['facebook:1:0'])
+        cache.add_perceptual('original', FLYER, 'facebook:1:0')
+
+        found, result = cache.get_similar_result(FLYER ^ 0b101, 'eng', 'copy', ['instagram:9:0'])
+        assert found
+        assert result['ocr_text'] == 'Konzert'
+        assert result['duplicate_flyer'] == {'image_hash': 'original', 'source_key': 'facebook:1:0', 'distance': 2}
+        # The copy is an exact hit from now on
+        assert cache.get_result('copy', 'eng') == (True, {'ocr_text': 'Konzert'})
+        assert cache.lookup_source(['instagram:9:0']) == 'copy'
+
+        # Other flyers, other analyzer settings and switched-off lookups miss
+        assert cache.get_similar_result(~FLYER & (2 ** 64 - 1), 'eng', 'other') == (False, None)
+        assert cache.get_similar_result(FLYER, 'eng+deu', 'other') == (False, None)
+        cache.perceptual_max_distance = None
+        assert cache.get_similar_result(FLYER, 'eng', 'other') == (False, None)
+        cache.close()
+
+        # Hashes persist (the tree is rebuilt from the database)
+        reopened = FlyerCache(test_path)
+        assert reopened.get_similar_result(FLYER ^ 1, 'eng', 'copy2')[0]
+        stats = reopened.get_stats()
+        assert stats['similar_hits'] == 1 and stats['perceptual'] == 1
+        reopened.close()
+    finally:
+        shutil.rmtree(test_path)
+
+
+class FakeOCRService:
+    def __init__(self):
+        self.submitted = []
+
+    def submit_batch(self, images):
+        futures = []
+        for image_data in images:
+            self.submitted.append(image_data)
+            future = Future()
+            future.set_result({'text': 'Konzert am 12.05.2026 20:00 Uhr', 'metadata': {}})
+            futures.append(future)
+        return futures
+
+
+def test_analyzer_skips_ocr_for_copies():
+    """A re-encoded repost is not OCR'd; results carry the flyer hash"""
+    test_path = Path(tempfile.mkdtemp(prefix='krwl_phash_test_'))
+    saved = analyzer_module.is_ocr_available, analyzer_module.perceptual_hash
+    try:
+        analyzer_module.is_ocr_available = lambda: True
+        # Both encodings of the poster hash alike
+        analyzer_module.perceptual_hash = lambda data: FLYER if data.startswith(b'poster') else FLYER ^ (2 ** 64 - 1)
+        analyzer = ImageAnalyzer({'languages': ['eng', 'deu']})
+        analyzer.ocr_service = FakeOCRService()
+        analyzer.result_cache = FlyerCache(test_path)
+
+        facebook = analyzer.analyze_bytes(b'poster as facebook jpeg', ['facebook:1:0'])
+        assert facebook['flyer_hash'] == format_hash(FLYER)
+        telegram = analyzer.analyze_bytes(b'poster as telegram upload', ['telegram:5'])
+        assert analyzer.ocr_service.submitted == [b'poster as facebook jpeg']
+        assert telegram['flyer_hash'] == facebook['flyer_hash']
+        assert telegram['duplicate_flyer']['source_key'] == 'facebook:1:0'
+
+        other = analyzer.analyze_bytes(b'another flyer')
+        assert len(analyzer.ocr_service.submitted) == 2 and 'duplicate_flyer' not in other
+        analyzer.result_cache.close()
+    finally:
+        analyzer_module.is_ocr_available, analyzer_module.perceptual_hash = saved
+        shutil.rmtree(test_path)
+
+
+def _event(title, source, flyer_hash=None):
+    event = {'title': title, 'source': source, 'start_time': '2026-05-12T20:00:00'}
+    if flyer_hash is not None:
+        event['flyer_hash'] = format_hash(flyer_hash)
+    return event
+
+
+def test_scraper_links_events_of_the_same_flyer():
+    """Copies of a pending or batch flyer are merged into that event"""
+    test_path = Path(tempfile.mkdtemp(prefix='krwl_phash_test_'))
+    try:
+        scraper = EventScraper({'scraping': {'sources': []}}, test_path)
+        pending = [_event('Jazz im Park', 'facebook_hof', FLYER)]
+        candidates = [
+            _event('Jazz Park 12.5.', 'instagram_hof', FLYER ^ 0b11),
+            _event('Ganz anderes Event', 'telegram', ~FLYER & (2 ** 64 - 1)),
+            _event('Anderes Event (Repost)', 'instagram_hof', (~FLYER & (2 ** 64 - 1)) ^ 1),
+            _event('Ohne Flyer', 'rss'),
+        ]
+        kept, stats = scraper._link_flyer_copies(candidates, pending)
+        assert [event['title'] for event in kept] == ['Ganz anderes Event', 'Ohne Flyer']
+        assert stats == {'linked': 2, 'pending_updated': True}
+        assert pending[0]['additional_sources'] == ['instagram_hof']
+        assert kept[0]['additional_sources'] == ['instagram_hof']
+
+        # Switched off
+        scraper.config['scraping']['image_cache'] = {'perceptual_max_distance': None}
+        kept, stats = scraper._link_flyer_copies(candidates[:1], pending)
+        assert len(kept) == 1 and stats['linked'] == 0
+    finally:
+        shutil.rmtree(test_path)
+
+
+def test_event_index_ignores_events_without_flyer():
+    index = FlyerEventIndex([_event('A', 'rss'), _event('B', 'facebook', FLYER)])
+    assert index.find(_event('C', 'rss')) is None
+    assert index.find(_event('D', 'telegram', FLYER ^ 1))[1] == 1
+
+
+if __name__ == '__main__':
+    test_bk_tree_matches_brute_force()
+    test_cache_answers_reencoded_copies()
+    test_analyzer_skips_ocr_for_copies()
+    test_scraper_links_events_of_the_same_flyer()
+    test_event_index_ignores_events_without_flyer()
+    print("✓ All perceptual hash tests passed")
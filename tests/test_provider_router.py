@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Tests for the AI provider router
+(modules/smart_scraper/ai_providers/router.py): failover, circuit breaking,
+rolling latency statistics, hedged calls and persistence, plus the token
+bucket behind RateLimiter.
+
+Providers are fakes with fixed latencies; no LLM is needed.
+"""
+
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Add src to path (go up one level from tests/ to project root, then to src/)
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from modules.smart_scraper.ai_providers import build_provider_router
+from modules.smart_scraper.ai_providers.base import (
+    BaseAIProvider, RateLimiter, TokenBucket, report_call_failure
+)
+from modules.smart_scraper.ai_providers.result_cache import AIResultCache
+from modules.smart_scraper.ai_providers.router import ProviderRouter, load_router_stats
+
+
+class FakeProvider(BaseAIProvider):
+    """Answers after `delay` seconds; fails while `failing` is set"""
+
+    def __init__(self, name, delay=0.0, failing=False, available=True):
+        super().__init__({'rate_limit': {'min_delay': 0, 'max_delay': 0}})
+        self.name = name
+        self.delay = delay
+        self.failing = failing
+        self.available = available
+        self.calls = 0
+        self.image_calls = 0
+
+    def get_name(self):
+        return self.name
+
+    def is_available(self):
+        return self.available
+
+    def extract_event_info(self, text, prompt=None):
+        self.calls += 1
+        time.sleep(self.delay)
+        if self.failing:
+            raise TimeoutError(f'{self.name} timed out')
+        return {'title': text, 'provider': self.name}
+
+    def analyze_image(self, image_data, prompt=None):
+        self.image_calls += 1
+        return None
+
+
+def test_token_bucket():
+    """Bursts up to capacity, then one token per 1/rate seconds"""
+    bucket = TokenBucket(rate=20, capacity=2)
+    start = time.monotonic()
+    waits = [bucket.acquire() for _ in range(4)]
+    elapsed = time.monotonic() - start
+    assert waits[0] == 0 and waits[1] == 0
+    assert waits[2] > 0 and 0.09 <= elapsed < 0.5
+    assert bucket.wait_time() > 0
+    assert TokenBucket(float('inf')).acquire() == 0
+
+    # Sustained rate follows the average of min/max delay
+    limiter = RateLimiter(min_delay=0.02, max_delay=0.06)
+    assert abs(limiter.bucket.rate - 25) < 0.01
+    limiter.handle_rate_limit(0)
+    assert limiter.wait_time() > 0
+
+
+def test_failover_and_circuit():
+    """A failing provider hands calls to the next and is skipped after 3 failures"""
+    flaky = FakeProvider('flaky', failing=True)
+    backup = FakeProvider('backup')
+    router = ProviderRouter({'flaky': flaky, 'backup': backup}, {'failure_threshold': 3})
+
+    for i in range(5):
+        assert router['flaky'].extract_event_info(f'event {i}')['provider'] == 'backup'
+    # Calls 4 and 5 skipped the open circuit
+    assert flaky.calls == 3
+    stats = router.get_stats()
+    assert stats['flaky']['circuit'] == 'open' and stats['flaky']['errors'] == 3
+    assert stats['backup']['calls'] == 5 and stats['backup']['error_rate'] == 0
+
+    # After the cool-down one probe decides
+    flaky.failing = False
+    router.health['flaky'].open_until = time.time() - 1
+    assert router['flaky'].extract_event_info('probe')['provider'] == 'flaky'
+    assert router.get_stats()['flaky']['circuit'] == 'closed'
+
+    # Unavailable providers are never called
+    backup.available = False
+    flaky.failing = True
+    router.health['flaky'].open_until = time.time() + 60
+    assert router['backup'].extract_event_info('x') is None
+    assert not router['backup'].is_available()
+
+
+def test_none_answers_leave_the_circuit_closed():
+    """A None answer is valid: it is not failed over and opens no circuit"""
+    primary = FakeProvider('primary')
+    backup = FakeProvider('backup')
+    router = ProviderRouter({'primary': primary, 'backup': backup}, {'failure_threshold': 3})
+
+    for i in range(6):
+        assert router['primary'].analyze_image(b'image %d' % i) is None
+    assert primary.image_calls == 6 and backup.image_calls == 0
+    stats = router.get_stats()
+    assert stats['primary']['circuit'] == 'closed'
+    assert stats['primary']['empty'] == 6 and stats['primary']['errors'] == 0
+    # The other methods still reach the provider
+    assert router['primary'].extract_event_info('event')['provider'] == 'primary'
+
+
+def test_reported_failure_fails_over():
+    """A provider that catches its request error and returns None still fails over"""
+
+    class SwallowingProvider(FakeProvider):
+        def extract_event_info(self, text, prompt=None):
+            self.calls += 1
+            report_call_failure()
+            return None
+
+    broken = SwallowingProvider('broken')
+    backup = FakeProvider('backup')
+    router = ProviderRouter({'broken': broken, 'backup': backup}, {'failure_threshold': 2})
+    for i in range(3):
+        assert router['broken'].extract_event_info(f'event {i}')['provider'] == 'backup'
+    assert broken.calls == 2
+    assert router.get_stats()['broken']['circuit'] == 'open'
+
+
+def test_probe_answered_from_cache_is_released():
+    """A probe served by the result cache does not keep the provider excluded"""
+    test_path = Path(tempfile.mkdtemp(prefix='krwl_router_test_'))
+    try:
+        provider = FakeProvider('ollama')
+        provider.result_cache = AIResultCache(test_path / 'ai.sqlite3')
+        router = ProviderRouter({'ollama': provider}, {'failure_threshold': 1})
+        router['ollama'].extract_event_info('cached event')
+        assert provider.calls == 1
+
+        # Cool-down over: the probe is answered from the cache
+        router.health['ollama'].open_until = time.time() - 1
+        assert router['ollama'].extract_event_info('cached event')['provider'] == 'ollama'
+        assert provider.calls == 1
+        assert router.health['ollama'].probing is False
+
+        # The next uncached call probes the provider itself
+        assert router['ollama'].extract_event_info('new event')['provider'] == 'ollama'
+        assert provider.calls == 2
+        assert router.get_stats()['ollama']['circuit'] == 'closed'
+        provider.result_cache.close()
+    finally:
+        shutil.rmtree(test_path)
+
+
+def test_rolling_percentiles_ignore_cache_hits():
+    test_path = Path(tempfile.mkdtemp(prefix='krwl_router_test_'))
+    try:
+        provider = FakeProvider('ollama', delay=0.01)
+        provider.result_cache = AIResultCache(test_path / 'ai.sqlite3')
+        router = ProviderRouter({'ollama': provider}, {'window': 4})
+        for i in range(6):
+            router['ollama'].extract_event_info(f'event {i}')
+        router['ollama'].extract_event_info('event 0')  # Cached
+        health = router.health['ollama']
+        assert health.calls == 6 and len(health.samples) == 4
+        assert 0.005 < router.get_stats()['ollama']['p95_ms'] / 1000 < 0.5
+        provider.result_cache.close()
+    finally:
+        shutil.rmtree(test_path)
+
+
+def test_hedged_call_uses_faster_provider():
+    """After the primary's p95 the backup is asked too; its answer wins"""
+    slow = FakeProvider('slow', delay=0.6)
+    fast = FakeProvider('fast', delay=0.01)
+    router = ProviderRouter({'slow': slow, 'fast': fast},
+                            {'hedge': {'enabled': True, 'min_delay_ms': 50, 'default_delay_ms': 100}})
+    try:
+        start = time.perf_counter()
+        result = router.hedged()['slow'].extract_event_info('flyer')
+        elapsed = time.perf_counter() - start
+        assert result['provider'] == 'fast'
+        assert elapsed < 0.5
+        stats = router.get_stats()
+        assert stats['fast']['hedges'] == 1 and stats['fast']['hedge_wins'] == 1
+
+        # Not hedged: the caller waits for the slow provider
+        assert router['slow'].extract_event_info('flyer')['provider'] == 'slow'
+        # Hedging switched off in config: the view does not hedge
+        plain = ProviderRouter({'slow': slow, 'fast': fast}, {'hedge': {'min_delay_ms': 50}})
+        assert plain.hedged()['slow'].extract_event_info('flyer')['provider'] == 'slow'
+    finally:
+        router.shutdown()
+
+
+def test_hedge_delay_follows_p95():
+    router = ProviderRouter({'a': FakeProvider('a'), 'b': FakeProvider('b')},
+                            {'hedge': {'min_delay_ms': 10, 'default_delay_ms': 2000, 'min_samples': 3}})
+    assert router.hedge_delay('a') == 2.0
+    for latency in (0.1, 0.2, 0.3, 0.4):
+        router._record('a', latency, 'ok')
+    assert router.hedge_delay('a') == 0.4
+
+
+def test_statistics_persist_for_the_cli():
+    test_path = Path(tempfile.mkdtemp(prefix='krwl_router_test_'))
+    try:
+        router = ProviderRouter({'flaky': FakeProvider('flaky', failing=True), 'backup': FakeProvider('backup')},
+                                {'failure_threshold': 2}, base_path=test_path)
+        for _ in range(3):
+            router['flaky'].extract_event_info('x')
+        router.flush()
+
+        stats = load_router_stats(test_path)
+        assert stats['flaky']['circuit'] == 'open' and stats['backup']['calls'] == 3
+        # The next run starts with the open circuit
+        again = ProviderRouter({'flaky': FakeProvider('flaky'), 'backup': FakeProvider('backup')},
+                               {}, base_path=test_path)
+        assert again['flaky'].extract_event_info('x')['provider'] == 'backup'
+        assert load_router_stats(test_path / 'missing') == {}
+    finally:
+        shutil.rmtree(test_path)
+
+
+def test_router_is_a_drop_in_for_the_provider_dict():
+    """get/values/in/len work as on the plain dict; disabled returns the plain dict"""
+    providers = {'ollama': FakeProvider('ollama'), 'groq': FakeProvider('groq')}
+    router = ProviderRouter(providers, {'order': ['groq']})
+    assert isinstance(router, dict)
+    assert list(router) == ['groq', 'ollama'] and len(router) == 2 and 'ollama' in router
+    assert router.get('missing') is None
+    assert next(iter(router.values())).get_name() == 'groq'
+    assert router['ollama'].rate_limiter is providers['ollama'].rate_limiter
+    assert build_provider_router({}) == {}
+
+    # Thread-safe under parallel sources
+    threads = [threading.Thread(target=router['ollama'].extract_event_info, args=(f'e{i}',)) for i in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert router.get_stats()['ollama']['calls'] == 20
+
+
+if __name__ == '__main__':
+    test_token_bucket()
+    test_failover_and_circuit()
+    test_none_answers_leave_the_circuit_closed()
+    test_reported_failure_fails_over()
+    test_probe_answered_from_cache_is_released()
+    test_rolling_percentiles_ignore_cache_hits()
+    test_hedged_call_uses_faster_provider()
+    test_hedge_delay_follows_p95()
+    test_statistics_persist_for_the_cli()
+    test_router_is_a_drop_in_for_the_provider_dict()
+    print("✓ All provider router tests passed")
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Tests for the publish/reject unit of work (modules/review_batch.py) and the
+bulk CLI commands built on it.
+"""
+
+import json
+import shutil
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+# Add src to path (go up one level from tests/ to project root, then to src/)
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from modules import utils
+from modules.backup_archive import close_backup_archives, get_backup_archive
+from modules.review_batch import ReviewBatch
+from event_manager import cli_bulk_publish_events, cli_bulk_reject_events
+
+
+def _setup(count):
+    test_path = Path(tempfile.mkdtemp(prefix='krwl_review_test_'))
+    json_dir = test_path / 'assets' / 'json'
+    json_dir.mkdir(parents=True)
+    pending = [{
+        'id': f'html_source_{i}',
+        'title': f'Konzert {i}',
+        'location': {'name': 'Freiheitshalle', 'lat': 50.31, 'lon': 11.91},
+        'start_time': f'2030-05-{i % 28 + 1:02d}T20:00:00',
+        'category': 'music',
+        'source': 'https://example.org/events',
+    } for i in range(count)]
+    (json_dir / 'pending_events.json').write_text(json.dumps({'pending_events': pending}))
+    (json_dir / 'events.json').write_text(json.dumps({'events': []}))
+    (json_dir / 'rejected_events.json').write_text(json.dumps(
+        {'rejected_events': [{'title': 'Konzert 1', 'source': 'https://example.org/events'}]}))
+    return test_path, json_dir
+
+
+def _count_writes():
+    """Wrap utils._write_document; returns the Counter of written file names"""
+    writes = Counter()
+    original = utils._write_document
+
+    def counting(path, data):
+        writes[Path(path).name] += 1
+        original(path, data)
+
+    utils._write_document = counting
+    return writes, original
+
+
+def test_bulk_reject_writes_each_file_once():
+    """Rejecting 1,000 pending events is one write per file and well under a second"""
+    test_path, json_dir = _setup(1000)
+    writes, original = _count_writes()
+    try:
+        start = time.perf_counter()
+        assert cli_bulk_reject_events(test_path, 'html_source_*') == 0
+        elapsed = time.perf_counter() - start
+        assert elapsed < 1.0, f"bulk reject took {elapsed:.2f}s"
+
+        assert writes['pending_events.json'] == 1
+        assert writes['rejected_events.json'] == 1
+        assert json.loads((json_dir / 'pending_events.json').read_text())['pending_events'] == []
+        rejected = json.loads((json_dir / 'rejected_events.json').read_text())['rejected_events']
+        # 'Konzert 1' was already on the list
+        assert len(rejected) == 1000
+    finally:
+        utils._write_document = original
+        close_backup_archives()
+        shutil.rmtree(test_path)
+
+
+def test_bulk_publish_and_partial_failures():
+    """Published events are archived in one append; invalid and unknown ids fail"""
+    test_path, json_dir = _setup(30)
+    pending = json.loads((json_dir / 'pending_events.json').read_text())
+    del pending['pending_events'][3]['category']
+    (json_dir / 'pending_events.json').write_text(json.dumps(pending))
+    writes, original = _count_writes()
+    try:
+        result = cli_bulk_publish_events(test_path, 'html_source_[0-4],html_source_2*,missing_id')
+        assert result == 1  # html_source_3 has no category, missing_id is unknown
+
+        assert writes['events.json'] == 1
+        assert writes['pending_events.json'] == 1
+        published = json.loads((json_dir / 'events.json').read_text())
+        published_ids = {event['id'] for event in published['events']}
+        assert published_ids == {f'html_source_{i}' for i in [0, 1, 2, 4] + list(range(20, 30))}
+        assert published['pending_count'] == 16
+        assert all(event['status'] == 'published' for event in published['events'])
+        assert len(get_backup_archive(test_path).get_by_id('html_source_25')) == 1
+
+        remaining = json.loads((json_dir / 'pending_events.json').read_text())['pending_events']
+        assert [event['id'] for event in remaining][:3] == ['html_source_3', 'html_source_5', 'html_source_6']
+    finally:
+        utils._write_document = original
+        close_backup_archives()
+        shutil.rmtree(test_path)
+
+
+def test_review_batch_stages_until_commit():
+    """Nothing is written before commit, staged ids cannot be taken twice"""
+    test_path, json_dir = _setup(5)
+    try:
+        before = (json_dir / 'pending_events.json').read_text()
+        batch = ReviewBatch(test_path)
+        found, missing = batch.find(['html_source_1', 'nope', 'html_source_4'])
+        assert [event_id for event_id, _ in found] == ['html_source_1', 'html_source_4']
+        assert missing == ['nope']
+
+        batch.reject('html_source_1')
+        batch.publish('html_source_4', {'title': 'Konzert 4 (validiert)'})
+        try:
+            batch.reject('html_source_4')
+            assert False, "staged event must not be found again"
+        except KeyError:
+            pass
+        assert (json_dir / 'pending_events.json').read_text() == before
+
+        assert batch.commit() == {'published': 1, 'rejected': 1, 'remaining': 3}
+        assert batch.get('html_source_2') is not None
+        assert json.loads((json_dir / 'events.json').read_text())['events'][0]['title'] == 'Konzert 4 (validiert)'
+    finally:
+        close_backup_archives()
+        shutil.rmtree(test_path)
+
+
+if __name__ == '__main__':
+    test_bulk_reject_writes_each_file_once()
+    test_bulk_publish_and_partial_failures()
+    test_review_batch_stages_until_commit()
+    print("✓ All review batch tests passed")
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Tests for parallel source scraping (scrape_pool.py and scrape_all_sources).
+"""
+
+import json
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Add src to path (go up one level from tests/ to project root, then to src/)
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from modules.scrape_pool import get_concurrency_settings, run_sources
+from modules.exceptions import NetworkError
+
+
+def _source(name, host, delay=0.0):
+    return {'name': name, 'url': f'https://{host}/events', 'enabled': True, 'delay': delay}
+
+
+def test_parallel_results_are_in_config_order():
+    """Wall time follows the slowest source; results keep config order"""
+    sources = [_source(f's{i}', f'host{i}.example', delay=0.2 - i * 0.03) for i in range(6)]
+
+    def scrape(source):
+        time.sleep(source['delay'])
+        if source['name'] == 's2':
+            raise NetworkError(source['url'], 'boom', 503)
+        return [{'title': source['name']}]
+
+    start = time.monotonic()
+    results = run_sources(sources, scrape, max_workers=6, per_host=1)
+    elapsed = time.monotonic() - start
+
+    assert elapsed < 0.45  # Sequential would take ~0.75s
+    assert [r.name for r in results] == ['s0', 's1', 's2', 's3', 's4', 's5']
+    assert isinstance(results[2].error, NetworkError)
+    assert results[0].events == [{'title': 's0'}]
+
+
+def test_per_host_cap():
+    """No more than per_host sources of one host run at the same time"""
+    sources = [_source(f'fb{i}', 'www.facebook.com', 0.05) for i in range(5)]
+    sources += [_source(f'web{i}', f'site{i}.example', 0.05) for i in range(3)]
+    active = {}
+    peak = {}
+    lock = threading.Lock()
+
+    def scrape(source):
+        host = source['url'].split('/')[2]
+        with lock:
+            active[host] = active.get(host, 0) + 1
+            peak[host] = max(peak.get(host, 0), active[host])
+        time.sleep(source['delay'])
+        with lock:
+            active[host] -= 1
+        return []
+
+    run_sources(sources, scrape, max_workers=8, per_host=2)
+    assert peak['www.facebook.com'] == 2
+    assert all(peak[f'site{i}.example'] == 1 for i in range(3))
+
+
+def test_settings_and_event_scraper_failures():
+    """Config/CLI settings are honoured and failures keep their types"""
+    assert get_concurrency_settings({}) == {'max_workers': 1, 'per_host': 2}
+    config = {'scraping': {'concurrency': {'max_workers': 4, 'per_host': 3}, 'sources': [
+        _source('Good', 'a.example'), _source('Down', 'b.example'),
+        {'name': 'Off', 'url': 'https://c.example', 'type': 'rss', 'enabled': False},
+    ]}}
+    assert get_concurrency_settings(config, max_workers=2) == {'max_workers': 2, 'per_host': 3}
+
+    from modules.scraper import EventScraper
+
+    test_path = Path(tempfile.mkdtemp(prefix='krwl_pool_test_'))
+    try:
+        json_dir = test_path / 'assets' / 'json'
+        json_dir.mkdir(parents=True)
+        (json_dir / 'pending_events.json').write_text(json.dumps({'pending_events': []}))
+        (json_dir / 'events.json').write_text(json.dumps({'events': []}))
+        (json_dir / 'rejected_events.json').write_text(json.dumps({'rejected_events': []}))
+
+        scraper = EventScraper(config, test_path)
+
+        def scrape_source(source):
+            if source['name'] == 'Down':
+                raise NetworkError(source['url'], 'Connection refused', None)
+            return []
+
+        scraper.scrape_source = scrape_source
+        scraper.scrape_all_sources()
+        assert scraper.failed_sources == [
+            {'name': 'Down', 'error': str(NetworkError('https://b.example/events', 'Connection refused', None)),
+             'type': 'network'}
+        ]
+    finally:
+        shutil.rmtree(test_path)
+
+
+if __name__ == '__main__':
+    test_parallel_results_are_in_config_order()
+    test_per_host_cap()
+    test_settings_and_event_scraper_failures()
+    print("✓ All scrape pool tests passed")